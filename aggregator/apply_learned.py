@@ -25,9 +25,10 @@ RESULT:
 New bad slug -> the gate learns it once -> the aggregator applies it forever.
 No more commit per edge case.
 """
-import json
 import os
 
+from outreach.brain_store import open_store
+
 BRAIN_FILE = os.path.join(
     os.path.dirname(os.path.abspath(__file__)), ".local", "brain.json"
 )
@@ -36,15 +37,14 @@ _cache = {"data": None, "mtime": 0}
 
 
 def _brain():
-    """Load brain.json, cached, refreshing only when the file changes."""
-    try:
-        mtime = os.path.getmtime(BRAIN_FILE)
-    except OSError:
+    """Load the brain, cached, refreshing only when the store changes."""
+    store = open_store(BRAIN_FILE)
+    mtime = store.mtime()
+    if not mtime:
         return {}
     if _cache["data"] is None or mtime != _cache["mtime"]:
         try:
-            with open(BRAIN_FILE, encoding="utf-8") as f:
-                _cache["data"] = json.load(f)
+            _cache["data"] = store.load()
             _cache["mtime"] = mtime
         except Exception:
             _cache["data"] = {}
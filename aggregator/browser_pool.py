@@ -0,0 +1,335 @@
+"""
+Bounded pool of headless Chrome workers for JS-heavy job pages.
+
+PageFetcher used to share one module-global WebDriver between every fetch
+thread. WebDriver is not thread-safe, so Workday / Oracle / Ashby pages
+rendered one at a time, and one crash tore the driver down for everybody.
+
+The pool owns at most `size` browsers, started lazily:
+
+    checkout()          context manager: borrow a browser, return it after.
+                        If the block raises, that browser is quit and
+                        replaced; the others keep working.
+    render(url, fn)     queue a render job, run fn(driver, url) on the next
+                        free browser, return its result.
+    submit(url, fn)     same, but returns a Future.
+
+When a browser is returned it is recycled (quit, and restarted on next use)
+after BROWSER_MAX_PAGES renders, or once chromedriver plus its Chrome
+children use more than BROWSER_MAX_RSS_MB. Queue wait and render time are
+recorded per job; stats() / log_summary() report them at the end of a run.
+
+Usage:
+    from aggregator.browser_pool import BrowserPool
+    html = BrowserPool.default().render(url, _render_page)
+    with BrowserPool.default().checkout() as browser:
+        browser.driver.get(url)
+"""
+import time
+import atexit
+import logging
+import threading
+import subprocess
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+from aggregator.config import (
+    USER_AGENTS,
+    BROWSER_POOL_SIZE,
+    BROWSER_MAX_PAGES,
+    BROWSER_MAX_RSS_MB,
+)
+
+log = logging.getLogger(__name__)
+
+_SAMPLES = 500  # recent timings kept for percentiles
+
+
+def chrome_driver():
+    """Headless Chrome configured the way PageFetcher always used it."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument(f"user-agent={USER_AGENTS[0]}")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
+    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+    driver.set_page_load_timeout(30)
+    return driver
+
+
+def process_tree_rss_mb(pid: int) -> float:
+    """Resident memory of `pid` and all its descendants, in MB (0 if unknown)."""
+    if not pid:
+        return 0.0
+    try:
+        import psutil
+        root = psutil.Process(pid)
+        procs = [root] + root.children(recursive=True)
+        return sum(p.memory_info().rss for p in procs) / (1024 * 1024)
+    except ImportError:
+        pass
+    except Exception:
+        return 0.0
+    try:
+        out = subprocess.run(["ps", "-A", "-o", "pid=,ppid=,rss="],
+                             capture_output=True, text=True, timeout=5).stdout
+    except Exception:
+        return 0.0
+    children, rss = {}, {}
+    for line in out.splitlines():
+        parts = line.split()
+        if len(parts) == 3 and all(p.isdigit() for p in parts):
+            p, pp, kb = map(int, parts)
+            children.setdefault(pp, []).append(p)
+            rss[p] = kb
+    total, stack = 0, [pid]
+    while stack:
+        p = stack.pop()
+        total += rss.get(p, 0)
+        stack.extend(children.get(p, []))
+    return total / 1024
+
+
+def _driver_pid(driver) -> int:
+    try:
+        return driver.service.process.pid
+    except Exception:
+        return 0
+
+
+class _Timings:
+    """Count / total / max plus a window of recent samples for p50/p95."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=_SAMPLES)
+
+    def add(self, sec: float):
+        self.count += 1
+        self.total += sec
+        self.max = max(self.max, sec)
+        self.recent.append(sec)
+
+    @property
+    def stats(self) -> dict:
+        ordered = sorted(self.recent)
+
+        def pct(p):
+            return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))], 2) if ordered else 0.0
+
+        return {
+            "count": self.count,
+            "avg_sec": round(self.total / self.count, 2) if self.count else 0.0,
+            "p50_sec": pct(0.50),
+            "p95_sec": pct(0.95),
+            "max_sec": round(self.max, 2),
+        }
+
+
+class BrowserWorker:
+    """One browser plus its bookkeeping."""
+
+    def __init__(self, worker_id: int, driver):
+        self.id = worker_id
+        self.driver = driver
+        self.pages = 0
+        self.started = time.time()
+
+    def rss_mb(self) -> float:
+        return process_tree_rss_mb(_driver_pid(self.driver))
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception as e:
+            log.debug(f"Browser {self.id} quit failed: {e}")
+
+
+class BrowserPool:
+    _default: Optional["BrowserPool"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, size: int = BROWSER_POOL_SIZE, max_pages: int = BROWSER_MAX_PAGES,
+                 max_rss_mb: float = BROWSER_MAX_RSS_MB, factory: Callable = chrome_driver,
+                 rss: Callable[[BrowserWorker], float] = None):
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self._factory = factory
+        self._rss = rss or (lambda w: w.rss_mb())
+        self._cond = threading.Condition()
+        self._idle: list = []
+        self._live = 0
+        self._next_id = 0
+        self._closed = False
+        self._executor = None
+        self.queue_wait = _Timings()
+        self.render_time = _Timings()
+        self.started = 0
+        self.recycled = 0
+        self.crashed = 0
+        self.failures = 0
+
+    @classmethod
+    def default(cls) -> "BrowserPool":
+        """Process-wide pool shared by every Selenium fetch path."""
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls()
+                    atexit.register(cls._default.shutdown)
+        return cls._default
+
+    # ── Checkout / return ────────────────────────────────────────────────────
+
+    def _acquire(self, timeout: float = None) -> BrowserWorker:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("browser pool is shut down")
+                if self._idle:
+                    return self._idle.pop()
+                if self._live < self.size:
+                    self._live += 1
+                    self._next_id += 1
+                    worker_id = self._next_id
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("no browser free")
+                self._cond.wait(remaining)
+        # Start the browser outside the lock — it takes seconds
+        try:
+            driver = self._factory()
+        except BaseException:
+            with self._cond:
+                self._live -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self.started += 1
+        log.info(f"Browser {worker_id} started ({self._live}/{self.size} live)")
+        return BrowserWorker(worker_id, driver)
+
+    def _release(self, worker: BrowserWorker, broken: bool = False):
+        reason = "crashed" if broken else None
+        if not broken:
+            worker.pages += 1
+            if self.max_pages and worker.pages >= self.max_pages:
+                reason = f"{worker.pages} pages"
+            elif self.max_rss_mb:
+                rss = self._rss(worker)
+                if rss > self.max_rss_mb:
+                    reason = f"{rss:.0f} MB"
+        if reason or self._closed:
+            worker.quit()
+            with self._cond:
+                self._live -= 1
+                if broken:
+                    self.crashed += 1
+                elif reason:
+                    self.recycled += 1
+                self._cond.notify()
+            if reason:
+                log.info(f"Browser {worker.id} recycled ({reason})")
+            return
+        with self._cond:
+            self._idle.append(worker)
+            self._cond.notify()
+
+    @contextmanager
+    def checkout(self, timeout: float = None):
+        """Borrow a browser; it is quit and replaced if the block raises."""
+        worker = self._acquire(timeout)
+        try:
+            yield worker
+        except BaseException:
+            self._release(worker, broken=True)
+            raise
+        self._release(worker)
+
+    # ── Render queue ─────────────────────────────────────────────────────────
+
+    def submit(self, url: str, fn: Callable) -> Future:
+        """Queue fn(driver, url) for the next free browser."""
+        with self._cond:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="browser")
+            executor = self._executor
+        return executor.submit(self._run, url, fn, time.monotonic())
+
+    def render(self, url: str, fn: Callable, timeout: float = None):
+        return self.submit(url, fn).result(timeout)
+
+    def _run(self, url: str, fn: Callable, queued_at: float):
+        with self.checkout() as worker:
+            began = time.monotonic()
+            with self._cond:
+                self.queue_wait.add(began - queued_at)
+            try:
+                return fn(worker.driver, url)
+            except BaseException:
+                with self._cond:
+                    self.failures += 1
+                raise
+            finally:
+                with self._cond:
+                    self.render_time.add(time.monotonic() - began)
+
+    # ── Metrics / lifecycle ──────────────────────────────────────────────────
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "size": self.size,
+                "live": self._live,
+                "idle": len(self._idle),
+                "started": self.started,
+                "recycled": self.recycled,
+                "crashed": self.crashed,
+                "failures": self.failures,
+                "queue_wait": self.queue_wait.stats,
+                "render": self.render_time.stats,
+            }
+
+    def log_summary(self):
+        s = self.stats()
+        if not s["render"]["count"]:
+            return
+        q, r = s["queue_wait"], s["render"]
+        log.info(
+            f"BrowserPool: {r['count']} renders ({s['failures']} failed) on {s['started']} browsers, "
+            f"{s['recycled']} recycled, {s['crashed']} crashed"
+        )
+        log.info(
+            f"  queue wait avg {q['avg_sec']:.1f}s p95 {q['p95_sec']:.1f}s max {q['max_sec']:.1f}s | "
+            f"render avg {r['avg_sec']:.1f}s p95 {r['p95_sec']:.1f}s max {r['max_sec']:.1f}s"
+        )
+
+    def shutdown(self):
+        """Quit every browser; in-flight renders finish first."""
+        with self._cond:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._live -= len(idle)
+            self._cond.notify_all()
+        for worker in idle:
+            worker.quit()
+        if idle:
+            log.info(f"Browser pool shut down ({len(idle)} browsers)")
@@ -131,6 +131,8 @@ JOBRIGHT_COOKIES_FILE = os.path.join(".local", "jobright_cookies.json")
 PROCESSED_EMAILS_FILE = os.path.join(".local", "processed_emails.json")
 FAILED_SIMPLIFY_CACHE = os.path.join(".local", "failed_simplify_urls.json")
 FAILED_URLS_FILE = os.path.join(".local", "failed_urls.json")
+# Per-feed ETag / Last-Modified and last parsed listings for the GitHub READMEs
+GITHUB_FEED_STATE_DIR = os.path.join(".local", "github_feeds")
 
 SIMPLIFY_URL = "https://raw.githubusercontent.com/SimplifyJobs/Summer2027-Internships/dev/README.md"
 VANSHB03_URL = (
@@ -184,6 +186,77 @@ MAX_RETRIES = 3
 RETRY_DELAY_SECONDS = 2
 BACKOFF_MULTIPLIER = 2
 
+# Per-host politeness: (requests/sec, burst). Matched on longest host suffix;
+# every distinct host gets its own bucket. Public board APIs tolerate far more
+# than the 1 req/sec we use for HTML job pages.
+DEFAULT_DOMAIN_RATE = (1.0, 1)
+DOMAIN_RATE_LIMITS = {
+    "boards-api.greenhouse.io": (8.0, 8),
+    "api.lever.co": (5.0, 5),
+    "api.ashbyhq.com": (5.0, 5),
+    "api.smartrecruiters.com": (4.0, 4),
+    "apply.workable.com": (2.0, 2),
+    "api.rippling.com": (4.0, 4),
+    "hacker-news.firebaseio.com": (10.0, 10),
+    "raw.githubusercontent.com": (5.0, 5),
+    "myworkdayjobs.com": (1.0, 2),
+    "greenhouse.io": (1.0, 2),
+    "lever.co": (1.0, 2),
+    "ashbyhq.com": (1.0, 2),
+    "jobright.ai": (0.5, 1),
+}
+
+# Direct ATS fan-out: global worker cap and max in-flight requests per host
+DIRECT_FETCH_MAX_WORKERS = 24
+DIRECT_FETCH_PER_HOST = 6
+
+# Direct ATS listings whose board API returned at least this much description
+# text are validated from that content; shorter ones fall back to a page fetch.
+DIRECT_CONTENT_MIN_CHARS = 300
+
+# Headless Chrome pool for JS-heavy pages (Workday, Oracle, Ashby, job-boards.greenhouse).
+# A browser is recycled after BROWSER_MAX_PAGES renders or once its process
+# tree grows past BROWSER_MAX_RSS_MB.
+BROWSER_POOL_SIZE = 3
+BROWSER_MAX_PAGES = 40
+BROWSER_MAX_RSS_MB = 1200
+
+# Fetched-page cache: memory LRU bounded by body bytes, gzip bodies on disk
+HTTP_CACHE_DIR = os.path.join(".local", "http_cache")
+HTTP_CACHE_TTL = 6 * 3600  # 6 hours
+HTTP_CACHE_NEGATIVE_TTL = 3600  # failed fetches
+HTTP_CACHE_MEMORY_BYTES = 64 * 1024 * 1024
+HTTP_CACHE_DISK_BYTES = 512 * 1024 * 1024
+
+# Gmail batch requests: messages().get calls per batch HTTP request. Gmail
+# allows 100, but rate-limits large batches; 50 stays under the per-user quota.
+GMAIL_BATCH_SIZE = 50
+
+# Pipelined run: producers list sources while a shared worker pool reads pages
+# and a writer flushes valid rows as they arrive. PIPELINE_WORKERS = 0 falls
+# back to the phased run (direct, then GitHub, then emails, one write at the end).
+PIPELINE_WORKERS = 12
+PIPELINE_QUEUE_SIZE = 200
+PIPELINE_FLUSH_ROWS = 25
+PIPELINE_FLUSH_SEC = 90
+
+# Run journal: checkpoints of processed work and unwritten jobs, so a run
+# killed by the scheduler timeout resumes instead of starting over. Journals
+# older than RUN_JOURNAL_MAX_AGE_HOURS are ignored (the listings have moved on).
+RUN_JOURNAL_FILE = os.path.join(".local", "run_journal.jsonl")
+RUN_JOURNAL_MAX_AGE_HOURS = 12
+RUN_CHECKPOINT_UNITS = 20
+RUN_CHECKPOINT_SEC = 30
+
+# Google Sheets API quota, shared by every script through SHEETS_QUOTA_FILE
+# (per-user defaults: 60 reads and 60 writes a minute). A 429 halves the rate
+# for all processes, never below SHEETS_MIN_SCALE of it.
+SHEETS_QUOTA_FILE = os.path.join(".local", "sheets_quota.json")
+SHEETS_READS_PER_MIN = 60
+SHEETS_WRITES_PER_MIN = 60
+SHEETS_MIN_SCALE = 0.2
+SHEETS_MAX_RETRIES = 5
+
 BLACKLIST_DOMAINS = ["workatastartup.com"    "youtube.com",
     "youtu.be",
 ]
@@ -0,0 +1,241 @@
+"""
+DedupIndex — thread-safe check-and-reserve for incoming jobs.
+
+UnifiedJobAggregator._is_duplicate used to hold _github_lock across the
+Brain lookup, company-name cleanup, URL normalization, the TF-IDF scan and
+the set inserts, so the 10-thread pools deduplicated one job at a time.
+Here the keys are computed first, with no lock held:
+
+    url      URLCleaner.clean_url(url)
+    job_id   "JID_" + Brain.normalize_job_id(job_id)
+    company  company with Inc./LLC/(SRA) suffixes stripped, normalized
+    ct       normalize_text(f"{company}_{title}")
+
+Only then are the locks taken. There is one stripe per hash of the
+normalized company (covering the company+title key and the fuzzy-title
+check), plus the stripes of the URL and job-ID keys. They are acquired in
+index order, so two threads never deadlock. Everything is checked, and
+only if none is a duplicate are all the keys reserved. Jobs from different
+companies with different URLs never wait on each other.
+
+The existing_* sets are shared with the aggregator, and `reserved` is its
+processing_lock set. Code that reads those sets directly keeps working.
+
+Usage:
+    index = DedupIndex(existing_jobs, existing_urls, existing_job_ids, processing_lock)
+    dup = index.check_and_reserve(company, title, url, job_id)
+    if dup:
+        outcomes[dup.outcome] += 1
+"""
+import re
+import logging
+import threading
+from contextlib import ExitStack
+from typing import NamedTuple, Optional
+
+from aggregator.utils import URLCleaner
+
+log = logging.getLogger(__name__)
+
+STRIPES = 64
+FUZZY_THRESHOLD = 0.90
+
+_SUFFIX_RE = re.compile(r",?\s*(Inc\.?|LLC|Ltd\.?|Corp\.?|L\.?P\.?)\s*$", re.I)
+_PAREN_RE = re.compile(r"\s*\([^)]+\)\s*$")
+
+
+class DedupKeys(NamedTuple):
+    url: str
+    job_id: str      # "JID_<normalized>" or "" when the job has no usable ID
+    company: str     # normalized company, the stripe key
+    ct: str          # normalized company+title
+
+
+class Duplicate(NamedTuple):
+    outcome: str     # key into UnifiedJobAggregator.outcomes
+    label: str       # short tag for the DUPLICATE (...) log line
+    match: object = None  # SimilarityMatch for fuzzy duplicates
+
+
+def _usable_job_id(job_id) -> bool:
+    return bool(job_id) and job_id not in ("N/A", "") and not job_id.startswith("HASH_")
+
+
+def clean_company(company: str) -> str:
+    """Strip Inc./LLC/Ltd./Corp./L.P. and a trailing (SRA)-style tag."""
+    co = _SUFFIX_RE.sub("", company or "").strip()
+    return _PAREN_RE.sub("", co).strip()
+
+
+class DedupIndex:
+    def __init__(self, jobs: set, urls: set, job_ids: set, reserved: set = None,
+                 brain=None, stripes: int = STRIPES):
+        self.jobs = jobs
+        self.urls = urls
+        self.job_ids = job_ids
+        self.reserved = reserved if reserved is not None else set()
+        self._brain = brain
+        self._stripes = [threading.Lock() for _ in range(stripes)]
+        self._similarity = None
+        self._similarity_lock = threading.Lock()
+
+    def _registry(self):
+        if self._brain is None:
+            from outreach.brain import Brain
+            self._brain = Brain.get()
+        return self._brain
+
+    # ── Pure computation (no locks) ──────────────────────────────────────────
+
+    def keys(self, company: str, title: str, url: str, job_id: str = "N/A") -> DedupKeys:
+        nid = ""
+        if _usable_job_id(job_id):
+            try:
+                nid = self._registry().normalize_job_id(job_id)
+            except Exception:
+                nid = ""
+        co = clean_company(company)
+        return DedupKeys(
+            url=URLCleaner.clean_url(url),
+            job_id=f"JID_{nid}" if nid else "",
+            company=URLCleaner.normalize_text(co),
+            ct=URLCleaner.normalize_text(f"{co}_{title}"),
+        )
+
+    def _stripe(self, key: str) -> int:
+        return hash(key) % len(self._stripes)
+
+    def _locked(self, keys: DedupKeys) -> ExitStack:
+        stack = ExitStack()
+        wanted = {self._stripe(keys.company), self._stripe(keys.url)}
+        if keys.job_id:
+            wanted.add(self._stripe(keys.job_id))
+        for i in sorted(wanted):
+            stack.enter_context(self._stripes[i])
+        return stack
+
+    # ── Fuzzy title index ────────────────────────────────────────────────────
+
+    def _engine(self):
+        """TitleSimilarity seeded from the sheet keys; caller holds _similarity_lock."""
+        if self._similarity is None:
+            from analytics.similarity import TitleSimilarity
+            engine = TitleSimilarity()
+            for existing in list(self.jobs):
+                parts = existing.split("_", 1)
+                if len(parts) == 2:
+                    engine.add(parts[1], company=parts[0])
+            self._similarity = engine
+        return self._similarity
+
+    def _fuzzy_match(self, company: str, title: str):
+        try:
+            with self._similarity_lock:
+                return self._engine().is_near_duplicate(title, company=company, threshold=FUZZY_THRESHOLD)
+        except Exception:
+            return None
+
+    def _remember_title(self, company: str, title: str):
+        try:
+            with self._similarity_lock:
+                self._engine().add(title, company=company)
+        except Exception:
+            pass
+
+    # ── Check-and-reserve ────────────────────────────────────────────────────
+
+    def is_known_url(self, url: str) -> bool:
+        clean = URLCleaner.clean_url(url)
+        return clean in self.urls or clean in self.reserved
+
+    def check_and_reserve(self, company: str, title: str, url: str,
+                          job_id: str = "N/A") -> Optional[Duplicate]:
+        """None if the job is new (its keys are now reserved), else why it's a duplicate."""
+        if _usable_job_id(job_id):
+            try:
+                if self._registry().is_duplicate_job_id(job_id, company, title):
+                    return Duplicate("skipped_duplicate_job_id", "job_id")
+            except Exception:
+                pass
+        keys = self.keys(company, title, url, job_id)
+
+        with self._locked(keys):
+            # Run-scoped job_id lock: catch same ID arriving twice in one run
+            # (e.g. ByteDance jobs.bytedance.com vs joinbytedance.com share a numeric ID)
+            if keys.job_id and keys.job_id in self.reserved:
+                return Duplicate("skipped_duplicate_job_id", "job_id run")
+            if keys.url in self.urls or keys.url in self.reserved:
+                return Duplicate("skipped_duplicate_url", "url")
+            if keys.ct in self.jobs or keys.ct in self.reserved:
+                return Duplicate("skipped_duplicate_company_title", "company+title")
+            if _usable_job_id(job_id) and job_id.lower() in self.job_ids:
+                return Duplicate("skipped_duplicate_job_id", "job_id2")
+            # TF-IDF fuzzy dedup: catch near-duplicates like
+            # "Software Engineering Intern" vs "Software Engineer - Intern"
+            match = self._fuzzy_match(company, title)
+            if match:
+                return Duplicate("skipped_duplicate_fuzzy", "fuzzy", match)
+            self._remember_title(company, title)
+            if keys.job_id:
+                self.reserved.add(keys.job_id)
+            self.reserved.add(keys.ct)
+            self.reserved.add(keys.url)
+        return None
+
+    def restore(self, company: str, title: str, url: str, job_id: str = "N/A") -> bool:
+        """Reserve a job carried over from an interrupted run. False if the
+        sheet already has it (the interrupted run got as far as writing it)."""
+        keys = self.keys(company, title, url, job_id)
+        with self._locked(keys):
+            if keys.ct in self.jobs or keys.ct in self.reserved:
+                return False
+            if keys.job_id:
+                self.reserved.add(keys.job_id)
+            self.reserved.add(keys.ct)
+            if url.startswith("http"):
+                self.reserved.add(keys.url)
+        self._remember_title(keys.company, title)
+        return True
+
+
+class ClaimSet:
+    """Listings a higher-priority source will process later in the same run.
+
+    The pipelined run reads GitHub pages while direct ATS jobs are still
+    queued. Direct listings are claimed as soon as they are listed. A GitHub
+    listing that matches a claim is dropped before its page is fetched, so
+    the direct copy always wins. This is the same outcome the phased run got
+    by reading every direct page first.
+    """
+
+    def __init__(self):
+        self._urls = set()
+        self._cts = set()
+        self._similarity = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._urls)
+
+    def add(self, company: str, title: str, url: str):
+        co = clean_company(company)
+        with self._lock:
+            self._urls.add(URLCleaner.clean_url(url))
+            self._cts.add(URLCleaner.normalize_text(f"{co}_{title}"))
+            if self._similarity is None:
+                from analytics.similarity import TitleSimilarity
+                self._similarity = TitleSimilarity()
+            self._similarity.add(title, company=URLCleaner.normalize_text(co))
+
+    def match(self, company: str, title: str, url: str) -> Optional[str]:
+        """'url' / 'company+title' / 'fuzzy' if a claimed listing matches, else None."""
+        co = clean_company(company)
+        with self._lock:
+            if URLCleaner.clean_url(url) in self._urls:
+                return "url"
+            if URLCleaner.normalize_text(f"{co}_{title}") in self._cts:
+                return "company+title"
+            if self._similarity is not None and self._similarity.is_near_duplicate(
+                    title, company=URLCleaner.normalize_text(co), threshold=FUZZY_THRESHOLD):
+                return "fuzzy"
+        return None
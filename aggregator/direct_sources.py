@@ -2,8 +2,13 @@
 Direct ATS API sources — Greenhouse, Lever, Ashby, Hacker News.
 Pulls intern/new-grad jobs directly from company career page APIs.
 Zero errors, real URLs, correct company names.
+
+Greenhouse, Lever and Ashby listings also carry the posting description
+and structured fields (see listing_page), so their jobs are validated
+without fetching the job page.
 """
 
+import html
 import json
 import logging
 import re
@@ -12,6 +17,10 @@ import urllib.request
 import ssl
 from typing import List, Dict, Optional
 
+from aggregator.config import DIRECT_FETCH_MAX_WORKERS, DIRECT_FETCH_PER_HOST
+from aggregator.fanout import FanOutEngine, FetchTask
+from aggregator.rate_limiter import DomainRateLimiter
+
 log = logging.getLogger(__name__)
 
 # SSL context for HTTPS requests
@@ -186,6 +195,7 @@ _SENIOR_KW = re.compile(
 def _fetch_json(url: str, timeout: int = 5) -> Optional[dict]:
     """Fetch JSON from URL, return None on failure."""
     try:
+        DomainRateLimiter.default().acquire(url)
         req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
         resp = urllib.request.urlopen(req, timeout=timeout, context=_CTX)
         return json.loads(resp.read())
@@ -203,113 +213,209 @@ def _is_intern_or_newgrad(title: str) -> bool:
     return not _SENIOR_KW.search(title)
 
 
+_WORKPLACE = {
+    "remote": "Remote", "Remote": "Remote",
+    "hybrid": "Hybrid", "Hybrid": "Hybrid",
+    "onsite": "On-site", "on-site": "On-site", "OnSite": "On-site",
+}
+
+
+def _iso_date(value) -> str:
+    """YYYY-MM-DD from an ISO timestamp or epoch milliseconds ("" if neither)."""
+    if isinstance(value, (int, float)) and value > 0:
+        return time.strftime("%Y-%m-%d", time.gmtime(value / 1000))
+    if isinstance(value, str) and re.match(r"\d{4}-\d{2}-\d{2}", value):
+        return value[:10]
+    return ""
+
+
 # ═══════════════════════════════════════════════════════════════════
 # GREENHOUSE
 # ═══════════════════════════════════════════════════════════════════
 
-def scrape_greenhouse() -> List[Dict]:
-    """Fetch intern/new-grad jobs from all Greenhouse company boards."""
+def _greenhouse_board(slug: str, company_name: str) -> List[Dict]:
+    """Fetch one Greenhouse board."""
     jobs = []
-    for slug, company_name in GREENHOUSE_COMPANIES.items():
-        data = _fetch_json(f"https://boards-api.greenhouse.io/v1/boards/{slug}/jobs")
-        if not data:
+    data = _fetch_json(f"https://boards-api.greenhouse.io/v1/boards/{slug}/jobs?content=true", timeout=10)
+    if not data:
+        return jobs
+    for job in data.get("jobs", []):
+        title = job.get("title", "")
+        if not _is_intern_or_newgrad(title):
             continue
-        for job in data.get("jobs", []):
-            title = job.get("title", "")
-            if not _is_intern_or_newgrad(title):
-                continue
-            # Extract location
-            location = "Unknown"
-            loc_data = job.get("location", {})
-            if isinstance(loc_data, dict):
-                location = loc_data.get("name", "Unknown")
-            elif isinstance(loc_data, str):
-                location = loc_data
-            url = job.get("absolute_url", "")
-            job_id = str(job.get("id", "N/A"))
-            jobs.append({
-                "company": company_name,
-                "title": title,
-                "location": location,
-                "url": url,
-                "job_id": job_id,
-                "source": "greenhouse_direct",
-                "age": "0d",
-                "is_closed": False,
-            })
+        # Extract location
+        location = "Unknown"
+        loc_data = job.get("location", {})
+        if isinstance(loc_data, dict):
+            location = loc_data.get("name", "Unknown")
+        elif isinstance(loc_data, str):
+            location = loc_data
+        url = job.get("absolute_url", "")
+        job_id = str(job.get("id", "N/A"))
+        jobs.append({
+            "company": company_name,
+            "title": title,
+            "location": location,
+            "url": url,
+            "job_id": job_id,
+            "source": "greenhouse_direct",
+            "age": "0d",
+            "is_closed": False,
+            # content=true returns the body HTML-escaped
+            "description_html": html.unescape(job.get("content") or ""),
+            "posted_at": _iso_date(job.get("first_published") or job.get("updated_at")),
+            "department": ", ".join(d.get("name", "") for d in job.get("departments") or [] if d.get("name")),
+        })
+    return jobs
+
+
+def _greenhouse_tasks() -> List[FetchTask]:
+    return [FetchTask("Greenhouse", "boards-api.greenhouse.io", _greenhouse_board, (slug, name))
+            for slug, name in GREENHOUSE_COMPANIES.items()]
+
+
+def _greenhouse_finish(jobs: List[Dict]) -> List[Dict]:
     log.info(f"Greenhouse direct: {len(jobs)} jobs from {len(GREENHOUSE_COMPANIES)} companies")
     return jobs
 
 
+def scrape_greenhouse() -> List[Dict]:
+    """Fetch intern/new-grad jobs from all Greenhouse company boards."""
+    return _scrape_source("Greenhouse")
+
+
 # ═══════════════════════════════════════════════════════════════════
 # LEVER
 # ═══════════════════════════════════════════════════════════════════
 
-def scrape_lever() -> List[Dict]:
-    """Fetch intern/new-grad jobs from all Lever company boards."""
+def _lever_board(slug: str, company_name: str) -> List[Dict]:
+    """Fetch one Lever board."""
     jobs = []
-    for slug, company_name in LEVER_COMPANIES.items():
-        data = _fetch_json(f"https://api.lever.co/v0/postings/{slug}?mode=json")
-        if not data or not isinstance(data, list):
+    data = _fetch_json(f"https://api.lever.co/v0/postings/{slug}?mode=json")
+    if not data or not isinstance(data, list):
+        return jobs
+    for job in data:
+        title = job.get("text", "")
+        if not _is_intern_or_newgrad(title):
             continue
-        for job in data:
-            title = job.get("text", "")
-            if not _is_intern_or_newgrad(title):
-                continue
-            location = "Unknown"
-            categories = job.get("categories", {})
-            if isinstance(categories, dict):
-                location = categories.get("location", "Unknown")
-            url = job.get("hostedUrl", "") or job.get("applyUrl", "")
-            jobs.append({
-                "company": company_name,
-                "title": title,
-                "location": location,
-                "url": url,
-                "job_id": "N/A",
-                "source": "lever_direct",
-                "age": "0d",
-                "is_closed": False,
-            })
+        categories = job.get("categories") or {}
+        if not isinstance(categories, dict):
+            categories = {}
+        location = categories.get("location", "Unknown")
+        url = job.get("hostedUrl", "") or job.get("applyUrl", "")
+        jobs.append({
+            "company": company_name,
+            "title": title,
+            "location": location,
+            "url": url,
+            "job_id": "N/A",
+            "source": "lever_direct",
+            "age": "0d",
+            "is_closed": False,
+            "description_html": _lever_description(job),
+            "posted_at": _iso_date(job.get("createdAt")),
+            "department": categories.get("team") or categories.get("department") or "",
+            "employment_type": categories.get("commitment") or "",
+            "compensation": _lever_salary(job),
+            "workplace": _WORKPLACE.get(job.get("workplaceType", ""), ""),
+        })
+    return jobs
+
+
+def _lever_description(job: Dict) -> str:
+    """Lever splits a posting into an opening, titled lists and a closing."""
+    parts = [job.get("description") or ""]
+    for section in job.get("lists") or []:
+        parts.append(f"<h3>{html.escape(section.get('text', ''))}</h3><ul>{section.get('content', '')}</ul>")
+    parts.append(job.get("additional") or "")
+    return "".join(parts)
+
+
+def _lever_salary(job: Dict) -> str:
+    rng = job.get("salaryRange")
+    if isinstance(rng, dict) and rng.get("min"):
+        interval = {"per-hour-wage": "/hr", "per-year-salary": "/yr", "per-month-salary": "/month"}
+        unit = "$" if rng.get("currency", "USD") == "USD" else f"{rng['currency']} "
+        return (f"{unit}{rng['min']:,} - {unit}{rng.get('max') or rng['min']:,}"
+                f"{interval.get(rng.get('interval', ''), '')}")
+    return job.get("salaryDescriptionPlain") or ""
+
+
+def _lever_tasks() -> List[FetchTask]:
+    return [FetchTask("Lever", "api.lever.co", _lever_board, (slug, name))
+            for slug, name in LEVER_COMPANIES.items()]
+
+
+def _lever_finish(jobs: List[Dict]) -> List[Dict]:
     log.info(f"Lever direct: {len(jobs)} jobs from {len(LEVER_COMPANIES)} companies")
     return jobs
 
 
+def scrape_lever() -> List[Dict]:
+    """Fetch intern/new-grad jobs from all Lever company boards."""
+    return _scrape_source("Lever")
+
+
 # ═══════════════════════════════════════════════════════════════════
 # ASHBY
 # ═══════════════════════════════════════════════════════════════════
 
-def scrape_ashby() -> List[Dict]:
-    """Fetch intern/new-grad jobs from all Ashby company boards."""
+def _ashby_board(slug: str, company_name: str) -> List[Dict]:
+    """Fetch one Ashby board."""
     jobs = []
-    for slug, company_name in ASHBY_COMPANIES.items():
-        data = _fetch_json(f"https://api.ashbyhq.com/posting-api/job-board/{slug}")
-        if not data:
+    data = _fetch_json(f"https://api.ashbyhq.com/posting-api/job-board/{slug}?includeCompensation=true", timeout=10)
+    if not data:
+        return jobs
+    for job in data.get("jobs", []):
+        title = job.get("title", "")
+        if not _is_intern_or_newgrad(title):
             continue
-        for job in data.get("jobs", []):
-            title = job.get("title", "")
-            if not _is_intern_or_newgrad(title):
-                continue
-            location = "Unknown"
-            if job.get("location"):
-                location = job["location"]
-            elif job.get("locationName"):
-                location = job["locationName"]
-            url = job.get("jobUrl", "") or f"https://jobs.ashbyhq.com/{slug}/{job.get('id', '')}"
-            jobs.append({
-                "company": company_name,
-                "title": title,
-                "location": location,
-                "url": url,
-                "job_id": "N/A",
-                "source": "ashby_direct",
-                "age": "0d",
-                "is_closed": False,
-            })
+        location = "Unknown"
+        if job.get("location"):
+            location = job["location"]
+        elif job.get("locationName"):
+            location = job["locationName"]
+        url = job.get("jobUrl", "") or f"https://jobs.ashbyhq.com/{slug}/{job.get('id', '')}"
+        jobs.append({
+            "company": company_name,
+            "title": title,
+            "location": location,
+            "url": url,
+            "job_id": "N/A",
+            "source": "ashby_direct",
+            "age": "0d",
+            "is_closed": False,
+            "description_html": job.get("descriptionHtml") or "",
+            "posted_at": _iso_date(job.get("publishedAt")),
+            "department": job.get("department") or job.get("team") or "",
+            "employment_type": job.get("employmentType") or "",
+            "compensation": _ashby_compensation(job),
+            "workplace": _WORKPLACE.get(job.get("workplaceType") or "", "Remote" if job.get("isRemote") else ""),
+        })
+    return jobs
+
+
+def _ashby_compensation(job: Dict) -> str:
+    comp = job.get("compensation") or {}
+    return (comp.get("scrapeableCompensationSalarySummary")
+            or comp.get("compensationTierSummary") or "")
+
+
+def _ashby_tasks() -> List[FetchTask]:
+    return [FetchTask("Ashby", "api.ashbyhq.com", _ashby_board, (slug, name))
+            for slug, name in ASHBY_COMPANIES.items()]
+
+
+def _ashby_finish(jobs: List[Dict]) -> List[Dict]:
     log.info(f"Ashby direct: {len(jobs)} jobs from {len(ASHBY_COMPANIES)} companies")
     return jobs
 
 
+def scrape_ashby() -> List[Dict]:
+    """Fetch intern/new-grad jobs from all Ashby company boards."""
+    return _scrape_source("Ashby")
+
+
 # ═══════════════════════════════════════════════════════════════════
 # HACKER NEWS "WHO IS HIRING"
 # ═══════════════════════════════════════════════════════════════════
@@ -468,62 +574,73 @@ WORKDAY_COMPANIES = {
     "Boeing": ("boeing.wd1.myworkdayjobs.com", "boeing", "external_careers"),
 }
 
-def scrape_workday() -> List[Dict]:
-    """Fetch intern/new-grad jobs from Workday company search APIs."""
+_WORKDAY_QUERIES = ["software engineer intern", "data science intern", "machine learning intern"]
+
+
+def _workday_search(company_name: str, domain: str, tenant: str, site: str, query: str) -> List[Dict]:
+    """Run one search query against one Workday company."""
     jobs = []
-    for company_name, (domain, tenant, site) in WORKDAY_COMPANIES.items():
-        for query in ["software engineer intern", "data science intern", "machine learning intern"]:
-            url = f"https://{domain}/wday/cxs/{tenant}/{site}/jobs"
-            payload = json.dumps({
-                "appliedFacets": {},
-                "limit": 20,
-                "offset": 0,
-                "searchText": query,
-            }).encode()
-            try:
-                req = urllib.request.Request(url,
-                    data=payload,
-                    headers={"User-Agent": "Mozilla/5.0", "Content-Type": "application/json"},
-                    method="POST")
-                resp = urllib.request.urlopen(req, timeout=10, context=_CTX)
-                data = json.loads(resp.read())
-            except Exception:
-                continue
+    url = f"https://{domain}/wday/cxs/{tenant}/{site}/jobs"
+    payload = json.dumps({
+        "appliedFacets": {},
+        "limit": 20,
+        "offset": 0,
+        "searchText": query,
+    }).encode()
+    try:
+        DomainRateLimiter.default().acquire(url)
+        req = urllib.request.Request(url,
+            data=payload,
+            headers={"User-Agent": "Mozilla/5.0", "Content-Type": "application/json"},
+            method="POST")
+        resp = urllib.request.urlopen(req, timeout=10, context=_CTX)
+        data = json.loads(resp.read())
+    except Exception:
+        return jobs
 
-            for posting in data.get("jobPostings", []):
-                title = posting.get("title", "")
-                if not _is_intern_or_newgrad(title):
-                    continue
+    for posting in data.get("jobPostings", []):
+        title = posting.get("title", "")
+        if not _is_intern_or_newgrad(title):
+            continue
 
-                # Build URL
-                external_path = posting.get("externalPath", "")
-                job_url = f"https://{domain}{external_path}" if external_path else ""
+        # Build URL
+        external_path = posting.get("externalPath", "")
+        job_url = f"https://{domain}{external_path}" if external_path else ""
+
+        # Location
+        loc_parts = []
+        if posting.get("locationsText"):
+            loc_parts.append(posting["locationsText"])
+        location = ", ".join(loc_parts) if loc_parts else "Unknown"
+
+        # Job ID from bulletFields
+        job_id = "N/A"
+        for field in posting.get("bulletFields", []):
+            if field and re.match(r"^[A-Z0-9_-]{4,20}$", str(field)):
+                job_id = str(field)
+                break
+
+        jobs.append({
+            "company": company_name,
+            "title": title,
+            "location": location,
+            "url": job_url,
+            "job_id": job_id,
+            "source": "workday_direct",
+            "age": "0d",
+            "is_closed": False,
+        })
+    return jobs
 
-                # Location
-                loc_parts = []
-                if posting.get("locationsText"):
-                    loc_parts.append(posting["locationsText"])
-                location = ", ".join(loc_parts) if loc_parts else "Unknown"
 
-                # Job ID from bulletFields
-                job_id = "N/A"
-                for field in posting.get("bulletFields", []):
-                    if field and re.match(r"^[A-Z0-9_-]{4,20}$", str(field)):
-                        job_id = str(field)
-                        break
+def _workday_tasks() -> List[FetchTask]:
+    return [FetchTask("Workday", domain, _workday_search, (company_name, domain, tenant, site, query))
+            for company_name, (domain, tenant, site) in WORKDAY_COMPANIES.items()
+            for query in _WORKDAY_QUERIES]
 
-                jobs.append({
-                    "company": company_name,
-                    "title": title,
-                    "location": location,
-                    "url": job_url,
-                    "job_id": job_id,
-                    "source": "workday_direct",
-                    "age": "0d",
-                    "is_closed": False,
-                })
 
-    # Dedup by company+title
+def _dedup_company_title(jobs: List[Dict]) -> List[Dict]:
+    """Dedup by company+title, keeping first occurrence."""
     seen = set()
     unique = []
     for j in jobs:
@@ -531,11 +648,20 @@ def scrape_workday() -> List[Dict]:
         if key not in seen:
             seen.add(key)
             unique.append(j)
+    return unique
+
 
+def _workday_finish(jobs: List[Dict]) -> List[Dict]:
+    unique = _dedup_company_title(jobs)
     log.info(f"Workday direct: {len(unique)} jobs from {len(WORKDAY_COMPANIES)} companies")
     return unique
 
 
+def scrape_workday() -> List[Dict]:
+    """Fetch intern/new-grad jobs from Workday company search APIs."""
+    return _scrape_source("Workday")
+
+
 # ═══════════════════════════════════════════════════════════════════
 # SMARTRECRUITERS API
 # ═══════════════════════════════════════════════════════════════════
@@ -551,136 +677,170 @@ SMARTRECRUITERS_COMPANIES = {
     "ServiceNow": "ServiceNow",
 }
 
-def scrape_smartrecruiters() -> List[Dict]:
-    """Fetch intern/new-grad jobs from SmartRecruiters company APIs."""
-    jobs = []
-    for company_id, company_name in SMARTRECRUITERS_COMPANIES.items():
-        for query in ["intern", "co-op", "new grad", "entry level", "junior"]:
-            data = _fetch_json(
-                f"https://api.smartrecruiters.com/v1/companies/{company_id}/postings?limit=50&q={query}",
-                timeout=8
-            )
-            if not data or not data.get("content"):
-                continue
+_SMARTRECRUITERS_QUERIES = ["intern", "co-op", "new grad", "entry level", "junior"]
 
-            for posting in data["content"]:
-                title = posting.get("name", "")
-                if not _is_intern_or_newgrad(title):
-                    continue
 
-                # Location
-                loc = posting.get("location", {})
-                city = loc.get("city", "")
-                region = loc.get("region", "")
-                country = loc.get("country", "")
-                if country and country.upper() != "US":
-                    continue  # US only
-                location = f"{city}, {region}" if city and region else city or region or "Unknown"
+def _smartrecruiters_search(company_id: str, company_name: str, query: str) -> List[Dict]:
+    """Run one search query against one SmartRecruiters company."""
+    jobs = []
+    data = _fetch_json(
+        f"https://api.smartrecruiters.com/v1/companies/{company_id}/postings?limit=50&q={query}",
+        timeout=8
+    )
+    if not data or not data.get("content"):
+        return jobs
 
-                # URL
-                job_url = posting.get("ref", "")
-                if not job_url:
-                    pid = posting.get("id", "")
-                    job_url = f"https://jobs.smartrecruiters.com/{company_id}/{pid}" if pid else ""
+    for posting in data["content"]:
+        title = posting.get("name", "")
+        if not _is_intern_or_newgrad(title):
+            continue
 
-                job_id = posting.get("id", "N/A")
+        # Location
+        loc = posting.get("location", {})
+        city = loc.get("city", "")
+        region = loc.get("region", "")
+        country = loc.get("country", "")
+        if country and country.upper() != "US":
+            continue  # US only
+        location = f"{city}, {region}" if city and region else city or region or "Unknown"
+
+        # URL
+        job_url = posting.get("ref", "")
+        if not job_url:
+            pid = posting.get("id", "")
+            job_url = f"https://jobs.smartrecruiters.com/{company_id}/{pid}" if pid else ""
+
+        job_id = posting.get("id", "N/A")
+
+        jobs.append({
+            "company": company_name,
+            "title": title,
+            "location": location,
+            "url": job_url,
+            "job_id": str(job_id),
+            "source": "smartrecruiters_direct",
+            "age": "0d",
+            "is_closed": False,
+        })
+    return jobs
 
-                jobs.append({
-                    "company": company_name,
-                    "title": title,
-                    "location": location,
-                    "url": job_url,
-                    "job_id": str(job_id),
-                    "source": "smartrecruiters_direct",
-                    "age": "0d",
-                    "is_closed": False,
-                })
 
-    # Dedup
-    seen = set()
-    unique = []
-    for j in jobs:
-        key = re.sub(r"[^a-z0-9]", "", f"{j['company']}_{j['title']}".lower())
-        if key not in seen:
-            seen.add(key)
-            unique.append(j)
+def _smartrecruiters_tasks() -> List[FetchTask]:
+    return [FetchTask("SmartRecruiters", "api.smartrecruiters.com", _smartrecruiters_search,
+                      (company_id, company_name, query))
+            for company_id, company_name in SMARTRECRUITERS_COMPANIES.items()
+            for query in _SMARTRECRUITERS_QUERIES]
+
 
+def _smartrecruiters_finish(jobs: List[Dict]) -> List[Dict]:
+    unique = _dedup_company_title(jobs)
     log.info(f"SmartRecruiters direct: {len(unique)} jobs from {len(SMARTRECRUITERS_COMPANIES)} companies")
     return unique
 
 
+def scrape_smartrecruiters() -> List[Dict]:
+    """Fetch intern/new-grad jobs from SmartRecruiters company APIs."""
+    return _scrape_source("SmartRecruiters")
+
+
 WORKABLE_COMPANIES = {}
 
 
-def scrape_workable() -> List[Dict]:
-    """Fetch intern/new-grad jobs from Workable company boards."""
+def _workable_board(slug: str, company_name: str) -> List[Dict]:
+    """Fetch one Workable board."""
     jobs = []
-    for slug, company_name in WORKABLE_COMPANIES.items():
-        data = _fetch_json(
-            f"https://apply.workable.com/api/v1/widget/accounts/{slug}?details=true",
-            timeout=8,
-        )
-        if not data:
+    data = _fetch_json(
+        f"https://apply.workable.com/api/v1/widget/accounts/{slug}?details=true",
+        timeout=8,
+    )
+    if not data:
+        return jobs
+    for job in data.get("jobs", []):
+        title = job.get("title", "")
+        if not _is_intern_or_newgrad(title):
             continue
-        for job in data.get("jobs", []):
-            title = job.get("title", "")
-            if not _is_intern_or_newgrad(title):
-                continue
-            location = job.get("location") or "Unknown"
-            if isinstance(location, dict):
-                city = location.get("city", "")
-                region = location.get("region", "")
-                location = ", ".join([x for x in (city, region) if x]) or "Unknown"
-            url = job.get("url") or job.get("application_url") or ""
-            if not url and job.get("shortcode"):
-                url = f"https://apply.workable.com/{slug}/j/{job['shortcode']}/"
-            jobs.append({
-                "company": company_name,
-                "title": title,
-                "location": location,
-                "url": url,
-                "job_id": str(job.get("shortcode", "N/A")),
-                "source": "workable_direct",
-                "age": "0d",
-                "is_closed": False,
-            })
+        location = job.get("location") or "Unknown"
+        if isinstance(location, dict):
+            city = location.get("city", "")
+            region = location.get("region", "")
+            location = ", ".join([x for x in (city, region) if x]) or "Unknown"
+        url = job.get("url") or job.get("application_url") or ""
+        if not url and job.get("shortcode"):
+            url = f"https://apply.workable.com/{slug}/j/{job['shortcode']}/"
+        jobs.append({
+            "company": company_name,
+            "title": title,
+            "location": location,
+            "url": url,
+            "job_id": str(job.get("shortcode", "N/A")),
+            "source": "workable_direct",
+            "age": "0d",
+            "is_closed": False,
+        })
+    return jobs
+
+
+def _workable_tasks() -> List[FetchTask]:
+    return [FetchTask("Workable", "apply.workable.com", _workable_board, (slug, name))
+            for slug, name in WORKABLE_COMPANIES.items()]
+
+
+def _workable_finish(jobs: List[Dict]) -> List[Dict]:
     log.info(f"Workable direct: {len(jobs)} jobs from {len(WORKABLE_COMPANIES)} companies")
     return jobs
 
 
+def scrape_workable() -> List[Dict]:
+    """Fetch intern/new-grad jobs from Workable company boards."""
+    return _scrape_source("Workable")
+
+
 RIPPLING_COMPANIES = {}
 
 
-def scrape_rippling() -> List[Dict]:
-    """Fetch jobs from Rippling ATS company boards."""
+def _rippling_board(slug: str, company_name: str) -> List[Dict]:
+    """Fetch one Rippling board."""
     jobs = []
-    for slug, company_name in RIPPLING_COMPANIES.items():
-        data = _fetch_json(
-            f"https://api.rippling.com/platform/api/ats/v1/board/{slug}/jobs",
-            timeout=8,
-        )
-        if not isinstance(data, list):
+    data = _fetch_json(
+        f"https://api.rippling.com/platform/api/ats/v1/board/{slug}/jobs",
+        timeout=8,
+    )
+    if not isinstance(data, list):
+        return jobs
+    for job in data:
+        title = job.get("name", "")
+        if not _is_intern_or_newgrad(title):
             continue
-        for job in data:
-            title = job.get("name", "")
-            if not _is_intern_or_newgrad(title):
-                continue
-            loc = job.get("workLocation") or {}
-            location = loc.get("label") or "Unknown" if isinstance(loc, dict) else "Unknown"
-            jobs.append({
-                "company": company_name,
-                "title": title,
-                "location": location,
-                "url": job.get("url", ""),
-                "job_id": str(job.get("uuid", "N/A")),
-                "source": "rippling_direct",
-                "age": "0d",
-                "is_closed": False,
-            })
+        loc = job.get("workLocation") or {}
+        location = loc.get("label") or "Unknown" if isinstance(loc, dict) else "Unknown"
+        jobs.append({
+            "company": company_name,
+            "title": title,
+            "location": location,
+            "url": job.get("url", ""),
+            "job_id": str(job.get("uuid", "N/A")),
+            "source": "rippling_direct",
+            "age": "0d",
+            "is_closed": False,
+        })
+    return jobs
+
+
+def _rippling_tasks() -> List[FetchTask]:
+    return [FetchTask("Rippling", "api.rippling.com", _rippling_board, (slug, name))
+            for slug, name in RIPPLING_COMPANIES.items()]
+
+
+def _rippling_finish(jobs: List[Dict]) -> List[Dict]:
     log.info(f"Rippling direct: {len(jobs)} jobs from {len(RIPPLING_COMPANIES)} companies")
     return jobs
 
 
+def scrape_rippling() -> List[Dict]:
+    """Fetch jobs from Rippling ATS company boards."""
+    return _scrape_source("Rippling")
+
+
 WORKDAY_TENANTS = {}
 
 
@@ -690,6 +850,7 @@ def _workday_fetch(tenant, wd, site, query, limit=20):
     url = f"https://{tenant}.{wd}.myworkdayjobs.com/wday/cxs/{tenant}/{site}/jobs"
     body = {"appliedFacets": {}, "limit": limit, "offset": 0, "searchText": query}
     try:
+        DomainRateLimiter.default().acquire(url)
         r = _rq.post(url, json=body, timeout=12, headers={
             "User-Agent": "Mozilla/5.0",
             "Content-Type": "application/json",
@@ -703,52 +864,68 @@ def _workday_fetch(tenant, wd, site, query, limit=20):
         return None
 
 
-def scrape_workday_tenants() -> List[Dict]:
-    """Fetch entry-level jobs from discovered Workday tenants."""
+_WORKDAY_TENANT_QUERIES = ["software engineer", "intern", "new grad", "data engineer"]
+
+
+def _workday_tenant_board(tenant: str, wd: str, site: str, company_name: str) -> List[Dict]:
+    """Run every tenant query against one discovered Workday tenant."""
     jobs = []
-    queries = ["software engineer", "intern", "new grad", "data engineer"]
+    seen_paths = set()
+    for q in _WORKDAY_TENANT_QUERIES:
+        posts = _workday_fetch(tenant, wd, site, q)
+        if not posts:
+            continue
+        for jp in posts:
+            title = jp.get("title", "")
+            path = jp.get("externalPath", "")
+            if not title or not path or path in seen_paths:
+                continue
+            if not _is_intern_or_newgrad(title):
+                continue
+            seen_paths.add(path)
+            loc = jp.get("locationsText", "Unknown")
+            bullets = jp.get("bulletFields") or []
+            jobs.append({
+                "company": company_name,
+                "title": title,
+                "location": loc,
+                "url": f"https://{tenant}.{wd}.myworkdayjobs.com/{site}{path}",
+                "job_id": str(bullets[0]) if bullets else "N/A",
+                "source": "workday_tenant",
+                "age": "0d",
+                "is_closed": False,
+            })
+    return jobs
+
+
+def _workday_tenant_tasks() -> List[FetchTask]:
+    tasks = []
     for key, company_name in WORKDAY_TENANTS.items():
         try:
             tenant, wd, site = key.split("|")
         except ValueError:
             continue
-        seen_paths = set()
-        for q in queries:
-            posts = _workday_fetch(tenant, wd, site, q)
-            if not posts:
-                continue
-            for jp in posts:
-                title = jp.get("title", "")
-                path = jp.get("externalPath", "")
-                if not title or not path or path in seen_paths:
-                    continue
-                if not _is_intern_or_newgrad(title):
-                    continue
-                seen_paths.add(path)
-                loc = jp.get("locationsText", "Unknown")
-                bullets = jp.get("bulletFields") or []
-                jobs.append({
-                    "company": company_name,
-                    "title": title,
-                    "location": loc,
-                    "url": f"https://{tenant}.{wd}.myworkdayjobs.com/{site}{path}",
-                    "job_id": str(bullets[0]) if bullets else "N/A",
-                    "source": "workday_tenant",
-                    "age": "0d",
-                    "is_closed": False,
-                })
+        tasks.append(FetchTask("Workday tenants", f"{tenant}.{wd}.myworkdayjobs.com",
+                               _workday_tenant_board, (tenant, wd, site, company_name)))
+    return tasks
+
+
+def _workday_tenant_finish(jobs: List[Dict]) -> List[Dict]:
     log.info(f"Workday tenants: {len(jobs)} jobs from {len(WORKDAY_TENANTS)} tenants")
     return jobs
 
 
+def scrape_workday_tenants() -> List[Dict]:
+    """Fetch entry-level jobs from discovered Workday tenants."""
+    return _scrape_source("Workday tenants")
+
+
 def _load_discovered_companies():
-    """Load auto-discovered companies from brain.json."""
-    import os
+    """Load auto-discovered companies from the brain."""
+    from outreach.brain_store import open_store
     try:
-        if os.path.exists(".local/brain.json"):
-            with open(".local/brain.json") as f:
-                brain = json.load(f)
-            discovered = brain.get("discovered_ats", {})
+        discovered = open_store(".local/brain.json").namespace("discovered_ats")
+        if discovered is not None:
             # Merge into main dicts
             for slug, name in discovered.get("greenhouse", {}).items():
                 if slug not in GREENHOUSE_COMPANIES:
@@ -775,58 +952,69 @@ def _load_discovered_companies():
         pass
 
 
+# ═══════════════════════════════════════════════════════════════════
+# FAN-OUT: every board across every ATS in one bounded pool
+# ═══════════════════════════════════════════════════════════════════
+
+def _hackernews_tasks() -> List[FetchTask]:
+    # Thread → comments is a dependent chain, so HN stays one task
+    return [FetchTask("HackerNews", "hacker-news.firebaseio.com", scrape_hackernews_hiring)]
+
+
+# (label, task builder, finisher) — list order is the output order
+_SOURCES = [
+    ("Greenhouse", _greenhouse_tasks, _greenhouse_finish),
+    ("Lever", _lever_tasks, _lever_finish),
+    ("Ashby", _ashby_tasks, _ashby_finish),
+    ("HackerNews", _hackernews_tasks, lambda jobs: jobs),
+    ("Workday", _workday_tasks, _workday_finish),
+    ("SmartRecruiters", _smartrecruiters_tasks, _smartrecruiters_finish),
+    ("Workable", _workable_tasks, _workable_finish),
+    ("Rippling", _rippling_tasks, _rippling_finish),
+    ("Workday tenants", _workday_tenant_tasks, _workday_tenant_finish),
+]
+
+
+def _engine() -> FanOutEngine:
+    return FanOutEngine(max_workers=DIRECT_FETCH_MAX_WORKERS, per_host=DIRECT_FETCH_PER_HOST)
+
+
+def _scrape_source(name: str) -> List[Dict]:
+    """Fan out a single platform's boards (used by the scrape_* entry points)."""
+    _, build, finish = next(src for src in _SOURCES if src[0] == name)
+    engine = _engine()
+    jobs = finish(engine.run(build()).get(name, []))
+    engine.log_timings()
+    return jobs
+
+
 def fetch_all_direct_sources() -> List[Dict]:
     """Fetch from all direct ATS APIs. Returns list of job dicts."""
     _load_discovered_companies()  # Auto-expand company list from brain
-    all_jobs = []
-    
-    log.info("Fetching direct sources: Greenhouse, Lever, Ashby, HackerNews")
-    
-    try:
-        all_jobs.extend(scrape_greenhouse())
-    except Exception as e:
-        log.error(f"Greenhouse scrape failed: {e}")
-    
-    try:
-        all_jobs.extend(scrape_lever())
-    except Exception as e:
-        log.error(f"Lever scrape failed: {e}")
-    
-    try:
-        all_jobs.extend(scrape_ashby())
-    except Exception as e:
-        log.error(f"Ashby scrape failed: {e}")
-    
-    try:
-        all_jobs.extend(scrape_hackernews_hiring())
-    except Exception as e:
-        log.error(f"HackerNews scrape failed: {e}")
 
-    try:
-        all_jobs.extend(scrape_workday())
-    except Exception as e:
-        log.error(f"Workday scrape failed: {e}")
+    log.info("Fetching direct sources: " + ", ".join(name for name, _, _ in _SOURCES))
 
-    try:
-        all_jobs.extend(scrape_smartrecruiters())
-    except Exception as e:
-        log.error(f"SmartRecruiters scrape failed: {e}")
+    tasks = []
+    for name, build, _ in _SOURCES:
+        try:
+            tasks.extend(build())
+        except Exception as e:
+            log.error(f"{name} task build failed: {e}")
 
-    try:
-        all_jobs.extend(scrape_workable())
-    except Exception as e:
-        log.error(f"Workable scrape failed: {e}")
+    engine = _engine()
+    start = time.monotonic()
+    results = engine.run(tasks)
+    elapsed = time.monotonic() - start
 
-    try:
-        all_jobs.extend(scrape_rippling())
-    except Exception as e:
-        log.error(f"Rippling scrape failed: {e}")
+    all_jobs = []
+    for name, _, finish in _SOURCES:
+        try:
+            all_jobs.extend(finish(results.get(name, [])))
+        except Exception as e:
+            log.error(f"{name} scrape failed: {e}")
+    engine.log_timings()
+    log.info(f"Direct fan-out: {len(tasks)} requests across {len(_SOURCES)} sources in {elapsed:.1f}s")
 
-    try:
-        all_jobs.extend(scrape_workday_tenants())
-    except Exception as e:
-        log.error(f"Workday tenants scrape failed: {e}")
-    
     # Filter US-only
     us_jobs = [j for j in all_jobs if _is_us_location(j.get("location", "Unknown"))]
     log.info(f"Total direct source jobs: {len(us_jobs)} (filtered from {len(all_jobs)})")
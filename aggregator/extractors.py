@@ -6,11 +6,11 @@ import pickle
 import os
 import json
 import time
+import hashlib
 import random
 import re
 import logging
 import threading
-import atexit
 from functools import lru_cache
 from contextlib import contextmanager
 from bs4 import BeautifulSoup
@@ -54,9 +54,22 @@ from aggregator.config import (
     BACKOFF_MULTIPLIER,
     MAX_REASONABLE_AGE_DAYS,
     FAILED_SIMPLIFY_CACHE,
+    GITHUB_FEED_STATE_DIR,
 )
 
 from aggregator.utils import PlatformDetector, CompanyNormalizer, CompanyValidator, DateParser
+from aggregator.rate_limiter import DomainRateLimiter
+from aggregator.page_document import PageDocument
+from aggregator.browser_pool import BrowserPool
+from aggregator.http_cache import HttpCache
+from aggregator.gmail_client import GmailClient, message_header
+from aggregator.listing_stream import (
+    EMOJI_PATTERN as _EMOJI_PATTERN,
+    HEADER_PATTERN as _HEADER_PATTERN,
+    ListingStream,
+    iter_listings,
+    markdown_row,
+)
 from aggregator.processors import (
     JobIDExtractor,
     LocationExtractor,
@@ -66,8 +79,6 @@ from aggregator.processors import (
 
 _SESSION = requests.Session()
 _SESSION.headers.update({"User-Agent": USER_AGENTS[0]})
-_SELENIUM_DRIVER = None
-
 # FIX 3: persist URL health cache to disk with 24-hour TTL
 _URL_HEALTH_CACHE_FILE = os.path.join(".local", "url_health_cache.json")
 _URL_HEALTH_CACHE_TTL = 86400  # 24 hours
@@ -94,43 +105,6 @@ def _save_url_health_cache(cache):
         pass
 
 _URL_HEALTH_CACHE = _load_url_health_cache()
-_SELENIUM_LAST_USED = None
-
-# FIX 8: persist HTTP response cache to disk with 6-hour TTL
-_HTTP_CACHE_FILE = os.path.join(".local", "http_response_cache.json")
-_HTTP_CACHE_TTL = 6 * 3600  # 6 hours
-
-def _load_http_cache():
-    """Load HTTP cache — keep all entries, check TTL per-entry at lookup time."""
-    try:
-        if os.path.exists(_HTTP_CACHE_FILE):
-            return json.load(open(_HTTP_CACHE_FILE))
-    except Exception:
-        pass
-    return {}
-
-def _http_cache_get(url):
-    """Get cached response only if not expired. Returns None if missing or stale."""
-    entry = _HTTP_RESPONSE_CACHE.get(url)
-    if not entry:
-        return None
-    if time.time() - entry.get("ts", 0) > _HTTP_CACHE_TTL:
-        del _HTTP_RESPONSE_CACHE[url]
-        return None
-    return entry
-
-def _save_http_cache(cache):
-    try:
-        os.makedirs(".local", exist_ok=True)
-        # Keep max 500 entries — evict oldest
-        if len(cache) > 500:
-            sorted_items = sorted(cache.items(), key=lambda x: x[1].get("ts", 0))
-            cache = dict(sorted_items[-500:])
-        json.dump(cache, open(_HTTP_CACHE_FILE, "w"))
-    except Exception:
-        pass
-
-_HTTP_RESPONSE_CACHE = _load_http_cache()
 
 # Module-level Simplify method cache — loaded once, not per resolve() call
 _SIMPLIFY_METHOD_CACHE_FILE = os.path.join(".local", "simplify_method_cache.json")
@@ -153,29 +127,6 @@ def _save_simplify_method_cache():
 _load_simplify_method_cache()
 
 
-def _cleanup_selenium_driver():
-    global _SELENIUM_DRIVER
-    if _SELENIUM_DRIVER:
-        try:
-            _SELENIUM_DRIVER.quit()
-            logging.info("Selenium driver cleaned up")
-        except Exception as _e:
-            logging.debug("suppressed: %s", _e)
-            pass
-        _SELENIUM_DRIVER = None
-
-
-atexit.register(_cleanup_selenium_driver)
-
-_EMOJI_PATTERN = re.compile(
-    r"[\U0001f600-\U0001f64f\U0001f300-\U0001f5ff\U0001f680-\U0001f6ff\U0001f1e0-\U0001f1ff]+",
-    re.UNICODE,
-)
-_HEADER_PATTERN = re.compile(
-    r"Company.*(?:Role|Position|Job.?Title).*Location.*(?:Application|Link|Posting|Posted|Date|Age|Apply|Model|Visa)", re.I
-)
-_HTML_LINK_PATTERN = re.compile(r'<a\s+href="(https?://[^"]+)"')
-_MD_LINK_PATTERN = re.compile(r"\[.*?\]\((https?://[^\)]+)\)")
 
 STRICT_JOB_BOARDS = [
     "myworkdayjobs.com",
@@ -219,25 +170,12 @@ def safe_parse_html(html_content, preferred_parser=None):
     return None, None
 
 
-# ── Politeness: per-domain rate limit so we never hammer one ATS ──
-_DOMAIN_LAST_HIT = {}
-_DOMAIN_LOCK = threading.Lock()
-_MIN_DOMAIN_INTERVAL = 1.0  # seconds between requests to the SAME domain
-
-
+# ── Politeness: per-domain token buckets so we never hammer one ATS ──
+# Waiting on one host no longer blocks threads bound for other hosts.
 def _polite_wait(url):
-    """Sleep just enough that we hit any single domain at most 1x/sec."""
+    """Sleep until the per-host bucket (config.DOMAIN_RATE_LIMITS) allows a hit."""
     try:
-        from urllib.parse import urlparse
-        host = (urlparse(url).netloc or "").lower()
-        if not host:
-            return
-        with _DOMAIN_LOCK:
-            last = _DOMAIN_LAST_HIT.get(host, 0.0)
-            wait = _MIN_DOMAIN_INTERVAL - (time.time() - last)
-            if wait > 0:
-                time.sleep(wait)
-            _DOMAIN_LAST_HIT[host] = time.time()
+        DomainRateLimiter.default().acquire(url)
     except Exception:
         pass
 
@@ -334,7 +272,7 @@ def retry_request(url, method="GET", max_retries=MAX_RETRIES, **kwargs):
                 response = _SESSION.head(url, timeout=5, **kwargs)
             else:
                 response = _SESSION.request(method, url, timeout=20, **kwargs)
-            if response.status_code == 200:
+            if response.status_code in (200, 304):
                 return response
             elif response.status_code in [403, 429]:
                 time.sleep(RETRY_DELAY_SECONDS * (BACKOFF_MULTIPLIER**attempt))
@@ -531,56 +469,29 @@ class SimplifyRedirectResolver:
 
     @staticmethod
     def _method_2_selenium_click(click_url):
-        global _SELENIUM_DRIVER
-
         if not SELENIUM_AVAILABLE:
             return None
 
         try:
-            if _SELENIUM_DRIVER is None:
-                chrome_options = Options()
-                chrome_options.add_argument("--headless")
-                chrome_options.add_argument(
-                    "--disable-blink-features=AutomationControlled"
-                )
-                chrome_options.add_argument("--no-sandbox")
-                chrome_options.add_argument("--disable-dev-shm-usage")
-                chrome_options.add_argument(f"user-agent={USER_AGENTS[0]}")
-                chrome_options.add_experimental_option(
-                    "excludeSwitches", ["enable-logging"]
-                )
-                service = Service(ChromeDriverManager().install())
-                _SELENIUM_DRIVER = webdriver.Chrome(
-                    service=service, options=chrome_options
-                )
-                _SELENIUM_DRIVER.set_page_load_timeout(20)
-                logging.info(
-                    "Selenium driver initialized (SimplifyRedirectResolver will reuse)"
-                )
-
-            _SELENIUM_DRIVER.get(click_url)
+            with BrowserPool.default().checkout() as browser:
+                driver = browser.driver
+                driver.set_page_load_timeout(20)
+                driver.get(click_url)
 
-            for wait_time in [5, 5, 5]:
-                time.sleep(wait_time)
-                current_url = _SELENIUM_DRIVER.current_url
+                for wait_time in [5, 5, 5]:
+                    time.sleep(wait_time)
+                    current_url = driver.current_url
 
-                if current_url != click_url:
-                    if SimplifyRedirectResolver._is_valid_job_url(current_url):
-                        return current_url
+                    if current_url != click_url:
+                        if SimplifyRedirectResolver._is_valid_job_url(current_url):
+                            return current_url
 
-                if "simplify.jobs" not in current_url:
-                    if SimplifyRedirectResolver._is_valid_job_url(current_url):
-                        return current_url
+                    if "simplify.jobs" not in current_url:
+                        if SimplifyRedirectResolver._is_valid_job_url(current_url):
+                            return current_url
 
         except Exception as e:
             logging.debug(f"SimplifyRedirectResolver Selenium failed: {e}")
-            if _SELENIUM_DRIVER:
-                try:
-                    _SELENIUM_DRIVER.quit()
-                except Exception as _e:
-                    logging.debug("suppressed: %s", _e)
-                    pass
-                _SELENIUM_DRIVER = None
 
         return None
 
@@ -1080,58 +991,43 @@ class JobrightRedirectResolver:
     @staticmethod
     def _method_3_selenium(jobright_url):
         """ENHANCED: Use Selenium to click through and get final URL"""
-        global _SELENIUM_DRIVER
-
         if not SELENIUM_AVAILABLE:
             return None
 
         try:
-            if _SELENIUM_DRIVER is None:
-                from selenium import webdriver
-                from selenium.webdriver.chrome.service import Service
-                from selenium.webdriver.chrome.options import Options
-                from webdriver_manager.chrome import ChromeDriverManager
-
-                chrome_options = Options()
-                chrome_options.add_argument("--headless")
-                chrome_options.add_argument("--no-sandbox")
-                chrome_options.add_argument("--disable-dev-shm-usage")
-                service = Service(ChromeDriverManager().install())
-                _SELENIUM_DRIVER = webdriver.Chrome(
-                    service=service, options=chrome_options
-                )
-                _SELENIUM_DRIVER.set_page_load_timeout(25)
-
-            _SELENIUM_DRIVER.get(jobright_url)
-            time.sleep(5)
+            with BrowserPool.default().checkout() as browser:
+                driver = browser.driver
+                driver.set_page_load_timeout(25)
+                driver.get(jobright_url)
+                time.sleep(5)
 
-            try:
-                from selenium.webdriver.common.by import By
-                from selenium.webdriver.support.ui import WebDriverWait
-                from selenium.webdriver.support import expected_conditions as EC
-
-                apply_button = WebDriverWait(_SELENIUM_DRIVER, 10).until(
-                    EC.presence_of_element_located(
-                        (
-                            By.XPATH,
-                            "//a[contains(text(), 'Apply') or contains(@class, 'apply')]",
+                try:
+                    from selenium.webdriver.common.by import By
+                    from selenium.webdriver.support.ui import WebDriverWait
+                    from selenium.webdriver.support import expected_conditions as EC
+
+                    apply_button = WebDriverWait(driver, 10).until(
+                        EC.presence_of_element_located(
+                            (
+                                By.XPATH,
+                                "//a[contains(text(), 'Apply') or contains(@class, 'apply')]",
+                            )
                         )
                     )
-                )
 
-                apply_url = apply_button.get_attribute("href")
-                if apply_url and "jobright.ai" not in apply_url:
-                    logging.debug(f"Jobright Selenium button click: {apply_url[:80]}")
-                    return apply_url
+                    apply_url = apply_button.get_attribute("href")
+                    if apply_url and "jobright.ai" not in apply_url:
+                        logging.debug(f"Jobright Selenium button click: {apply_url[:80]}")
+                        return apply_url
 
-            except Exception as _e:
-                logging.debug("suppressed: %s", _e)
-                pass
+                except Exception as _e:
+                    logging.debug("suppressed: %s", _e)
+                    pass
 
-            current_url = _SELENIUM_DRIVER.current_url
-            if current_url != jobright_url and "jobright.ai" not in current_url:
-                logging.debug(f"Jobright Selenium redirect: {current_url[:80]}")
-                return current_url
+                current_url = driver.current_url
+                if current_url != jobright_url and "jobright.ai" not in current_url:
+                    logging.debug(f"Jobright Selenium redirect: {current_url[:80]}")
+                    return current_url
 
         except Exception as e:
             logging.debug(f"Jobright Selenium failed: {e}")
@@ -1332,8 +1228,10 @@ class JobrightAuthenticator:
 
 
 class EmailExtractor:
-    def __init__(self):
-        self.service = None
+    JOB_HUNT_QUERY = 'label:"Job Hunt" newer_than:3d'
+
+    def __init__(self, service=None):
+        self.service = service
 
     def authenticate(self):
         creds = None
@@ -1378,7 +1276,10 @@ class EmailExtractor:
         self.service = build("gmail", "v1", credentials=creds)
         return True
 
-    def fetch_job_emails(self, max_results=100):
+    def fetch_job_emails(self, max_results=100, processed=None):
+        """Labeled job-alert emails with their job URLs, newest first.
+        Messages whose id is in `processed` (ProcessedEmailTracker) are
+        dropped after the metadata pass, so their bodies are never fetched."""
         if not self.service:
             # (auth silently)
             if not self.authenticate():
@@ -1387,34 +1288,27 @@ class EmailExtractor:
             print("✗ Gmail authentication failed")
             logging.error("Gmail service not initialized")
             return []
+        processed = processed or {}
         try:
-            results = (
-                self.service.users()
-                .messages()
-                .list(
-                    userId="me",
-                    q='label:"Job Hunt" newer_than:3d',
-                    maxResults=max_results,
-                )
-                .execute()
-            )
-            messages = results.get("messages", [])
-            if not messages:
+            gmail = GmailClient(self.service)
+            ids = gmail.list_ids(self.JOB_HUNT_QUERY, max_results=max_results)
+            if not ids:
                 logging.info("No labeled emails found")
                 print("No emails with 'Job Hunt' label found")
                 return []
-            print(f"Found {len(messages)} labeled emails")
+            print(f"Found {len(ids)} labeled emails")
+
+            def unseen(meta):
+                if meta["id"] in processed:
+                    logging.info(f"Skipping already processed email: {message_header(meta, 'Subject')}")
+                    return False
+                return True
+
             emails_with_data = []
-            for message in messages:
+            for msg in gmail.fetch(ids, keep=unseen):
                 try:
-                    msg = (
-                        self.service.users()
-                        .messages()
-                        .get(userId="me", id=message["id"], format="full")
-                        .execute()
-                    )
                     internal_date = int(msg.get("internalDate", 0))
-                    email_id = message["id"]
+                    email_id = msg["id"]
                     headers = {
                         h["name"]: h["value"] for h in msg["payload"].get("headers", [])
                     }
@@ -1437,6 +1331,7 @@ class EmailExtractor:
                 except Exception as e:
                     logging.error(f"Failed to process email: {e}")
                     continue
+            gmail.log_summary("Gmail job emails")
             emails_with_data.sort(key=lambda x: x["timestamp"], reverse=True)
             total_urls = sum(len(email["urls"]) for email in emails_with_data)
             print(f"Total: {total_urls} job URLs from {len(emails_with_data)} emails\n")
@@ -1888,9 +1783,15 @@ class PageFetcher:
             pass
 
     def fetch_page(self, url):
-        if url in _HTTP_RESPONSE_CACHE:
-            cached = _HTTP_RESPONSE_CACHE[url]
-            return cached["response"], cached["final_url"], cached["page_source"]
+        cache = HttpCache.default()
+        try:
+            cached = cache.get(url)
+            if cached is not None:
+                return cached, cached.url, cached.text
+            if cache.failed(url):
+                return None, None, None
+        except Exception as e:
+            logging.debug(f"HTTP cache lookup failed: {e}")
 
         # Check failed URL cache (skip URLs that failed before today)
         failed = self._load_failed_urls()
@@ -1906,21 +1807,20 @@ class PageFetcher:
         if self._is_js_heavy_platform(url):
             html, final_url, page_source = self._try_selenium(url)
             if html:
-                response = self._create_mock_response(html, final_url)
-                _HTTP_RESPONSE_CACHE[url] = {
-                    "response": response,
-                    "final_url": final_url,
-                    "page_source": page_source,
-                }
-                return response, final_url, page_source
+                return self._cache_page(url, html, final_url)
 
-        response = retry_request(url)
+        try:
+            conditional = cache.conditional_headers(url)
+        except Exception:
+            conditional = {}
+        response = retry_request(url, headers=conditional) if conditional else retry_request(url)
+        if response is not None and response.status_code == 304:
+            revalidated = cache.revalidated(url, response.headers)
+            if revalidated is not None:
+                return revalidated, revalidated.url, revalidated.text
+            response = retry_request(url)
         if response and 200 <= response.status_code < 400:
-            _HTTP_RESPONSE_CACHE[url] = {
-                "response": response,
-                "final_url": response.url,
-                "page_source": response.text,
-            }
+            self._cache_page(url, response.text, response.url, response.status_code, response.headers)
             return response, response.url, response.text
 
         # Auto-retry with different user agents before falling back to Selenium
@@ -1931,11 +1831,7 @@ class PageFetcher:
                     _r = _req.get(url, timeout=15, headers={"User-Agent": _alt_ua}, allow_redirects=True)
                     if _r and 200 <= _r.status_code < 400:
                         logging.info(f"Retry with alt UA succeeded: {url[:60]}")
-                        _HTTP_RESPONSE_CACHE[url] = {
-                            "response": _r,
-                            "final_url": _r.url,
-                            "page_source": _r.text,
-                        }
+                        self._cache_page(url, _r.text, _r.url, _r.status_code, _r.headers)
                         return _r, _r.url, _r.text
                 except Exception:
                     continue
@@ -1944,22 +1840,23 @@ class PageFetcher:
             logging.info(f"Standard request failed, trying Selenium for {url}")
             html, final_url, page_source = self._try_selenium(url)
             if html:
-                response = self._create_mock_response(html, final_url)
-                _HTTP_RESPONSE_CACHE[url] = {
-                    "response": response,
-                    "final_url": final_url,
-                    "page_source": page_source,
-                }
-                return response, final_url, page_source
+                return self._cache_page(url, html, final_url)
 
-        _HTTP_RESPONSE_CACHE[url] = {
-            "response": None,
-            "final_url": None,
-            "page_source": None,
-        }
+        cache.put_failure(url)
         self._save_failed_url(url)
         return None, None, None
 
+    @staticmethod
+    def _cache_page(url, html, final_url, status_code=200, headers=None):
+        """Store a fetched page; returns (response, final_url, page_source)."""
+        try:
+            entry = HttpCache.default().put(url, html, final_url, status_code, headers)
+            return entry, entry.url, entry.text
+        except Exception as e:
+            logging.debug(f"HTTP cache store failed: {e}")
+            response = PageFetcher._create_mock_response(html, final_url)
+            return response, final_url, html
+
     @staticmethod
     def _is_js_heavy_platform(url):
         if not url:
@@ -1982,77 +1879,49 @@ class PageFetcher:
 
     @staticmethod
     def _try_selenium(url):
-        global _SELENIUM_DRIVER, _SELENIUM_LAST_USED
-
         if not SELENIUM_AVAILABLE:
             return None, None, None
 
         try:
-            if _SELENIUM_DRIVER is None:
-                chrome_options = Options()
-                chrome_options.add_argument("--headless")
-                chrome_options.add_argument(
-                    "--disable-blink-features=AutomationControlled"
-                )
-                chrome_options.add_argument("--no-sandbox")
-                chrome_options.add_argument("--disable-dev-shm-usage")
-                chrome_options.add_argument(f"user-agent={USER_AGENTS[0]}")
-                chrome_options.add_experimental_option(
-                    "excludeSwitches", ["enable-logging"]
-                )
-                service = Service(ChromeDriverManager().install())
-                _SELENIUM_DRIVER = webdriver.Chrome(
-                    service=service, options=chrome_options
-                )
-                _SELENIUM_DRIVER.set_page_load_timeout(30)
-                logging.info("Selenium driver initialized (will be reused)")
-
-            _SELENIUM_DRIVER.get(url)
-            _SELENIUM_LAST_USED = time.time()
-
-            url_lower = url.lower()
-            # Adaptive wait: wait for content instead of fixed sleep
-            max_wait = 15 if ("oracle" in url_lower or "workday" in url_lower) else (8 if "greenhouse" in url_lower else (6 if "ashby" in url_lower else 5))
-            try:
-                WebDriverWait(_SELENIUM_DRIVER, max_wait).until(
-                    lambda d: d.execute_script("return document.readyState") == "complete"
-                )
-            except Exception as _e:
-                logging.debug("suppressed: %s", _e)
-                pass
-            # Short extra wait for JS rendering
-            extra = 3 if ("oracle" in url_lower or "workday" in url_lower) else 1
-            time.sleep(extra)
-            # Wait for job content element
-            try:
-                WebDriverWait(_SELENIUM_DRIVER, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "h1, h2, [data-automation-id], .job-title, .posting-headline"))
-                )
-            except Exception as _e:
-                logging.debug("suppressed: %s", _e)
-                pass
-
-            _SELENIUM_DRIVER.execute_script(
-                "window.scrollTo(0, document.body.scrollHeight);"
-            )
-            time.sleep(1)
-            page_source = _SELENIUM_DRIVER.page_source
-            current_url = _SELENIUM_DRIVER.current_url
-
+            page_source, current_url = BrowserPool.default().render(url, PageFetcher._render_page)
             return page_source, current_url, page_source
-
         except Exception as e:
             logging.error(f"Selenium failed for {url}: {e}")
+            return None, None, None
 
-            if _SELENIUM_DRIVER:
-                try:
-                    _SELENIUM_DRIVER.quit()
-                except Exception as _e:
-                    logging.debug("suppressed: %s", _e)
-                    pass
-                _SELENIUM_DRIVER = None
+    @staticmethod
+    def _render_page(driver, url):
+        """Load `url` in a pooled browser and wait for the job content to render."""
+        driver.set_page_load_timeout(30)
+        driver.get(url)
 
-            return None, None, None
+        url_lower = url.lower()
+        # Adaptive wait: wait for content instead of fixed sleep
+        max_wait = 15 if ("oracle" in url_lower or "workday" in url_lower) else (8 if "greenhouse" in url_lower else (6 if "ashby" in url_lower else 5))
+        try:
+            WebDriverWait(driver, max_wait).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+        except Exception as _e:
+            logging.debug("suppressed: %s", _e)
+            pass
+        # Short extra wait for JS rendering
+        extra = 3 if ("oracle" in url_lower or "workday" in url_lower) else 1
+        time.sleep(extra)
+        # Wait for job content element
+        try:
+            WebDriverWait(driver, 5).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "h1, h2, [data-automation-id], .job-title, .posting-headline"))
+            )
+        except Exception as _e:
+            logging.debug("suppressed: %s", _e)
+            pass
+
+        driver.execute_script(
+            "window.scrollTo(0, document.body.scrollHeight);"
+        )
+        time.sleep(1)
+        return driver.page_source, driver.current_url
 
     @staticmethod
     def _create_mock_response(html, url):
@@ -2073,10 +1942,10 @@ class PageParser:
         candidates = []
 
         try:
-            json_ld = soup.find("script", type="application/ld+json")
-            if json_ld:
+            page = PageDocument.of(soup)
+            if page.json_ld:
                 try:
-                    data = json.loads(json_ld.string)
+                    data = page.first_json_ld
                     if isinstance(data, dict) and data.get("title"):
                         title = data["title"]
                         if 5 < len(title) < 200:
@@ -2196,7 +2065,7 @@ class PageParser:
         if not soup:
             return None
         try:
-            page_text = soup.get_text()[:3000]
+            page_text = PageDocument.of(soup).prefix(3000)
             days = DateParser.extract_days_ago(page_text)
             if days is not None:
                 if days > MAX_REASONABLE_AGE_DAYS or days < 0:
@@ -2262,12 +2131,13 @@ class JobTypeExtractor:
         if not soup:
             return "Unknown"
 
+        page = PageDocument.of(soup)
         results = []
 
-        results.append(JobTypeExtractor.extract_from_json_ld(soup))
-        results.append(JobTypeExtractor.extract_from_meta(soup))
-        results.append(JobTypeExtractor.extract_from_selectors(soup))
-        results.append(JobTypeExtractor.extract_from_page_text(soup))
+        results.append(JobTypeExtractor.extract_from_json_ld(page))
+        results.append(JobTypeExtractor.extract_from_meta(page))
+        results.append(JobTypeExtractor.extract_from_selectors(page))
+        results.append(JobTypeExtractor.extract_from_page_text(page))
         results.append(JobTypeExtractor.extract_from_url(url))
 
         valid_results = [r for r in results if r and r != "Unknown"]
@@ -2285,9 +2155,9 @@ class JobTypeExtractor:
     @staticmethod
     def extract_from_json_ld(soup):
         try:
-            script = soup.find("script", type="application/ld+json")
-            if script:
-                data = json.loads(script.string)
+            page = PageDocument.of(soup)
+            if page.json_ld:
+                data = page.first_json_ld
                 emp_type = data.get("employmentType", "")
                 return JobTypeExtractor._normalize_type(emp_type)
         except Exception as _e:
@@ -2338,7 +2208,7 @@ class JobTypeExtractor:
     @staticmethod
     def extract_from_page_text(soup):
         try:
-            text = soup.get_text()[:2000]
+            text = PageDocument.of(soup).prefix(2000)
 
             patterns = [
                 (r"(?:job|employment)\s+type:?\s*(intern(?:ship)?|co-?op)", 1),
@@ -2783,39 +2653,202 @@ class ZipRecruiterResolver:
         except Exception as e:
             logging.debug(f"ZipRecruiter email parsing failed: {e}")
             return []
+def _feed_state_path(source_name):
+    return os.path.join(GITHUB_FEED_STATE_DIR, re.sub(r"[^A-Za-z0-9_.-]", "_", source_name) + ".json")
+
+
+def _load_feed_state(source_name, url):
+    """Validators and row fingerprints from the last fetch of this feed."""
+    try:
+        with open(_feed_state_path(source_name)) as f:
+            state = json.load(f)
+        if state.get("url") == url and state.get("version") == _FEED_STATE_VERSION:
+            return state
+    except Exception:
+        pass
+    return {}
+
+
+def _save_feed_state(source_name, state):
+    try:
+        os.makedirs(GITHUB_FEED_STATE_DIR, exist_ok=True)
+        path = _feed_state_path(source_name)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp, path)
+    except Exception as e:
+        logging.debug(f"Feed state save failed for {source_name}: {e}")
+
+
+def _record_closures(source_name, removed):
+    """Append rows that disappeared from a feed to closures.jsonl."""
+    if not removed:
+        return
+    try:
+        os.makedirs(GITHUB_FEED_STATE_DIR, exist_ok=True)
+        now = time.strftime("%Y-%m-%dT%H:%M:%S")
+        with open(os.path.join(GITHUB_FEED_STATE_DIR, "closures.jsonl"), "a") as f:
+            for company, title, url in removed:
+                f.write(json.dumps({"source": source_name, "company": company, "title": title,
+                                    "url": url, "closed_at": now}) + "\n")
+    except Exception as e:
+        logging.debug(f"Closure log failed for {source_name}: {e}")
+
+
+def _fingerprint(job):
+    """(key, [company, title, url, digest]) for one listing, keyed on
+    (company, title, url). Age is left out of the digest: the feeds
+    rewrite it every day."""
+    ident = [job.get("company", ""), job.get("title", ""), job.get("url", "")]
+    key = hashlib.sha1("\x1f".join(ident).encode()).hexdigest()[:20]
+    body = json.dumps([job.get("location", ""), bool(job.get("is_closed")), job.get("github_category", "")])
+    return key, ident + [hashlib.sha1(body.encode()).hexdigest()[:16]]
+
+
+def _diff_rows(previous, jobs):
+    """Split a fresh parse against the last run's fingerprints.
+    Returns (inserted or changed jobs, new fingerprints, removed idents)."""
+    rows, changed = {}, []
+    for job in jobs:
+        key, row = _fingerprint(job)
+        if key in rows:
+            continue
+        rows[key] = row
+        old = previous.get(key)
+        if old is None or old[3] != row[3]:
+            changed.append(job)
+    removed = [tuple(row[:3]) for key, row in previous.items() if key not in rows]
+    return changed, rows, removed
+
+
+def _response_lines(response, chunk_size=65536):
+    """Decoded lines of a streamed response, split on "\n" only (like
+    text.split), without holding the whole body."""
+    if not hasattr(response, "iter_content"):
+        yield from response.text.split("\n")
+        return
+    if not response.encoding:
+        response.encoding = "utf-8"
+    pending = ""
+    for chunk in response.iter_content(chunk_size=chunk_size, decode_unicode=True):
+        lines = (pending + chunk).split("\n")
+        pending = lines.pop()
+        yield from lines
+    yield pending
+
+
+# Bump when the README parsers or the state layout change, so feeds are re-parsed
+_FEED_STATE_VERSION = 2
+
+
 class SimplifyGitHubScraper:
+    # source_name -> "not_modified" | "fetched" for the current run
+    feed_status = {}
+    # source_name -> [(company, title, url)] rows that left the feed this run
+    closures = {}
+    # source_name -> feed state to save once the listings have been processed
+    _pending = {}
+
+    @staticmethod
+    def commit(source_name=None):
+        """Save fingerprints (and log closures) for feeds whose listings were
+        processed. Until then, a crashed run re-emits the same rows next time."""
+        names = [source_name] if source_name else list(SimplifyGitHubScraper._pending)
+        for name in names:
+            state = SimplifyGitHubScraper._pending.pop(name, None)
+            if state is None:
+                continue
+            _save_feed_state(name, state)
+            _record_closures(name, SimplifyGitHubScraper.closures.get(name, []))
+
+    @staticmethod
+    def forget(job):
+        """Drop a listing from its feed's fingerprints before commit(), so the
+        next run returns it as new (its processing failed this run). The
+        validators go too: a 304 next run would otherwise skip it."""
+        state = SimplifyGitHubScraper._pending.get(job.get("_source_name") or job.get("source"))
+        if state is not None:
+            state["rows"].pop(_fingerprint(job)[0], None)
+            state["etag"] = state["last_modified"] = ""
+
     @staticmethod
     def scrape(url, source_name="GitHub"):
+        """Listings that are new or changed since the last run of this feed.
+        The first run (or after a state reset) returns every listing."""
         try:
             logging.info(f"Fetching {source_name} from {url}")
-            response = retry_request(url)
+            state = _load_feed_state(source_name, url)
+            previous = state.get("rows") or {}
+            headers = {}
+            if previous:
+                if state.get("etag"):
+                    headers["If-None-Match"] = state["etag"]
+                if state.get("last_modified"):
+                    headers["If-Modified-Since"] = state["last_modified"]
+            response = (retry_request(url, stream=True, headers=headers) if headers
+                        else retry_request(url, stream=True))
             if not response:
                 logging.error(f"{source_name}: Failed to fetch URL")
                 return []
+            if response.status_code == 304:
+                SimplifyGitHubScraper.feed_status[source_name] = "not_modified"
+                logging.info(f"{source_name}: Not modified ({len(previous)} listings unchanged)")
+                return []
             if response.status_code != 200:
                 logging.error(f"{source_name}: HTTP {response.status_code}")
                 return []
-            logging.info(f"{source_name}: Fetched, length: {len(response.text)}")
-            soup, parser = safe_parse_html(response.text)
-            if soup:
-                logging.info(f"{source_name}: Parsed with {parser}")
-                tables = soup.find_all("table")
-                if tables:
-                    jobs = SimplifyGitHubScraper._parse_html_tables(soup, source_name)
-                    if jobs:
-                        logging.info(f"{source_name}: Found {len(jobs)} jobs via HTML")
-                        return jobs
-            logging.info(f"{source_name}: Trying Markdown")
-            jobs = SimplifyGitHubScraper._parse_markdown_text(
-                response.text, source_name
+            SimplifyGitHubScraper.feed_status[source_name] = "fetched"
+            stream = ListingStream(source_name)
+            try:
+                changed, rows, removed = _diff_rows(
+                    previous, iter_listings(_response_lines(response), source_name, stream)
+                )
+            finally:
+                getattr(response, "close", lambda: None)()
+            logging.info(
+                f"{source_name}: Streamed {stream.chars} chars, {len(rows)} jobs via {stream.format or 'nothing'}"
             )
-            if jobs:
-                logging.info(f"{source_name}: Found {len(jobs)} jobs via Markdown")
-            return jobs
+            if not rows:
+                return []  # keep the old fingerprints; an empty parse is a format problem
+            if previous:
+                logging.info(
+                    f"{source_name}: {len(changed)} new/changed, {len(removed)} removed, "
+                    f"{len(rows) - len(changed)} unchanged"
+                )
+            SimplifyGitHubScraper.closures[source_name] = removed
+            SimplifyGitHubScraper._pending[source_name] = {
+                "url": url,
+                "version": _FEED_STATE_VERSION,
+                "etag": response.headers.get("ETag", ""),
+                "last_modified": response.headers.get("Last-Modified", ""),
+                "fetched_at": time.time(),
+                "rows": rows,
+            }
+            return changed
         except Exception as e:
             logging.error(f"{source_name}: Error: {e}")
             return []
 
+    @staticmethod
+    def _parse(text, source_name):
+        """Whole-document parse (soup, then Markdown). scrape() streams with
+        ListingStream instead; this stays as the reference implementation."""
+        soup, parser = safe_parse_html(text)
+        if soup:
+            logging.info(f"{source_name}: Parsed with {parser}")
+            tables = soup.find_all("table")
+            if tables:
+                jobs = SimplifyGitHubScraper._parse_html_tables(soup, source_name)
+                if jobs:
+                    logging.info(f"{source_name}: Found {len(jobs)} jobs via HTML")
+                    return jobs
+        logging.info(f"{source_name}: Trying Markdown")
+        jobs = SimplifyGitHubScraper._parse_markdown_text(text, source_name)
+        if jobs:
+            logging.info(f"{source_name}: Found {len(jobs)} jobs via Markdown")
+        return jobs
+
     @staticmethod
     def _parse_markdown_text(text, source_name):
         lines = text.split("\n")
@@ -2830,59 +2863,9 @@ class SimplifyGitHubScraper:
         start = header_idx + 1 if delimiter == "\t" else header_idx + 2
         last_company = ""  # FIX 6: initialize before loop to prevent UnboundLocalError
         for line in lines[start:]:
-            if not line.strip():
-                continue
-            parts = [p.strip() for p in line.split(delimiter) if p.strip()]
-            if len(parts) < 5:
-                continue
-            # Strip HTML tags from company cell (SpeedyApply wraps in <a><strong>)
-            _co_cell = re.sub(r"<[^>]+>", "", parts[0])
-            _co_cell = re.sub(r"\*\*", "", _co_cell)  # Strip markdown bold
-            raw_company = _EMOJI_PATTERN.sub("", _co_cell).strip()
-            if raw_company and "↳" not in raw_company:
-                company = raw_company
-                last_company = company
-            else:
-                company = last_company
-                if not company:
-                    continue  # FIX 6: skip continuation rows with no known parent company
-            title = _EMOJI_PATTERN.sub("", parts[1]).strip()
-            location = _EMOJI_PATTERN.sub("", parts[2]).strip()
-            # Find the apply link by scanning cells from the end (link is always
-            # in the last populated cell; column count varies by source: Visa, Salary, etc.)
-            link_cell = ""
-            age = ""
-            for _cell in reversed(parts[2:]):
-                if _HTML_LINK_PATTERN.search(_cell) or _MD_LINK_PATTERN.search(_cell) or _cell.startswith("http"):
-                    link_cell = _cell
-                    break
-            # age = first cell after location that looks like a short duration
-            for _cell in parts[3:]:
-                if re.match(r"^\d+[dhmw]", _cell.strip()):
-                    age = _cell.strip()
-                    break
-            match = _HTML_LINK_PATTERN.search(link_cell) or _MD_LINK_PATTERN.search(
-                link_cell
-            )
-            url = (
-                match.group(1)
-                if match
-                else (link_cell if link_cell.startswith("http") else None)
-            )
-            if not url or any(marker in line for marker in ["🔒", "❌", "closed"]):
-                continue
-            jobs.append(
-                {
-                    "company": company,
-                    "title": title,
-                    "location": location,
-                    "url": url,
-                    "age": age,
-                    "is_closed": False,
-                    "source": source_name,
-                    "github_category": "",
-                }
-            )
+            job, last_company = markdown_row(line, delimiter, last_company, source_name)
+            if job:
+                jobs.append(job)
         return jobs
 
     @staticmethod
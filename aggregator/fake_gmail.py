@@ -0,0 +1,141 @@
+"""
+FakeGmail — an in-memory stand-in for the Gmail discovery service, replaying
+recorded messages for offline tests and dry runs.
+
+Messages are the JSON the API returned for messages().get(format="full").
+list() returns the ids recorded for that query, or every message when no
+queries were recorded.
+The fake serves the calls GmailClient, EmailExtractor and BounceScanner
+make: users().messages().list / get (format full or metadata, with
+metadataHeaders filtering) and new_batch_http_request(). Every network
+request is counted in .api_calls; a batch counts once as "batch", and each
+part also counts under "get_<format>".
+
+Failures are scripted per id: fail={"id": [429, 429]} makes the next two
+gets of that message raise HttpError 429 before it succeeds.
+
+Usage:
+    gmail = FakeGmail.from_file("recorded_messages.json")
+    gmail = FakeGmail(messages, queries={'label:"Job Hunt" newer_than:3d': ["18c1", "18c2"]})
+    EmailExtractor(service=gmail).fetch_job_emails()
+    gmail.api_calls["get_full"]
+"""
+import json
+from collections import Counter
+from typing import Dict, Iterable, List
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+
+def _metadata(msg: dict, headers: Iterable[str] = None) -> dict:
+    """What format=metadata returns for a recorded full message."""
+    wanted = {h.lower() for h in headers} if headers else None
+    payload = msg.get("payload", {})
+    out = {k: msg[k] for k in ("id", "threadId", "labelIds", "snippet", "historyId",
+                                 "internalDate", "sizeEstimate") if k in msg}
+    out["payload"] = {
+        "mimeType": payload.get("mimeType", ""),
+        "headers": [h for h in payload.get("headers", [])
+                    if wanted is None or h.get("name", "").lower() in wanted],
+    }
+    return out
+
+
+class _Call:
+    def __init__(self, gmail, name, fn):
+        self.gmail, self.name, self.fn = gmail, name, fn
+
+    def execute(self):
+        self.gmail.api_calls[self.name] += 1
+        return self.fn()
+
+
+class _Messages:
+    def __init__(self, gmail):
+        self.gmail = gmail
+
+    def list(self, userId="me", q="", maxResults=100, **kwargs):
+        gmail = self.gmail
+
+        def run():
+            ids = list(gmail.queries.get(q, [])) if gmail.queries else list(gmail.messages)
+            ids = ids[:maxResults]
+            result = {"resultSizeEstimate": len(ids)}
+            if ids:
+                result["messages"] = [{"id": i, "threadId": gmail.messages[i].get("threadId", i)} for i in ids]
+            return result
+        return _Call(gmail, "list", run)
+
+    def get(self, userId="me", id="", format="full", metadataHeaders=None, **kwargs):
+        gmail = self.gmail
+
+        def run():
+            gmail.api_calls[f"get_{format}"] += 1
+            script = gmail.fail.get(id)
+            if script:
+                raise gmail.http_error(script.pop(0))
+            if id not in gmail.messages:
+                raise gmail.http_error(404)
+            msg = gmail.messages[id]
+            return json.loads(json.dumps(msg)) if format == "full" else _metadata(msg, metadataHeaders)
+        return _Call(gmail, "get", run)
+
+
+class _Users:
+    def __init__(self, gmail):
+        self.gmail = gmail
+
+    def messages(self):
+        return _Messages(self.gmail)
+
+
+class FakeBatch:
+    def __init__(self, gmail, callback=None):
+        self.gmail = gmail
+        self.callback = callback
+        self._parts = []
+
+    def add(self, request, callback=None, request_id=None):
+        request_id = request_id or str(len(self._parts) + 1)
+        if any(rid == request_id for rid, _, _ in self._parts):
+            raise KeyError(f"duplicate request_id {request_id}")
+        self._parts.append((request_id, request, callback or self.callback))
+
+    def execute(self):
+        if len(self._parts) > 100:
+            raise ValueError("Gmail batches are limited to 100 requests")
+        self.gmail.api_calls["batch"] += 1
+        for request_id, request, callback in self._parts:
+            try:
+                response, exc = request.fn(), None
+            except HttpError as e:
+                response, exc = None, e
+            if callback:
+                callback(request_id, response, exc)
+
+
+class FakeGmail:
+    def __init__(self, messages: List[dict] = (), queries: Dict[str, List[str]] = None,
+                 fail: Dict[str, List[int]] = None):
+        self.messages: Dict[str, dict] = {m["id"]: m for m in messages}
+        self.queries = dict(queries or {})
+        self.fail = {k: list(v) for k, v in (fail or {}).items()}
+        self.api_calls = Counter()
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "FakeGmail":
+        """Load {"messages": [...], "queries": {...}} recorded from the API."""
+        with open(path) as f:
+            data = json.load(f)
+        return cls(data.get("messages", []), data.get("queries"), **kwargs)
+
+    @staticmethod
+    def http_error(status: int) -> HttpError:
+        return HttpError(httplib2.Response({"status": status}), b'{"error": {"code": %d}}' % status)
+
+    def users(self):
+        return _Users(self)
+
+    def new_batch_http_request(self, callback=None):
+        return FakeBatch(self, callback)
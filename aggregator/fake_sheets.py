@@ -0,0 +1,214 @@
+"""
+FakeSpreadsheet / FakeWorksheet — an in-memory stand-in for the gspread
+objects the pipeline uses, for offline tests and dry runs.
+
+Only the calls the pipeline makes are implemented, and they behave like the
+real API where it matters: values come back as strings, trailing empty
+cells and rows are trimmed from value ranges, get_all_values() pads rows to
+a rectangle, and delete_rows() shifts everything below up. Every request
+that would hit the network is counted in .api_calls, keyed by method name.
+
+Usage:
+    ss = FakeSpreadsheet({"Valid Entries": [HEADER, row, ...]})
+    ws = ss.worksheet("Valid Entries")
+    ws.update(values=[[...]], range_name="A5:N5")
+    ss.api_calls["values_batch_get"]
+"""
+from collections import Counter
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+from gspread.utils import a1_range_to_grid_range, fill_gaps
+
+
+def _cell(v) -> str:
+    if v is None:
+        return ""
+    if isinstance(v, bool):
+        return "TRUE" if v else "FALSE"
+    return str(v)
+
+
+def _trim(rows: List[List[str]]) -> List[List[str]]:
+    """Drop trailing empty cells and rows, as the values API does."""
+    out = []
+    for row in rows:
+        row = list(row)
+        while row and row[-1] == "":
+            row.pop()
+        out.append(row)
+    while out and not out[-1]:
+        out.pop()
+    return out
+
+
+class FakeWorksheet:
+    def __init__(self, spreadsheet, id: int, title: str, rows=None, row_count=1000, col_count=26):
+        self.spreadsheet = spreadsheet
+        self.id = id
+        self.title = title
+        self._rows: List[List[str]] = [[_cell(v) for v in r] for r in (rows or [])]
+        self.row_count = max(row_count, len(self._rows))
+        self.col_count = max([col_count] + [len(r) for r in self._rows])
+
+    def _count(self, name):
+        self.spreadsheet.api_calls[name] += 1
+
+    # Reads
+
+    def read_range(self, grid: dict) -> List[List[str]]:
+        r0 = grid.get("startRowIndex", 0)
+        r1 = grid.get("endRowIndex", len(self._rows))
+        c0 = grid.get("startColumnIndex", 0)
+        c1 = grid.get("endColumnIndex", self.col_count)
+        return _trim([row[c0:c1] for row in self._rows[r0:r1]])
+
+    def get_all_values(self, **kwargs) -> List[List[str]]:
+        self._count("get_all_values")
+        rows = _trim(self._rows)
+        return fill_gaps(rows) if rows else []
+
+    def row_values(self, row: int) -> List[str]:
+        self._count("row_values")
+        return _trim([self._rows[row - 1]])[0] if row <= len(self._rows) else []
+
+    def acell(self, label: str):
+        self._count("acell")
+        grid = a1_range_to_grid_range(label)
+        r, c = grid.get("startRowIndex", 0), grid.get("startColumnIndex", 0)
+        row = self._rows[r] if r < len(self._rows) else []
+        return SimpleNamespace(row=r + 1, col=c + 1, value=row[c] if c < len(row) else "")
+
+    def col_values(self, col: int) -> List[str]:
+        self._count("col_values")
+        col_rows = _trim([[r[col - 1] if len(r) >= col else ""] for r in self._rows])
+        return [r[0] if r else "" for r in col_rows]
+
+    # Writes
+
+    def update(self, values=None, range_name=None, value_input_option=None, **kwargs):
+        self._count("update")
+        if values is None or range_name is None:
+            return {}
+        grid = a1_range_to_grid_range(range_name)
+        r0, c0 = grid.get("startRowIndex", 0), grid.get("startColumnIndex", 0)
+        for i, row in enumerate(values):
+            self._write_row(r0 + i, c0, row)
+        return {"updatedRows": len(values)}
+
+    def _write_row(self, r: int, c0: int, row):
+        while len(self._rows) <= r:
+            self._rows.append([])
+        target = self._rows[r]
+        target.extend([""] * (c0 + len(row) - len(target)))
+        for j, v in enumerate(row):
+            target[c0 + j] = _cell(v)
+        self.row_count = max(self.row_count, len(self._rows))
+        self.col_count = max(self.col_count, len(target))
+
+    def append_rows(self, values, value_input_option=None, **kwargs):
+        self._count("append_rows")
+        start = len(_trim(self._rows))
+        for i, row in enumerate(values):
+            self._write_row(start + i, 0, row)
+
+    def append_row(self, values, **kwargs):
+        self.append_rows([values], **kwargs)
+
+    def delete_rows(self, start_index: int, end_index: Optional[int] = None):
+        self._count("delete_rows")
+        self._delete(start_index, end_index or start_index)
+
+    def _delete(self, start_index: int, end_index: int):
+        del self._rows[start_index - 1:end_index]
+        self.row_count -= end_index - start_index + 1
+
+    def resize(self, rows=None, cols=None):
+        self._count("resize")
+        if rows is not None:
+            self.row_count = rows
+            del self._rows[rows:]
+        if cols is not None:
+            self.col_count = cols
+
+    def format(self, *args, **kwargs):
+        self._count("format")
+
+
+def _check_grid_limits(req, by_id):
+    for kind, args in req.items():
+        if kind == "updateCells":
+            sheet_id, end = args["start"]["sheetId"], args["start"]["rowIndex"] + len(args.get("rows", []))
+        elif isinstance(args.get("range"), dict) and "endRowIndex" in args["range"]:
+            sheet_id, end = args["range"]["sheetId"], args["range"]["endRowIndex"]
+        else:
+            continue
+        ws = by_id.get(sheet_id)
+        if ws is not None and end > ws.row_count:
+            raise Exception(f"APIError: [400]: Invalid requests[{kind}]: Range ({ws.title}!"
+                            f"{end}) exceeds grid limits. Max rows: {ws.row_count}")
+
+
+class FakeSpreadsheet:
+    def __init__(self, sheets: Dict[str, list] = None):
+        self.api_calls = Counter()
+        self._sheets: Dict[str, FakeWorksheet] = {}
+        self.batch_updates: List[dict] = []
+        for title, rows in (sheets or {}).items():
+            self.add_worksheet(title, values=rows, _count=False)
+
+    def add_worksheet(self, title, rows=1000, cols=26, values=None, _count=True):
+        if _count:
+            self.api_calls["add_worksheet"] += 1
+        ws = FakeWorksheet(self, len(self._sheets) + 1, title, values, row_count=rows, col_count=cols)
+        self._sheets[title] = ws
+        return ws
+
+    def worksheet(self, title) -> FakeWorksheet:
+        self.api_calls["worksheet"] += 1
+        if title not in self._sheets:
+            from gspread.exceptions import WorksheetNotFound
+            raise WorksheetNotFound(title)
+        return self._sheets[title]
+
+    def worksheets(self) -> List[FakeWorksheet]:
+        self.api_calls["worksheets"] += 1
+        return list(self._sheets.values())
+
+    def _resolve(self, rng: str):
+        title, _, a1 = rng.rpartition("!") if "!" in rng else (rng, "", "")
+        return self._sheets[title.strip("'").replace("''", "'")], a1
+
+    def values_batch_get(self, ranges, params=None) -> dict:
+        self.api_calls["values_batch_get"] += 1
+        out = []
+        for rng in ranges:
+            ws, a1 = self._resolve(rng)
+            values = ws.read_range(a1_range_to_grid_range(a1) if a1 else {})
+            out.append({"range": rng, **({"values": values} if values else {})})
+        return {"valueRanges": out}
+
+    def values_batch_update(self, body) -> dict:
+        self.api_calls["values_batch_update"] += 1
+        for vr in body.get("data", []):
+            ws, a1 = self._resolve(vr["range"])
+            grid = a1_range_to_grid_range(a1)
+            r0, c0 = grid.get("startRowIndex", 0), grid.get("startColumnIndex", 0)
+            for i, row in enumerate(vr.get("values", [])):
+                ws._write_row(r0 + i, c0, row)
+        return {"totalUpdatedCells": sum(len(r) for vr in body.get("data", []) for r in vr.get("values", []))}
+
+    def batch_update(self, body) -> dict:
+        """Records every request; applies deleteDimension (ROWS) like the API.
+        Like the API, the whole batch is rejected if any request reaches past
+        a sheet's row_count."""
+        self.api_calls["batch_update"] += 1
+        self.batch_updates.append(body)
+        by_id = {ws.id: ws for ws in self._sheets.values()}
+        for req in body.get("requests", []):
+            _check_grid_limits(req, by_id)
+        for req in body.get("requests", []):
+            rng = req.get("deleteDimension", {}).get("range")
+            if rng and rng.get("dimension") == "ROWS":
+                by_id[rng["sheetId"]]._delete(rng["startIndex"] + 1, rng["endIndex"])
+        return {"replies": [{} for _ in body.get("requests", [])]}
@@ -0,0 +1,126 @@
+"""
+Bounded fan-out engine for many small blocking fetches.
+
+Runs every task on one shared thread pool (global concurrency limit) while
+keeping any single API from seeing more than `per_host` requests in flight.
+Tasks wait in per-host queues and are handed to the pool round-robin by
+host, only while their host is under its cap, so a long run of tasks for
+one host never parks workers that another host could use. Results come
+back in submission order, grouped by source label, with per-source timing
+for the log.
+
+Usage:
+    engine = FanOutEngine(max_workers=24, per_host=4)
+    results = engine.run([
+        FetchTask("Greenhouse", "boards-api.greenhouse.io", fetch_board, ("stripe", "Stripe")),
+        FetchTask("Lever", "api.lever.co", fetch_lever, ("palantir", "Palantir")),
+    ])
+    results["Greenhouse"]      # flattened list of whatever fetch_board returned
+    engine.timings["Lever"]    # SourceTiming(tasks=1, errors=0, wall_sec=..., busy_sec=...)
+"""
+import time
+import logging
+import threading
+import concurrent.futures
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Tuple
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class FetchTask:
+    """One unit of work: call fn(*args) → list of results."""
+    source: str
+    host: str
+    fn: Callable
+    args: Tuple = ()
+
+
+@dataclass
+class SourceTiming:
+    tasks: int = 0
+    errors: int = 0
+    results: int = 0
+    busy_sec: float = 0.0       # sum of per-task durations
+    first_start: float = 0.0
+    last_end: float = 0.0
+
+    @property
+    def wall_sec(self) -> float:
+        if not self.first_start:
+            return 0.0
+        return self.last_end - self.first_start
+
+
+@dataclass
+class FanOutEngine:
+    max_workers: int = 24
+    per_host: int = 4
+
+    timings: Dict[str, SourceTiming] = field(default_factory=dict, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def _run_one(self, task: FetchTask):
+        start = time.monotonic()
+        try:
+            out = task.fn(*task.args)
+            err = False
+        except Exception as e:
+            log.debug(f"FanOut[{task.source}] {task.args!r} failed: {e}")
+            out, err = None, True
+        end = time.monotonic()
+        with self._lock:
+            t = self.timings.setdefault(task.source, SourceTiming())
+            t.tasks += 1
+            t.errors += int(err)
+            t.busy_sec += end - start
+            t.first_start = min(t.first_start or start, start)
+            t.last_end = max(t.last_end, end)
+        return out or []
+
+    def run(self, tasks: List[FetchTask]) -> Dict[str, list]:
+        """Execute all tasks; return {source: results in task order}."""
+        ordered: List[list] = [[] for _ in tasks]
+        queues: Dict[str, deque] = {}
+        for i, t in enumerate(tasks):
+            queues.setdefault(t.host, deque()).append(i)
+        in_flight: Dict[str, int] = defaultdict(int)
+        running: Dict[concurrent.futures.Future, int] = {}
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            def fill():
+                # One task per host per pass, while the host and the pool have room
+                progress = True
+                while progress and len(running) < self.max_workers:
+                    progress = False
+                    for host, queue in queues.items():
+                        if queue and in_flight[host] < self.per_host and len(running) < self.max_workers:
+                            i = queue.popleft()
+                            in_flight[host] += 1
+                            running[pool.submit(self._run_one, tasks[i])] = i
+                            progress = True
+
+            fill()
+            while running:
+                done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for fut in done:
+                    i = running.pop(fut)
+                    in_flight[tasks[i].host] -= 1
+                    ordered[i] = fut.result()
+                fill()
+
+        grouped: Dict[str, list] = defaultdict(list)
+        for task, out in zip(tasks, ordered):
+            grouped[task.source].extend(out)
+        for source, items in grouped.items():
+            self.timings[source].results = len(items)
+        return grouped
+
+    def log_timings(self):
+        for source, t in self.timings.items():
+            log.info(
+                f"FanOut {source}: {t.tasks} tasks → {t.results} rows in "
+                f"{t.wall_sec:.1f}s wall ({t.busy_sec:.1f}s busy, {t.errors} errors)"
+            )
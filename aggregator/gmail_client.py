@@ -0,0 +1,147 @@
+"""
+Two-phase Gmail message fetch over batch HTTP requests.
+
+EmailExtractor and BounceScanner used to list up to 100 messages and then
+call messages().get(format="full") once per message: 100 round trips, and
+full bodies downloaded again for mail that had been processed on an earlier
+run.
+
+GmailClient wraps the discovery service (or a FakeGmail) and fetches in two
+phases, GMAIL_BATCH_SIZE gets per batch HTTP request:
+
+    metadata    format=metadata for every listed id (headers, internalDate,
+                labelIds, no body). The caller's keep(meta) predicate drops
+                messages it has already seen.
+    full        format=full only for the messages that survived.
+
+Rate-limited (429) or 5xx parts of a batch are retried with backoff; any
+other per-message error drops that message and is logged, as the per-message
+try/except did before.
+
+Usage:
+    gmail = GmailClient(service)
+    ids = gmail.list_ids('label:"Job Hunt" newer_than:3d', max_results=100)
+    for msg in gmail.fetch(ids, keep=lambda meta: meta["id"] not in processed):
+        ...
+"""
+import time
+import logging
+from typing import Callable, Dict, Iterable, List, Optional
+
+from aggregator.config import GMAIL_BATCH_SIZE, MAX_RETRIES, RETRY_DELAY_SECONDS, BACKOFF_MULTIPLIER
+
+log = logging.getLogger(__name__)
+
+_RETRYABLE = {429, 500, 502, 503, 504}
+
+
+def _status(exc) -> Optional[int]:
+    try:
+        return int(exc.resp.status)
+    except Exception:
+        return None
+
+
+def message_header(msg: dict, name: str) -> str:
+    """Value of a message header (case-insensitive), '' if absent."""
+    for h in msg.get("payload", {}).get("headers", []):
+        if h.get("name", "").lower() == name.lower():
+            return h.get("value", "")
+    return ""
+
+
+class GmailClient:
+    def __init__(self, service, user_id: str = "me", batch_size: int = GMAIL_BATCH_SIZE,
+                 max_retries: int = MAX_RETRIES, sleep: Callable[[float], None] = time.sleep):
+        self.service = service
+        self.user_id = user_id
+        self.batch_size = max(1, batch_size)
+        self.max_retries = max_retries
+        self._sleep = sleep
+        self.stats = {"listed": 0, "metadata": 0, "full": 0, "skipped": 0,
+                      "batches": 0, "retried": 0, "failed": 0}
+
+    def list_ids(self, query: str, max_results: int = 100) -> List[str]:
+        result = (
+            self.service.users()
+            .messages()
+            .list(userId=self.user_id, q=query, maxResults=max_results)
+            .execute()
+        )
+        ids = [m["id"] for m in result.get("messages", [])]
+        self.stats["listed"] += len(ids)
+        return ids
+
+    def get_many(self, ids: Iterable[str], format: str = "full",
+                 metadata_headers: Iterable[str] = None) -> Dict[str, dict]:
+        """messages().get for every id, batched. Returns {id: message} for
+        the ones that came back; failures are logged and left out."""
+        kwargs = {"format": format}
+        if format == "metadata" and metadata_headers:
+            kwargs["metadataHeaders"] = list(metadata_headers)
+        pending = list(dict.fromkeys(ids))
+        out: Dict[str, dict] = {}
+        for attempt in range(self.max_retries + 1):
+            retry = []
+            for start in range(0, len(pending), self.batch_size):
+                retry += self._batch(pending[start:start + self.batch_size], kwargs, out)
+            if not retry:
+                break
+            if attempt == self.max_retries:
+                self.stats["failed"] += len(retry)
+                log.warning(f"Gmail: {len(retry)} messages still rate-limited after {attempt + 1} attempts")
+                break
+            self.stats["retried"] += len(retry)
+            self._sleep(RETRY_DELAY_SECONDS * (BACKOFF_MULTIPLIER ** attempt))
+            pending = retry
+        self.stats[format] = self.stats.get(format, 0) + len(out)
+        return out
+
+    def _batch(self, ids: List[str], kwargs: dict, out: Dict[str, dict]) -> List[str]:
+        """One batch HTTP request. Returns the ids worth retrying."""
+        retry = []
+
+        def done(request_id, response, exception):
+            if exception is None:
+                out[request_id] = response
+            elif _status(exception) in _RETRYABLE:
+                retry.append(request_id)
+            else:
+                self.stats["failed"] += 1
+                log.debug(f"Gmail get {request_id} failed: {exception}")
+
+        batch = self.service.new_batch_http_request(callback=done)
+        messages = self.service.users().messages()
+        for msg_id in ids:
+            batch.add(messages.get(userId=self.user_id, id=msg_id, **kwargs), request_id=msg_id)
+        self.stats["batches"] += 1
+        try:
+            batch.execute()
+        except Exception as e:
+            # The whole batch failed (network, auth): retry what never answered
+            if _status(e) not in _RETRYABLE and _status(e) is not None:
+                raise
+            log.debug(f"Gmail batch failed: {e}")
+            answered = set(out) | set(retry)
+            retry += [i for i in ids if i not in answered]
+        return retry
+
+    def fetch(self, ids: Iterable[str], keep: Callable[[dict], bool] = None,
+              metadata_headers: Iterable[str] = ("From", "Subject")) -> List[dict]:
+        """Full messages for `ids`, in list order. With `keep`, metadata is
+        fetched first and only messages keep(meta) accepts are fetched in full."""
+        ids = list(dict.fromkeys(ids))
+        if keep is not None and ids:
+            meta = self.get_many(ids, format="metadata", metadata_headers=metadata_headers)
+            wanted = [i for i in ids if i in meta and keep(meta[i])]
+            self.stats["skipped"] += len(meta) - len(wanted)
+            ids = wanted
+        full = self.get_many(ids, format="full") if ids else {}
+        return [full[i] for i in ids if i in full]
+
+    def log_summary(self, label: str = "Gmail"):
+        s = self.stats
+        log.info(
+            f"{label}: {s['listed']} listed, {s['metadata']} metadata, {s['skipped']} already seen, "
+            f"{s['full']} full in {s['batches']} batch requests ({s['retried']} retried, {s['failed']} failed)"
+        )
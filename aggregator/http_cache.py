@@ -0,0 +1,348 @@
+"""
+HttpCache — bounded, size-aware cache for fetched pages.
+
+PageFetcher used to keep whole requests.Response objects in an unbounded
+module dict for the life of a run, and it never checked the TTL on a hit.
+This cache has two layers:
+
+    memory   LRU of CachedResponse objects, bounded by body bytes
+             (HTTP_CACHE_MEMORY_BYTES); least recently used go first
+    disk     .local/http_cache/ — gzip bodies in content-addressed files
+             (objects/ab/abcdef….gz, so identical pages are stored once)
+             plus an SQLite index: url → digest, final URL, status,
+             ETag, Last-Modified, stored_at, expires_at
+
+An entry past its expires_at is never served by get(). It is kept, so that
+conditional_headers() can still offer its ETag / Last-Modified for a
+conditional GET, and a 304 answer is turned back into a fresh entry by
+revalidated(). Failed fetches are remembered in memory only, for
+HTTP_CACHE_NEGATIVE_TTL (see failed()). stats() reports hits, misses and bytes.
+
+Usage:
+    cache = HttpCache.default()
+    hit = cache.get(url)                       # CachedResponse or None
+    r = session.get(url, headers=cache.conditional_headers(url))
+    hit = cache.revalidated(url, r.headers) if r.status_code == 304 \\
+        else cache.put(url, r.text, r.url, r.status_code, r.headers)
+"""
+import os
+import gzip
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from aggregator.config import (
+    HTTP_CACHE_DIR,
+    HTTP_CACHE_TTL,
+    HTTP_CACHE_NEGATIVE_TTL,
+    HTTP_CACHE_MEMORY_BYTES,
+    HTTP_CACHE_DISK_BYTES,
+)
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """Stands in for the requests.Response that PageFetcher callers read
+    (.text, .status_code, .url)."""
+    request_url: str
+    url: str                 # final URL after redirects
+    text: str
+    status_code: int = 200
+    etag: str = ""
+    last_modified: str = ""
+    stored_at: float = 0.0
+    expires_at: float = 0.0
+    size: int = 0            # encoded body bytes
+    digest: str = ""
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode("utf-8")
+
+
+def _header(headers, name) -> str:
+    if not headers:
+        return ""
+    try:
+        return headers.get(name) or ""
+    except AttributeError:
+        return ""
+
+
+class HttpCache:
+    _default: Optional["HttpCache"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, directory: str = HTTP_CACHE_DIR, ttl: float = HTTP_CACHE_TTL,
+                 memory_bytes: int = HTTP_CACHE_MEMORY_BYTES, disk_bytes: int = HTTP_CACHE_DISK_BYTES,
+                 negative_ttl: float = HTTP_CACHE_NEGATIVE_TTL):
+        self.directory = directory
+        self.ttl = ttl
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self.negative_ttl = negative_ttl
+        self._memory: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._memory_used = 0
+        self._negative: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        self._conn = None
+        self.counters = {
+            "hits_memory": 0, "hits_disk": 0, "hits_negative": 0, "misses": 0, "expired": 0,
+            "stored": 0, "revalidated": 0, "evicted": 0, "bytes_served": 0, "bytes_stored": 0,
+        }
+
+    @classmethod
+    def default(cls) -> "HttpCache":
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls()
+        return cls._default
+
+    # ── Disk layer ───────────────────────────────────────────────────────────
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.join(self.directory, "objects"), exist_ok=True)
+            conn = sqlite3.connect(os.path.join(self.directory, "index.db"),
+                                   isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA busy_timeout = 15000")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    url TEXT PRIMARY KEY, digest TEXT, final_url TEXT, status INTEGER,
+                    etag TEXT, last_modified TEXT, stored_at REAL, expires_at REAL, size INTEGER)
+            """)
+            self._conn = conn
+        return self._conn
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "objects", digest[:2], digest + ".gz")
+
+    def _write_blob(self, digest: str, body: bytes):
+        path = self._blob_path(digest)
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(gzip.compress(body, compresslevel=6))
+        os.replace(tmp, path)
+
+    def _read_blob(self, digest: str) -> Optional[str]:
+        try:
+            with open(self._blob_path(digest), "rb") as f:
+                return gzip.decompress(f.read()).decode("utf-8")
+        except (OSError, EOFError, UnicodeDecodeError):
+            return None
+
+    def _load(self, url: str) -> Optional[CachedResponse]:
+        """Disk entry for `url`, body included, fresh or not."""
+        row = self._db().execute(
+            "SELECT digest, final_url, status, etag, last_modified, stored_at, expires_at, size "
+            "FROM entries WHERE url = ?", (url,)
+        ).fetchone()
+        if not row:
+            return None
+        text = self._read_blob(row[0])
+        if text is None:
+            return None
+        return CachedResponse(url, row[1], text, row[2], row[3] or "", row[4] or "",
+                              row[5], row[6], row[7], row[0])
+
+    def _save(self, entry: CachedResponse):
+        self._db().execute(
+            "INSERT OR REPLACE INTO entries (url, digest, final_url, status, etag, last_modified, "
+            "stored_at, expires_at, size) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (entry.request_url, entry.digest, entry.url, entry.status_code, entry.etag,
+             entry.last_modified, entry.stored_at, entry.expires_at, entry.size),
+        )
+
+    # ── Memory layer ─────────────────────────────────────────────────────────
+
+    def _remember(self, entry: CachedResponse):
+        old = self._memory.pop(entry.request_url, None)
+        if old is not None:
+            self._memory_used -= old.size
+        if entry.size > self.memory_bytes:
+            return
+        self._memory[entry.request_url] = entry
+        self._memory_used += entry.size
+        while self._memory_used > self.memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_used -= evicted.size
+            self.counters["evicted"] += 1
+
+    def _lookup(self, url: str) -> Optional[CachedResponse]:
+        entry = self._memory.get(url)
+        if entry is not None:
+            self._memory.move_to_end(url)
+            return entry
+        entry = self._load(url)
+        if entry is not None:
+            self._remember(entry)
+        return entry
+
+    # ── Public API ───────────────────────────────────────────────────────────
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Fresh entry for `url`, or None."""
+        with self._lock:
+            in_memory = url in self._memory
+            entry = self._lookup(url)
+            if entry is None:
+                self.counters["misses"] += 1
+                return None
+            if not entry.fresh:
+                self.counters["expired"] += 1
+                return None
+            self.counters["hits_memory" if in_memory else "hits_disk"] += 1
+            self.counters["bytes_served"] += entry.size
+            return entry
+
+    def put(self, url: str, text: str, final_url: str = None, status_code: int = 200,
+            headers=None, ttl: float = None) -> CachedResponse:
+        body = (text or "").encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()
+        now = time.time()
+        entry = CachedResponse(
+            request_url=url, url=final_url or url, text=text or "", status_code=status_code,
+            etag=_header(headers, "ETag"), last_modified=_header(headers, "Last-Modified"),
+            stored_at=now, expires_at=now + (self.ttl if ttl is None else ttl),
+            size=len(body), digest=digest,
+        )
+        with self._lock:
+            self._negative.pop(url, None)
+            try:
+                self._write_blob(digest, body)
+                self._save(entry)
+            except (OSError, sqlite3.Error) as e:
+                log.debug(f"HTTP cache disk write failed for {url[:60]}: {e}")
+            self._remember(entry)
+            self.counters["stored"] += 1
+            self.counters["bytes_stored"] += entry.size
+        return entry
+
+    def failed(self, url: str) -> bool:
+        """True if put_failure() recorded `url` within the negative TTL."""
+        with self._lock:
+            until = self._negative.get(url)
+            if until is None:
+                return False
+            if time.time() >= until:
+                del self._negative[url]
+                return False
+            self.counters["hits_negative"] += 1
+            return True
+
+    def put_failure(self, url: str, ttl: float = None):
+        """Remember that `url` could not be fetched (memory only)."""
+        with self._lock:
+            self._negative[url] = time.time() + (self.negative_ttl if ttl is None else ttl)
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since from the stored entry, fresh or stale."""
+        with self._lock:
+            entry = self._lookup(url)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def revalidated(self, url: str, headers=None, ttl: float = None) -> Optional[CachedResponse]:
+        """The server answered 304: extend the stored entry's life and return it."""
+        with self._lock:
+            entry = self._lookup(url)
+            if entry is None:
+                return None
+            now = time.time()
+            entry.stored_at = now
+            entry.expires_at = now + (self.ttl if ttl is None else ttl)
+            entry.etag = _header(headers, "ETag") or entry.etag
+            entry.last_modified = _header(headers, "Last-Modified") or entry.last_modified
+            try:
+                self._save(entry)
+            except sqlite3.Error as e:
+                log.debug(f"HTTP cache revalidate failed for {url[:60]}: {e}")
+            self.counters["revalidated"] += 1
+            self.counters["bytes_served"] += entry.size
+            return entry
+
+    def invalidate(self, url: str):
+        with self._lock:
+            entry = self._memory.pop(url, None)
+            if entry is not None:
+                self._memory_used -= entry.size
+            self._negative.pop(url, None)
+            self._db().execute("DELETE FROM entries WHERE url = ?", (url,))
+
+    def prune(self, max_stale_sec: float = 7 * 86400) -> int:
+        """Drop entries stale for longer than max_stale_sec, then the oldest
+        until the disk store fits HTTP_CACHE_DISK_BYTES, then orphaned bodies.
+        Returns the number of body files deleted."""
+        with self._lock:
+            db = self._db()
+            db.execute("DELETE FROM entries WHERE expires_at < ?", (time.time() - max_stale_sec,))
+            total = 0
+            keep = set()
+            for url, digest, size in db.execute(
+                "SELECT url, digest, size FROM entries ORDER BY stored_at DESC"
+            ).fetchall():
+                if digest not in keep:
+                    total += size or 0
+                if total > self.disk_bytes:
+                    db.execute("DELETE FROM entries WHERE url = ?", (url,))
+                    continue
+                keep.add(digest)
+            removed = 0
+            objects = os.path.join(self.directory, "objects")
+            for root, _, files in os.walk(objects):
+                for name in files:
+                    if name.endswith(".gz") and name[:-3] not in keep:
+                        try:
+                            os.remove(os.path.join(root, name))
+                            removed += 1
+                        except OSError:
+                            pass
+            return removed
+
+    def stats(self) -> dict:
+        with self._lock:
+            s = dict(self.counters)
+            s["memory_entries"] = len(self._memory)
+            s["memory_bytes"] = self._memory_used
+            lookups = s["hits_memory"] + s["hits_disk"] + s["misses"] + s["expired"]
+            s["hit_rate"] = round((s["hits_memory"] + s["hits_disk"]) / lookups, 3) if lookups else 0.0
+            return s
+
+    def log_summary(self):
+        s = self.stats()
+        if not (s["hits_memory"] or s["hits_disk"] or s["misses"] or s["expired"]):
+            return
+        log.info(
+            f"HttpCache: {s['hits_memory']} memory + {s['hits_disk']} disk hits, {s['misses']} misses, "
+            f"{s['expired']} expired, {s['revalidated']} revalidated (304), hit rate {s['hit_rate']:.0%}; "
+            f"served {s['bytes_served'] / 1e6:.1f} MB, stored {s['bytes_stored'] / 1e6:.1f} MB, "
+            f"memory {s['memory_bytes'] / 1e6:.1f} MB in {s['memory_entries']} entries"
+        )
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
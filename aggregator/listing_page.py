@@ -0,0 +1,95 @@
+"""
+Job pages rendered from direct ATS listing content.
+
+Greenhouse (?content=true), Lever (mode=json) and Ashby
+(?includeCompensation=true) return each posting's description HTML and its
+structured fields in the board listing itself. _read_direct_page used to
+ignore that and fetch every job page again, hundreds of requests a run,
+just to read the same description.
+
+The direct_sources board parsers now keep that content on the job dict:
+
+    description_html   the posting body (HTML)
+    posted_at          ISO date the posting went live
+    department         team / department name
+    employment_type    "Intern", "Full-time", ...
+    compensation       salary summary text
+    workplace          "Remote", "Hybrid", "On-site"
+
+listing_html(job) turns it into a small HTML document: a JobPosting JSON-LD
+block plus the description body. Every extractor and validator already
+reads JSON-LD first and page text after it, so the document goes through
+_process_single_job_comprehensive like a fetched page. It returns None
+when the listing has too little description text to validate from, and
+the caller fetches the real page as before.
+
+Usage:
+    html = listing_html(job)
+    self._process_single_job_comprehensive(job["url"], ..., page_html=html)
+"""
+import html
+import json
+import re
+from typing import Dict, Optional
+
+from aggregator.config import DIRECT_CONTENT_MIN_CHARS
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_CITY_STATE_RE = re.compile(r"^\s*([^,]+),\s*([A-Z]{2})\b")
+
+_FACTS = [
+    ("department", "Department"),
+    ("employment_type", "Employment type"),
+    ("workplace", "Workplace"),
+    ("compensation", "Compensation"),
+    ("posted_at", "Posted"),
+]
+
+
+def description_text(description_html: str) -> str:
+    """Plain text of a description, for the length check."""
+    return " ".join(html.unescape(_TAG_RE.sub(" ", description_html or "")).split())
+
+
+def _json_ld(job: Dict) -> Dict:
+    data = {
+        "@context": "https://schema.org",
+        "@type": "JobPosting",
+        "title": job.get("title", ""),
+        "hiringOrganization": {"@type": "Organization", "name": job.get("company", "")},
+    }
+    m = _CITY_STATE_RE.match(job.get("location") or "")
+    if m:
+        data["jobLocation"] = {"@type": "Place", "address": {
+            "@type": "PostalAddress", "addressLocality": m.group(1).strip(), "addressRegion": m.group(2),
+        }}
+    if job.get("job_id") and job["job_id"] != "N/A":
+        data["identifier"] = {"@type": "PropertyValue", "value": job["job_id"]}
+    if job.get("employment_type"):
+        data["employmentType"] = job["employment_type"]
+    if job.get("posted_at"):
+        data["datePosted"] = job["posted_at"]
+    return data
+
+
+def listing_html(job: Dict) -> Optional[str]:
+    """HTML page for a direct listing, or None if it has too little
+    description to validate without fetching the real page."""
+    description = job.get("description_html") or ""
+    if len(description_text(description)) < DIRECT_CONTENT_MIN_CHARS:
+        return None
+    title = html.escape(job.get("title", ""))
+    company = html.escape(job.get("company", ""))
+    ld = json.dumps(_json_ld(job)).replace("</", "<\\/")
+    facts = "".join(
+        f"<li>{label}: {html.escape(str(job[key]))}</li>" for key, label in _FACTS if job.get(key)
+    )
+    return (
+        f"<html><head><title>{title} - {company}</title>"
+        f'<meta property="og:title" content="{title}">'
+        f'<script type="application/ld+json">{ld}</script></head>'
+        f"<body><h1>{title}</h1>"
+        f'<div class="location">{html.escape(job.get("location") or "")}</div>'
+        f'<ul class="listing-facts">{facts}</ul>'
+        f"<div class=\"description\">{description}</div></body></html>"
+    )
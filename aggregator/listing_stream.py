@@ -0,0 +1,290 @@
+"""
+Streaming parser for the GitHub job-listing READMEs.
+
+SimplifyGitHubScraper used to read the whole README into one string, build
+a BeautifulSoup tree of it just to look for <table>, and, failing that,
+split the string into lines for the pipe-table parser. For the multi-MB
+Simplify READMEs the tree dominated both memory and time.
+
+ListingStream reads the document one line at a time (straight from
+response.iter_lines()) and handles both formats in the same pass:
+
+    HTML tables   an html.parser state machine tracks h2/h3 → table →
+                  tr → td → a, and emits a job as each </tr> closes
+    pipe tables   after the first line matching HEADER_PATTERN, every line
+                  with five or more cells is a listing row
+
+It yields the same job dicts as SimplifyGitHubScraper._parse_html_tables /
+_parse_markdown_text. A document has one format or the other. If both
+appear, whichever yields a job first wins, where _parse preferred the
+HTML rows.
+
+Usage:
+    for job in iter_listings(response.iter_lines(decode_unicode=True), "SimplifyJobs"):
+        ...
+"""
+import re
+from html.parser import HTMLParser
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+EMOJI_PATTERN = re.compile(
+    r"[\U0001f600-\U0001f64f\U0001f300-\U0001f5ff\U0001f680-\U0001f6ff\U0001f1e0-\U0001f1ff]+",
+    re.UNICODE,
+)
+HEADER_PATTERN = re.compile(
+    r"Company.*(?:Role|Position|Job.?Title).*Location.*(?:Application|Link|Posting|Posted|Date|Age|Apply|Model|Visa)", re.I
+)
+HTML_LINK_PATTERN = re.compile(r'<a\s+href="(https?://[^"]+)"')
+MD_LINK_PATTERN = re.compile(r"\[.*?\]\((https?://[^\)]+)\)")
+_AGE_RE = re.compile(r"^\d+[dhmw]")
+_TAG_RE = re.compile(r"<[^>]+>")
+_CLOSED_MARKERS = ("🔒", "❌", "closed")
+
+
+def github_category(heading: str) -> str:
+    """Category for a table from the h2/h3 heading above it."""
+    ht = heading.lower()
+    if "software" in ht and "internship" in ht:
+        return "Software Engineering Internship"
+    if any(k in ht for k in ["data science", "machine learning", "ai"]):
+        return "Data Science AI ML Internship"
+    return ""
+
+
+def markdown_row(line: str, delimiter: str, last_company: str,
+                 source_name: str) -> Tuple[Optional[dict], str]:
+    """Parse one pipe/tab-table line. Returns (job or None, last_company)."""
+    if not line.strip():
+        return None, last_company
+    parts = [p.strip() for p in line.split(delimiter) if p.strip()]
+    if len(parts) < 5:
+        return None, last_company
+    # Strip HTML tags from company cell (SpeedyApply wraps in <a><strong>)
+    _co_cell = _TAG_RE.sub("", parts[0])
+    _co_cell = re.sub(r"\*\*", "", _co_cell)  # Strip markdown bold
+    raw_company = EMOJI_PATTERN.sub("", _co_cell).strip()
+    if raw_company and "↳" not in raw_company:
+        company = raw_company
+        last_company = company
+    else:
+        company = last_company
+        if not company:
+            return None, last_company  # continuation row with no known parent company
+    title = EMOJI_PATTERN.sub("", parts[1]).strip()
+    location = EMOJI_PATTERN.sub("", parts[2]).strip()
+    # Find the apply link by scanning cells from the end (link is always
+    # in the last populated cell; column count varies by source: Visa, Salary, etc.)
+    link_cell = ""
+    age = ""
+    for _cell in reversed(parts[2:]):
+        if HTML_LINK_PATTERN.search(_cell) or MD_LINK_PATTERN.search(_cell) or _cell.startswith("http"):
+            link_cell = _cell
+            break
+    # age = first cell after location that looks like a short duration
+    for _cell in parts[3:]:
+        if _AGE_RE.match(_cell.strip()):
+            age = _cell.strip()
+            break
+    match = HTML_LINK_PATTERN.search(link_cell) or MD_LINK_PATTERN.search(link_cell)
+    url = match.group(1) if match else (link_cell if link_cell.startswith("http") else None)
+    if not url or any(marker in line for marker in _CLOSED_MARKERS):
+        return None, last_company
+    return {
+        "company": company,
+        "title": title,
+        "location": location,
+        "url": url,
+        "age": age,
+        "is_closed": False,
+        "source": source_name,
+        "github_category": "",
+    }, last_company
+
+
+class _Cell:
+    __slots__ = ("texts", "anchor_texts", "in_anchor", "has_anchor", "href")
+
+    def __init__(self):
+        self.texts: List[str] = []
+        self.anchor_texts: List[str] = []
+        self.in_anchor = 0       # depth inside the cell's first <a>
+        self.has_anchor = False
+        self.href = None         # href of the first <a href=...> in the cell
+
+    @property
+    def text(self) -> str:
+        return "".join(self.texts)
+
+
+class _TableRows(HTMLParser):
+    """Event-driven equivalent of the BeautifulSoup table walk."""
+
+    def __init__(self, source_name: str):
+        super().__init__(convert_charrefs=True)
+        self.source_name = source_name
+        self.jobs: List[dict] = []
+        self.tables_seen = 0
+        self._heading = ""
+        self._heading_parts: Optional[List[str]] = None
+        self._heading_depth = 0
+        self._table_depth = 0
+        self._category = ""
+        self._rows_in_table = 0
+        self._row: Optional[List[_Cell]] = None
+        self._row_closed = False
+        self._cell: Optional[_Cell] = None
+        self._last_company = ""
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("h2", "h3"):
+            if self._heading_parts is None:
+                self._heading_parts = []
+            self._heading_depth += 1
+        elif tag == "table":
+            self._table_depth += 1
+            self.tables_seen += 1
+            if self._table_depth == 1:
+                self._category = github_category(self._heading)
+                self._rows_in_table = 0
+        if self._table_depth == 0:
+            return
+        if self._row is not None and any(v and "🔒" in v for _, v in attrs):
+            self._row_closed = True
+        if tag == "tr" and self._row is None:
+            self._row, self._row_closed = [], False
+        elif tag == "td" and self._row is not None and self._cell is None:
+            self._cell = _Cell()
+        elif tag == "a" and self._cell is not None:
+            cell = self._cell
+            if not cell.has_anchor:
+                cell.has_anchor = True
+                cell.in_anchor = 1
+            elif cell.in_anchor:
+                cell.in_anchor += 1
+            href = dict(attrs).get("href") if any(k == "href" for k, _ in attrs) else None
+            if href is not None and cell.href is None:
+                cell.href = href
+
+    def handle_endtag(self, tag):
+        if tag in ("h2", "h3") and self._heading_depth:
+            self._heading_depth -= 1
+            if not self._heading_depth:
+                self._heading = "".join(self._heading_parts or [])
+                self._heading_parts = None
+            return
+        if self._table_depth == 0:
+            return
+        if tag == "a" and self._cell is not None and self._cell.in_anchor:
+            self._cell.in_anchor -= 1
+        elif tag == "td" and self._cell is not None:
+            self._row.append(self._cell)
+            self._cell = None
+        elif tag == "tr" and self._row is not None:
+            row, self._row = self._row, None
+            self._rows_in_table += 1
+            if self._rows_in_table > 1:  # first <tr> is the header
+                self._emit(row)
+        elif tag == "table":
+            self._table_depth -= 1
+
+    def handle_data(self, data):
+        text = data.strip()
+        if self._heading_parts is not None and text:
+            self._heading_parts.append(text)
+        if self._row is not None and "🔒" in data:
+            self._row_closed = True
+        if self._cell is not None and text:
+            self._cell.texts.append(text)
+            if self._cell.in_anchor:
+                self._cell.anchor_texts.append(text)
+
+    def _emit(self, cells: List[_Cell]):
+        if len(cells) < 5:
+            return
+        if cells[0].has_anchor:
+            company = EMOJI_PATTERN.sub("", "".join(cells[0].anchor_texts))
+            self._last_company = company
+        else:
+            # Sub-listing (↳) — inherit company from parent row
+            cell_text = cells[0].text
+            if "↳" in cell_text or not cell_text.strip():
+                company = self._last_company
+            else:
+                return
+        url = None
+        for cell in cells[2:]:
+            if cell.href is not None and cell.href.startswith("http"):
+                url = cell.href
+                break
+        if not url:
+            return
+        self.jobs.append({
+            "company": company,
+            "title": EMOJI_PATTERN.sub("", cells[1].text),
+            "location": EMOJI_PATTERN.sub("", cells[2].text),
+            "url": url,
+            "age": cells[4].text,
+            "is_closed": self._row_closed,
+            "source": self.source_name,
+            "github_category": self._category,
+        })
+
+
+class ListingStream:
+    """Feed lines, collect jobs. iter_listings() is the usual entry point."""
+
+    def __init__(self, source_name: str):
+        self.source_name = source_name
+        self.html = _TableRows(source_name)
+        self.chars = 0
+        self.lines = 0
+        self.format = ""             # "html" or "markdown" once a job was emitted
+        self._delimiter = None       # set once the pipe-table header is seen
+        self._skip = 0
+        self._last_company = ""
+
+    def feed(self, line: str) -> List[dict]:
+        """Parse one line; returns the jobs it completed."""
+        self.lines += 1
+        self.chars += len(line) + 1
+        out: List[dict] = []
+        if self.format != "markdown":
+            self.html.feed(line + "\n")
+            if self.html.jobs:
+                out, self.html.jobs = self.html.jobs, []
+                self.format = "html"
+        if self.format != "html":
+            job = self._markdown(line)
+            if job is not None:
+                self.format = "markdown"
+                out.append(job)
+        return out
+
+    def _markdown(self, line: str) -> Optional[dict]:
+        if self._delimiter is None:
+            if HEADER_PATTERN.search(line):
+                self._delimiter = "\t" if "\t" in line else "|"
+                self._skip = 0 if self._delimiter == "\t" else 1  # separator row
+            return None
+        if self._skip:
+            self._skip -= 1
+            return None
+        job, self._last_company = markdown_row(line, self._delimiter, self._last_company, self.source_name)
+        return job
+
+    def close(self) -> List[dict]:
+        if self.format == "markdown":
+            return []
+        self.html.close()
+        out, self.html.jobs = self.html.jobs, []
+        return out
+
+
+def iter_listings(lines: Iterable[str], source_name: str, stream: ListingStream = None) -> Iterator[dict]:
+    """Yield job dicts from README lines as soon as each row is complete."""
+    stream = stream or ListingStream(source_name)
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", errors="replace")
+        yield from stream.feed(line)
+    yield from stream.close()
@@ -0,0 +1,128 @@
+"""
+PageDocument — one parsed job page, text extracted once.
+
+soup.get_text() walks the whole DOM on every call, and the validators used
+to call it dozens of times per page (slices of 2k/5k/10k/15k, each then
+lowercased). A PageDocument is built once per fetched page and caches:
+
+    .soup              the parsed BeautifulSoup tree
+    .text              soup.get_text()
+    .lower             .text.lower()
+    .prefix(n)         .text[:n]
+    .lower_prefix(n)   .text[:n].lower()   (same result as the old idiom)
+    .json_ld           parsed <script type="application/ld+json"> blocks
+    .first_json_ld     the first block (what the extractors always read)
+    .memo(key, fn)     anything else derived from the page, computed once
+
+It also forwards attribute access to the soup (find, find_all, select,
+title, ...), and get_text() with no arguments returns the cached text, so
+any helper that still expects a soup can be handed a PageDocument.
+
+Usage:
+    page = PageDocument(soup)
+    ValidationHelper.check_page_restrictions(page)
+    PageDocument.of(soup_or_page).lower_prefix(PAGE_TEXT_FULL_SCAN)
+"""
+import json
+import logging
+from typing import Dict, List, Optional
+
+log = logging.getLogger(__name__)
+
+
+class PageDocument:
+    __slots__ = ("soup", "_text", "_lower", "_lower_prefixes", "_json_ld", "_get_text_cache", "_memo")
+
+    def __init__(self, soup):
+        self.soup = soup
+        self._text: Optional[str] = None
+        self._lower: Optional[str] = None
+        self._lower_prefixes: Dict[int, str] = {}
+        self._json_ld: Optional[List] = None
+        self._get_text_cache: Dict[tuple, str] = {}
+        self._memo: Dict = {}
+
+    @classmethod
+    def of(cls, page):
+        """Wrap a soup (or pass a PageDocument/None straight through)."""
+        if page is None or isinstance(page, cls):
+            return page
+        return cls(page)
+
+    # ── Text ──────────────────────────────────────────────────────────
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self.soup.get_text() if self.soup is not None else ""
+        return self._text
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    def prefix(self, n: int) -> str:
+        return self.text[:n]
+
+    def lower_prefix(self, n: int) -> str:
+        """text[:n].lower() — cached per n (lower() can change length, so
+        this is not always lower[:n])."""
+        cached = self._lower_prefixes.get(n)
+        if cached is None:
+            cached = self._lower_prefixes[n] = self.text[:n].lower()
+        return cached
+
+    def get_text(self, *args, **kwargs) -> str:
+        if not args and not kwargs:
+            return self.text
+        key = (args, tuple(sorted(kwargs.items())))
+        cached = self._get_text_cache.get(key)
+        if cached is None:
+            cached = self._get_text_cache[key] = self.soup.get_text(*args, **kwargs)
+        return cached
+
+    @property
+    def page_title(self) -> str:
+        t = self.soup.title if self.soup is not None else None
+        return t.string.strip() if t and t.string else ""
+
+    # ── JSON-LD ───────────────────────────────────────────────────────
+
+    @property
+    def json_ld(self) -> List:
+        """Parsed JSON-LD blocks, in document order. Unparseable blocks are None."""
+        if self._json_ld is None:
+            blocks = []
+            if self.soup is not None:
+                for tag in self.soup.find_all("script", {"type": "application/ld+json"}):
+                    try:
+                        blocks.append(json.loads(tag.string))
+                    except Exception:
+                        blocks.append(None)
+            self._json_ld = blocks
+        return self._json_ld
+
+    @property
+    def first_json_ld(self):
+        return self.json_ld[0] if self.json_ld else None
+
+    def memo(self, key, fn):
+        """fn() the first time `key` is asked for on this page, cached after."""
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = fn()
+            return value
+
+    # ── Soup passthrough ──────────────────────────────────────────────
+
+    def __getattr__(self, name):
+        # Only reached for names not defined above (find, find_all, select, title, ...)
+        if name in PageDocument.__slots__:
+            raise AttributeError(name)
+        return getattr(self.soup, name)
+
+    def __bool__(self):
+        return self.soup is not None
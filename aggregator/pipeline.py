@@ -0,0 +1,263 @@
+"""
+Staged producer/consumer pipeline for one aggregator run.
+
+UnifiedJobAggregator.run used to go phase by phase: list and read every
+direct ATS job, then list every GitHub feed and read each feed's pages on
+its own pool, then emails, then one sheet write at the very end. Most of
+the run was one stage waiting on another.
+
+    producers ──put()──▶ bounded priority queue ──▶ N fetch/validate workers
+                                                          │ valid_jobs
+                                               writer ◀───┘ (flush every
+                                                             flush_rows / flush_sec)
+
+Producers run on their own threads and block when the queue is full, so
+listing never races far ahead of fetching. Lower priority numbers are taken
+first. Each stage (producer name) is counted separately, and wait_stage()
+lets one stage start only after another has fully drained.
+
+The writer only flushes jobs that no running item can still touch. Every
+item records mark() (the length of the valid list) when it starts. The
+writer flushes up to the smallest mark of the items still running, or up
+to mark() when nothing is running. Work done outside the queue (a producer
+processing emails itself) is registered with busy(stage).
+
+Usage:
+    pipe = RunPipeline(workers=12, flush=write_rows, mark=lambda: len(valid))
+    pipe.producer("direct", list_direct)        # fn(pipe) → pipe.put(...)
+    pipe.producer("github", list_github)
+    pipe.run()                                  # returns when every stage is done
+"""
+import time
+import queue
+import logging
+import threading
+import itertools
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(order=True)
+class _Item:
+    priority: int
+    seq: int
+    stage: str = field(compare=False)
+    fn: Callable = field(compare=False)
+    args: tuple = field(compare=False)
+    queued_at: float = field(compare=False)
+
+
+@dataclass
+class StageStats:
+    items: int = 0
+    errors: int = 0
+    busy_sec: float = 0.0
+    max_wait_sec: float = 0.0
+    first_start: float = 0.0
+    last_end: float = 0.0
+    pending: int = 0
+    producing: int = 0
+
+    @property
+    def wall_sec(self) -> float:
+        return self.last_end - self.first_start if self.first_start else 0.0
+
+
+_STOP = object()
+
+
+class RunPipeline:
+    def __init__(self, workers: int, flush: Callable[[int], int], mark: Callable[[], int],
+                 queue_size: int = 200, flush_rows: int = 25, flush_sec: float = 90.0):
+        self.workers = max(1, workers)
+        self._flush = flush            # flush(upto) → index written up to
+        self._mark = mark
+        self.flush_rows = flush_rows
+        self.flush_sec = flush_sec
+        self._queue: "queue.PriorityQueue" = queue.PriorityQueue(maxsize=queue_size)
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._inflight: Dict[int, int] = {}
+        self._tokens = itertools.count()
+        self._producers: List[threading.Thread] = []
+        self._written = 0
+        self._stopping = False
+        self.stages: Dict[str, StageStats] = {}
+        self.flushes = 0
+        self.flush_errors = 0
+
+    def _stage(self, name: str) -> StageStats:
+        st = self.stages.get(name)
+        if st is None:
+            st = self.stages[name] = StageStats()
+        return st
+
+    # ── Producers ────────────────────────────────────────────────────────────
+
+    def producer(self, stage: str, fn: Callable[["RunPipeline"], None]):
+        """Run fn(pipeline) on its own thread once run() starts."""
+        with self._cond:
+            self._stage(stage).producing += 1
+
+        def body():
+            try:
+                fn(self)
+            except Exception as e:
+                log.error(f"Pipeline producer {stage} failed: {e}", exc_info=True)
+                with self._cond:
+                    self._stage(stage).errors += 1
+            finally:
+                with self._cond:
+                    self._stage(stage).producing -= 1
+                    self._cond.notify_all()
+        self._producers.append(threading.Thread(target=body, name=f"produce-{stage}", daemon=True))
+
+    def put(self, stage: str, priority: int, fn: Callable, *args):
+        """Queue fn(*args) for the worker pool; blocks while the queue is full."""
+        with self._cond:
+            self._stage(stage).pending += 1
+        self._queue.put(_Item(priority, next(self._seq), stage, fn, args, time.monotonic()))
+
+    def wait_stage(self, stage: str, timeout: float = None) -> bool:
+        """Block until `stage` has no running producer and no queued or running items."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: stage not in self.stages or
+                (not self.stages[stage].producing and not self.stages[stage].pending),
+                timeout,
+            )
+
+    @contextmanager
+    def busy(self, stage: str):
+        """Hold the writer back while work outside the queue may append jobs."""
+        token = self._begin()
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self._end(token, stage, start, error=False, counted=False)
+
+    # ── Workers ──────────────────────────────────────────────────────────────
+
+    def _begin(self) -> int:
+        with self._cond:
+            token = next(self._tokens)
+            self._inflight[token] = self._mark()
+            return token
+
+    def _end(self, token: int, stage: str, start: float, error: bool, counted: bool = True):
+        end = time.monotonic()
+        with self._cond:
+            self._inflight.pop(token, None)
+            st = self._stage(stage)
+            st.busy_sec += end - start
+            st.first_start = st.first_start or start
+            st.last_end = max(st.last_end, end)
+            if counted:
+                st.items += 1
+                st.pending -= 1
+                st.errors += error
+            self._cond.notify_all()
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item.fn is _STOP:
+                self._queue.task_done()
+                return
+            start = time.monotonic()
+            token = self._begin()
+            with self._cond:
+                st = self._stage(item.stage)
+                st.max_wait_sec = max(st.max_wait_sec, start - item.queued_at)
+            error = False
+            try:
+                item.fn(*item.args)
+            except Exception as e:
+                error = True
+                log.error(f"Pipeline {item.stage} item failed: {e}", exc_info=True)
+            finally:
+                self._end(token, item.stage, start, error)
+                self._queue.task_done()
+
+    # ── Writer ───────────────────────────────────────────────────────────────
+
+    def _watermark_locked(self) -> int:
+        return min(self._inflight.values()) if self._inflight else self._mark()
+
+    def watermark(self) -> int:
+        """Jobs below this index belong to finished items and can be written."""
+        with self._cond:
+            return self._watermark_locked()
+
+    def _flush_to(self, upto: int) -> bool:
+        try:
+            self._written = max(self._written, self._flush(upto))
+            self.flushes += 1
+            return True
+        except Exception as e:
+            self.flush_errors += 1
+            log.error(f"Pipeline flush failed (will retry): {e}", exc_info=True)
+            return False
+
+    def _write(self):
+        last = time.monotonic()
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._stopping or self._watermark_locked() - self._written >= self.flush_rows,
+                    timeout=max(0.1, self.flush_sec - (time.monotonic() - last)),
+                )
+                if self._stopping:
+                    return
+            upto = self.watermark()
+            due = time.monotonic() - last >= self.flush_sec
+            if upto - self._written >= self.flush_rows or (due and upto > self._written):
+                ok = self._flush_to(upto)
+                last = time.monotonic()
+                if not ok:  # back off instead of hammering the Sheets API
+                    with self._cond:
+                        self._cond.wait_for(lambda: self._stopping, timeout=self.flush_sec)
+            elif due:
+                last = time.monotonic()
+
+    # ── Lifecycle ────────────────────────────────────────────────────────────
+
+    def run(self) -> int:
+        """Start every stage and return once all are done and the last rows
+        are written. Returns the index of the valid list written up to."""
+        workers = [threading.Thread(target=self._work, name=f"pipeline-{i}", daemon=True)
+                   for i in range(self.workers)]
+        writer = threading.Thread(target=self._write, name="pipeline-writer", daemon=True)
+        for t in workers + self._producers + [writer]:
+            t.start()
+        for t in self._producers:
+            t.join()
+        self._queue.join()
+        for _ in workers:
+            self._queue.put(_Item(1 << 30, next(self._seq), "", _STOP, (), 0.0))
+        for t in workers:
+            t.join()
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        writer.join()
+        upto = self._mark()
+        if upto > self._written:
+            # Last flush: a failure here propagates, as the single end-of-run write did
+            self._written = max(self._written, self._flush(upto))
+            self.flushes += 1
+        return self._written
+
+    def log_summary(self):
+        for name, st in self.stages.items():
+            if not st.items and not st.errors:
+                continue
+            log.info(
+                f"Pipeline {name}: {st.items} items ({st.errors} errors), wall {st.wall_sec:.0f}s, "
+                f"busy {st.busy_sec:.0f}s, max queue wait {st.max_wait_sec:.0f}s"
+            )
+        log.info(f"Pipeline writer: {self.flushes} flushes ({self.flush_errors} failed), {self._written} rows")
@@ -42,6 +42,7 @@ from aggregator.config import (
     SPONSORSHIP_REJECT_PATTERNS,
     BLACKLIST_DOMAINS,
     MAX_REASONABLE_AGE_DAYS,
+    PAGE_TEXT_FULL_SCAN,
 )
 
 from aggregator.utils import (
@@ -51,6 +52,8 @@ from aggregator.utils import (
     CompanyValidator,
     PlatformDetector,
 )
+from aggregator.page_document import PageDocument
+from aggregator.restriction_rules import scan_page, UNDERGRADUATE_FLEXIBILITY_RES
 
 # ============================================================================
 # Compiled Patterns (Performance Optimization)
@@ -917,9 +920,9 @@ class JobIDExtractor:
             return ExtractionResult(None, 0.0, "json_ld")
 
         try:
-            json_ld = soup.find("script", {"type": "application/ld+json"})
-            if json_ld:
-                data = json.loads(json_ld.string)
+            page = PageDocument.of(soup)
+            if page.json_ld:
+                data = page.first_json_ld
                 if isinstance(data, dict):
                     identifier = data.get("identifier", {})
                     if isinstance(identifier, dict) and identifier.get("value"):
@@ -937,7 +940,7 @@ class JobIDExtractor:
             return ExtractionResult(None, 0.0, "page_text")
 
         try:
-            page_text = soup.get_text()[:5000]
+            page_text = PageDocument.of(soup).prefix(5000)
             for pattern, confidence in [
                 (r"Job\s*Code\s*:?\s*([A-Z0-9]{4,15})\b", 0.90),
                 (r"Job\s*ID\s*:?\s*([A-Z0-9\-]{4,15})\b", 0.85),
@@ -992,11 +995,12 @@ class JobIDExtractor:
     @staticmethod
     def extract_all_methods(url, soup, platform="generic"):
         """ORIGINAL: All methods execute, vote on non-None"""
+        page = PageDocument.of(soup)
         results = [
             JobIDExtractor.extract_from_url(url, platform),
-            JobIDExtractor.extract_from_html_meta(soup),
-            JobIDExtractor.extract_from_json_ld(soup),
-            JobIDExtractor.extract_from_page_text(soup),
+            JobIDExtractor.extract_from_html_meta(page),
+            JobIDExtractor.extract_from_json_ld(page),
+            JobIDExtractor.extract_from_page_text(page),
         ]
 
         best_result = ExtractionVoter.vote(
@@ -1084,9 +1088,9 @@ class LocationExtractor:
             return ExtractionResult(None, 0.0, "json_ld")
 
         try:
-            json_ld = soup.find("script", {"type": "application/ld+json"})
-            if json_ld:
-                data = json.loads(json_ld.string)
+            page = PageDocument.of(soup)
+            if page.json_ld:
+                data = page.first_json_ld
                 if isinstance(data, dict):
                     job_location = data.get("jobLocation", {})
                     if isinstance(job_location, dict):
@@ -1110,7 +1114,7 @@ class LocationExtractor:
             return ExtractionResult(None, 0.0, "page_text")
 
         try:
-            page_text = soup.get_text()[:5000]
+            page_text = PageDocument.of(soup).prefix(5000)
 
             # Original pattern
             match = _LOCATION_LABEL_PATTERN.search(page_text)
@@ -1278,11 +1282,12 @@ class LocationExtractor:
         Title extraction is PRIORITY 1 (highest confidence)
         page_source parameter added for Selenium text extraction
         """
+        page = PageDocument.of(soup)
         results = [
             LocationExtractor.extract_from_title(title),  # NEW PRIORITY 1
-            LocationExtractor.extract_from_json_ld(soup),
-            LocationExtractor.extract_from_html_selectors(soup, platform),
-            LocationExtractor.extract_from_page_text(soup),
+            LocationExtractor.extract_from_json_ld(page),
+            LocationExtractor.extract_from_html_selectors(page, platform),
+            LocationExtractor.extract_from_page_text(page),
             LocationExtractor.extract_from_url(url),  # ENHANCED Workday parser
         ]
 
@@ -1666,7 +1671,7 @@ class LocationProcessor:
                 if "on-site" in desc_lower or "onsite" in desc_lower:
                     return "On Site"
 
-            page_text = soup.get_text()[:2000].lower()
+            page_text = PageDocument.of(soup).lower_prefix(2000)
 
             try:
                 from aggregator.config import ENHANCED_REMOTE_PATTERNS
@@ -1887,7 +1892,7 @@ class LocationProcessor:
             return canada_url_check
 
         if location == "Unknown" and soup:
-            page_snippet = soup.get_text()[:3000].lower()
+            page_snippet = PageDocument.of(soup).lower_prefix(3000)
             for pattern, country in INTERNATIONAL_TEXT_INDICATORS:
                 if re.search(pattern, page_snippet):
                     return f"Location: International ({country} from page)"
@@ -1953,7 +1958,7 @@ class LocationProcessor:
         if location:
             context_text += location.lower() + " "
         if soup:
-            context_text += soup.get_text()[:3000].lower() + " "
+            context_text += PageDocument.of(soup).lower_prefix(3000) + " "
         if url:
             context_text += url.lower() + " "
 
@@ -1988,7 +1993,7 @@ class LocationProcessor:
                 if content == "canada" or "canada only" in content:
                     return "Location: Canada (from meta tag)"
 
-            _raw = soup.get_text()[:10000]
+            _raw = PageDocument.of(soup).prefix(10000)
             page_text = _raw
             for _lp in [" du Canada", " du canada", "du Canada\n", "du canada\n", "du Canada ", "du canada "]:
                 page_text = page_text.replace(_lp, " ")
@@ -2256,35 +2261,30 @@ class ValidationHelper:
             return None, None
 
         try:
-            from aggregator.config import HIGH_SCHOOL_ONLY_PATTERNS, PAGE_TEXT_FULL_SCAN
-        except (ImportError, AttributeError):
-            return None, None
-
-        try:
-            page_text = soup.get_text()[:PAGE_TEXT_FULL_SCAN].lower()
-
-            for pattern in HIGH_SCHOOL_ONLY_PATTERNS:
-                match = re.search(pattern, page_text)
-                if match:
-                    matched_text = match.group(0)
-                    context = page_text[
-                        max(0, match.start() - 150) : min(
-                            len(page_text), match.end() + 150
-                        )
-                    ]
+            scan = scan_page(soup, PAGE_TEXT_FULL_SCAN)
+            page_text = scan.text
 
-                    log_detailed_rejection(
-                        "Company",
-                        "Title",
-                        "High school only",
-                        pattern=pattern,
-                        matched_text=matched_text,
-                        context=context[:200],
-                    )
-                    return (
-                        "REJECT",
-                        "High school students only (college students not eligible)",
+            for hit in scan.hits("high_school"):
+                pattern, match = hit.pattern, hit.match
+                matched_text = match.group(0)
+                context = page_text[
+                    max(0, match.start() - 150) : min(
+                        len(page_text), match.end() + 150
                     )
+                ]
+
+                log_detailed_rejection(
+                    "Company",
+                    "Title",
+                    "High school only",
+                    pattern=pattern,
+                    matched_text=matched_text,
+                    context=context[:200],
+                )
+                return (
+                    "REJECT",
+                    "High school students only (college students not eligible)",
+                )
 
         except Exception as e:
             logging.debug(f"High school check failed: {e}")
@@ -2298,35 +2298,30 @@ class ValidationHelper:
             return None, None
 
         try:
-            from aggregator.config import PERMANENT_US_AUTHORIZATION_PATTERNS, PAGE_TEXT_FULL_SCAN
-        except (ImportError, AttributeError):
-            return None, None
-
-        try:
-            page_text = soup.get_text()[:PAGE_TEXT_FULL_SCAN].lower()
+            scan = scan_page(soup, PAGE_TEXT_FULL_SCAN)
+            page_text = scan.text
 
-            for pattern in PERMANENT_US_AUTHORIZATION_PATTERNS:
-                match = re.search(pattern, page_text)
-                if match:
-                    matched_text = match.group(0)
-                    context = page_text[
-                        max(0, match.start() - 150) : min(
-                            len(page_text), match.end() + 150
-                        )
-                    ]
-
-                    log_detailed_rejection(
-                        "Company",
-                        "Title",
-                        "Permanent authorization",
-                        pattern=pattern,
-                        matched_text=matched_text,
-                        context=context[:200],
-                    )
-                    return (
-                        "REJECT",
-                        "Requires permanent US work authorization (F-1 temporary status not eligible)",
+            for hit in scan.hits("permanent_authorization"):
+                pattern, match = hit.pattern, hit.match
+                matched_text = match.group(0)
+                context = page_text[
+                    max(0, match.start() - 150) : min(
+                        len(page_text), match.end() + 150
                     )
+                ]
+
+                log_detailed_rejection(
+                    "Company",
+                    "Title",
+                    "Permanent authorization",
+                    pattern=pattern,
+                    matched_text=matched_text,
+                    context=context[:200],
+                )
+                return (
+                    "REJECT",
+                    "Requires permanent US work authorization (F-1 temporary status not eligible)",
+                )
 
         except Exception as e:
             logging.debug(f"Permanent authorization check failed: {e}")
@@ -2340,44 +2335,39 @@ class ValidationHelper:
             return None, None
 
         try:
-            from aggregator.config import NON_CS_UNDERGRADUATE_DEGREE_PATTERNS, PAGE_TEXT_FULL_SCAN
-        except (ImportError, AttributeError):
-            return None, None
-
-        try:
-            page_text = soup.get_text()[:PAGE_TEXT_FULL_SCAN].lower()
+            scan = scan_page(soup, PAGE_TEXT_FULL_SCAN)
+            page_text = scan.text
 
-            for pattern in NON_CS_UNDERGRADUATE_DEGREE_PATTERNS:
-                match = re.search(pattern, page_text)
-                if match:
-                    matched_text = match.group(0)
-                    context = page_text[
-                        max(0, match.start() - 200) : min(
-                            len(page_text), match.end() + 200
-                        )
-                    ]
-
-                    cs_keywords = [
-                        "computer science",
-                        "software engineering",
-                        "computer engineering",
-                        "information technology",
-                        "data science",
-                        "information systems",
-                    ]
-                    if any(kw in context for kw in cs_keywords):
-                        logging.debug(
-                            f"Non-CS degree found but CS also mentioned - accepting"
-                        )
-                        continue
-
-                    logging.debug(
-                        f"Non-CS undergraduate degree requirement: '{matched_text}'"
+            for hit in scan.hits("non_cs_undergrad"):
+                match = hit.match
+                matched_text = match.group(0)
+                context = page_text[
+                    max(0, match.start() - 200) : min(
+                        len(page_text), match.end() + 200
                     )
-                    return (
-                        "REJECT",
-                        "Requires non-CS undergraduate degree (Electrical/Mechanical Engineering)",
+                ]
+
+                cs_keywords = [
+                    "computer science",
+                    "software engineering",
+                    "computer engineering",
+                    "information technology",
+                    "data science",
+                    "information systems",
+                ]
+                if any(kw in context for kw in cs_keywords):
+                    logging.debug(
+                        f"Non-CS degree found but CS also mentioned - accepting"
                     )
+                    continue
+
+                logging.debug(
+                    f"Non-CS undergraduate degree requirement: '{matched_text}'"
+                )
+                return (
+                    "REJECT",
+                    "Requires non-CS undergraduate degree (Electrical/Mechanical Engineering)",
+                )
 
         except Exception as e:
             logging.debug(f"Non-CS degree check failed: {e}")
@@ -2391,46 +2381,40 @@ class ValidationHelper:
             return None, None
 
         try:
-            from aggregator.config import PREFERRED_DEGREE_MISMATCH_PATTERNS, PAGE_TEXT_FULL_SCAN
-        except (ImportError, AttributeError):
-            return None, None
-
-        try:
-            page_text = soup.get_text()[:PAGE_TEXT_FULL_SCAN].lower()
-
-            for pattern in PREFERRED_DEGREE_MISMATCH_PATTERNS:
-                match = re.search(pattern, page_text)
-                if match:
-                    degree_list = match.group(1).lower()
-
-                    cs_keywords = [
-                        "computer",
-                        "software",
-                        "cs ",
-                        "information technology",
-                        "it ",
-                        "data science",
-                    ]
-                    has_cs = any(kw in degree_list for kw in cs_keywords)
-
-                    non_cs_keywords = [
-                        "mechanical",
-                        "electrical",
-                        "civil",
-                        "aerospace",
-                        "chemical",
-                        "agricultural",
-                    ]
-                    has_non_cs = any(kw in degree_list for kw in non_cs_keywords)
-
-                    if has_non_cs and not has_cs:
-                        logging.debug(
-                            f"Preferred degrees mismatch: '{degree_list}' (no CS/Software mentioned)"
-                        )
-                        return (
-                            "REJECT",
-                            "Preferred degrees do not include CS/Software (Mechanical/Electrical Engineering only)",
-                        )
+            scan = scan_page(soup, PAGE_TEXT_FULL_SCAN)
+
+            for hit in scan.hits("preferred_degree_mismatch"):
+                match = hit.match
+                degree_list = match.group(1).lower()
+
+                cs_keywords = [
+                    "computer",
+                    "software",
+                    "cs ",
+                    "information technology",
+                    "it ",
+                    "data science",
+                ]
+                has_cs = any(kw in degree_list for kw in cs_keywords)
+
+                non_cs_keywords = [
+                    "mechanical",
+                    "electrical",
+                    "civil",
+                    "aerospace",
+                    "chemical",
+                    "agricultural",
+                ]
+                has_non_cs = any(kw in degree_list for kw in non_cs_keywords)
+
+                if has_non_cs and not has_cs:
+                    logging.debug(
+                        f"Preferred degrees mismatch: '{degree_list}' (no CS/Software mentioned)"
+                    )
+                    return (
+                        "REJECT",
+                        "Preferred degrees do not include CS/Software (Mechanical/Electrical Engineering only)",
+                    )
 
         except Exception as e:
             logging.debug(f"Preferred degree check failed: {e}")
@@ -2445,7 +2429,7 @@ class ValidationHelper:
         try:
             import re as _re
             # Scan full page — salary often appears at bottom of Workday pages
-            page_text = soup.get_text()[:15000]
+            page_text = PageDocument.of(soup).prefix(15000)
             patterns = [
                 r'\$(\d+(?:\.\d+)?)\s*/\s*hr',
                 r'\$(\d+(?:\.\d+)?)\s*(?:per\s*hour|/hour)',
@@ -2492,87 +2476,89 @@ class ValidationHelper:
         if not soup:
             return None, None, []
 
+        # One text extraction shared by every pass below
+        page = PageDocument.of(soup)
         try:
             clearance_decision, clearance_reason = (
-                ValidationHelper._check_clearance_requirements(soup)
+                ValidationHelper._check_clearance_requirements(page)
             )
             if clearance_decision == "REJECT":
                 return clearance_decision, clearance_reason, []
 
             citizenship_decision, citizenship_reason = (
-                ValidationHelper._check_citizenship_requirements(soup)
+                ValidationHelper._check_citizenship_requirements(page)
             )
             if citizenship_decision == "REJECT":
                 return citizenship_decision, citizenship_reason, []
 
             grad_decision, grad_reason = (
-                ValidationHelper._check_graduation_requirements(soup)
+                ValidationHelper._check_graduation_requirements(page)
             )
             if grad_decision == "REJECT":
                 return grad_decision, grad_reason, []
 
             perm_auth_decision, perm_auth_reason = (
-                ValidationHelper._check_permanent_authorization(soup)
+                ValidationHelper._check_permanent_authorization(page)
             )
             if perm_auth_decision == "REJECT":
                 return perm_auth_decision, perm_auth_reason, []
 
             highschool_decision, highschool_reason = (
-                ValidationHelper._check_high_school_only(soup)
+                ValidationHelper._check_high_school_only(page)
             )
             if highschool_decision == "REJECT":
                 return highschool_decision, highschool_reason, []
 
             undergrad_decision, undergrad_reason = (
-                ValidationHelper._check_undergraduate_only_requirements(soup)
+                ValidationHelper._check_undergraduate_only_requirements(page)
             )
             if undergrad_decision == "REJECT":
                 return undergrad_decision, undergrad_reason, []
 
             non_cs_decision, non_cs_reason = (
-                ValidationHelper._check_non_cs_undergraduate_degree(soup)
+                ValidationHelper._check_non_cs_undergraduate_degree(page)
             )
             if non_cs_decision == "REJECT":
                 return non_cs_decision, non_cs_reason, []
 
             pref_degree_decision, pref_degree_reason = (
-                ValidationHelper._check_preferred_degree_mismatch(soup)
+                ValidationHelper._check_preferred_degree_mismatch(page)
             )
             if pref_degree_decision == "REJECT":
                 return pref_degree_decision, pref_degree_reason, []
 
             phd_decision, phd_reason = ValidationHelper._check_phd_only_requirements(
-                soup
+                page
             )
             if phd_decision == "REJECT":
                 return phd_decision, phd_reason, []
 
             geographic_decision, geographic_reason = (
-                ValidationHelper._check_geographic_enrollment_restrictions(soup)
+                ValidationHelper._check_geographic_enrollment_restrictions(page)
             )
             if geographic_decision == "REJECT":
                 return geographic_decision, geographic_reason, []
 
             cpt_decision, cpt_reason = ValidationHelper._check_cpt_opt_restrictions(
-                soup
+                page
             )
             if cpt_decision == "REJECT":
                 return cpt_decision, cpt_reason, []
 
             us_person_decision, us_person_reason = (
-                ValidationHelper._check_us_person_dod_requirements(soup)
+                ValidationHelper._check_us_person_dod_requirements(page)
             )
             if us_person_decision == "REJECT":
                 return us_person_decision, us_person_reason, []
 
             degree_decision, degree_reason = (
-                ValidationHelper._check_degree_requirements_strict(soup)
+                ValidationHelper._check_degree_requirements_strict(page)
             )
             if degree_decision == "REJECT":
                 return degree_decision, degree_reason, []
 
             year_decision, year_reason = (
-                ValidationHelper._check_graduation_year_requirements(soup)
+                ValidationHelper._check_graduation_year_requirements(page)
             )
             if year_decision == "REJECT":
                 return year_decision, year_reason, []
@@ -2603,7 +2589,7 @@ class ValidationHelper:
             if main_content:
                 content_text = main_content.get_text()[:PAGE_TEXT_STANDARD_SCAN]
             else:
-                all_text = soup.get_text()
+                all_text = PageDocument.of(soup).text
                 if len(all_text) > 500:
                     content_text = all_text[
                         200 : min(len(all_text), PAGE_TEXT_STANDARD_SCAN + 200)
@@ -2681,28 +2667,20 @@ class ValidationHelper:
             return None, None
 
         try:
-            page_text = soup.get_text()[:15000].lower()
-
-            for pattern in [
-                r"bachelor'?s?\s+(?:students?|degree|candidates?)\s+only",
-                r"undergraduate\s+(?:students?|only)",
-                r"undergraduate\s+students?\s+only",
-                r"open\s+to\s+undergraduate\s+students?",
-                r"for\s+undergraduate\s+students?\s+only",
-                r"currently\s+pursuing\s+a?\s+bachelor",
-                r"only\s+open\s+to\s+undergraduate",
-            ]:
-                match = re.search(pattern, page_text, re.I)
-                if match:
-                    context = page_text[
-                        max(0, match.start() - 300) : min(
-                            len(page_text), match.end() + 300
-                        )
-                    ]
-                    if not any(
-                        any(re.search(rf"\\b{kw}\\b", context) for kw in ["master", "ms/phd", "graduate degree", "grad student", "graduate program", "bs/ms", "ms ", " ms", "ms degree", "pursuing.*ms", "pursuing.*master"])
-                    ):
-                        return "REJECT", "Bachelor's students only"
+            scan = scan_page(soup, 15000)
+            page_text = scan.text
+
+            for hit in scan.hits("bachelors_only"):
+                match = hit.match
+                context = page_text[
+                    max(0, match.start() - 300) : min(
+                        len(page_text), match.end() + 300
+                    )
+                ]
+                if not any(
+                    any(re.search(rf"\\b{kw}\\b", context) for kw in ["master", "ms/phd", "graduate degree", "grad student", "graduate program", "bs/ms", "ms ", " ms", "ms degree", "pursuing.*ms", "pursuing.*master"])
+                ):
+                    return "REJECT", "Bachelor's students only"
         except Exception as e:
             logging.debug(f"Degree requirements check failed: {e}")
 
@@ -2715,190 +2693,46 @@ class ValidationHelper:
             return None, None
 
         try:
-            page_text = soup.get_text()[:15000].lower()
-
-            # Patterns that indicate CURRENT undergrad enrollment required
-            undergraduate_patterns = [
-                r"active\s+student\s+(?:currently\s+)?obtaining\s+a\s+bachelor",
-                r"currently\s+obtaining\s+(?:a\s+|an\s+)?bachelor",
-                r"student\s+obtaining\s+(?:a\s+)?(?:bs|ba|b\.s\.|b\.a\.)",
-                r"pursuing\s+(?:a\s+)?bachelor'?s?\s+degree",
-                r"currently\s+pursuing\s+(?:a\s+)?bachelor'?s?\s+degree",
-                r"working\s+towards?\s+(?:a\s+)?bachelor'?s?\s+degree",
-                r"rising\s+(?:junior|senior)\s+preferred",
-                r"currently\s+pursuing\s+(?:a\s+)?(?:bs|ba|b\.s\.|b\.a\.)\s+(?:degree|in)",
-                r"undergraduate\s+(?:junior|senior|sophomore)\s+status",
-                r"(?:junior|senior)\s+pursuing\s+(?:a\s+)?bachelor",
-                r"bachelor'?s?\s+student\s+enrolled",
-                r"pursuing\s+(?:an?\s+)?undergraduate\s+degree",
-                r"qualifications\s+include\s+pursuing\s+(?:an?\s+)?undergraduate",
-                r"currently\s+enrolled\s+in\s+(?:a\s+)?bachelor",
-                r"entering\s+(?:junior|senior)\s+year",
-                r"(?:sophomore|junior|senior)\s+standing",
-                r"currently\s+a\s+college\s+student",
-                r"phd\s+(?:students?\s+)?(?:preferred|required|only)",
-                r"3rd\s+year\s+phd\s+and\s+above",
-                r"doctoral\s+degree.*required",
-                r"must\s+be\s+pursuing\s+a\s+ph\.?d",
-                r"\(ph\.?d\.?\)",
-                r"ph\.?d\.?\s+intern",
-                r"research\s+scientist\s+intern.*(?:audio|speech|vision|nlp|perception)",
-                r"20\d\d\s+start\s+\(ph\.?d",
-                r"summer\s+2027",
-                r"fall\s+2027",
-                r"2027\s+start",
-                r"start.*2027",
-                r"phd\s+internship",
-                r"in\s+the\s+process\s+of\s+obtaining.*ph\.?d",
-                r"currently\s+has.*ph\.?d\s+degree",
-                r"ph\.?d\s+degree\s+in\s+the\s+field\s+of",
-                r"(?:requires?|must\s+have).*ph\.?d\s+(?:degree|student|candidate)",
-                r"currently\s+pursuing\s+ph\.?d",
-                r"preferably\s+a\s+current\s+3rd\s+year",
-                r"must\s+be\s+currently\s+pursuing\s+a\s+bachelor",
-                r"not\s+open\s+to\s+candidates\s+on\s+opt",
-                r"no\s+sponsorship\s+available.*not\s+open\s+to",
-                r"actively\s+pursuing.*bachelor.*computer\s+(?:science|engineering)",
-                r"must\s+be\s+actively\s+enrolled.*bachelor",
-                r"current\s+student\s+pursuing.*bachelor",
-                r"students?\s+must\s+be\s+continuing.*degree\s+during",
-                r"associate.?s.*or.*bachelor.?s.*degree.*preferred",
-                r"enrolled.*associate.?s.*or.*bachelor",
-                r"actively\s+enrolled.*associate.?s.*or.*bachelor",
-                r"student\s+going\s+into\s+junior\s+or\s+senior\s+year",
-                r"rising\s+junior\s+or\s+senior",
-                r"scheduled\s+to\s+obtain.*bachelor.*202[678]",
-                r"junior\s+or\s+senior.*pursuing.*bachelor",
-                r"pursuing\s+bsee",
-                r"presently\s+pursuing\s+bsee",
-                r"currently\s+pursuing.*bachelor.*computer.*science.*data.*science",
-                r"undergraduate\s+students?\s+only",
-                r"must\s+be\s+pursuing\s+(?:a\s+)?(?:bs|ba)\b",
-                r"enrolled\s+in\s+(?:an?\s+)?undergraduate\s+program",
-                r"currently\s+pursuing\s+(?:a\s+)?bachelor",
-                r"must\s+be\s+(?:an?\s+)?undergraduate\s+student",
-                r"(?:must\s+be\s+)?(?:a\s+)?rising\s+(?:junior|senior)",
-                r"entering\s+(?:third|fourth)\s+year",
-                r"(?:sophomore|junior|senior)\s+status",
-                r"bachelor'?s?\s+candidates?\s+only",
-                r"pursuing\s+(?:bs|ba)\s+degree",
-                r"current\s+(?:bs|ba)\s+student",
-                r"enrolled\s+(?:bs|ba)\s+program",
-                r"undergraduate\s+enrollment\s+required",
-                r"must\s+be\s+enrolled\s+in\s+bachelor",
-                r"bachelor'?s?\s+program\s+enrollment",
-                r"currently\s+enrolled\s+in\s+a\s+bachelor'?s?\s+degree\s+program",
-                r"enrolled\s+in\s+(?:a\s+)?bachelor'?s?\s+degree\s+program",
-                r"(?:junior|senior)\s+year\s+standing",
-                r"rising\s+(?:sophomore|junior|senior)",
-                r"advancing\s+to\s+(?:their\s+)?(?:junior|senior)\s+year",
-                r"at\s+least\s+advancing\s+to\s+(?:their\s+)?(?:junior|senior)",
-                r"entering\s+(?:their\s+)?(?:junior|senior)\s+year",
-                r"going\s+into\s+(?:their\s+)?(?:junior|senior)\s+year",
-                r"currently\s+enrolled\s+college\s+student",
-                r"currently\s+enrolled\s+(?:as\s+a\s+)?college\s+student",
-                r"enrolled\s+college\s+student",
-                r"intern\s+undergraduate",
-                r"undergraduate\s+intern",
-                r"applicants?\s+considered\s+for.*undergraduate\s+only",
-                r"undergraduate\s+students?\s+pursuing",
-                r"pursuing\s+(?:a\s+)?bachelor.*computer\s+(?:science|engineering)",
-                r"class\s+standing:\s*(?:junior|senior)",
-                r"enrolled\s+(?:as\s+a\s+)?(?:full.?time\s+)?student\s+at\s+(?:an?\s+)?accredited\s+(?:four.year|4.year)",
-                r"currently\s+enrolled\s+(?:as\s+a\s+)?(?:full.?time\s+)?student.*(?:four.year|4.year|college|university)",
-                r"must\s+be\s+(?:a\s+)?(?:current|active|full.?time)\s+student.*(?:four.year|4.year|college|university)",
-                r"accredited\s+four.year\s+(?:college|university)",
-                r"enrolled.*(?:fulltime|full.time).*(?:college|university).*(?:bachelor|undergraduate|four.year)",
-                r"pursuing\s+undergraduate\s+degree",
-                r"current\s+undergraduate\s+status",
-                r"undergraduate\s+student\s+status",
-                r"(?:junior|senior)\s+or\s+senior\s+year",
-                r"in\s+their\s+(?:junior|senior)\s+or\s+senior\s+year",
-                r"junior\s+or\s+senior\s+year",
-                r"junior\s+or\s+senior\s+standing",
-                r"must\s+be\s+(?:a\s+)?(?:junior|senior)\s+(?:or\s+senior\s+)?(?:year|student)",
-                r"for\s+(?:junior|senior)\s+(?:year\s+)?students\s+only",
-                r"bachelor'?s?\s+level\s+student",
-                r"undergraduate\s+program\s+student",
-                r"enrolled\s+in\s+(?:a\s+)?4-year\s+(?:bachelor|undergraduate)",
-                r"pursuing\s+(?:a\s+)?4-year\s+degree",
-                r"rising\s+(?:sophomore|junior|senior)\s+(?:year\s+)?(?:student|pursuing|working)",
-                r"completed\s+(?:2|3|two|three)\s+years?\s+by\s+start",
-                r"must\s+have\s+completed\s+(?:sophomore|junior|senior)\s+year",
-                r"entering\s+(?:their\s+)?(?:sophomore|junior|senior)\s+year",
-                r"currently\s+enrolled\s+as\s+a\s+(?:junior|senior)\s+pursuing\s+a\s+bachelor",
-                r"junior\s+or\s+senior\s+pursuing\s+a\s+bachelor",
-                r"(?:must|should)\s+be\s+pursuing\s+(?:their|a)\s+bachelor",
-                r"target(?:ed)?\s+majors?.*bachelor",
-                r"(?:associate|associates|aa|as)\s+(?:or|and)\s+bachelor",
-                r"(?:associate|aa)\s+degree.*only",
-                r"no\s+(?:prior\s+)?experience.*bachelor.*program",
-                r"graduating.*with\s+(?:a\s+)?(?:ba|bs|ba/bs|bs/ba|b\.s\.|b\.a\.)\b",
-                r"with\s+(?:a\s+)?(?:ba/bs|bs/ba)\s*,?\s*majoring",
-                r"graduating.*(?:ba|bs|ba/bs|bs/ba)\s*,?\s*majoring",
-                r"receive\s+(?:a\s+)?(?:ba|bs|ba/bs)\s+(?:by|before|prior)",
-                r"high\s+school\s+diploma.*currently\s+attending\s+(?:a\s+)?college",
-            ]
+            scan = scan_page(soup, 15000)
+            page_text = scan.text
 
-            for pattern in undergraduate_patterns:
-                match = re.search(pattern, page_text, re.I)
-                if match:
-                    # Check context for flexibility (MS/graduate also acceptable)
-                    context_start = max(0, match.start() - 500)
-                    context_end = min(len(page_text), match.end() + 500)
-                    context = page_text[context_start:context_end]
-
-                    # If context mentions graduate/master's, it's flexible
-                    if any(
-                        bool(re.search(rf"\b{kw}\b", context, re.I))
-                        for kw in [
-                            "master",
-                            "masters",
-                            "graduate",
-                            "ms/phd",
-                            "or graduate",
-                            "and graduate",
-                            "or master",
-                            "master's degree",
-                            "masters degree",
-                            "ms degree",
-                            "or ms",
-                            r"m\.s\.",
-                            "grad student",
-                            "graduate student",
-                            "bachelor.*or higher degree",  # "bachelor or higher" means MS accepted
-                            "bachelor.*or.*master.*degree",  # explicit bachelor+master
-                            "bachelor.*or.*master",
-                            "bachelor.*master",
-                            "pursuing.*master",
-                            "advanced degree",
-                        ]
-                    ):
-                        logging.debug(
-                            f"Undergrad pattern matched but graduate/master's also mentioned - accepting"
-                        )
-                        continue
-
-                    if "senior" in pattern or "junior" in pattern:
-                        if "level" in pattern:
-                            wider_context = page_text[
-                                max(0, match.start() - 50) : min(
-                                    len(page_text), match.end() + 50
-                                )
-                            ]
-                            if "student" not in wider_context:
-                                logging.debug(
-                                    f"Undergrad check: '{pattern}' without 'student' context - likely 'senior engineer'"
-                                )
-                                continue
+            for hit in scan.hits("undergraduate_only"):
+                pattern, match = hit.pattern, hit.match
+                # Check context for flexibility (MS/graduate also acceptable)
+                context_start = max(0, match.start() - 500)
+                context_end = min(len(page_text), match.end() + 500)
+                context = page_text[context_start:context_end]
 
+                # If context mentions graduate/master's, it's flexible
+                if any(
+                    kw_re.search(context)
+                    for kw_re in UNDERGRADUATE_FLEXIBILITY_RES
+                ):
                     logging.debug(
-                        f"Undergrad-only check: Found '{pattern}' without grad flexibility"
-                    )
-                    return (
-                        "REJECT",
-                        "Undergraduate students only (MS students not eligible)",
+                        f"Undergrad pattern matched but graduate/master's also mentioned - accepting"
                     )
+                    continue
+
+                if "senior" in pattern or "junior" in pattern:
+                    if "level" in pattern:
+                        wider_context = page_text[
+                            max(0, match.start() - 50) : min(
+                                len(page_text), match.end() + 50
+                            )
+                        ]
+                        if "student" not in wider_context:
+                            logging.debug(
+                                f"Undergrad check: '{pattern}' without 'student' context - likely 'senior engineer'"
+                            )
+                            continue
+
+                logging.debug(
+                    f"Undergrad-only check: Found '{pattern}' without grad flexibility"
+                )
+                return (
+                    "REJECT",
+                    "Undergraduate students only (MS students not eligible)",
+                )
 
         except Exception as e:
             logging.debug(f"Undergraduate-only check failed: {e}")
@@ -2912,19 +2746,16 @@ class ValidationHelper:
 
         try:
             from aggregator.config import (
-                ENHANCED_PHD_PATTERNS,
                 PHD_MS_FLEXIBILITY_KEYWORDS,
-                PAGE_TEXT_FULL_SCAN,
                 DEGREE_LIST_PATTERNS,
             )
         except (ImportError, AttributeError):
-            ENHANCED_PHD_PATTERNS = []
             PHD_MS_FLEXIBILITY_KEYWORDS = ["master", " ms ", "ms/phd"]
-            PAGE_TEXT_FULL_SCAN = 15000
             DEGREE_LIST_PATTERNS = []
 
         try:
-            page_text = soup.get_text()[:PAGE_TEXT_FULL_SCAN].lower()
+            scan = scan_page(soup, PAGE_TEXT_FULL_SCAN)
+            page_text = scan.text
 
             for degree_pattern in DEGREE_LIST_PATTERNS:
                 degree_matches = list(re.finditer(degree_pattern, page_text))
@@ -2937,59 +2768,44 @@ class ValidationHelper:
                         )
                         return None, None
 
-            phd_only_patterns = [
-                r"\bphd\s+(?:intern|student|candidate|only|required)",
-                r"doctoral\s+(?:intern|student|candidate|only)",
-                r"(?:pursuing|enrolled\s+in|candidates?\s+in).*\bphd\s+(?:degree|program)",
-                r"phd-only",
-                r"phd\s+internship",
-                r"in\s+the\s+process\s+of\s+obtaining.*ph\.?d",
-                r"currently\s+has.*ph\.?d\s+degree",
-                r"ph\.?d\s+degree\s+in\s+the\s+field\s+of",
-                r"(?:requires?|must\s+have).*ph\.?d\s+(?:degree|student|candidate)",
-            ]
-
-            phd_only_patterns.extend(ENHANCED_PHD_PATTERNS)
-
-            for pattern in phd_only_patterns:
-                match = re.search(pattern, page_text)
-                if match:
-                    matched_text = match.group(0)
-                    context = page_text[
-                        max(0, match.start() - 500) : min(
-                            len(page_text), match.end() + 500
-                        )
-                    ]
+            for hit in scan.hits("phd_only"):
+                pattern, match = hit.pattern, hit.match
+                matched_text = match.group(0)
+                context = page_text[
+                    max(0, match.start() - 500) : min(
+                        len(page_text), match.end() + 500
+                    )
+                ]
+
+                if not any(kw in context for kw in PHD_MS_FLEXIBILITY_KEYWORDS):
+                    requirements_start = page_text.find("qualification")
+                    if requirements_start == -1:
+                        requirements_start = page_text.find("requirement")
+                    requirements_section = (
+                        page_text[requirements_start : requirements_start + 2000]
+                        if requirements_start != -1
+                        else ""
+                    )
 
-                    if not any(kw in context for kw in PHD_MS_FLEXIBILITY_KEYWORDS):
-                        requirements_start = page_text.find("qualification")
-                        if requirements_start == -1:
-                            requirements_start = page_text.find("requirement")
-                        requirements_section = (
-                            page_text[requirements_start : requirements_start + 2000]
-                            if requirements_start != -1
-                            else ""
+                    if requirements_section and any(
+                        kw in requirements_section
+                        for kw in PHD_MS_FLEXIBILITY_KEYWORDS
+                    ):
+                        logging.debug(
+                            f"PhD check: MS found in requirements section"
                         )
+                        continue
 
-                        if requirements_section and any(
-                            kw in requirements_section
-                            for kw in PHD_MS_FLEXIBILITY_KEYWORDS
-                        ):
-                            logging.debug(
-                                f"PhD check: MS found in requirements section"
-                            )
-                            continue
-
-                        log_detailed_rejection(
-                            "Company",
-                            "Title",
-                            "PhD-only",
-                            pattern=pattern,
-                            matched_text=matched_text,
-                            context=context[:200],
-                            debug_info=f"No MS keywords in context or requirements",
-                        )
-                        return "REJECT", "PhD students only (MS students not eligible)"
+                    log_detailed_rejection(
+                        "Company",
+                        "Title",
+                        "PhD-only",
+                        pattern=pattern,
+                        matched_text=matched_text,
+                        context=context[:200],
+                        debug_info=f"No MS keywords in context or requirements",
+                    )
+                    return "REJECT", "PhD students only (MS students not eligible)"
 
         except Exception as e:
             logging.debug(f"PhD check failed: {e}")
@@ -3003,40 +2819,11 @@ class ValidationHelper:
             return None, None
 
         try:
-            page_text = soup.get_text()[:15000].lower()
-
-            # Patterns that indicate citizenship is required
-            citizenship_patterns = [
-                r"u\.?s\.?\s+citizenship\s+required",
-                r"must\s+be\s+(?:a\s+)?u\.?s\.?\s+citizen",
-                r"u\.?s\.?\s+citizen\s+or\s+permanent\s+resident",
-                r"citizenship\s+requirement",
-                r"require(?:s|d)?\s+u\.?s\.?\s+citizenship",
-                r"only\s+u\.?s\.?\s+citizens",
-                r"u\.?s\.?\s+citizens?\s+only",
-                r"must\s+be\s+authorized\s+to\s+work.*(?:without|no)\s+(?:employer\s+)?sponsor",
-                r"permanent\s+(?:us\s+)?work\s+authorization\s+required",
-                # FIX 3: Trane-style combined citizenship+sponsorship phrase
-                r"u\.?s\.?\s+citizen\s+or\s+have\s+the\s+legal\s+right\s+to\s+work",
-                r"legal\s+right\s+to\s+work.*without\s+(?:requiring\s+)?sponsor",
-                r"without\s+requiring\s+sponsorship\s+now\s+or\s+in\s+the\s+future",
-                r"not\s+(?:now|currently).*require.*sponsorship.*future",
-                r"no\s+visa\s+sponsorship.*(?:now|future|available)",
-                r"students?\s+must\s+be\s+authorized\s+to\s+work\s+in\s+the\s+u\.?s\.?\s+without",
-                r"u\.?s\.?\s+citizen\b(?!\s+or\s+permanent)",  # "U.S. Citizen" alone
-                r"\bu\.?s\.?\s+citizenship\b",
-                r"must\s+be\s+a\s+u\.?s\.?\s+citizen",
-                r"candidates?\s+must\s+be\s+u\.?s\.?\s+citizens?",
-                r"this\s+role\s+is\s+not\s+eligible\s+for.*sponsor",
-                r"not\s+eligible\s+for\s+employer.sponsored\s+work\s+visa",
-                r"no\s+employment\s+sponsorship\s+(?:required|available).*(?:now|future)",
-                r"employment\s+sponsorship\s+(?:is\s+)?not\s+(?:required|available)",
-            ]
+            scan = scan_page(soup, 15000)
 
-            for pattern in citizenship_patterns:
-                if re.search(pattern, page_text, re.I):
-                    logging.debug(f"Citizenship check: Found requirement pattern")
-                    return "REJECT", "US Citizenship required"
+            if scan.hits("citizenship"):
+                logging.debug(f"Citizenship check: Found requirement pattern")
+                return "REJECT", "US Citizenship required"
 
         except Exception as e:
             logging.debug(f"Citizenship check failed: {e}")
@@ -3049,19 +2836,9 @@ class ValidationHelper:
         if not soup:
             return None, None
         try:
-            page_text = soup.get_text()[:15000].lower()
-            grad_patterns = [
-                r"graduat(?:e|ing|ion)\s+(?:by|before|no later than)\s+(?:fall|december|dec)\s+2026",
-                r"(?:fall|december|dec)\s+2026\s+graduat",
-                r"must\s+(?:be\s+)?graduat(?:e|ing)\s+(?:by|in)\s+(?:fall|december|dec)\s+2026",
-                r"juniors?,?\s+seniors?,?\s+or\s+master'?s?\s+students?\s+in\s+(?:the\s+)?fall\s+(?:of\s+)?2026",
-                r"graduating\s+(?:in\s+)?(?:fall|december)\s+202[0-5]",
-                r"ideal\s+intern.*graduat(?:e|ing)\s+by\s+december\s+2026",
-                r"complete\s+(?:ms|master|degree)\s+(?:by|in)\s+(?:fall|december|dec)\s+2026",
-            ]
-            for pattern in grad_patterns:
-                if re.search(pattern, page_text, re.I):
-                    return "REJECT", "Requires graduation by Fall/Dec 2026 (user graduates May 2027)"
+            scan = scan_page(soup, 15000)
+            if scan.hits("graduation"):
+                return "REJECT", "Requires graduation by Fall/Dec 2026 (user graduates May 2027)"
         except Exception:
             pass
         return None, None
@@ -3072,51 +2849,46 @@ class ValidationHelper:
             return None, None
 
         try:
-            from aggregator.config import CPT_OPT_EXCLUSION_PATTERNS, PAGE_TEXT_FULL_SCAN
-        except (ImportError, AttributeError):
-            return None, None
-
-        try:
-            page_text = soup.get_text()[:PAGE_TEXT_FULL_SCAN].lower()
-
-            for pattern in CPT_OPT_EXCLUSION_PATTERNS:
-                match = re.search(pattern, page_text)
-                if match:
-                    matched_text = match.group(0)
-                    context = page_text[
-                        max(0, match.start() - 150) : min(
-                            len(page_text), match.end() + 150
-                        )
-                    ]
+            scan = scan_page(soup, PAGE_TEXT_FULL_SCAN)
+            page_text = scan.text
 
-                    positive_indicators = [
-                        "support cpt",
-                        "cpt eligible",
-                        "cpt accepted",
-                        "welcome cpt",
-                        "provide cpt",
-                        "offer cpt",
-                        "support opt",
-                        "opt eligible",
-                    ]
-                    if any(indicator in context for indicator in positive_indicators):
-                        logging.debug(
-                            f"CPT/OPT: Skipping positive mention: {matched_text}"
-                        )
-                        continue
-
-                    log_detailed_rejection(
-                        "Company",
-                        "Title",
-                        "CPT/OPT exclusion",
-                        pattern=pattern,
-                        matched_text=matched_text,
-                        context=context[:200],
+            for hit in scan.hits("cpt_opt"):
+                pattern, match = hit.pattern, hit.match
+                matched_text = match.group(0)
+                context = page_text[
+                    max(0, match.start() - 150) : min(
+                        len(page_text), match.end() + 150
                     )
-                    return (
-                        "REJECT",
-                        "Company does not support CPT/OPT (F-1 students not eligible)",
+                ]
+
+                positive_indicators = [
+                    "support cpt",
+                    "cpt eligible",
+                    "cpt accepted",
+                    "welcome cpt",
+                    "provide cpt",
+                    "offer cpt",
+                    "support opt",
+                    "opt eligible",
+                ]
+                if any(indicator in context for indicator in positive_indicators):
+                    logging.debug(
+                        f"CPT/OPT: Skipping positive mention: {matched_text}"
                     )
+                    continue
+
+                log_detailed_rejection(
+                    "Company",
+                    "Title",
+                    "CPT/OPT exclusion",
+                    pattern=pattern,
+                    matched_text=matched_text,
+                    context=context[:200],
+                )
+                return (
+                    "REJECT",
+                    "Company does not support CPT/OPT (F-1 students not eligible)",
+                )
 
         except Exception as e:
             logging.debug(f"CPT/OPT check failed: {e}")
@@ -3129,45 +2901,41 @@ class ValidationHelper:
             return None, None
 
         try:
-            from aggregator.config import (
-                US_PERSON_DOD_PATTERNS,
-                PAGE_TEXT_FULL_SCAN,
-                EXPORT_CONTROL_EXCLUSION_KEYWORDS,
-            )
+            from aggregator.config import EXPORT_CONTROL_EXCLUSION_KEYWORDS
         except (ImportError, AttributeError):
             EXPORT_CONTROL_EXCLUSION_KEYWORDS = ["export control", "export compliance"]
 
         try:
-            page_text = soup.get_text()[:PAGE_TEXT_FULL_SCAN].lower()
-
-            for pattern in US_PERSON_DOD_PATTERNS:
-                match = re.search(pattern, page_text)
-                if match:
-                    matched_text = match.group(0)
-                    context_start = max(0, match.start() - 300)
-                    context_end = min(len(page_text), match.end() + 300)
-                    context = page_text[context_start:context_end]
+            scan = scan_page(soup, PAGE_TEXT_FULL_SCAN)
+            page_text = scan.text
 
-                    is_export_control = any(
-                        keyword in context
-                        for keyword in EXPORT_CONTROL_EXCLUSION_KEYWORDS
-                    )
+            for hit in scan.hits("us_person_dod"):
+                pattern, match = hit.pattern, hit.match
+                matched_text = match.group(0)
+                context_start = max(0, match.start() - 300)
+                context_end = min(len(page_text), match.end() + 300)
+                context = page_text[context_start:context_end]
 
-                    if is_export_control:
-                        logging.debug(
-                            f"US Person found in export control context - skipping: '{matched_text}'"
-                        )
-                        continue
+                is_export_control = any(
+                    keyword in context
+                    for keyword in EXPORT_CONTROL_EXCLUSION_KEYWORDS
+                )
 
-                    log_detailed_rejection(
-                        "Company",
-                        "Title",
-                        "US Person/DoD",
-                        pattern=pattern,
-                        matched_text=matched_text,
-                        context=context[:200],
+                if is_export_control:
+                    logging.debug(
+                        f"US Person found in export control context - skipping: '{matched_text}'"
                     )
-                    return "REJECT", "US Person or DoD contract requirement"
+                    continue
+
+                log_detailed_rejection(
+                    "Company",
+                    "Title",
+                    "US Person/DoD",
+                    pattern=pattern,
+                    matched_text=matched_text,
+                    context=context[:200],
+                )
+                return "REJECT", "US Person or DoD contract requirement"
 
         except Exception as e:
             logging.debug(f"US Person/DoD check failed: {e}")
@@ -3181,7 +2949,7 @@ class ValidationHelper:
 
         # If page says enrolled at university in the US/United States, that is NOT a geographic restriction
         try:
-            quick_text = soup.get_text()[:10000].lower()
+            quick_text = PageDocument.of(soup).lower_prefix(10000)
             if any(phrase in quick_text for phrase in [
                 'university in the united states',
                 'college or university in the us',
@@ -3195,8 +2963,6 @@ class ValidationHelper:
 
         try:
             from aggregator.config import (
-                GEOGRAPHIC_ENROLLMENT_PATTERNS,
-                PAGE_TEXT_FULL_SCAN,
                 USER_LOCATION,
                 USER_STATE,
                 USER_COUNTRY,
@@ -3207,11 +2973,11 @@ class ValidationHelper:
             USER_LOCATION = "Boston"
 
         try:
-            page_text = soup.get_text()[:PAGE_TEXT_FULL_SCAN].lower()
+            scan = scan_page(soup, PAGE_TEXT_FULL_SCAN)
 
-            for pattern in GEOGRAPHIC_ENROLLMENT_PATTERNS:
-                match = re.search(pattern, page_text)
-                if match and match.lastindex >= 1:
+            for hit in scan.hits("geographic_enrollment"):
+                pattern, match = hit.pattern, hit.match
+                if match.lastindex >= 1:
                     required_location = match.group(1).strip()
 
                     if not required_location:
@@ -3335,38 +3101,11 @@ class ValidationHelper:
             return None, None
 
         try:
-            page_text = soup.get_text()[:15000].lower()
-
-            clearance_patterns = [
-                r"export\s+administration\s+regulations",
-                r"ear\s+eligible",
-                r"must\s+be\s+ear\s+eligible",
-                r"eligible\s+under.*export",
-                r"us\s+export\s+control",
-                r"itar\s+(?:compliance|eligible|required)",
-                r"(?:security\s+)?clearance.*(?:required|preferred)",
-                r"must\s+(?:be\s+)?(?:able\s+to\s+)?(?:obtain|get|acquire).*clearance",
-                r"(?:eligible|eligibility)\s+for.*(?:security\s+)?clearance",
-                r"able\s+to\s+obtain.*clearance",
-                r"obtain\s+(?:a\s+)?(?:secret|top\s+secret|ts/sci)\s+clearance",
-                r"ability\s+to\s+obtain\s+(?:a\s+)?(?:secret|top)\s+clearance",
-                r"clearance\s+(?:eligibility|required|preferred)",
-                r"u\.?s\.?\s+citizen.*clearance",
-                r"citizenship.*clearance",
-                r"dod\s+(?:secret|top\s+secret)",
-                r"ts/sci",
-                r"polygraph",
-                r"ear/itar",
-                r"itar.*(?:required|compliance|restriction)",
-                r"export\s+control.*(?:required|compliance|restriction)",
-                r"access\s+to\s+export.controlled",
-                r"export.controlled.*(?:information|technology|data)",
-            ]
+            scan = scan_page(soup, 15000)
 
-            for pattern in clearance_patterns:
-                if re.search(pattern, page_text, re.I):
-                    logging.debug(f"Clearance check: Found requirement")
-                    return "REJECT", "Security clearance required"
+            if scan.hits("clearance"):
+                logging.debug(f"Clearance check: Found requirement")
+                return "REJECT", "Security clearance required"
 
         except Exception as e:
             logging.debug(f"Clearance check failed: {e}")
@@ -3380,7 +3119,7 @@ class ValidationHelper:
             return None, None
 
         try:
-            page_text = soup.get_text()[:15000]
+            page_text = PageDocument.of(soup).prefix(15000)
 
             # Check for flexibility phrases first
             if re.search(
@@ -3545,7 +3284,7 @@ class ValidationHelper:
             return "Unknown"
 
         try:
-            page_text = soup.get_text()[:3000]
+            page_text = PageDocument.of(soup).prefix(3000)
 
             if re.search(
                 r"(?:will|does|provides?)\s+sponsor|h-?1b.*sponsor|sponsor.*h-?1b|h-?1b\s+visa\s+sponsor", page_text, re.I
@@ -3619,9 +3358,9 @@ class CompanyExtractor:
             return ExtractionResult(None, 0.0, "json_ld")
 
         try:
-            json_ld = soup.find("script", {"type": "application/ld+json"})
-            if json_ld:
-                data = json.loads(json_ld.string)
+            page = PageDocument.of(soup)
+            if page.json_ld:
+                data = page.first_json_ld
                 org = (
                     data.get("hiringOrganization", {}) if isinstance(data, dict) else {}
                 )
@@ -3916,15 +3655,16 @@ class CompanyExtractor:
     @staticmethod
     def extract_all_methods(url, soup):
         platform = PlatformDetector.detect(url)
+        page = PageDocument.of(soup)
 
-        workday_result = CompanyExtractor.extract_from_workday(url, soup)
+        workday_result = CompanyExtractor.extract_from_workday(url, page)
 
         results = [
             workday_result,
             CompanyExtractor.extract_from_url_mapping(url),
-            CompanyExtractor.extract_from_json_ld(soup),
-            CompanyExtractor.extract_from_meta_tags(soup),
-            CompanyExtractor.extract_from_visible_elements(soup, url),
+            CompanyExtractor.extract_from_json_ld(page),
+            CompanyExtractor.extract_from_meta_tags(page),
+            CompanyExtractor.extract_from_visible_elements(page, url),
             CompanyExtractor.extract_from_url_path(url, platform),
             CompanyExtractor.extract_from_subdomain(url),
         ]
@@ -0,0 +1,159 @@
+"""
+Per-domain token-bucket rate limiter.
+
+Each host gets its own bucket, so a thread waiting on greenhouse.io never
+blocks a thread that wants lever.co. Slots are reserved under a short
+per-bucket lock and the actual sleep happens with no lock held.
+
+Rates are configured per ATS in config.DOMAIN_RATE_LIMITS (matched on the
+longest host suffix); anything unlisted gets DEFAULT_DOMAIN_RATE.
+
+Usage:
+    from aggregator.rate_limiter import DomainRateLimiter
+    limiter = DomainRateLimiter.default()
+    limiter.acquire("https://boards-api.greenhouse.io/v1/boards/stripe/jobs")
+    print(limiter.stats())   # {"boards-api.greenhouse.io": {"requests": 1, "wait_sec": 0.0, ...}}
+"""
+import time
+import threading
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from aggregator.config import DOMAIN_RATE_LIMITS, DEFAULT_DOMAIN_RATE
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class TokenBucket:
+    """
+    Classic token bucket: `rate` tokens/sec refill, holding at most `burst`.
+
+    reserve() may drive the balance negative — that is a queue of callers
+    who already own a future slot. The returned delay is how long the
+    caller must sleep before using it.
+    """
+    rate: float
+    burst: float = 1.0
+
+    tokens: float = field(default=0.0, init=False)
+    updated: float = field(default=0.0, init=False)
+    requests: int = field(default=0, init=False)
+    waited: int = field(default=0, init=False)
+    wait_sec: float = field(default=0.0, init=False)
+    max_wait_sec: float = field(default=0.0, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self):
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take one token and return the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1.0
+            delay = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+            self.requests += 1
+            if delay > 0:
+                self.waited += 1
+                self.wait_sec += delay
+                self.max_wait_sec = max(self.max_wait_sec, delay)
+            return delay
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "rate": self.rate,
+            "requests": self.requests,
+            "waited": self.waited,
+            "wait_sec": round(self.wait_sec, 2),
+            "max_wait_sec": round(self.max_wait_sec, 2),
+        }
+
+
+class DomainRateLimiter:
+    """Registry of per-host token buckets."""
+    _default: Optional["DomainRateLimiter"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, limits: Dict[str, Tuple[float, float]] = None,
+                 default_rate: Tuple[float, float] = None):
+        self.limits = dict(DOMAIN_RATE_LIMITS if limits is None else limits)
+        self.default_rate = default_rate or DEFAULT_DOMAIN_RATE
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        # Longest suffix first so "boards-api.greenhouse.io" beats "greenhouse.io"
+        self._suffixes = sorted(self.limits, key=len, reverse=True)
+
+    @classmethod
+    def default(cls) -> "DomainRateLimiter":
+        """Process-wide limiter shared by every fetch path."""
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls()
+        return cls._default
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        try:
+            return (urlparse(url).hostname or "").lower()
+        except Exception:
+            return ""
+
+    def rate_for(self, host: str) -> Tuple[float, float]:
+        """(rate, burst) for a host — longest configured suffix wins."""
+        for suffix in self._suffixes:
+            if host == suffix or host.endswith("." + suffix):
+                return self.limits[suffix]
+        return self.default_rate
+
+    def bucket(self, host: str) -> TokenBucket:
+        b = self._buckets.get(host)
+        if b is None:
+            with self._lock:
+                b = self._buckets.get(host)
+                if b is None:
+                    rate, burst = self.rate_for(host)
+                    b = self._buckets[host] = TokenBucket(rate=rate, burst=burst)
+        return b
+
+    def acquire(self, url: str) -> float:
+        """Block until `url`'s host may be hit. Returns seconds slept."""
+        host = self.host_of(url)
+        if not host:
+            return 0.0
+        delay = self.bucket(host).reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def stats(self) -> Dict[str, dict]:
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {host: b.stats for host, b in buckets.items()}
+
+    def total_wait_sec(self) -> float:
+        return round(sum(s["wait_sec"] for s in self.stats().values()), 2)
+
+    def log_summary(self, top: int = 10):
+        """Log the hosts we spent the most time waiting on."""
+        stats = self.stats()
+        if not stats:
+            return
+        worst = sorted(stats.items(), key=lambda kv: kv[1]["wait_sec"], reverse=True)[:top]
+        log.info(
+            f"RateLimiter: {sum(s['requests'] for s in stats.values())} requests "
+            f"across {len(stats)} hosts, {self.total_wait_sec():.1f}s total wait"
+        )
+        for host, s in worst:
+            if s["wait_sec"] > 0:
+                log.info(
+                    f"  {host}: {s['requests']} req, waited {s['waited']}x "
+                    f"= {s['wait_sec']:.1f}s (max {s['max_wait_sec']:.1f}s, {s['rate']}/s)"
+                )
@@ -0,0 +1,493 @@
+"""
+Restriction rule engine — every page-restriction pattern compiled once.
+
+ValidationHelper.check_page_restrictions used to run each _check_* pass as
+a loop of re.search(pattern_string, page_text) calls: ~300 uncompiled
+patterns per page, enough to keep evicting each other from re's internal
+cache so many were re-parsed on every page.
+
+Here every rule is compiled at import time, and for each one we also work
+out which literal substrings any match *must* contain (e.g.
+r"(?:sophomore|junior|senior)\\s+standing" cannot match a page without
+"standing"). A scan checks each required literal once against the page
+text — a plain substring search — and only runs the regexes whose literals
+are all present. Python's re has no multi-pattern set/automaton, so this
+literal prefilter is what stands in for one; on a typical posting it
+rules out most patterns without running them.
+
+A scan returns, per category, every rule that matched along with its
+first match, in the same order the old loops tried them. The checks keep
+their context filters and decide from those hits, so decisions are
+unchanged.
+
+Usage:
+    scan = scan_page(page)                       # cached on the PageDocument
+    for hit in scan.hits("citizenship"):
+        hit.pattern, hit.match.group(0)
+"""
+import re
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+try:
+    from re import _parser as _sre_parse, _constants as _sre_const
+except ImportError:  # Python < 3.11
+    import sre_parse as _sre_parse
+    import sre_constants as _sre_const
+
+from aggregator.config import (
+    PAGE_TEXT_FULL_SCAN,
+    HIGH_SCHOOL_ONLY_PATTERNS,
+    PERMANENT_US_AUTHORIZATION_PATTERNS,
+    NON_CS_UNDERGRADUATE_DEGREE_PATTERNS,
+    PREFERRED_DEGREE_MISMATCH_PATTERNS,
+    ENHANCED_PHD_PATTERNS,
+    CPT_OPT_EXCLUSION_PATTERNS,
+    US_PERSON_DOD_PATTERNS,
+    GEOGRAPHIC_ENROLLMENT_PATTERNS,
+)
+from aggregator.page_document import PageDocument
+
+log = logging.getLogger(__name__)
+
+# Literals shorter than this are too common to be worth a substring check
+MIN_LITERAL_LEN = 3
+
+# Non-ASCII characters that re.IGNORECASE treats as equal to an ASCII letter
+# but that str.lower() leaves alone (or, for U+0130, expands to two chars).
+_CASEFOLD_EXTRAS = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+_REPEATS = tuple(
+    getattr(_sre_const, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(_sre_const, name)
+)
+
+
+def required_literals(pattern: str, flags: int = 0) -> Tuple[str, ...]:
+    """Substrings every match of `pattern` must contain.
+
+    Only walks parts of the pattern that are mandatory: top-level literal
+    runs, groups, and repeats with a minimum of one. Alternations, optional
+    parts and character classes end a run. For IGNORECASE patterns the
+    literals are lowercased and must be checked against casefold_text().
+    Returns () when nothing useful can be proven (the rule then always runs).
+    """
+    try:
+        parsed = _sre_parse.parse(pattern, flags)
+    except Exception:
+        return ()
+    ignorecase = bool(parsed.state.flags & re.IGNORECASE)
+
+    runs: List[str] = []
+    current: List[str] = []
+
+    def flush():
+        if len(current) >= MIN_LITERAL_LEN:
+            runs.append("".join(current))
+        current.clear()
+
+    def walk(items):
+        for op, av in items:
+            if op is _sre_const.LITERAL:
+                ch = chr(av)
+                if ignorecase:
+                    if not ch.isascii():
+                        flush()
+                        continue
+                    ch = ch.lower()
+                current.append(ch)
+            elif op is _sre_const.SUBPATTERN:
+                flush()
+                _group, add_flags, del_flags, sub = av
+                # Scoped flag changes like (?i:...) alter matching — skip them
+                if not (add_flags or del_flags):
+                    walk(sub)
+                flush()
+            elif op in _REPEATS and av[0] >= 1:
+                flush()
+                walk(av[2])
+                flush()
+            else:
+                flush()
+
+    walk(parsed.data)
+    flush()
+    return tuple(dict.fromkeys(runs))
+
+
+def casefold_text(text: str) -> str:
+    """The text IGNORECASE literals are checked against."""
+    return text.translate(_CASEFOLD_EXTRAS).lower()
+
+
+@dataclass(frozen=True)
+class RestrictionRule:
+    category: str
+    pattern: str
+    regex: re.Pattern
+    literals: Tuple[str, ...]
+    ignorecase: bool
+
+
+@dataclass(frozen=True)
+class RuleHit:
+    rule: RestrictionRule
+    match: re.Match
+
+    @property
+    def category(self) -> str:
+        return self.rule.category
+
+    @property
+    def pattern(self) -> str:
+        return self.rule.pattern
+
+
+class RuleScan:
+    """Matches of one rule set against one text.
+
+    Literal checks are shared across categories; each category's regexes
+    run the first time that category is asked for, so a check that rejects
+    early doesn't pay for the categories after it.
+    """
+
+    def __init__(self, rule_set: "RestrictionRuleSet", text: str, prefilter: bool = True):
+        self.text = text
+        self._rule_set = rule_set
+        self._prefilter = prefilter
+        self._folded = None
+        self._present: Dict[Tuple[bool, str], bool] = {}
+        self._hits: Dict[str, List[RuleHit]] = {}
+
+    def _has_literal(self, literal: str, ignorecase: bool) -> bool:
+        key = (ignorecase, literal)
+        found = self._present.get(key)
+        if found is None:
+            if ignorecase:
+                if self._folded is None:
+                    self._folded = casefold_text(self.text)
+                haystack = self._folded
+            else:
+                haystack = self.text
+            found = self._present[key] = literal in haystack
+        return found
+
+    def hits(self, category: str) -> List[RuleHit]:
+        """Every rule in `category` that matches, in registration order."""
+        cached = self._hits.get(category)
+        if cached is not None:
+            return cached
+        found = []
+        for rule in self._rule_set.rules(category):
+            if self._prefilter and not all(
+                self._has_literal(lit, rule.ignorecase) for lit in rule.literals
+            ):
+                continue
+            match = rule.regex.search(self.text)
+            if match:
+                found.append(RuleHit(rule, match))
+        self._hits[category] = found
+        return found
+
+    def all_hits(self) -> List[RuleHit]:
+        return [hit for category in self._rule_set.categories for hit in self.hits(category)]
+
+
+class RestrictionRuleSet:
+    def __init__(self):
+        self._rules: Dict[str, List[RestrictionRule]] = {}
+
+    def add(self, category: str, patterns: Iterable[str], flags: int = 0):
+        rules = self._rules.setdefault(category, [])
+        for pattern in patterns:
+            regex = re.compile(pattern, flags)
+            rules.append(
+                RestrictionRule(
+                    category=category,
+                    pattern=pattern,
+                    regex=regex,
+                    literals=required_literals(pattern, flags),
+                    ignorecase=bool(regex.flags & re.IGNORECASE),
+                )
+            )
+        return self
+
+    @property
+    def categories(self) -> List[str]:
+        return list(self._rules)
+
+    def rules(self, category: str) -> List[RestrictionRule]:
+        return self._rules.get(category, [])
+
+    def __len__(self):
+        return sum(len(r) for r in self._rules.values())
+
+    def scan(self, text: str, prefilter: bool = True) -> RuleScan:
+        return RuleScan(self, text, prefilter=prefilter)
+
+
+# ── Rule definitions ──────────────────────────────────────────────────
+# Flags match what each _check_* pass used with re.search before.
+
+CLEARANCE_PATTERNS = [
+    r"export\s+administration\s+regulations",
+    r"ear\s+eligible",
+    r"must\s+be\s+ear\s+eligible",
+    r"eligible\s+under.*export",
+    r"us\s+export\s+control",
+    r"itar\s+(?:compliance|eligible|required)",
+    r"(?:security\s+)?clearance.*(?:required|preferred)",
+    r"must\s+(?:be\s+)?(?:able\s+to\s+)?(?:obtain|get|acquire).*clearance",
+    r"(?:eligible|eligibility)\s+for.*(?:security\s+)?clearance",
+    r"able\s+to\s+obtain.*clearance",
+    r"obtain\s+(?:a\s+)?(?:secret|top\s+secret|ts/sci)\s+clearance",
+    r"ability\s+to\s+obtain\s+(?:a\s+)?(?:secret|top)\s+clearance",
+    r"clearance\s+(?:eligibility|required|preferred)",
+    r"u\.?s\.?\s+citizen.*clearance",
+    r"citizenship.*clearance",
+    r"dod\s+(?:secret|top\s+secret)",
+    r"ts/sci",
+    r"polygraph",
+    r"ear/itar",
+    r"itar.*(?:required|compliance|restriction)",
+    r"export\s+control.*(?:required|compliance|restriction)",
+    r"access\s+to\s+export.controlled",
+    r"export.controlled.*(?:information|technology|data)",
+]
+
+CITIZENSHIP_PATTERNS = [
+    r"u\.?s\.?\s+citizenship\s+required",
+    r"must\s+be\s+(?:a\s+)?u\.?s\.?\s+citizen",
+    r"u\.?s\.?\s+citizen\s+or\s+permanent\s+resident",
+    r"citizenship\s+requirement",
+    r"require(?:s|d)?\s+u\.?s\.?\s+citizenship",
+    r"only\s+u\.?s\.?\s+citizens",
+    r"u\.?s\.?\s+citizens?\s+only",
+    r"must\s+be\s+authorized\s+to\s+work.*(?:without|no)\s+(?:employer\s+)?sponsor",
+    r"permanent\s+(?:us\s+)?work\s+authorization\s+required",
+    # FIX 3: Trane-style combined citizenship+sponsorship phrase
+    r"u\.?s\.?\s+citizen\s+or\s+have\s+the\s+legal\s+right\s+to\s+work",
+    r"legal\s+right\s+to\s+work.*without\s+(?:requiring\s+)?sponsor",
+    r"without\s+requiring\s+sponsorship\s+now\s+or\s+in\s+the\s+future",
+    r"not\s+(?:now|currently).*require.*sponsorship.*future",
+    r"no\s+visa\s+sponsorship.*(?:now|future|available)",
+    r"students?\s+must\s+be\s+authorized\s+to\s+work\s+in\s+the\s+u\.?s\.?\s+without",
+    r"u\.?s\.?\s+citizen\b(?!\s+or\s+permanent)",  # "U.S. Citizen" alone
+    r"\bu\.?s\.?\s+citizenship\b",
+    r"must\s+be\s+a\s+u\.?s\.?\s+citizen",
+    r"candidates?\s+must\s+be\s+u\.?s\.?\s+citizens?",
+    r"this\s+role\s+is\s+not\s+eligible\s+for.*sponsor",
+    r"not\s+eligible\s+for\s+employer.sponsored\s+work\s+visa",
+    r"no\s+employment\s+sponsorship\s+(?:required|available).*(?:now|future)",
+    r"employment\s+sponsorship\s+(?:is\s+)?not\s+(?:required|available)",
+]
+
+GRADUATION_DEADLINE_PATTERNS = [
+    r"graduat(?:e|ing|ion)\s+(?:by|before|no later than)\s+(?:fall|december|dec)\s+2026",
+    r"(?:fall|december|dec)\s+2026\s+graduat",
+    r"must\s+(?:be\s+)?graduat(?:e|ing)\s+(?:by|in)\s+(?:fall|december|dec)\s+2026",
+    r"juniors?,?\s+seniors?,?\s+or\s+master'?s?\s+students?\s+in\s+(?:the\s+)?fall\s+(?:of\s+)?2026",
+    r"graduating\s+(?:in\s+)?(?:fall|december)\s+202[0-5]",
+    r"ideal\s+intern.*graduat(?:e|ing)\s+by\s+december\s+2026",
+    r"complete\s+(?:ms|master|degree)\s+(?:by|in)\s+(?:fall|december|dec)\s+2026",
+]
+
+# Patterns that indicate CURRENT undergrad enrollment required
+UNDERGRADUATE_ONLY_PATTERNS = [
+    r"active\s+student\s+(?:currently\s+)?obtaining\s+a\s+bachelor",
+    r"currently\s+obtaining\s+(?:a\s+|an\s+)?bachelor",
+    r"student\s+obtaining\s+(?:a\s+)?(?:bs|ba|b\.s\.|b\.a\.)",
+    r"pursuing\s+(?:a\s+)?bachelor'?s?\s+degree",
+    r"currently\s+pursuing\s+(?:a\s+)?bachelor'?s?\s+degree",
+    r"working\s+towards?\s+(?:a\s+)?bachelor'?s?\s+degree",
+    r"rising\s+(?:junior|senior)\s+preferred",
+    r"currently\s+pursuing\s+(?:a\s+)?(?:bs|ba|b\.s\.|b\.a\.)\s+(?:degree|in)",
+    r"undergraduate\s+(?:junior|senior|sophomore)\s+status",
+    r"(?:junior|senior)\s+pursuing\s+(?:a\s+)?bachelor",
+    r"bachelor'?s?\s+student\s+enrolled",
+    r"pursuing\s+(?:an?\s+)?undergraduate\s+degree",
+    r"qualifications\s+include\s+pursuing\s+(?:an?\s+)?undergraduate",
+    r"currently\s+enrolled\s+in\s+(?:a\s+)?bachelor",
+    r"entering\s+(?:junior|senior)\s+year",
+    r"(?:sophomore|junior|senior)\s+standing",
+    r"currently\s+a\s+college\s+student",
+    r"phd\s+(?:students?\s+)?(?:preferred|required|only)",
+    r"3rd\s+year\s+phd\s+and\s+above",
+    r"doctoral\s+degree.*required",
+    r"must\s+be\s+pursuing\s+a\s+ph\.?d",
+    r"\(ph\.?d\.?\)",
+    r"ph\.?d\.?\s+intern",
+    r"research\s+scientist\s+intern.*(?:audio|speech|vision|nlp|perception)",
+    r"20\d\d\s+start\s+\(ph\.?d",
+    r"summer\s+2027",
+    r"fall\s+2027",
+    r"2027\s+start",
+    r"start.*2027",
+    r"phd\s+internship",
+    r"in\s+the\s+process\s+of\s+obtaining.*ph\.?d",
+    r"currently\s+has.*ph\.?d\s+degree",
+    r"ph\.?d\s+degree\s+in\s+the\s+field\s+of",
+    r"(?:requires?|must\s+have).*ph\.?d\s+(?:degree|student|candidate)",
+    r"currently\s+pursuing\s+ph\.?d",
+    r"preferably\s+a\s+current\s+3rd\s+year",
+    r"must\s+be\s+currently\s+pursuing\s+a\s+bachelor",
+    r"not\s+open\s+to\s+candidates\s+on\s+opt",
+    r"no\s+sponsorship\s+available.*not\s+open\s+to",
+    r"actively\s+pursuing.*bachelor.*computer\s+(?:science|engineering)",
+    r"must\s+be\s+actively\s+enrolled.*bachelor",
+    r"current\s+student\s+pursuing.*bachelor",
+    r"students?\s+must\s+be\s+continuing.*degree\s+during",
+    r"associate.?s.*or.*bachelor.?s.*degree.*preferred",
+    r"enrolled.*associate.?s.*or.*bachelor",
+    r"actively\s+enrolled.*associate.?s.*or.*bachelor",
+    r"student\s+going\s+into\s+junior\s+or\s+senior\s+year",
+    r"rising\s+junior\s+or\s+senior",
+    r"scheduled\s+to\s+obtain.*bachelor.*202[678]",
+    r"junior\s+or\s+senior.*pursuing.*bachelor",
+    r"pursuing\s+bsee",
+    r"presently\s+pursuing\s+bsee",
+    r"currently\s+pursuing.*bachelor.*computer.*science.*data.*science",
+    r"undergraduate\s+students?\s+only",
+    r"must\s+be\s+pursuing\s+(?:a\s+)?(?:bs|ba)\b",
+    r"enrolled\s+in\s+(?:an?\s+)?undergraduate\s+program",
+    r"currently\s+pursuing\s+(?:a\s+)?bachelor",
+    r"must\s+be\s+(?:an?\s+)?undergraduate\s+student",
+    r"(?:must\s+be\s+)?(?:a\s+)?rising\s+(?:junior|senior)",
+    r"entering\s+(?:third|fourth)\s+year",
+    r"(?:sophomore|junior|senior)\s+status",
+    r"bachelor'?s?\s+candidates?\s+only",
+    r"pursuing\s+(?:bs|ba)\s+degree",
+    r"current\s+(?:bs|ba)\s+student",
+    r"enrolled\s+(?:bs|ba)\s+program",
+    r"undergraduate\s+enrollment\s+required",
+    r"must\s+be\s+enrolled\s+in\s+bachelor",
+    r"bachelor'?s?\s+program\s+enrollment",
+    r"currently\s+enrolled\s+in\s+a\s+bachelor'?s?\s+degree\s+program",
+    r"enrolled\s+in\s+(?:a\s+)?bachelor'?s?\s+degree\s+program",
+    r"(?:junior|senior)\s+year\s+standing",
+    r"rising\s+(?:sophomore|junior|senior)",
+    r"advancing\s+to\s+(?:their\s+)?(?:junior|senior)\s+year",
+    r"at\s+least\s+advancing\s+to\s+(?:their\s+)?(?:junior|senior)",
+    r"entering\s+(?:their\s+)?(?:junior|senior)\s+year",
+    r"going\s+into\s+(?:their\s+)?(?:junior|senior)\s+year",
+    r"currently\s+enrolled\s+college\s+student",
+    r"currently\s+enrolled\s+(?:as\s+a\s+)?college\s+student",
+    r"enrolled\s+college\s+student",
+    r"intern\s+undergraduate",
+    r"undergraduate\s+intern",
+    r"applicants?\s+considered\s+for.*undergraduate\s+only",
+    r"undergraduate\s+students?\s+pursuing",
+    r"pursuing\s+(?:a\s+)?bachelor.*computer\s+(?:science|engineering)",
+    r"class\s+standing:\s*(?:junior|senior)",
+    r"enrolled\s+(?:as\s+a\s+)?(?:full.?time\s+)?student\s+at\s+(?:an?\s+)?accredited\s+(?:four.year|4.year)",
+    r"currently\s+enrolled\s+(?:as\s+a\s+)?(?:full.?time\s+)?student.*(?:four.year|4.year|college|university)",
+    r"must\s+be\s+(?:a\s+)?(?:current|active|full.?time)\s+student.*(?:four.year|4.year|college|university)",
+    r"accredited\s+four.year\s+(?:college|university)",
+    r"enrolled.*(?:fulltime|full.time).*(?:college|university).*(?:bachelor|undergraduate|four.year)",
+    r"pursuing\s+undergraduate\s+degree",
+    r"current\s+undergraduate\s+status",
+    r"undergraduate\s+student\s+status",
+    r"(?:junior|senior)\s+or\s+senior\s+year",
+    r"in\s+their\s+(?:junior|senior)\s+or\s+senior\s+year",
+    r"junior\s+or\s+senior\s+year",
+    r"junior\s+or\s+senior\s+standing",
+    r"must\s+be\s+(?:a\s+)?(?:junior|senior)\s+(?:or\s+senior\s+)?(?:year|student)",
+    r"for\s+(?:junior|senior)\s+(?:year\s+)?students\s+only",
+    r"bachelor'?s?\s+level\s+student",
+    r"undergraduate\s+program\s+student",
+    r"enrolled\s+in\s+(?:a\s+)?4-year\s+(?:bachelor|undergraduate)",
+    r"pursuing\s+(?:a\s+)?4-year\s+degree",
+    r"rising\s+(?:sophomore|junior|senior)\s+(?:year\s+)?(?:student|pursuing|working)",
+    r"completed\s+(?:2|3|two|three)\s+years?\s+by\s+start",
+    r"must\s+have\s+completed\s+(?:sophomore|junior|senior)\s+year",
+    r"entering\s+(?:their\s+)?(?:sophomore|junior|senior)\s+year",
+    r"currently\s+enrolled\s+as\s+a\s+(?:junior|senior)\s+pursuing\s+a\s+bachelor",
+    r"junior\s+or\s+senior\s+pursuing\s+a\s+bachelor",
+    r"(?:must|should)\s+be\s+pursuing\s+(?:their|a)\s+bachelor",
+    r"target(?:ed)?\s+majors?.*bachelor",
+    r"(?:associate|associates|aa|as)\s+(?:or|and)\s+bachelor",
+    r"(?:associate|aa)\s+degree.*only",
+    r"no\s+(?:prior\s+)?experience.*bachelor.*program",
+    r"graduating.*with\s+(?:a\s+)?(?:ba|bs|ba/bs|bs/ba|b\.s\.|b\.a\.)\b",
+    r"with\s+(?:a\s+)?(?:ba/bs|bs/ba)\s*,?\s*majoring",
+    r"graduating.*(?:ba|bs|ba/bs|bs/ba)\s*,?\s*majoring",
+    r"receive\s+(?:a\s+)?(?:ba|bs|ba/bs)\s+(?:by|before|prior)",
+    r"high\s+school\s+diploma.*currently\s+attending\s+(?:a\s+)?college",
+]
+
+# Any of these near an undergrad match means MS students are welcome too
+UNDERGRADUATE_FLEXIBILITY_KEYWORDS = [
+    "master",
+    "masters",
+    "graduate",
+    "ms/phd",
+    "or graduate",
+    "and graduate",
+    "or master",
+    "master's degree",
+    "masters degree",
+    "ms degree",
+    "or ms",
+    r"m\.s\.",
+    "grad student",
+    "graduate student",
+    "bachelor.*or higher degree",  # "bachelor or higher" means MS accepted
+    "bachelor.*or.*master.*degree",  # explicit bachelor+master
+    "bachelor.*or.*master",
+    "bachelor.*master",
+    "pursuing.*master",
+    "advanced degree",
+]
+UNDERGRADUATE_FLEXIBILITY_RES = [
+    re.compile(rf"\b{kw}\b", re.I) for kw in UNDERGRADUATE_FLEXIBILITY_KEYWORDS
+]
+
+PHD_ONLY_PATTERNS = [
+    r"\bphd\s+(?:intern|student|candidate|only|required)",
+    r"doctoral\s+(?:intern|student|candidate|only)",
+    r"(?:pursuing|enrolled\s+in|candidates?\s+in).*\bphd\s+(?:degree|program)",
+    r"phd-only",
+    r"phd\s+internship",
+    r"in\s+the\s+process\s+of\s+obtaining.*ph\.?d",
+    r"currently\s+has.*ph\.?d\s+degree",
+    r"ph\.?d\s+degree\s+in\s+the\s+field\s+of",
+    r"(?:requires?|must\s+have).*ph\.?d\s+(?:degree|student|candidate)",
+]
+
+BACHELORS_ONLY_PATTERNS = [
+    r"bachelor'?s?\s+(?:students?|degree|candidates?)\s+only",
+    r"undergraduate\s+(?:students?|only)",
+    r"undergraduate\s+students?\s+only",
+    r"open\s+to\s+undergraduate\s+students?",
+    r"for\s+undergraduate\s+students?\s+only",
+    r"currently\s+pursuing\s+a?\s+bachelor",
+    r"only\s+open\s+to\s+undergraduate",
+]
+
+RESTRICTION_RULES = (
+    RestrictionRuleSet()
+    .add("clearance", CLEARANCE_PATTERNS, re.I)
+    .add("citizenship", CITIZENSHIP_PATTERNS, re.I)
+    .add("graduation", GRADUATION_DEADLINE_PATTERNS, re.I)
+    .add("permanent_authorization", PERMANENT_US_AUTHORIZATION_PATTERNS)
+    .add("high_school", HIGH_SCHOOL_ONLY_PATTERNS)
+    .add("undergraduate_only", UNDERGRADUATE_ONLY_PATTERNS, re.I)
+    .add("non_cs_undergrad", NON_CS_UNDERGRADUATE_DEGREE_PATTERNS)
+    .add("preferred_degree_mismatch", PREFERRED_DEGREE_MISMATCH_PATTERNS)
+    .add("phd_only", PHD_ONLY_PATTERNS + ENHANCED_PHD_PATTERNS)
+    .add("geographic_enrollment", GEOGRAPHIC_ENROLLMENT_PATTERNS)
+    .add("cpt_opt", CPT_OPT_EXCLUSION_PATTERNS)
+    .add("us_person_dod", US_PERSON_DOD_PATTERNS)
+    .add("bachelors_only", BACHELORS_ONLY_PATTERNS, re.I)
+)
+
+
+def scan_page(page, n: int = PAGE_TEXT_FULL_SCAN) -> RuleScan:
+    """Restriction scan of page.lower_prefix(n), shared by every check on the page."""
+    page = PageDocument.of(page)
+    return page.memo(
+        ("restriction_scan", n),
+        lambda: RESTRICTION_RULES.scan(page.lower_prefix(n)),
+    )
@@ -9,6 +9,7 @@ import os
 import logging
 import sqlite3
 from collections import defaultdict
+from contextlib import nullcontext
 from bs4 import BeautifulSoup
 
 from aggregator.url_validator import validate_job, validate_job_integrity
@@ -41,6 +42,10 @@ from aggregator.config import (
     TERMINAL_COMPANY_WIDTH,
     VERBOSE_OUTPUT,
     SHOW_GITHUB_COUNTS,
+    PIPELINE_WORKERS,
+    PIPELINE_QUEUE_SIZE,
+    PIPELINE_FLUSH_ROWS,
+    PIPELINE_FLUSH_SEC,
 )
 
 from aggregator.extractors import (
@@ -56,6 +61,10 @@ from aggregator.extractors import (
     safe_parse_html,
     retry_request,
 )
+from aggregator.page_document import PageDocument
+from aggregator.dedup_index import ClaimSet, DedupIndex
+from aggregator.pipeline import RunPipeline
+from aggregator.run_journal import RunJournal
 
 try:
     from scripts.pipeline_brain import PipelineBrain
@@ -482,6 +491,12 @@ class UnifiedJobAggregator:
         self.outcomes = defaultdict(int)
         self.source_stats = defaultdict(lambda: defaultdict(int))
         import threading as _t; self._github_lock = _t.Lock()  # thread safety for parallel processing
+        self._quiet = _t.local()  # per-worker: GitHub pipeline items don't print rejections
+        self._fetch_failed = _t.local()  # per-worker: set when the current job page couldn't be fetched
+        # Check-and-reserve for URL / job_id / company+title keys, striped by company
+        self.dedup = DedupIndex(
+            self.existing_jobs, self.existing_urls, self.existing_job_ids, self.processing_lock
+        )
 
         print(
             # (loaded silently)
@@ -494,7 +509,7 @@ class UnifiedJobAggregator:
         if os.path.exists(_lock_file):
             try:
                 _lock_age = time.time() - os.path.getmtime(_lock_file)
-                if _lock_age < 600:  # 10 minutes
+                if _lock_age < 600 and self._lock_holder_alive(_lock_file):  # 10 minutes
                     print("⚠️  Another aggregator run is in progress (lock file < 10 min old). Exiting.")
                     logging.warning(f"Skipped: lock file exists, age={_lock_age:.0f}s")
                     return
@@ -523,138 +538,51 @@ class UnifiedJobAggregator:
 
         # (silent)
 
-        # ── Direct ATS API sources (Greenhouse, Lever, Ashby, HackerNews) ──
-        try:
-            from aggregator.direct_sources import fetch_all_direct_sources
-            direct_jobs = fetch_all_direct_sources()
-            for dj in direct_jobs:
-                dj["_source_name"] = dj.get("source", "direct")
-                dj["github_category"] = "Direct ATS API"
-            if direct_jobs:
-                import concurrent.futures as _cf
-                from aggregator.extractors import (
-                    already_fetched, mark_fetched, save_fetched_urls,
-                )
-                # Skip job pages we already read in a previous run
-                _fresh = [_j for _j in direct_jobs
-                          if _j.get("url") and not already_fetched(_j["url"])]
-                logging.info(
-                    f"Direct ATS: {len(direct_jobs)} fetched, "
-                    f"{len(_fresh)} new (rest already seen)"
-                )
-
-                def _read_page(_j):
-                    """Open the real job page so every column is accurate."""
-                    try:
-                        self._process_single_job_comprehensive(
-                            _j["url"],
-                            company_hint=_j.get("company", ""),
-                            title_hint=_j.get("title", ""),
-                            location_hint=_j.get("location", ""),
-                            source=_j.get("source", "direct_ats"),
-                        )
-                        mark_fetched(_j["url"])
-                    except Exception:
-                        raise
-
-                _errs = 0
-                with _cf.ThreadPoolExecutor(max_workers=6) as _pool:
-                    _futs = {_pool.submit(_read_page, _j): _j for _j in _fresh}
-                    for _f in _cf.as_completed(_futs):
-                        try:
-                            _f.result()
-                        except Exception as _e:
-                            _errs += 1
-                            logging.error(
-                                f"Direct ATS job failed "
-                                f"{_futs[_f].get('company','?')}: {_e}"
-                            )
-                save_fetched_urls()
-                logging.info(
-                    f"Direct ATS sources: {len(_fresh)} pages read "
-                    f"({_errs} errors)"
-                )
-        except Exception as e:
-            logging.error(f"Direct ATS sources failed: {e}")
-
-        # GitHub feeds run AFTER direct sources (direct data is authoritative)
-        self._scrape_simplify_github()
-
-        print("\nProcessing email jobs...")
-        try:
-            emails_data = self.email_extractor.fetch_job_emails()
-            if emails_data:
-                total_urls = sum(len(email["urls"]) for email in emails_data)
-                print(
-                    f"Processing {total_urls} URLs from {len(emails_data)} emails...\n"
-                )
-                self._process_emails_grouped(emails_data)
-            else:
-                print("No email jobs found")
-                logging.warning("No email data received from Gmail")
-        except Exception as e:
-            print(f"Email processing error: {e}")
-            logging.error(f"Email processing error: {e}", exc_info=True)
-
-        self._ensure_mutual_exclusion()
-
-        # Save Brain once after all job_id registrations
-        try:
-            from outreach.brain import Brain
-            Brain.get().save()
-        except Exception:
-            pass
-
-        rows = self.sheets.get_next_row_numbers()
-
         # ── WAL: wrap sheet writes in transactions for crash safety ──
-        _wal = None
-        _tx_valid = None
-        _tx_discarded = None
+        self._wal = None
         try:
             from aggregator.wal import WriteAheadLog
-            _wal = WriteAheadLog()
+            self._wal = WriteAheadLog()
             # Replay any pending transactions from previous crashed runs
-            _pending = _wal.get_pending()
+            _pending = self._wal.get_pending()
             if _pending:
                 logging.info(f"WAL: {len(_pending)} pending transactions from previous run")
-                _wal.replay_pending()
+                self._wal.replay_pending(self._replay_wal_tx)
         except Exception as _wal_e:
             logging.debug(f"WAL init: {_wal_e}")
 
-        # Write valid jobs with WAL protection
-        try:
-            if _wal and self.valid_jobs:
-                _tx_valid = _wal.begin("add_valid_jobs", {
-                    "count": len(self.valid_jobs),
-                    "start_row": rows["valid"],
-                })
-        except Exception:
-            pass
+        # ── Run journal: resume an interrupted run, checkpoint this one ──
+        self._start_journal()
 
-        added_valid = self.sheets.add_valid_jobs(
-            self.valid_jobs, rows["valid"], rows["valid_sr_no"]
-        )
+        if PIPELINE_WORKERS > 0:
+            added_valid = self._run_pipelined()
+        else:
+            added_valid = self._run_phased()
 
-        try:
-            if _wal and _tx_valid:
-                _wal.commit(_tx_valid)
-        except Exception:
-            pass
+        # Save Brain once after all job_id registrations
+        self._checkpoint_brain()
+
+        rows = self.sheets.get_next_row_numbers()
+        _wal = self._wal
+        _tx_discarded = None
+        self._journal.checkpoint()
 
         # Write discarded jobs with WAL protection
         try:
             if _wal and self.discarded_jobs:
-                _tx_discarded = _wal.begin("add_discarded_jobs", {
-                    "count": len(self.discarded_jobs),
-                    "start_row": rows["discarded"],
-                })
+                _tx_discarded = _wal.begin(
+                    "add_discarded_jobs",
+                    self._wal_payload(self.discarded_jobs, rows["discarded"], rows["discarded_sr_no"]),
+                    key=self._wal_key("add_discarded_jobs", self.discarded_jobs),
+                )
         except Exception:
             pass
 
         added_discarded = self.sheets.add_discarded_jobs(
             self.discarded_jobs, rows["discarded"], rows["discarded_sr_no"]
         )
+        self._journal.written("discarded")
+        self._journal.finish()
 
         try:
             if _wal and _tx_discarded:
@@ -708,14 +636,39 @@ class UnifiedJobAggregator:
         except Exception as _a_e:
             logging.debug(f"Analytics recording skipped: {_a_e}")
 
-        # ── WAL cleanup: remove old committed transactions ──
+        # ── WAL compaction: drop transactions settled over a week ago ──
         try:
             if _wal:
-                _wal.cleanup_committed(max_age_days=7)
+                _wal.compact(max_age_days=7)
+                _wal.close()
         except Exception:
             pass
 
         self._print_summary()
+
+        # ── Per-host rate-limit wait time (where the run spent its sleeps) ──
+        try:
+            from aggregator.rate_limiter import DomainRateLimiter
+            DomainRateLimiter.default().log_summary()
+        except Exception:
+            pass
+
+        # ── Page cache: hit rate and bytes, then trim the disk store ──
+        try:
+            from aggregator.http_cache import HttpCache
+            HttpCache.default().log_summary()
+            HttpCache.default().prune()
+        except Exception:
+            pass
+
+        # ── Browser pool: queue wait and render time for JS-heavy pages ──
+        try:
+            from aggregator.browser_pool import BrowserPool
+            if BrowserPool._default is not None:
+                BrowserPool._default.log_summary()
+        except Exception:
+            pass
+
         elapsed = time.time() - start_time
         print(f"\n✓ DONE: {added_valid} valid, {added_discarded} discarded")
         print(f"Execution time: {elapsed / 60:.1f} minutes")
@@ -742,6 +695,349 @@ class UnifiedJobAggregator:
         except Exception as _me:
             logging.warning(f"Metrics recording failed: {_me}")
 
+    @staticmethod
+    def _lock_holder_alive(lock_file):
+        """False when the run that wrote the lock file has exited (killed runs
+        leave their lock behind; the restart should resume, not wait)."""
+        try:
+            with open(lock_file) as f:
+                pid = int(f.readline().strip())
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except Exception:
+            pass
+        return True
+
+    def _start_journal(self):
+        """Carry over unwritten jobs and finished work from an interrupted run,
+        then start checkpointing this one."""
+        self._journal = RunJournal(valid=lambda: self.valid_jobs, discarded=lambda: self.discarded_jobs)
+        state = self._journal.load()
+        if state is None:
+            self._journal.start()
+            return
+        # A row the interrupted run wrote is in the sheet now: don't write it twice
+        valid = [
+            j for j in state.valid
+            if self.dedup.restore(j.get("company", ""), j.get("title", ""), j.get("url", ""), j.get("job_id", "N/A"))
+        ]
+        self._discarded_url_seen = getattr(self, "_discarded_url_seen", set())
+        self._discarded_ct_seen = getattr(self, "_discarded_ct_seen", set())
+        for d in state.discarded:
+            self._discarded_url_seen.add((d.get("url"), d.get("reason")))
+            self._discarded_ct_seen.add(re.sub(r"[^a-z0-9]", "", f"{d.get('company')}_{d.get('title')}".lower()))
+        self.valid_jobs.extend(valid)
+        self.discarded_jobs.extend(state.discarded)
+        self.outcomes["valid"] += len(valid)
+        self.outcomes["discarded"] += len(state.discarded)
+        self._journal.start(valid, state.discarded, state.done)
+        print(
+            f"↻ Resuming {state.run_id}: {len(valid)} valid + {len(state.discarded)} discarded "
+            f"jobs to write, {len(state.done)} units already done"
+        )
+        logging.info(
+            f"Resumed {state.run_id}: {len(valid)} valid ({len(state.valid) - len(valid)} already in sheet), "
+            f"{len(state.discarded)} discarded, {len(state.done)} done units"
+        )
+
+    def _unit(self, key):
+        journal = getattr(self, "_journal", None)
+        return journal.unit(key) if journal else nullcontext()
+
+    def _is_done(self, key):
+        journal = getattr(self, "_journal", None)
+        return bool(journal) and journal.is_done(key)
+
+    # ── Run stages ───────────────────────────────────────────────────────────
+
+    def _list_direct_jobs(self):
+        """Direct ATS listings (Greenhouse, Lever, Ashby, HackerNews) whose job
+        pages were not read in an earlier run."""
+        from aggregator.direct_sources import fetch_all_direct_sources
+        from aggregator.extractors import already_fetched
+        direct_jobs = fetch_all_direct_sources()
+        for dj in direct_jobs:
+            dj["_source_name"] = dj.get("source", "direct")
+            dj["github_category"] = "Direct ATS API"
+        # Skip job pages we already read in a previous run
+        fresh = [j for j in direct_jobs if j.get("url") and not already_fetched(j["url"])
+                 and not self._is_done(f"direct:{j['url']}")]
+        if direct_jobs:
+            with_content = sum(1 for j in fresh if j.get("description_html"))
+            logging.info(
+                f"Direct ATS: {len(direct_jobs)} fetched, "
+                f"{len(fresh)} new (rest already seen), {with_content} with listing content"
+            )
+        return fresh
+
+    def _read_direct_page(self, job):
+        """Validate a direct listing from the description its board API
+        returned; open the real job page only when there isn't enough of it."""
+        from aggregator.extractors import mark_fetched
+        from aggregator.listing_page import listing_html
+        page_html = listing_html(job)
+        key = "direct_from_listing" if page_html else "direct_page_fetch"
+        self.outcomes[key] = self.outcomes.get(key, 0) + 1
+        with self._unit(f"direct:{job['url']}"):
+            self._process_single_job_comprehensive(
+                job["url"],
+                company_hint=job.get("company", ""),
+                title_hint=job.get("title", ""),
+                location_hint=job.get("location", ""),
+                source=job.get("source", "direct_ats"),
+                page_html=page_html,
+            )
+        mark_fetched(job["url"])
+
+    def _read_direct_sources(self):
+        import concurrent.futures as _cf
+        from aggregator.extractors import save_fetched_urls
+        try:
+            fresh = self._list_direct_jobs()
+            _errs = 0
+            with _cf.ThreadPoolExecutor(max_workers=6) as _pool:
+                _futs = {_pool.submit(self._read_direct_page, _j): _j for _j in fresh}
+                for _f in _cf.as_completed(_futs):
+                    try:
+                        _f.result()
+                    except Exception as _e:
+                        _errs += 1
+                        logging.error(
+                            f"Direct ATS job failed "
+                            f"{_futs[_f].get('company','?')}: {_e}"
+                        )
+            save_fetched_urls()
+            logging.info(
+                f"Direct ATS sources: {len(fresh)} jobs read, "
+                f"{self.outcomes.get('direct_page_fetch', 0)} page fetches ({_errs} errors)"
+            )
+        except Exception as e:
+            logging.error(f"Direct ATS sources failed: {e}")
+
+    def _fetch_email_jobs(self):
+        print("\nProcessing email jobs...")
+        try:
+            emails_data = self.email_extractor.fetch_job_emails(processed=ProcessedEmailTracker.load())
+        except Exception as e:
+            print(f"Email processing error: {e}")
+            logging.error(f"Email processing error: {e}", exc_info=True)
+            return []
+        if emails_data:
+            total_urls = sum(len(email["urls"]) for email in emails_data)
+            print(f"Processing {total_urls} URLs from {len(emails_data)} emails...\n")
+        else:
+            print("No email jobs found")
+            logging.warning("No email data received from Gmail")
+        return emails_data or []
+
+    def _process_email_jobs(self, emails_data):
+        if not emails_data:
+            return
+        try:
+            self._process_emails_grouped(emails_data)
+        except Exception as e:
+            print(f"Email processing error: {e}")
+            logging.error(f"Email processing error: {e}", exc_info=True)
+
+    @staticmethod
+    def _wal_payload(jobs, start_row, start_sr_no):
+        return {"count": len(jobs), "start_row": start_row, "start_sr_no": start_sr_no, "jobs": jobs}
+
+    def _wal_key(self, operation, jobs):
+        """Idempotency key: the same rows give the same key on any run."""
+        from aggregator.wal import WriteAheadLog
+        return WriteAheadLog.rows_key(operation, (
+            f"{self.dedup.keys(j.get('company', ''), j.get('title', ''), j.get('url', '')).ct}|{j.get('url', '')}"
+            for j in jobs
+        ))
+
+    def _replay_wal_tx(self, tx):
+        """WAL executor: write a crashed run's rows again, minus any the
+        sheet already has (the write got that far before the crash)."""
+        jobs = tx.payload.get("jobs")
+        if jobs is None or tx.operation not in ("add_valid_jobs", "add_discarded_jobs"):
+            logging.warning(f"WAL: {tx.tx_id} ({tx.operation}) has no row payload — cannot replay")
+            return False
+        keys = [self.dedup.keys(j.get("company", ""), j.get("title", ""), j.get("url", "")).ct for j in jobs]
+        fresh = [j for j, k in zip(jobs, keys) if k not in self.existing_jobs]
+        if fresh:
+            rows = self.sheets.get_next_row_numbers()
+            if tx.operation == "add_valid_jobs":
+                self.sheets.add_valid_jobs(fresh, rows["valid"], rows["valid_sr_no"])
+            else:
+                self.sheets.add_discarded_jobs(fresh, rows["discarded"], rows["discarded_sr_no"])
+        # Keeps a resumed run journal from writing the same rows again
+        self.existing_jobs.update(keys)
+        logging.info(
+            f"WAL: replayed {tx.operation}: {len(fresh)} rows written, "
+            f"{len(jobs) - len(fresh)} already in sheet"
+        )
+        return True
+
+    def _write_valid(self, jobs, rows):
+        """add_valid_jobs at `rows`, wrapped in a WAL transaction."""
+        _wal = getattr(self, "_wal", None)
+        _tx_valid = None
+        try:
+            if _wal and jobs:
+                _tx_valid = _wal.begin(
+                    "add_valid_jobs",
+                    self._wal_payload(jobs, rows["valid"], rows["valid_sr_no"]),
+                    key=self._wal_key("add_valid_jobs", jobs),
+                )
+        except Exception:
+            pass
+
+        added = self.sheets.add_valid_jobs(jobs, rows["valid"], rows["valid_sr_no"])
+
+        try:
+            if _wal and _tx_valid:
+                _wal.commit(_tx_valid)
+        except Exception:
+            pass
+        return added
+
+    def _run_phased(self):
+        """Direct sources, then GitHub feeds, then emails; one sheet write at the end."""
+        self._read_direct_sources()
+        self._checkpoint_brain()
+
+        # GitHub feeds run AFTER direct sources (direct data is authoritative)
+        self._scrape_simplify_github()
+        self._checkpoint_brain()
+
+        self._process_email_jobs(self._fetch_email_jobs())
+        self._journal.checkpoint()
+        self._ensure_mutual_exclusion()
+        added = self._write_valid(self.valid_jobs, self.sheets.get_next_row_numbers())
+        self._journal.written("valid")
+        return added
+
+    def _run_pipelined(self):
+        """Direct, GitHub and email stages on one shared worker pool, with
+        valid rows flushed to the sheet while the run is still going.
+
+        GitHub feeds are listed while direct sources are. Their pages are
+        queued as soon as every direct listing is claimed, behind the direct
+        pages (lower priority). A GitHub listing that matches a claimed direct
+        listing is dropped unread, so direct data stays authoritative. Emails
+        start once the direct stage has drained.
+        """
+        from aggregator.extractors import save_fetched_urls
+
+        claims = ClaimSet()
+        direct_listed = _threading.Event()
+        self._written_valid = 0
+        self._added_valid = 0
+        self._flushed_keys = set()
+        self._withheld = []
+        pipe = RunPipeline(
+            PIPELINE_WORKERS,
+            flush=self._flush_valid,
+            mark=lambda: len(self.valid_jobs),
+            queue_size=PIPELINE_QUEUE_SIZE,
+            flush_rows=PIPELINE_FLUSH_ROWS,
+            flush_sec=PIPELINE_FLUSH_SEC,
+        )
+
+        def list_direct(p):
+            fresh = []
+            try:
+                fresh = self._list_direct_jobs()
+                for j in fresh:
+                    claims.add(j.get("company", ""), j.get("title", ""), j["url"])
+            except Exception as e:
+                logging.error(f"Direct ATS sources failed: {e}")
+            finally:
+                direct_listed.set()
+            for j in fresh:
+                p.put("direct", 0, self._read_direct_page, j)
+
+        def list_github(p):
+            results = self._list_github_feeds()
+            direct_listed.wait()
+            claimed = 0
+            for name in self._GITHUB_PROCESSED:
+                for job in self._fresh_github_jobs(results.get(name, []), name):
+                    why = claims.match(job.get("company", ""), job.get("title", ""), job.get("url", ""))
+                    if why:
+                        claimed += 1
+                        with self._github_lock:
+                            self.outcomes[self._CLAIM_OUTCOMES[why]] += 1
+                        logging.info(f"DUPLICATE (direct {why}) | {job.get('company', '?')} | {job.get('title', '?')}")
+                        continue
+                    p.put("github", 1, self._process_github_item, job)
+            if claimed:
+                logging.info(f"GitHub: {claimed} listings skipped, already listed by a direct source")
+
+        def list_emails(p):
+            emails_data = self._fetch_email_jobs()
+            p.wait_stage("direct")
+            with p.busy("email"):
+                self._process_email_jobs(emails_data)
+
+        pipe.producer("direct", list_direct)
+        pipe.producer("github", list_github)
+        pipe.producer("email", list_emails)
+        pipe.run()
+
+        save_fetched_urls()
+        self._commit_github_feeds()
+        self._log_github_summary()
+        pipe.log_summary()
+        self._settle_pipelined()
+        return self._added_valid
+
+    def _settle_pipelined(self):
+        """Mutual exclusion for the pipelined run, once every write is done.
+
+        Withheld valid jobs leave valid_jobs. A job discarded after its valid
+        row was flushed keeps that row and leaves discarded_jobs, so it never
+        lands in both sheets."""
+        if self._withheld:
+            withheld = {id(j) for j in self._withheld}
+            self.valid_jobs = [j for j in self.valid_jobs if id(j) not in withheld]
+            self.outcomes["valid"] = len(self.valid_jobs)
+        late = self._valid_keys(self.discarded_jobs) & self._flushed_keys
+        if late:
+            logging.warning(f"{len(late)} jobs were discarded after their valid row was written, keeping the valid row")
+            kept = [
+                j for j in self.discarded_jobs
+                if (URLCleaner.normalize_text(j["company"]), URLCleaner.normalize_text(j["title"])) not in late
+            ]
+            self.outcomes["discarded"] -= len(self.discarded_jobs) - len(kept)
+            self.discarded_jobs = kept
+
+    @staticmethod
+    def _valid_keys(jobs):
+        return {
+            (URLCleaner.normalize_text(j["company"]), URLCleaner.normalize_text(j["title"]))
+            for j in jobs
+        }
+
+    def _flush_valid(self, upto):
+        """Pipeline writer: append valid_jobs[written:upto] to the Valid sheet.
+
+        Jobs already discarded under the same company+title are withheld, as
+        _ensure_mutual_exclusion does for the phased run. Only jobs already in
+        the run journal are written. Returns the index written up to."""
+        upto = min(upto, self._journal.checkpoint())
+        discarded = self._valid_keys(list(self.discarded_jobs))
+        batch = []
+        for j in self.valid_jobs[self._written_valid:upto]:
+            key = (URLCleaner.normalize_text(j["company"]), URLCleaner.normalize_text(j["title"]))
+            if key in discarded:
+                self._withheld.append(j)
+            elif key not in self._flushed_keys:
+                batch.append(j)
+        if batch:
+            self._added_valid += self._write_valid(batch, self.sheets.get_next_row_numbers())
+            self._flushed_keys |= self._valid_keys(batch)
+        self._journal.written("valid", upto)
+        self._written_valid = upto
+        return upto
+
     def _log_run_to_db(self, valid, discarded, elapsed_seconds):
         """Append this run's stats to .local/run_history.db for trend analysis."""
         try:
@@ -898,7 +1194,20 @@ class UnifiedJobAggregator:
                 print(f"\n{'='*60}\n  WARNING: Selenium auto-repair failed (attempt {fail_count})\n"
                       f"  Error: {e}\n  Workday/Ashby/Oracle jobs will fail.\n{'='*60}")
 
-    def _scrape_simplify_github(self):
+    # Feeds whose listings are processed, in processing order; the rest are
+    # only listed (and logged)
+    _GITHUB_PROCESSED = [
+        "SimplifyJobs", "vanshb03", "speedyapply_swe",
+        "speedyapply_ai", "vanshb03_offseason", "simplify_newgrad", "cvrve_newgrad",
+    ]
+    _CLAIM_OUTCOMES = {
+        "url": "skipped_duplicate_url",
+        "company+title": "skipped_duplicate_company_title",
+        "fuzzy": "skipped_duplicate_fuzzy",
+    }
+
+    def _list_github_feeds(self):
+        """Fetch every GitHub README feed, 5 at a time → {source_name: listings}."""
         import concurrent.futures
 
         _all_sources = [
@@ -917,6 +1226,9 @@ class UnifiedJobAggregator:
         ]
 
         _results = {}
+        SimplifyGitHubScraper.feed_status.clear()
+        SimplifyGitHubScraper.closures.clear()
+        SimplifyGitHubScraper._pending.clear()
         with concurrent.futures.ThreadPoolExecutor(max_workers=5) as ex:
             _futures = {
                 ex.submit(self._safe_scrape, url, name): name
@@ -926,34 +1238,63 @@ class UnifiedJobAggregator:
                 name = _futures[fut]
                 _results[name] = fut.result()
 
-        simplify_jobs = _results.get("SimplifyJobs", [])
-        vanshb03_jobs = _results.get("vanshb03", [])
-        speedyapply_jobs = _results.get("speedyapply_swe", [])
-
-        self._github_mode = True
-
         _new_total = sum(len(v) for k, v in _results.items()
                          if k not in ("SimplifyJobs", "vanshb03", "speedyapply_swe"))
         logging.info(
-            f"GitHub: {len(simplify_jobs)} SimplifyJobs + {len(vanshb03_jobs)} vanshb03"
-            f" + {len(speedyapply_jobs)} speedyapply + {_new_total} new sources"
+            f"GitHub: {len(_results.get('SimplifyJobs', []))} SimplifyJobs"
+            f" + {len(_results.get('vanshb03', []))} vanshb03"
+            f" + {len(_results.get('speedyapply_swe', []))} speedyapply + {_new_total} new sources"
+        )
+        _unchanged = [n for n, st in SimplifyGitHubScraper.feed_status.items() if st == "not_modified"]
+        if _unchanged:
+            logging.info(f"GitHub: {len(_unchanged)}/{len(_all_sources)} feeds not modified (304): {', '.join(sorted(_unchanged))}")
+        _closed = sum(len(v) for v in SimplifyGitHubScraper.closures.values())
+        if _closed:
+            logging.info(f"GitHub: {_closed} listings removed from feeds since last run (see github_feeds/closures.jsonl)")
+        return _results
+
+    def _fresh_github_jobs(self, jobs, source_name):
+        """Listings young enough to process, tagged with their feed name."""
+        fresh, skipped_old = [], 0
+        for job in jobs:
+            age_days = self._parse_github_age(job["age"])
+            if age_days is not None and age_days > MAX_JOB_AGE_DAYS:
+                skipped_old += 1
+            elif self._is_done(f"github:{job['url']}"):
+                continue  # finished by the interrupted run this one resumed
+            else:
+                job["_source_name"] = source_name
+                fresh.append(job)
+        print(f"  {source_name}: {len(fresh)} fresh, {skipped_old} too old")
+        return fresh
+
+    def _commit_github_feeds(self):
+        # Listings are processed — remember what each processed feed looked like
+        for _src_name in self._GITHUB_PROCESSED:
+            SimplifyGitHubScraper.commit(_src_name)
+
+    def _log_github_summary(self):
+        github_valid = sum(
+            1 for j in self.valid_jobs if j["source"] in ["SimplifyJobs", "vanshb03", "speedyapply_swe"]
         )
+        print(f"\n  GitHub: {github_valid} valid jobs total")
+        logging.info(f"GitHub summary: {github_valid} valid jobs")
 
+    def _scrape_simplify_github(self):
         import concurrent.futures
 
+        _results = self._list_github_feeds()
+        simplify_jobs = _results.get("SimplifyJobs", [])
+        vanshb03_jobs = _results.get("vanshb03", [])
+        speedyapply_jobs = _results.get("speedyapply_swe", [])
+
+        self._github_mode = True
+
         def _process_github_batch(jobs, source_name):
-            fresh, skipped_old = [], 0
-            for job in jobs:
-                age_days = self._parse_github_age(job["age"])
-                if age_days is not None and age_days > MAX_JOB_AGE_DAYS:
-                    skipped_old += 1
-                else:
-                    job["_source_name"] = source_name
-                    fresh.append(job)
-            print(f"  {source_name}: {len(fresh)} fresh, {skipped_old} too old")
+            fresh = self._fresh_github_jobs(jobs, source_name)
             errors = 0
             with concurrent.futures.ThreadPoolExecutor(max_workers=10) as pool:
-                futures = {pool.submit(self._process_single_github_job, job): job for job in fresh}
+                futures = {pool.submit(self._github_unit, job): job for job in fresh}
                 for fut in concurrent.futures.as_completed(futures):
                     try:
                         fut.result()
@@ -971,20 +1312,39 @@ class UnifiedJobAggregator:
         _process_github_batch(speedyapply_jobs, "speedyapply_swe")
 
         # ── New sources (fault-isolated: each source independent) ──
-        for _src_name in ["speedyapply_ai",                           "vanshb03_offseason", "simplify_newgrad",
-                          "cvrve_newgrad"]:
+        for _src_name in self._GITHUB_PROCESSED[3:]:
             _src_jobs = _results.get(_src_name, [])
             if _src_jobs:
                 print(f"\n  Processing {_src_name} ({len(_src_jobs)} listings)...")
                 _process_github_batch(_src_jobs, _src_name)
 
         self._github_mode = False
+        self._commit_github_feeds()
+        self._log_github_summary()
 
-        github_valid = sum(
-            1 for j in self.valid_jobs if j["source"] in ["SimplifyJobs", "vanshb03", "speedyapply_swe"]
-        )
-        print(f"\n  GitHub: {github_valid} valid jobs total")
-        logging.info(f"GitHub summary: {github_valid} valid jobs")
+    def _process_github_item(self, job):
+        """_process_single_github_job for a pipeline worker, with rejections
+        kept off the console as _github_mode does for the phased run."""
+        self._quiet.github = True
+        try:
+            self._github_unit(job)
+        finally:
+            self._quiet.github = False
+
+    def _github_unit(self, job):
+        """One GitHub listing. If its processing raises or its page fetch
+        fails, it is left out of the feed fingerprints so the next run emits
+        it again."""
+        listing = dict(job)  # fingerprint as parsed, before processing edits it
+        self._fetch_failed.flag = False
+        try:
+            with self._unit(f"github:{job['url']}"):
+                self._process_single_github_job(job)
+        except Exception:
+            SimplifyGitHubScraper.forget(listing)
+            raise
+        if self._fetch_failed.flag:
+            SimplifyGitHubScraper.forget(listing)
 
     def _process_single_github_job(self, job):
         title = TitleProcessor.clean_title_aggressive(job["title"])
@@ -1478,7 +1838,7 @@ class UnifiedJobAggregator:
             if not hasattr(self, "_existing_job_ids"):
                 self._existing_job_ids = set()
                 # Load existing job IDs from sheet
-                for _ej_row in self.sheets.valid_sheet.get_all_values()[1:]:
+                for _ej_row in self.sheets.snapshot.values(self.sheets.valid_sheet)[1:]:
                     if len(_ej_row) > 6 and _ej_row[6].strip() and _ej_row[6].strip() != "N/A":
                         _ej_co = re.sub(r"[^a-z0-9]", "", _ej_row[2].lower())
                         self._existing_job_ids.add(f"{_ej_co}_{_ej_row[6].strip()}")
@@ -1716,6 +2076,10 @@ class UnifiedJobAggregator:
             if email_id in processed_emails:
                 logging.info(f"Skipping already processed email: {subject}")
                 continue
+            if self._is_done(f"email:{email_id}"):
+                # Processed by the interrupted run this one resumed
+                ProcessedEmailTracker.mark_email_processed(processed_emails, email_id, subject, len(urls))
+                continue
 
             if sender == "ZipRecruiter" and html_content:
                 zr_jobs = ZipRecruiterResolver.parse_email_jobs(html_content)
@@ -1801,7 +2165,7 @@ class UnifiedJobAggregator:
                     logging.error(f"Failed to process email URL {url}: {e}")
                     return None
 
-            with _cf.ThreadPoolExecutor(max_workers=10) as pool:
+            with self._unit(f"email:{email_id}"), _cf.ThreadPoolExecutor(max_workers=10) as pool:
                 results = list(pool.map(_process_url, enumerate(deduped_urls)))
 
             inline_dups = sum(1 for r in results if r == "duplicate")
@@ -2250,6 +2614,7 @@ class UnifiedJobAggregator:
                 if zr_resp and zr_resp.status_code == 200:
                     zr_soup, _ = _sph(zr_resp.text)
                     if zr_soup:
+                        zr_soup = PageDocument(zr_soup)
                         # Check CS/Engineering role using page description
                         zr_desc = zr_soup.get_text(separator=" ", strip=True)[:8000]
                         is_cs = TitleProcessor.is_cs_engineering_role(title, zr_desc)
@@ -2868,6 +3233,7 @@ class UnifiedJobAggregator:
         location_hint="",
         source="Unknown",
         email_html=None,
+        page_html=None,
     ):
         try:
             # ══════════════════════════════════════════════════════
@@ -3000,10 +3366,15 @@ class UnifiedJobAggregator:
                 return None
             platform = PlatformDetector.detect(url)
 
-            response, final_url, page_source = self.page_fetcher.fetch_page(url)
+            if page_html:
+                # Direct ATS listing content stands in for the job page
+                response, final_url, page_source = page_html, url, page_html
+            else:
+                response, final_url, page_source = self.page_fetcher.fetch_page(url)
 
             if not response:
                 self.outcomes["failed_http"] += 1
+                self._fetch_failed.flag = True
                 co = company_hint or "Unknown"
                 ti = title_hint or "Unknown"
                 self._print_rejected(co, "HTTP fetch failed")
@@ -3032,8 +3403,11 @@ class UnifiedJobAggregator:
                 self._add_discarded(co, ti, location_hint or "Unknown", "Unknown", url, "N/A", "Internship", source, "HTML parse failed")
                 return None
 
+            # Extract page text once; every check below reads from this
+            page = PageDocument(soup)
+
             # ── Post-parse dead page title check ──────────────────
-            page_title = soup.title.string.strip() if soup.title and soup.title.string else ""
+            page_title = page.page_title
             if self._is_dead_page(page_title, final_url):
                 co = company_hint or "Unknown"
                 ti = title_hint or "Unknown"
@@ -3043,7 +3417,7 @@ class UnifiedJobAggregator:
                 self._add_discarded(co, ti, "Unknown", "Unknown", url, "N/A", "Internship", source, "Job posting expired/unavailable")
                 return None
 
-            company = CompanyExtractor.extract_all_methods(final_url or url, soup)
+            company = CompanyExtractor.extract_all_methods(final_url or url, page)
 
             if self._is_garbage_company(company) and company_hint:
                 company = company_hint
@@ -3076,12 +3450,12 @@ class UnifiedJobAggregator:
                 elif company_hint:
                     company = company_hint
 
-            title = PageParser.extract_title(soup)
+            title = PageParser.extract_title(page)
             if not title or title == "Unknown":
                 title = title_hint if title_hint else "Unknown"
 
             # ── POST-GATE: PhD detection from raw title + page <title> ──
-            _raw_phd_check = (title or "") + " " + (soup.title.string if soup and soup.title else "")
+            _raw_phd_check = (title or "") + " " + (page.title.string if page and page.title else "")
             if re.search(r"\(ph\.?d\.?\)", _raw_phd_check, re.I):
                 _co = company_hint or "Unknown"
                 self._add_discarded(_co, title, location_hint or "Unknown", "Unknown",
@@ -3129,7 +3503,7 @@ class UnifiedJobAggregator:
                 return None
 
             is_internship, intern_reason = TitleProcessor.is_internship_role(
-                title, page_text=soup.get_text()[:5000] if soup else ""
+                title, page_text=page.prefix(5000) if page else ""
             )
             if not is_internship and not source.startswith("simplify_newgrad"):
                 self.outcomes["skipped_senior_role"] += 1
@@ -3149,7 +3523,7 @@ class UnifiedJobAggregator:
                 return None
 
             season_ok, season_reason = TitleProcessor.check_season_requirement(
-                title, page_text=soup.get_text()[:5000] if soup else ""
+                title, page_text=page.prefix(5000) if page else ""
             )
             if not season_ok:
                 self.outcomes["skipped_wrong_season"] += 1
@@ -3169,7 +3543,7 @@ class UnifiedJobAggregator:
                 return None
 
             is_tech = TitleProcessor.is_cs_engineering_role(
-                title, description=soup.get_text()[:3000] if soup else ""
+                title, description=page.prefix(3000) if page else ""
             )
             if not is_tech:
                 self.outcomes["skipped_non_tech"] += 1
@@ -3210,9 +3584,9 @@ class UnifiedJobAggregator:
                 return None
 
             # ── Undergrad-only check: MS students not eligible ──
-            if soup:
+            if page:
                 try:
-                    ug_result, ug_reason = ValidationHelper._check_undergraduate_only_requirements(soup)
+                    ug_result, ug_reason = ValidationHelper._check_undergraduate_only_requirements(page)
                     if ug_result == "REJECT":
                         self._add_discarded(company, title, location_hint or "Unknown", "Unknown",
                             final_url or url, "N/A", "Internship", source, ug_reason)
@@ -3240,7 +3614,7 @@ class UnifiedJobAggregator:
                 "sandisk", "copart", "eversana", "zipline", "1password"}
             _co_lower = company.lower().strip()
             _is_whitelisted = any(wc in _co_lower or _co_lower in wc for wc in _NO_CLEARANCE_COMPANIES)
-            if soup and not _is_whitelisted:
+            if page and not _is_whitelisted:
                 try:
                     _clearance_pats = [
                         r"security\s+clearance\s+(?:is\s+)?required",
@@ -3254,7 +3628,7 @@ class UnifiedJobAggregator:
                         r"active\s+(?:secret|top secret|ts/sci)\s+clearance",
                         r"(?:secret|top secret)\s+clearance\s+(?:required|needed|mandatory)",
                     ]
-                    _page_text = soup.get_text()[:10000].lower()
+                    _page_text = page.lower_prefix(10000)
                     for _clr_pat in _clearance_pats:
                         if re.search(_clr_pat, _page_text, re.I):
                             self._add_discarded(company, title, location_hint or "Unknown", "Unknown",
@@ -3285,8 +3659,8 @@ class UnifiedJobAggregator:
                 ):
                     _sponsorship = "No"
                 # Then check JD text
-                if soup and _sponsorship == "Unknown":
-                    _jd_text = soup.get_text()[:10000].lower()
+                if page and _sponsorship == "Unknown":
+                    _jd_text = page.lower_prefix(10000)
                     for _pat in H1B_SPONSOR_JD_NO:
                         if re.search(_pat, _jd_text, re.I):
                             _sponsorship = "No"
@@ -3300,9 +3674,9 @@ class UnifiedJobAggregator:
                 pass
 
             # ── Salary check: reject jobs below $25/hr ──
-            if soup:
+            if page:
                 try:
-                    _jd = soup.get_text()[:15000].lower()
+                    _jd = page.lower_prefix(15000)
                     _min_hourly = 25.0
                     _min_annual = 52000  # ~$25/hr full time
 
@@ -3358,7 +3732,7 @@ class UnifiedJobAggregator:
 
             location = LocationExtractor.extract_all_methods(
                 final_url or url,
-                soup,
+                page,
                 title=title,
                 platform=platform,
                 page_source=page_source or "",
@@ -3430,7 +3804,7 @@ class UnifiedJobAggregator:
                 location = location.strip().strip(",").strip()
 
             international_check = LocationProcessor.check_if_international(
-                location, soup=soup, url=final_url or url, title=title
+                location, soup=page, url=final_url or url, title=title
             )
             if international_check:
                 self.outcomes["skipped_international"] += 1
@@ -3469,7 +3843,7 @@ class UnifiedJobAggregator:
                 return None
 
             page_decision, page_reason, _ = ValidationHelper.check_page_restrictions(
-                soup
+                page
             )
             if page_decision == "REJECT":
                 self.outcomes["skipped_page_restriction"] += 1
@@ -3488,7 +3862,7 @@ class UnifiedJobAggregator:
                 logging.info(f"REJECTED | {company} | {title} | {page_reason}")
                 return None
 
-            page_age = ValidationHelper.extract_page_age(soup)
+            page_age = ValidationHelper.extract_page_age(page)
             if page_age is not None and page_age > PAGE_AGE_THRESHOLD_DAYS:
                 self.outcomes["skipped_too_old"] += 1
                 self._add_discarded(
@@ -3507,7 +3881,7 @@ class UnifiedJobAggregator:
                 return None
 
             # Salary check — reject if listed and under $25/hr
-            sal_dec, sal_reason = ValidationHelper.check_salary_requirement(soup)
+            sal_dec, sal_reason = ValidationHelper.check_salary_requirement(page)
             if sal_dec == "REJECT":
                 self.outcomes["skipped_low_salary"] = self.outcomes.get("skipped_low_salary", 0) + 1
                 self._add_discarded(company, title, location, "Unknown",
@@ -3517,16 +3891,16 @@ class UnifiedJobAggregator:
                 return None
 
             remote = LocationProcessor.extract_remote_status_enhanced(
-                soup,
+                page,
                 location,
                 final_url or url,
-                description=soup.get_text()[:2000] if soup else "",
+                description=page.prefix(2000) if page else "",
             )
-            job_id = PageParser.extract_job_id(soup, final_url or url)
+            job_id = PageParser.extract_job_id(page, final_url or url)
             # Fallback: use URL-extracted job_id if page extraction failed
             if (not job_id or job_id == "N/A") and _url_job_id:
                 job_id = _url_job_id
-            sponsorship = ValidationHelper.check_sponsorship_status(soup)
+            sponsorship = ValidationHelper.check_sponsorship_status(page)
 
             # Use original URL if redirect crossed to different domain (prevents company/URL mismatch)
             _store_url = final_url or url
@@ -3598,86 +3972,35 @@ class UnifiedJobAggregator:
             logging.error(f"Processing failed for {url}: {e}", exc_info=True)
             return None
 
+    def _checkpoint_brain(self):
+        """Write buffered Brain job-ID registrations to brain.json."""
+        try:
+            from outreach.brain import Brain
+            Brain.get().flush_job_ids()
+        except Exception as e:
+            logging.debug(f"Brain checkpoint failed: {e}")
+
     def _is_garbage_company(self, name):
         if not name:
             return True
         return name.lower().strip() in GARBAGE_COMPANY_NAMES
 
     def _is_duplicate(self, company, title, url, job_id="N/A"):
-        with getattr(self, "_github_lock", _NOOP_LOCK):
-            if job_id and job_id not in ("N/A", "") and not job_id.startswith("HASH_"):
-                try:
-                    from outreach.brain import Brain
-                    if Brain.get().is_duplicate_job_id(job_id, company, title):
-                        self.outcomes["skipped_duplicate_job_id"] += 1
-                        logging.info(f"DUPLICATE (job_id) | {company} | {title}")
-                        return True
-                except Exception:
-                    pass
-            # Run-scoped job_id lock: catch same ID arriving twice in one run
-            # (e.g. ByteDance jobs.bytedance.com vs joinbytedance.com share a numeric ID)
-            if job_id and job_id not in ("N/A", "") and not job_id.startswith("HASH_"):
-                try:
-                    from outreach.brain import Brain
-                    _nid = "JID_" + Brain.get().normalize_job_id(job_id)
-                    if _nid != "JID_" and _nid in self.processing_lock:
-                        self.outcomes["skipped_duplicate_job_id"] += 1
-                        logging.info(f"DUPLICATE (job_id run) | {company} | {title}")
-                        return True
-                    if _nid != "JID_":
-                        self.processing_lock.add(_nid)
-                except Exception:
-                    pass
-            clean_url = URLCleaner.clean_url(url)
-            if clean_url in self.existing_urls or clean_url in self.processing_lock:
-                self.outcomes["skipped_duplicate_url"] += 1
-                logging.info(f"DUPLICATE (url) | {company} | {title} | {url[:60]}")
-                return True
-            # Normalize company name for dedup: strip Inc., LLC, (SRA), etc.
-            import re as _dn_re
-            _co_clean = _dn_re.sub(r",?\s*(Inc\.?|LLC|Ltd\.?|Corp\.?|L\.?P\.?)\s*$", "", company, flags=_dn_re.I).strip()
-            _co_clean = _dn_re.sub(r"\s*\([^)]+\)\s*$", "", _co_clean).strip()  # Strip (SRA), (SIG) etc.
-            norm_key = URLCleaner.normalize_text(f"{_co_clean}_{title}")
-            if norm_key in self.existing_jobs or norm_key in self.processing_lock:
-                self.outcomes["skipped_duplicate_company_title"] += 1
-                logging.info(f"DUPLICATE (company+title) | {company} | {title}")
-                return True
-            # TF-IDF fuzzy dedup: catch near-duplicates like
-            # "Software Engineering Intern" vs "Software Engineer - Intern"
-            try:
-                if not hasattr(self, "_similarity_engine"):
-                    from analytics.similarity import TitleSimilarity
-                    self._similarity_engine = TitleSimilarity()
-                    for existing in self.existing_jobs:
-                        parts = existing.split("_", 1)
-                        if len(parts) == 2:
-                            self._similarity_engine.add(parts[1], company=parts[0])
-                match = self._similarity_engine.is_near_duplicate(title, company=company, threshold=0.90)
-                if match:
-                    self.outcomes["skipped_duplicate_fuzzy"] = self.outcomes.get("skipped_duplicate_fuzzy", 0) + 1
-                    logging.info(f"DUPLICATE (fuzzy) | {company} | {title} ≈ {match.title} ({match.score:.2f})")
-                    return True
-                self._similarity_engine.add(title, company=company)
-            except Exception:
-                pass
-            # Add norm_key to processing_lock so parallel threads see it as duplicate
-            self.processing_lock.add(norm_key)
-            self.processing_lock.add(clean_url)
-            if (
-                job_id
-                and job_id != "N/A"
-                and not job_id.startswith("HASH_")
-                and job_id.lower() in self.existing_job_ids
-            ):
-                self.outcomes["skipped_duplicate_job_id"] += 1
-                logging.info(f"DUPLICATE (job_id2) | {company} | {title}")
-                return True
-            self.processing_lock.add(clean_url)
+        dup = self.dedup.check_and_reserve(company, title, url, job_id)
+        if not dup:
             return False
+        with self._github_lock:
+            self.outcomes[dup.outcome] += 1
+        if dup.match is not None:
+            logging.info(f"DUPLICATE ({dup.label}) | {company} | {title} ≈ {dup.match.title} ({dup.match.score:.2f})")
+        elif dup.outcome == "skipped_duplicate_url":
+            logging.info(f"DUPLICATE ({dup.label}) | {company} | {title} | {url[:60]}")
+        else:
+            logging.info(f"DUPLICATE ({dup.label}) | {company} | {title}")
+        return True
 
     def _is_duplicate_url(self, url):
-        clean_url = URLCleaner.clean_url(url)
-        return clean_url in self.existing_urls or clean_url in self.processing_lock
+        return self.dedup.is_known_url(url)
 
     def _add_discarded(
         self,
@@ -3737,7 +4060,8 @@ class UnifiedJobAggregator:
     def _print_rejected(self, company, reason):
         display = (company or "Unknown")
         logging.info(f"REJECTED | {display} | {reason}")
-        if not getattr(self, "_github_mode", False):
+        quiet = getattr(getattr(self, "_quiet", None), "github", False)
+        if not (getattr(self, "_github_mode", False) or quiet):
             print(f"    {display}: ✗ {reason}")
 
     def _ensure_mutual_exclusion(self):
@@ -0,0 +1,244 @@
+"""
+RunJournal — checkpoints an aggregator run so a killed run can resume.
+
+Everything a run learns lives in valid_jobs / discarded_jobs until the sheet
+writes at the end. A scheduler timeout or a laptop sleep loses all of it, and
+the next run reads every page again.
+
+The journal is one append-only JSON-lines file (.local/run_journal.jsonl):
+
+    {"run": "run_20261016_091500", "started": 1760606100.0}
+    {"valid": {...job...}}            valid_jobs[i], in list order
+    {"discarded": {...job...}}        discarded_jobs[i], in list order
+    {"done": "github:https://..."}    a unit of work that finished
+    {"written": "valid", "upto": 25}  the first 25 valid jobs are in the sheet
+
+Work is wrapped in unit(key): one direct listing, one GitHub listing, one
+email. Jobs are journaled once no running unit can still touch them (the
+same watermark rule as RunPipeline), and a unit is journaled as done only
+after every job it produced, so a resumed run never skips work whose
+results were lost. Lines are appended and fsynced in batches every
+RUN_CHECKPOINT_UNITS units or RUN_CHECKPOINT_SEC seconds; a torn last line
+from a crash is skipped on load. finish() deletes the file.
+
+Usage:
+    journal = RunJournal(valid=lambda: agg.valid_jobs, discarded=lambda: agg.discarded_jobs)
+    state = journal.load()                  # ResumeState or None
+    journal.start(valid, discarded, done)   # new file, carried-over state first
+    with journal.unit("direct:" + url):
+        ...
+    journal.checkpoint(); sheet write; journal.written("valid", upto)
+    journal.finish()
+"""
+import os
+import json
+import time
+import logging
+import threading
+import itertools
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from aggregator.config import (
+    RUN_JOURNAL_FILE,
+    RUN_JOURNAL_MAX_AGE_HOURS,
+    RUN_CHECKPOINT_UNITS,
+    RUN_CHECKPOINT_SEC,
+)
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class ResumeState:
+    run_id: str
+    started: float
+    valid: List[dict] = field(default_factory=list)        # not yet in the sheet
+    discarded: List[dict] = field(default_factory=list)
+    done: Set[str] = field(default_factory=set)
+
+
+class RunJournal:
+    def __init__(self, valid: Callable[[], list], discarded: Callable[[], list],
+                 path: str = RUN_JOURNAL_FILE, max_age_hours: float = RUN_JOURNAL_MAX_AGE_HOURS,
+                 every_units: int = RUN_CHECKPOINT_UNITS, every_sec: float = RUN_CHECKPOINT_SEC):
+        self.path = path
+        self.max_age_hours = max_age_hours
+        self.every_units = every_units
+        self.every_sec = every_sec
+        self._valid = valid
+        self._discarded = discarded
+        self._lock = threading.RLock()
+        self._file = None
+        self._tokens = itertools.count()
+        self._inflight: Dict[int, int] = {}
+        self._finished: List[tuple] = []        # (key, len(valid) when it ended)
+        self._done: Set[str] = set()
+        self._n_valid = 0                       # journaled so far
+        self._n_discarded = 0
+        self._last_checkpoint = time.monotonic()
+        self.run_id = ""
+        self.started = 0.0
+        self.resumed: Optional[ResumeState] = None
+
+    # ── Resume ───────────────────────────────────────────────────────────────
+
+    def load(self) -> Optional[ResumeState]:
+        """State left by an interrupted run, or None (no journal, or too old)."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log.warning(f"Run journal unreadable, starting fresh: {e}")
+            return None
+
+        state, valid, discarded, written = None, [], [], {"valid": 0, "discarded": 0}
+        for i, line in enumerate(lines):
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                if i == len(lines) - 1:
+                    break  # torn write from the crash
+                log.warning(f"Run journal: skipping corrupt line {i + 1}")
+                continue
+            if "run" in entry:
+                state = ResumeState(entry["run"], entry.get("started", 0.0))
+            elif state is None:
+                continue
+            elif "valid" in entry:
+                valid.append(entry["valid"])
+            elif "discarded" in entry:
+                discarded.append(entry["discarded"])
+            elif "done" in entry:
+                state.done.add(entry["done"])
+            elif "written" in entry:
+                written[entry["written"]] = max(written.get(entry["written"], 0), entry.get("upto", 0))
+
+        if state is None:
+            return None
+        age_h = (time.time() - state.started) / 3600
+        if age_h > self.max_age_hours:
+            log.info(f"Run journal from {state.run_id} is {age_h:.0f}h old — not resuming")
+            return None
+        state.valid = valid[written["valid"]:]
+        state.discarded = discarded[written["discarded"]:]
+        self.resumed = state
+        return state
+
+    def start(self, valid: Iterable[dict] = (), discarded: Iterable[dict] = (),
+              done: Iterable[str] = ()):
+        """Begin a fresh journal holding the carried-over state. Passing the
+        resumed run's state keeps its run id and start time."""
+        valid, discarded = list(valid), list(discarded)
+        if self.resumed:
+            self.run_id, self.started = self.resumed.run_id, self.resumed.started
+        else:
+            self.run_id, self.started = datetime.now().strftime("run_%Y%m%d_%H%M%S"), time.time()
+        with self._lock:
+            self._done = set(done)
+            self._n_valid, self._n_discarded = len(valid), len(discarded)
+            lines = [{"run": self.run_id, "started": self.started}]
+            lines += [{"valid": j} for j in valid]
+            lines += [{"discarded": j} for j in discarded]
+            lines += [{"done": k} for k in sorted(self._done)]
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                tmp = self.path + ".tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    f.writelines(json.dumps(e, default=str) + "\n" for e in lines)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, self.path)
+                self._file = open(self.path, "a", encoding="utf-8")
+            except Exception as e:
+                log.warning(f"Run journal disabled: {e}")
+                self._file = None
+
+    def is_done(self, key: str) -> bool:
+        return key in self._done
+
+    # ── Units of work ────────────────────────────────────────────────────────
+
+    @contextmanager
+    def unit(self, key: str):
+        """Scope one unit of work. It is recorded as done only if the body
+        returns normally; a unit that raised is retried by a resumed run."""
+        with self._lock:
+            token = next(self._tokens)
+            self._inflight[token] = len(self._valid())
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            with self._lock:
+                self._inflight.pop(token, None)
+                if ok:
+                    self._finished.append((key, len(self._valid())))
+                due = (len(self._finished) >= self.every_units
+                       or time.monotonic() - self._last_checkpoint >= self.every_sec)
+            if due:
+                self.checkpoint()
+
+    # ── Checkpoints ──────────────────────────────────────────────────────────
+
+    def checkpoint(self) -> int:
+        """Append every settled job and finished unit. Returns how many
+        valid jobs are journaled (the prefix safe to write to the sheet)."""
+        with self._lock:
+            valid = self._valid()
+            upto = min(self._inflight.values()) if self._inflight else len(valid)
+            upto = max(upto, self._n_valid)
+            discarded = self._discarded()
+            n_disc = max(len(discarded), self._n_discarded)
+            lines = [{"valid": j} for j in valid[self._n_valid:upto]]
+            lines += [{"discarded": j} for j in discarded[self._n_discarded:n_disc]]
+            ready = [k for k, end in self._finished if end <= upto]
+            self._finished = [(k, end) for k, end in self._finished if end > upto]
+            lines += [{"done": k} for k in ready]
+            if self._file is None or self._append(lines):   # no journal: nothing to hold back
+                self._n_valid, self._n_discarded = upto, n_disc
+                self._done.update(ready)
+            else:
+                self._finished += [(k, 0) for k in ready]
+            self._last_checkpoint = time.monotonic()
+            return self._n_valid
+
+    def written(self, sheet: str, upto: int = None):
+        """Record that the first `upto` journaled jobs of `sheet` ("valid" or
+        "discarded") are in the sheet; None means all journaled so far."""
+        with self._lock:
+            if upto is None:
+                upto = self._n_valid if sheet == "valid" else self._n_discarded
+            self._append([{"written": sheet, "upto": upto}])
+
+    def finish(self):
+        """The run completed: nothing left to resume."""
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                log.warning(f"Run journal not removed: {e}")
+
+    def _append(self, entries: List[dict]) -> bool:
+        if self._file is None:
+            return False
+        if not entries:
+            return True
+        try:
+            self._file.writelines(json.dumps(e, default=str) + "\n" for e in entries)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            return True
+        except Exception as e:
+            log.warning(f"Run journal append failed: {e}")
+            return False
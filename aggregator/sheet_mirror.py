@@ -0,0 +1,311 @@
+"""
+SheetMirror — a local SQLite copy of the tracking spreadsheet, kept current
+with row-range deltas instead of full-sheet downloads.
+
+Every aggregator/outreach run and most scripts used to start by pulling the
+full Valid / Discarded / Reviewed sheets. The mirror (.local/sheet_mirror.db)
+remembers what each worksheet looked like at the last sync, and a warm sync
+is ONE values:batchGet asking, per worksheet, for:
+
+    tail    A{n}:{last col}     rows past the last synced row n, starting at
+                                row n itself as an anchor
+    keys    B2:E{n}             status / company / title / date applied —
+                                the columns people and scripts edit
+    probe   A{p}:{last col}{q}  one PROBE_ROWS block of the synced area,
+                                round-robin, compared by checksum
+
+New tail rows are appended, status/date edits are patched in place, and a
+probe block whose checksum differs is replaced. If the anchor row or any
+company/title cell moved (rows deleted, inserted or re-keyed), that sheet is
+re-downloaded in full in a second request. Sheets never seen before, or
+marked with invalidate() after a script rewrote them, are fetched in full.
+
+Any process can read the mirror (SQLite WAL), and sync(max_age=...) skips
+the API entirely when another process synced recently.
+
+Usage:
+    mirror = SheetMirror.get()
+    mirror.sync(spreadsheet, [valid_ws, discarded_ws])   # 1 small API call
+    rows = mirror.values(valid_ws)          # same rows as get_all_values()
+    mirror.invalidate(valid_ws)             # after deleting/moving rows
+"""
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from gspread.utils import absolute_range_name, fill_gaps, rowcol_to_a1
+
+log = logging.getLogger(__name__)
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SHEET_MIRROR_DB = os.path.join(_ROOT, ".local", "sheet_mirror.db")
+
+PROBE_ROWS = 200
+KEY_COLS = (2, 5)  # B..E, 1-based inclusive
+_STRUCTURAL = (2, 3)  # company, title (0-based) — a change here means re-key or shift
+
+
+def _trim(row) -> List[str]:
+    row = ["" if v is None else str(v) for v in row]
+    while row and row[-1] == "":
+        row.pop()
+    return row
+
+
+def _at(row, c) -> str:
+    return str(row[c]) if c < len(row) and row[c] is not None else ""
+
+
+def _checksum(rows) -> str:
+    return hashlib.sha1(json.dumps([_trim(r) for r in rows]).encode()).hexdigest()
+
+
+class SheetMirror:
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> "SheetMirror":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, path: str = SHEET_MIRROR_DB):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = None
+        self.api_calls = 0
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA busy_timeout = 15000")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS sheets (
+                    sheet_id INTEGER PRIMARY KEY, title TEXT, n_rows INTEGER,
+                    probe_at INTEGER DEFAULT 1, synced_at REAL, dirty INTEGER DEFAULT 0);
+                CREATE TABLE IF NOT EXISTS rows (
+                    sheet_id INTEGER, row_no INTEGER, value TEXT NOT NULL,
+                    PRIMARY KEY (sheet_id, row_no));
+            """)
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ── Reads ────────────────────────────────────────────────────────────────
+
+    def _state(self, sheet_id) -> Optional[tuple]:
+        return self._db().execute(
+            "SELECT n_rows, probe_at, synced_at, dirty FROM sheets WHERE sheet_id = ?", (sheet_id,)
+        ).fetchone()
+
+    def _stored(self, sheet_id) -> List[List[str]]:
+        rows = self._db().execute(
+            "SELECT row_no, value FROM rows WHERE sheet_id = ? ORDER BY row_no", (sheet_id,)
+        ).fetchall()
+        out = []
+        for row_no, value in rows:
+            while len(out) < row_no - 1:
+                out.append([])
+            out.append(json.loads(value))
+        return out
+
+    def values(self, worksheet) -> List[List[str]]:
+        """Mirrored rows of `worksheet`, padded like get_all_values()."""
+        with self._lock:
+            rows = self._stored(worksheet.id)
+        return fill_gaps(rows) if rows else []
+
+    def synced_at(self, worksheet) -> float:
+        with self._lock:
+            state = self._state(worksheet.id)
+        return (state[2] or 0.0) if state else 0.0
+
+    def invalidate(self, worksheet):
+        """Force a full download of `worksheet` on the next sync."""
+        with self._lock:
+            self._db().execute("UPDATE sheets SET dirty = 1 WHERE sheet_id = ?", (worksheet.id,))
+
+    # ── Sync ─────────────────────────────────────────────────────────────────
+
+    def sync(self, spreadsheet, worksheets, max_age: float = 0) -> Dict[str, str]:
+        """Bring the mirror of each worksheet up to date. Returns how each
+        sheet was refreshed: "fresh", "delta" or "full"."""
+        with self._lock:
+            now = time.time()
+            plans, ranges, result = [], [], {}
+            for ws in worksheets:
+                state = self._state(ws.id)
+                if state and not state[3] and max_age and now - (state[2] or 0) < max_age:
+                    result[ws.title] = "fresh"
+                    continue
+                plan = self._plan(ws, state)
+                plans.append(plan)
+                ranges.extend(plan["ranges"])
+            if not plans:
+                return result
+
+            resp = self._batch_get(spreadsheet, ranges)
+            full = []
+            pos = 0
+            for plan in plans:
+                got = resp[pos:pos + len(plan["ranges"])]
+                pos += len(plan["ranges"])
+                if plan["kind"] == "full":
+                    self._store_full(plan["ws"], got[0])
+                    result[plan["ws"].title] = "full"
+                elif self._apply_delta(plan, got):
+                    result[plan["ws"].title] = "delta"
+                else:
+                    full.append(plan["ws"])
+
+            if full:
+                resp = self._batch_get(spreadsheet, [absolute_range_name(ws.title) for ws in full])
+                for ws, values in zip(full, resp):
+                    self._store_full(ws, values)
+                    result[ws.title] = "full"
+            log.debug(f"Sheet mirror sync: {result}")
+            return result
+
+    def _batch_get(self, spreadsheet, ranges) -> List[List[List[str]]]:
+        self.api_calls += 1
+        resp = spreadsheet.values_batch_get(ranges)
+        return [vr.get("values", []) for vr in resp.get("valueRanges", [])]
+
+    def _plan(self, ws, state) -> dict:
+        title = ws.title
+        if not state or state[3] or not state[0] or state[0] < 2:
+            return {"ws": ws, "kind": "full", "ranges": [absolute_range_name(title)]}
+        n, probe_at = state[0], state[1] or 1
+        last_col = rowcol_to_a1(1, max(ws.col_count, 1)).rstrip("0123456789")
+        k0 = rowcol_to_a1(1, KEY_COLS[0]).rstrip("1")
+        k1 = rowcol_to_a1(1, KEY_COLS[1]).rstrip("1")
+        if probe_at > n:
+            probe_at = 1
+        probe_end = min(probe_at + PROBE_ROWS - 1, n)
+        return {
+            "ws": ws, "kind": "delta", "n": n, "probe": (probe_at, probe_end),
+            "ranges": [
+                absolute_range_name(title, f"A{n}:{last_col}"),
+                absolute_range_name(title, f"{k0}2:{k1}{n}"),
+                absolute_range_name(title, f"A{probe_at}:{last_col}{probe_end}"),
+            ],
+        }
+
+    def _store_full(self, ws, values):
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.execute("DELETE FROM rows WHERE sheet_id = ?", (ws.id,))
+            db.executemany(
+                "INSERT INTO rows (sheet_id, row_no, value) VALUES (?, ?, ?)",
+                [(ws.id, i, json.dumps(_trim(r))) for i, r in enumerate(values, start=1) if _trim(r)],
+            )
+            db.execute(
+                "INSERT INTO sheets (sheet_id, title, n_rows, probe_at, synced_at, dirty) "
+                "VALUES (?, ?, ?, 1, ?, 0) ON CONFLICT(sheet_id) DO UPDATE SET "
+                "title = excluded.title, n_rows = excluded.n_rows, probe_at = 1, "
+                "synced_at = excluded.synced_at, dirty = 0",
+                (ws.id, ws.title, len(values), time.time()),
+            )
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+
+    def _apply_delta(self, plan, got) -> bool:
+        """Apply tail / key / probe ranges; False if the sheet shifted."""
+        ws, n = plan["ws"], plan["n"]
+        tail, keys, probe = got
+        stored = self._stored(ws.id)
+        stored += [[] for _ in range(n - len(stored))]
+
+        # Anchor: row n must still be what we synced
+        if not tail or _trim(tail[0]) != _trim(stored[n - 1]):
+            return False
+
+        changed = {}
+        k0, k1 = KEY_COLS[0] - 1, KEY_COLS[1]
+        for i in range(1, n):
+            have = stored[i]
+            now = keys[i - 1] if i - 1 < len(keys) else []
+            if any(_at(now, c - k0) != _at(have, c) for c in _STRUCTURAL):
+                return False
+            if all(_at(now, c - k0) == _at(have, c) for c in range(k0, k1)):
+                continue
+            row = _trim(have)
+            row += [""] * (k1 - len(row))
+            for c in range(k0, k1):
+                row[c] = _at(now, c - k0)
+            changed[i + 1] = _trim(row)
+
+        p0, p1 = plan["probe"]
+        block = [changed.get(r, stored[r - 1]) for r in range(p0, p1 + 1)]
+        fetched = [probe[i] if i < len(probe) else [] for i in range(p1 - p0 + 1)]
+        if _checksum(block) != _checksum(fetched):
+            for i, row in enumerate(fetched):
+                if any(_at(row, c) != _at(block[i], c) for c in _STRUCTURAL):
+                    return False
+                changed[p0 + i] = _trim(row)
+
+        for i, row in enumerate(tail[1:], start=n + 1):
+            changed[i] = _trim(row)
+        n_rows = n + len(tail) - 1
+
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            for row_no, row in changed.items():
+                if row:
+                    db.execute(
+                        "INSERT INTO rows (sheet_id, row_no, value) VALUES (?, ?, ?) "
+                        "ON CONFLICT(sheet_id, row_no) DO UPDATE SET value = excluded.value",
+                        (ws.id, row_no, json.dumps(row)),
+                    )
+                else:
+                    db.execute("DELETE FROM rows WHERE sheet_id = ? AND row_no = ?", (ws.id, row_no))
+            db.execute(
+                "UPDATE sheets SET n_rows = ?, probe_at = ?, synced_at = ?, title = ? WHERE sheet_id = ?",
+                (n_rows, p1 + 1 if p1 < n else 1, time.time(), ws.title, ws.id),
+            )
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        return True
+
+
+def read_sheets(spreadsheet, worksheets, max_age: float = 0) -> List[List[List[str]]]:
+    """get_all_values() for each worksheet, served from the mirror after one
+    delta sync. Falls back to live reads if the mirror can't be used."""
+    try:
+        mirror = SheetMirror.get()
+        mirror.sync(spreadsheet, worksheets, max_age=max_age)
+        return [mirror.values(ws) for ws in worksheets]
+    except Exception as e:
+        log.debug(f"Sheet mirror unavailable, reading live: {e}")
+        return [ws.get_all_values() for ws in worksheets]
+
+
+def invalidate_sheets(*worksheets):
+    """Call after rewriting, moving or deleting rows outside the mirror's view."""
+    try:
+        mirror = SheetMirror.get()
+        for ws in worksheets:
+            mirror.invalidate(ws)
+    except Exception as e:
+        log.debug(f"Sheet mirror invalidate failed: {e}")
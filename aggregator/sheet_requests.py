@@ -0,0 +1,113 @@
+"""
+Builders for raw spreadsheets.batchUpdate requests.
+
+SheetsManager._batch_write used to write a block of new rows in about eight
+requests: a values update, a format call, chunks of hyperlink updateCells,
+status dropdowns, resume dropdowns, status colors and a buffer-row reset,
+with a time.sleep(1) after each. The Sheets API can carry all of that in a
+single batchUpdate: one updateCells request whose CellData holds the value,
+userEnteredFormat (alignment, font, colors, number format), textFormatRuns
+(the hyperlink) and dataValidation of every cell, followed by whatever
+repeatCell / setDataValidation requests the caller adds.
+
+Values are sent the way USER_ENTERED would store them: numbers as numbers,
+"=..." as formulas, and dates given a date_format as date serials with a
+matching number format. Everything else is a string.
+
+Usage:
+    cells = [[cell(v, fmt=BASE, link=v if c == 5 else None) for c, v in enumerate(row)]
+             for row in rows]
+    ss.batch_update({"requests": [update_cells(ws.id, start_row, cells)] + extra})
+"""
+import datetime
+from typing import Iterable, List, Optional
+
+# Columns of CellData that update_cells writes. Anything else a cell already
+# has (borders, wrap, notes) is left alone.
+CELL_FIELDS = ",".join([
+    "userEnteredValue",
+    "textFormatRuns",
+    "dataValidation",
+    "userEnteredFormat.horizontalAlignment",
+    "userEnteredFormat.verticalAlignment",
+    "userEnteredFormat.textFormat",
+    "userEnteredFormat.backgroundColor",
+    "userEnteredFormat.numberFormat",
+])
+
+_SERIAL_EPOCH = datetime.date(1899, 12, 30)
+
+WHITE = {"red": 1.0, "green": 1.0, "blue": 1.0}
+BLACK = {"red": 0.0, "green": 0.0, "blue": 0.0}
+
+
+def extended_value(value, date_format: str = None) -> dict:
+    """ExtendedValue for `value`, parsed like USER_ENTERED input."""
+    if value is None:
+        return {"stringValue": ""}
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, (int, float)):
+        return {"numberValue": value}
+    text = str(value)
+    if text.startswith("="):
+        return {"formulaValue": text}
+    if date_format:
+        try:
+            day = datetime.datetime.strptime(text, date_format).date()
+            return {"numberValue": (day - _SERIAL_EPOCH).days}
+        except ValueError:
+            pass
+    return {"stringValue": text}
+
+
+def list_rule(values: Iterable[str]) -> dict:
+    """Dropdown DataValidationRule (not strict, like the sheet's own)."""
+    return {
+        "condition": {"type": "ONE_OF_LIST", "values": [{"userEnteredValue": v} for v in values]},
+        "showCustomUi": True,
+        "strict": False,
+    }
+
+
+def cell(value, fmt: dict = None, link: str = None, validation: dict = None,
+         date_format: str = None, date_pattern: str = None) -> dict:
+    """CellData for one cell. `link` makes the whole text a hyperlink;
+    `date_format` (strptime) + `date_pattern` (Sheets) store a date."""
+    ev = extended_value(value, date_format)
+    data = {"userEnteredValue": ev}
+    fmt = dict(fmt or {})
+    if date_pattern and "numberValue" in ev and not isinstance(value, (int, float)):
+        fmt["numberFormat"] = {"type": "DATE", "pattern": date_pattern}
+    if fmt:
+        data["userEnteredFormat"] = fmt
+    if link and "stringValue" in ev:
+        data["textFormatRuns"] = [{"startIndex": 0, "format": {"link": {"uri": link}}}]
+    if validation:
+        data["dataValidation"] = validation
+    return data
+
+
+def grid_range(sheet_id: int, row0: int, row1: int, col0: int, col1: int) -> dict:
+    """GridRange from 0-based, end-exclusive indexes."""
+    return {"sheetId": sheet_id, "startRowIndex": row0, "endRowIndex": row1,
+            "startColumnIndex": col0, "endColumnIndex": col1}
+
+
+def update_cells(sheet_id: int, start_row: int, rows: List[List[dict]],
+                 fields: str = CELL_FIELDS) -> dict:
+    """updateCells writing `rows` of CellData from 1-based `start_row`, column A."""
+    return {"updateCells": {
+        "start": {"sheetId": sheet_id, "rowIndex": start_row - 1, "columnIndex": 0},
+        "rows": [{"values": r} for r in rows],
+        "fields": fields,
+    }}
+
+
+def repeat_cell(rng: dict, fmt: dict, fields: str = "userEnteredFormat") -> dict:
+    return {"repeatCell": {"range": rng, "cell": {"userEnteredFormat": fmt}, "fields": fields}}
+
+
+def set_validation(rng: dict, rule: Optional[dict]) -> dict:
+    """setDataValidation; rule=None clears it."""
+    return {"setDataValidation": {"range": rng, "rule": rule}}
@@ -0,0 +1,106 @@
+"""
+SheetSnapshot — the tracked worksheets, downloaded once per run.
+
+SheetsManager used to call worksheet.get_all_values() for every question it
+asked: load_existing_jobs read all three sheets, get_next_row_numbers then
+re-read the valid and discarded sheets twice each, ensure_sufficient_rows
+read them again, and load_urls_only / load_company_titles_only /
+load_job_ids_only re-read everything once more. A SheetSnapshot fetches all
+registered worksheets in one values:batchGet request on first use and
+answers from memory:
+
+    .values(sheet)              same rows get_all_values() returns (padded)
+    .next_row(sheet)            {"row", "sr_no"} of the first empty row
+    .used_rows(sheet)           len(values) — for the free-row check
+    .record_rows(sheet, r, rs)  keep the copy current after writing rows
+    .refresh()                  re-download (e.g. after an external edit)
+
+Worksheets not registered with the snapshot fall back to get_all_values().
+Given a SheetMirror, the download is a delta sync of the local mirror
+(usually one small request) instead of the full sheets.
+
+Usage:
+    snap = SheetSnapshot(spreadsheet, [valid_sheet, discarded_sheet])
+    snap.next_row(valid_sheet)["row"]
+    snap.record_rows(valid_sheet, 42, rows)
+"""
+import logging
+import threading
+from typing import Dict, List
+
+from gspread.utils import absolute_range_name, fill_gaps
+
+log = logging.getLogger(__name__)
+
+
+class SheetSnapshot:
+    def __init__(self, spreadsheet, worksheets, mirror=None):
+        self.spreadsheet = spreadsheet
+        self.mirror = mirror
+        self._sheets = {ws.id: ws for ws in worksheets}
+        self._values: Dict[int, List[List[str]]] = {}
+        self._loaded = False
+        self._lock = threading.RLock()
+        self.fetches = 0
+
+    def refresh(self):
+        """Download every registered worksheet in a single batch request."""
+        with self._lock:
+            sheets = list(self._sheets.values())
+            if self.mirror is not None:
+                try:
+                    self.mirror.sync(self.spreadsheet, sheets)
+                    self._values = {ws.id: self.mirror.values(ws) for ws in sheets}
+                    self._loaded = True
+                    return
+                except Exception as e:
+                    log.warning(f"Sheet mirror sync failed, downloading sheets: {e}")
+            resp = self.spreadsheet.values_batch_get(
+                [absolute_range_name(ws.title) for ws in sheets]
+            )
+            self.fetches += 1
+            ranges = resp.get("valueRanges", [])
+            self._values = {
+                ws.id: fill_gaps(vr.get("values", [])) if vr.get("values") else []
+                for ws, vr in zip(sheets, ranges)
+            }
+            self._loaded = True
+            log.debug(f"Sheet snapshot: {', '.join(f'{ws.title}={len(self._values[ws.id])}' for ws in sheets)} rows")
+
+    def _rows(self, sheet) -> List[List[str]]:
+        with self._lock:
+            if sheet.id not in self._sheets:
+                return None
+            if not self._loaded:
+                self.refresh()
+            return self._values[sheet.id]
+
+    def values(self, sheet) -> List[List[str]]:
+        """All rows including the header, as get_all_values() would return them."""
+        rows = self._rows(sheet)
+        return sheet.get_all_values() if rows is None else rows
+
+    def used_rows(self, sheet) -> int:
+        return len(self.values(sheet))
+
+    def next_row(self, sheet) -> dict:
+        """First row with neither company (C) nor title (D) filled in."""
+        data = self.values(sheet)
+        for idx, row in enumerate(data[1:], start=2):
+            if len(row) <= 2 or not (row[2].strip() or row[3].strip()):
+                return {"row": idx, "sr_no": idx - 1}
+        return {"row": len(data) + 1, "sr_no": len(data)}
+
+    def record_rows(self, sheet, start_row: int, rows):
+        """Mirror a write of `rows` at 1-based `start_row` into the snapshot."""
+        with self._lock:
+            data = self._rows(sheet)
+            if data is None:
+                return
+            width = max([len(data[0]) if data else 0] + [len(r) for r in rows])
+            new = [["" if v is None else str(v) for v in r] for r in rows]
+            end = start_row - 1 + len(new)
+            while len(data) < end:
+                data.append([""] * width)
+            data[start_row - 1:end] = new
+            self._values[sheet.id] = fill_gaps(data, cols=width)
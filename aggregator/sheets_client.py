@@ -0,0 +1,265 @@
+"""
+Quota-aware Google Sheets access shared by every script.
+
+The aggregator, outreach and the hygiene scripts each dealt with Sheets
+quota on their own: _sheets_retry, Sheets._retry, _p() pauses and a
+time.sleep after nearly every call. None of them knew about the others, so
+two scripts running at once still tripped the per-minute quota, and
+nothing showed which script was using it up.
+
+authorize(creds) returns a normal gspread Client whose HTTP layer is a
+QuotaHTTPClient. On gspread 6 that is the client's HTTPClient; on the
+pinned 5.x it is the Client itself, since Client.request is where every
+call goes there. Every Sheets request, from any Worksheet or Spreadsheet
+method, then goes through one SharedQuota:
+
+    reserve     one slot in the read or write window for the current minute.
+                The windows live in .local/sheets_quota.json under a file
+                lock, so every process on the machine shares them. The
+                caller sleeps only when the window is full.
+    adapt       a 429 halves that window's rate for every process, and the
+                rate recovers by a tenth per minute (AIMD) instead of sitting
+                behind fixed sleeps.
+    retry       429 / 5xx responses are retried with exponential backoff.
+    count       calls, throttles and wait time per script per day, in the
+                same file:  python -m aggregator.sheets_client
+
+Small writes are coalesced one level up: SheetWriteBuffer collects cell
+writes and sends them as one values_batch_update through this client.
+
+Usage:
+    from aggregator.sheets_client import authorize
+    gc = authorize(creds)                    # instead of gspread.authorize
+    ws = gc.open(SHEET_NAME).worksheet(...)  # paced, retried, counted
+"""
+import os
+import sys
+import json
+import time
+import fcntl
+import random
+import logging
+import tempfile
+import threading
+import datetime
+from typing import Callable, Dict, Optional
+
+import gspread
+from gspread.exceptions import APIError
+
+try:
+    from gspread.http_client import HTTPClient as _Transport    # gspread 6: every call goes through HTTPClient
+except ImportError:
+    _Transport = gspread.Client                                 # gspread 5.x: every call goes through Client.request
+
+from aggregator.config import (
+    SHEETS_QUOTA_FILE,
+    SHEETS_READS_PER_MIN,
+    SHEETS_WRITES_PER_MIN,
+    SHEETS_MIN_SCALE,
+    SHEETS_MAX_RETRIES,
+)
+
+log = logging.getLogger(__name__)
+
+WINDOW_SEC = 60.0
+RECOVERY_PER_MIN = 0.1
+KEEP_DAYS = 7
+_RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+
+
+def script_name() -> str:
+    """Name the current process is counted under (the script's file name)."""
+    main = sys.argv[0] if sys.argv and sys.argv[0] else "python"
+    return os.path.splitext(os.path.basename(main))[0] or "python"
+
+
+class SharedQuota:
+    """Per-minute read/write windows and per-script counters in one JSON
+    file shared by every process (in memory if the file can't be used)."""
+
+    _default: Optional["SharedQuota"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, path: str = SHEETS_QUOTA_FILE, reads_per_min: int = SHEETS_READS_PER_MIN,
+                 writes_per_min: int = SHEETS_WRITES_PER_MIN, min_scale: float = SHEETS_MIN_SCALE,
+                 clock: Callable[[], float] = time.time):
+        self.path = path
+        self.limits = {"read": reads_per_min, "write": writes_per_min}
+        self.min_scale = min_scale
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._memory: Optional[dict] = None       # set once the file is unusable
+
+    @classmethod
+    def default(cls) -> "SharedQuota":
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    # ── Shared state ─────────────────────────────────────────────────────────
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            log.warning("Sheets quota file corrupt, starting fresh")
+            return {}
+
+    def _write(self, state: dict):
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp, self.path)
+        except Exception:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def _update(self, mutator: Callable[[dict], object]):
+        """Apply mutator(state) under the cross-process lock; returns its result."""
+        with self._lock:
+            if self._memory is None:
+                try:
+                    os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                    with open(self.path + ".lock", "w") as lock:
+                        fcntl.flock(lock, fcntl.LOCK_EX)
+                        try:
+                            state = self._load()
+                            result = mutator(state)
+                            self._write(state)
+                            return result
+                        finally:
+                            fcntl.flock(lock, fcntl.LOCK_UN)
+                except Exception as e:
+                    log.warning(f"Sheets quota file unusable, pacing this process only: {e}")
+                    self._memory = {}
+            return mutator(self._memory)
+
+    def _counter(self, state: dict, script: str, now: float) -> dict:
+        days = state.setdefault("calls", {})
+        today = datetime.date.fromtimestamp(now).isoformat()
+        for day in [d for d in days if d < (datetime.date.fromtimestamp(now)
+                                           - datetime.timedelta(days=KEEP_DAYS)).isoformat()]:
+            del days[day]
+        return days.setdefault(today, {}).setdefault(
+            script, {"read": 0, "write": 0, "other": 0, "throttled": 0, "wait_sec": 0.0})
+
+    def _scale(self, state: dict, kind: str, now: float) -> float:
+        """Current share of the configured rate: halved on a 429, recovering
+        RECOVERY_PER_MIN per minute since."""
+        s = state.get("scale", {}).get(kind)
+        if not s:
+            return 1.0
+        return min(1.0, s["value"] + RECOVERY_PER_MIN * (now - s["at"]) / WINDOW_SEC)
+
+    # ── API ──────────────────────────────────────────────────────────────────
+
+    def reserve(self, kind: str, script: str) -> float:
+        """Take a slot for one `kind` request ("read", "write", or anything
+        else, which is only counted). Returns seconds to wait before sending."""
+        def take(state):
+            now = self._clock()
+            counter = self._counter(state, script, now)
+            if kind not in self.limits:
+                counter["other"] += 1
+                return 0.0
+            counter[kind] += 1
+            limit = max(1, int(self.limits[kind] * self._scale(state, kind, now)))
+            windows = state.setdefault("windows", {})
+            slots = sorted(t for t in windows.get(kind, []) if t > now - WINDOW_SEC)
+            slot = now if len(slots) < limit else max(now, slots[-limit] + WINDOW_SEC)
+            slots.append(slot)
+            windows[kind] = slots
+            delay = slot - now
+            counter["wait_sec"] = round(counter["wait_sec"] + delay, 2)
+            return delay
+        return self._update(take)
+
+    def throttled(self, kind: str, script: str):
+        """A request of `kind` was rejected for quota: slow every process down."""
+        def back_off(state):
+            now = self._clock()
+            self._counter(state, script, now)["throttled"] += 1
+            if kind in self.limits:
+                value = max(self.min_scale, self._scale(state, kind, now) / 2)
+                state.setdefault("scale", {})[kind] = {"value": value, "at": now}
+        self._update(back_off)
+
+    def counts(self, days: int = 1) -> Dict[str, dict]:
+        """Per-script totals for the last `days` days (today = 1)."""
+        state = self._memory if self._memory is not None else self._load()
+        since = (datetime.date.fromtimestamp(self._clock()) - datetime.timedelta(days=days - 1)).isoformat()
+        totals: Dict[str, dict] = {}
+        for day, scripts in state.get("calls", {}).items():
+            if day < since:
+                continue
+            for script, c in scripts.items():
+                t = totals.setdefault(script, {"read": 0, "write": 0, "other": 0, "throttled": 0, "wait_sec": 0.0})
+                for k, v in c.items():
+                    t[k] = round(t.get(k, 0) + v, 2)
+        return totals
+
+
+class QuotaHTTPClient(_Transport):
+    """gspread HTTP client (gspread 6) or Client (5.x) that paces, retries
+    and counts through SharedQuota."""
+
+    quota: Optional[SharedQuota] = None
+    script: Optional[str] = None
+    retries: int = SHEETS_MAX_RETRIES
+    sleep = staticmethod(time.sleep)
+
+    @staticmethod
+    def kind(method: str, endpoint: str) -> str:
+        if "sheets.googleapis.com" not in endpoint:
+            return "other"      # Drive lookups (open by name) have their own quota
+        return "read" if method.upper() == "GET" else "write"
+
+    def request(self, method, endpoint, *args, **kwargs):
+        quota = self.quota or SharedQuota.default()
+        script = self.script or script_name()
+        kind = self.kind(method, endpoint)
+        for attempt in range(self.retries + 1):
+            delay = quota.reserve(kind, script)
+            if delay > 0:
+                log.debug(f"Sheets {kind} quota: waiting {delay:.1f}s")
+                self.sleep(delay)
+            try:
+                return super().request(method, endpoint, *args, **kwargs)
+            except APIError as e:
+                status = getattr(e.response, "status_code", None)
+                if status not in _RETRYABLE_STATUS or attempt == self.retries:
+                    raise
+                if status == 429:
+                    quota.throttled(kind, script)
+                wait = min(64.0, 2.0 ** attempt) + random.uniform(0, 1)
+                log.warning(f"Sheets API {status}, retrying in {wait:.0f}s (attempt {attempt + 1}/{self.retries})")
+                self.sleep(wait)
+
+
+def authorize(credentials) -> gspread.Client:
+    """gspread.authorize with quota-aware pacing, retries and call counts."""
+    if _Transport is gspread.Client:
+        return gspread.authorize(credentials, client_factory=QuotaHTTPClient)
+    return gspread.authorize(credentials, http_client=QuotaHTTPClient)
+
+
+def _print_counts(days: int = 1):
+    counts = SharedQuota.default().counts(days)
+    if not counts:
+        print("No Sheets API calls recorded")
+        return
+    print(f"Sheets API calls, last {days} day(s):")
+    print(f"  {'script':<28}{'reads':>7}{'writes':>8}{'other':>7}{'429s':>6}{'wait s':>9}")
+    for script, c in sorted(counts.items(), key=lambda kv: -(kv[1]["read"] + kv[1]["write"])):
+        print(f"  {script:<28}{c['read']:>7}{c['write']:>8}{c['other']:>7}{c['throttled']:>6}{c['wait_sec']:>9.1f}")
+
+
+if __name__ == "__main__":
+    _print_counts(int(sys.argv[1]) if len(sys.argv) > 1 else 1)
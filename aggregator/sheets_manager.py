@@ -1,28 +1,6 @@
 #!/usr/bin/env python3
 
 import gspread
-import time as _time
-import functools
-
-def _sheets_retry(func):
-    """Retry Google Sheets API calls on quota/rate limit errors."""
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        for attempt in range(5):
-            try:
-                return func(*args, **kwargs)
-            except Exception as e:
-                msg = str(e).lower()
-                if any(x in msg for x in ("429", "quota", "rate limit", "resource exhausted", "service unavailable")):
-                    wait = (2 ** attempt) * 5  # 5, 10, 20, 40, 80s
-                    import logging
-                    logging.warning(f"Sheets quota hit, retrying in {wait}s (attempt {attempt+1}/5)")
-                    _time.sleep(wait)
-                else:
-                    raise
-        return func(*args, **kwargs)
-    return wrapper
-import time
 import re
 from functools import lru_cache
 from oauth2client.service_account import ServiceAccountCredentials
@@ -35,6 +13,19 @@ from aggregator.config import (
     SHEETS_CREDS_FILE,
     STATUS_COLORS,
 )
+from aggregator.sheet_mirror import SheetMirror
+from aggregator.sheet_snapshot import SheetSnapshot
+from aggregator.sheets_client import authorize
+from aggregator.sheet_requests import (
+    BLACK,
+    WHITE,
+    cell,
+    grid_range,
+    list_rule,
+    repeat_cell,
+    set_validation,
+    update_cells,
+)
 
 
 class SheetsManager:
@@ -46,10 +37,17 @@ class SheetsManager:
         creds = ServiceAccountCredentials.from_json_keyfile_name(
             SHEETS_CREDS_FILE, scope
         )
-        client = gspread.authorize(creds)
+        client = authorize(creds)
         self.spreadsheet = client.open(SHEET_NAME)
         self.valid_sheet = self.spreadsheet.worksheet(WORKSHEET_NAME)
         self._initialize_sheets()
+        # Every index question (existing keys, next free row, ...) is
+        # answered from one delta sync of the local sheet mirror
+        self.snapshot = SheetSnapshot(
+            self.spreadsheet,
+            [self.valid_sheet, self.discarded_entries, self.reviewed___not_applied],
+            mirror=SheetMirror.get(),
+        )
         self._auto_expand_all_sheets()
 
     def _auto_expand_all_sheets(self):
@@ -87,7 +85,6 @@ class SheetsManager:
                 if empty_rows < 200:
                     new_count = ws.row_count + 1000
                     ws.resize(rows=new_count)
-                    time.sleep(1)
         except Exception:
             pass
 
@@ -160,41 +157,6 @@ class SheetsManager:
 
             setattr(self, sheet_name.lower().replace(" ", "_").replace("-", "_"), sheet)
 
-    def _apply_not_applied_colors(self, start_row, count):
-        """Apply blue color to 'Not Applied' cells in new rows."""
-        try:
-            _NOT_APPLIED_BG = {"red": 0.6, "green": 0.76, "blue": 1.0}
-            requests = []
-            for i in range(count):
-                row_idx = start_row - 1 + i  # 0-indexed
-                requests.append({
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": self.valid_sheet.id,
-                            "startRowIndex": row_idx,
-                            "endRowIndex": row_idx + 1,
-                            "startColumnIndex": 1,
-                            "endColumnIndex": 2,
-                        },
-                        "cell": {"userEnteredFormat": {
-                            "backgroundColor": _NOT_APPLIED_BG,
-                            "textFormat": {
-                                "foregroundColor": {"red": 0, "green": 0, "blue": 0},
-                                "fontFamily": "Times New Roman", "fontSize": 13,
-                            },
-                            "horizontalAlignment": "CENTER",
-                            "verticalAlignment": "MIDDLE",
-                        }},
-                        "fields": "userEnteredFormat",
-                    }
-                })
-            if requests:
-                for i in range(0, len(requests), 50):
-                    self.spreadsheet.batch_update({"requests": requests[i:i+50]})
-                import time; time.sleep(1)
-        except Exception:
-            pass
-
     def _fix_broken_search_links(self):
         """Fix any search links written as plain text instead of HYPERLINK formula."""
         try:
@@ -217,7 +179,6 @@ class SheetsManager:
                         range_name=f'F{i}', values=[[new_formula]],
                         value_input_option='USER_ENTERED'
                     )
-            import time; time.sleep(1)
         except Exception:
             pass
 
@@ -261,7 +222,7 @@ class SheetsManager:
             self.discarded_entries,
             self.reviewed___not_applied,
         ]:
-            for row in sheet.get_all_values()[1:]:
+            for row in self.snapshot.values(sheet)[1:]:
                 if len(row) <= 5:
                     continue
 
@@ -315,7 +276,7 @@ class SheetsManager:
             self.discarded_entries,
             self.reviewed___not_applied,
         ]:
-            for row in sheet.get_all_values()[1:]:
+            for row in self.snapshot.values(sheet)[1:]:
                 if len(row) > 5:
                     url = row[5].strip()
                     if url and "http" in url:
@@ -329,7 +290,7 @@ class SheetsManager:
             self.discarded_entries,
             self.reviewed___not_applied,
         ]:
-            for row in sheet.get_all_values()[1:]:
+            for row in self.snapshot.values(sheet)[1:]:
                 if len(row) > 3:
                     company = row[2].strip()
                     title = row[3].strip()
@@ -345,7 +306,7 @@ class SheetsManager:
             self.discarded_entries,
             self.reviewed___not_applied,
         ]:
-            for row in sheet.get_all_values()[1:]:
+            for row in self.snapshot.values(sheet)[1:]:
                 if len(row) > 6:
                     job_id = row[6].strip()
                     if (
@@ -357,19 +318,17 @@ class SheetsManager:
         return job_ids
 
     def get_next_row_numbers(self):
+        valid = self._find_next_row(self.valid_sheet)
+        discarded = self._find_next_row(self.discarded_entries)
         return {
-            "valid": self._find_next_row(self.valid_sheet)["row"],
-            "valid_sr_no": self._find_next_row(self.valid_sheet)["sr_no"],
-            "discarded": self._find_next_row(self.discarded_entries)["row"],
-            "discarded_sr_no": self._find_next_row(self.discarded_entries)["sr_no"],
+            "valid": valid["row"],
+            "valid_sr_no": valid["sr_no"],
+            "discarded": discarded["row"],
+            "discarded_sr_no": discarded["sr_no"],
         }
 
     def _find_next_row(self, sheet):
-        data = sheet.get_all_values()
-        for idx, row in enumerate(data[1:], start=2):
-            if len(row) <= 2 or not (row[2].strip() or row[3].strip()):
-                return {"row": idx, "sr_no": idx - 1}
-        return {"row": len(data) + 1, "sr_no": len(data)}
+        return self.snapshot.next_row(sheet)
 
     def ensure_sufficient_rows(self, sheet, min_available=250, add_count=1000):
         """
@@ -377,12 +336,9 @@ class SheetsManager:
         If available rows < min_available, expand sheet by add_count rows
         """
         try:
-            import time
-
             current_total_rows = sheet.row_count
 
-            all_data = sheet.get_all_values()
-            used_rows = len(all_data)
+            used_rows = self.snapshot.used_rows(sheet)
 
             available_rows = current_total_rows - used_rows
 
@@ -390,7 +346,6 @@ class SheetsManager:
                 new_total = current_total_rows + add_count
 
                 sheet.resize(rows=new_total)
-                time.sleep(2)
             else:
                 pass
 
@@ -481,7 +436,6 @@ class SheetsManager:
         ]
 
         self._batch_write(self.valid_sheet, start_row, rows, is_valid_sheet=True)
-        self._apply_not_applied_colors(start_row, len(rows))
         self._fix_broken_search_links()
         self._ensure_status_dropdowns()
         self._auto_resize_columns(self.valid_sheet, 14)
@@ -522,7 +476,7 @@ class SheetsManager:
             range_name=f"A{start_row}:M{end_row}",
             value_input_option="USER_ENTERED",
         )
-        import time; time.sleep(1)
+        self.snapshot.record_rows(self.discarded_entries, start_row, rows)
         self.discarded_entries.format(
             f"A{start_row}:M{end_row}",
             {
@@ -531,7 +485,6 @@ class SheetsManager:
                 "textFormat": {"fontFamily": "Times New Roman", "fontSize": 13},
             },
         )
-        import time; time.sleep(1)
         # Add clickable hyperlinks for Job URL column (F, index 5)
         url_requests = [
             {
@@ -564,231 +517,101 @@ class SheetsManager:
         if url_requests:
             for i in range(0, len(url_requests), 100):
                 self.spreadsheet.batch_update({"requests": url_requests[i : i + 100]})
-                time.sleep(1)
 
         self._auto_resize_columns(self.discarded_entries, 13)
         return len(jobs)
 
+    CELL_FORMAT = {
+        "horizontalAlignment": "CENTER",
+        "verticalAlignment": "MIDDLE",
+        "textFormat": {"fontFamily": "Times New Roman", "fontSize": 13},
+    }
+    RESUME_TYPES = ["SDE", "ML", "DA"]
+
+    def _status_format(self, status):
+        """Column B format for a status, or None for an unknown status."""
+        color = STATUS_COLORS.get(status)
+        if not color:
+            return None
+        return {
+            **self.CELL_FORMAT,
+            "backgroundColor": color,
+            "textFormat": {
+                **self.CELL_FORMAT["textFormat"],
+                "foregroundColor": WHITE if status == "Offer accepted" else BLACK,
+            },
+        }
+
     def _batch_write(self, sheet, start_row, rows_data, is_valid_sheet):
+        """Write rows_data from start_row with its formats, hyperlinks,
+        dropdowns and status colors in ONE spreadsheets.batchUpdate."""
         if not rows_data:
             return
 
         end_row = start_row + len(rows_data) - 1
-        sheet.update(
-            values=rows_data,
-            range_name=f"A{start_row}:N{end_row}",
-            value_input_option="USER_ENTERED",
-        )
-        time.sleep(1)
-
-        sheet.format(
-            f"A{start_row}:N{end_row}",
-            {
-                "horizontalAlignment": "CENTER",
-                "verticalAlignment": "MIDDLE",
-                "textFormat": {"fontFamily": "Times New Roman", "fontSize": 13},
-            },
-        )
-        time.sleep(1)
-
-        url_requests = [
-            {
-                "updateCells": {
-                    "range": {
-                        "sheetId": sheet.id,
-                        "startRowIndex": start_row + idx - 1,
-                        "endRowIndex": start_row + idx,
-                        "startColumnIndex": 5,
-                        "endColumnIndex": 6,
-                    },
-                    "rows": [
-                        {
-                            "values": [
-                                {
-                                    "userEnteredValue": {"stringValue": row[5]},
-                                    "textFormatRuns": [
-                                        {"startIndex": 0, "format": {"link": {"uri": row[5]}}}
-                                    ],
-                                }
-                            ]
-                        }
-                    ],
-                    "fields": "userEnteredValue,textFormatRuns",
-                }
-            }
-            for idx, row in enumerate(rows_data)
-            if row[5] and row[5].startswith("http")
-        ]
-
-        if url_requests:
-            for i in range(0, len(url_requests), 100):
-                self.spreadsheet.batch_update({"requests": url_requests[i : i + 100]})
-                time.sleep(1)
-
+        status_rule = list_rule(STATUS_COLORS.keys())
+        resume_rule = list_rule(self.RESUME_TYPES)
+        cells = []
+        for row in rows_data:
+            out = []
+            for col, value in enumerate(row):
+                fmt, link, rule = self.CELL_FORMAT, None, None
+                if col == 5 and str(value).startswith("http"):
+                    link = str(value)
+                elif is_valid_sheet and col == 1:
+                    fmt, rule = self._status_format(value) or self.CELL_FORMAT, status_rule
+                elif is_valid_sheet and col == 9:
+                    rule = resume_rule
+                out.append(cell(value, fmt, link=link, validation=rule,
+                                date_format="%d-%b-%Y" if col == 11 else None,
+                                date_pattern="dd-mmm-yyyy"))
+            cells.append(out)
+
+        requests = [update_cells(sheet.id, start_row, cells)]
         if is_valid_sheet:
-            self._add_status_dropdowns(sheet, start_row, len(rows_data))
-            self._add_resume_dropdowns(sheet, start_row, len(rows_data))
-            self._apply_status_colors(sheet, start_row, end_row)
-            # Clear column B color+validation on buffer rows after last written row
-            try:
-                self.spreadsheet.batch_update({"requests": [
-                    {
-                        "repeatCell": {
-                            "range": {
-                                "sheetId": sheet.id,
-                                "startRowIndex": end_row,
-                                "endRowIndex": end_row + 500,
-                                "startColumnIndex": 1,
-                                "endColumnIndex": 2,
-                            },
-                            "cell": {"userEnteredFormat": {
-                                "backgroundColor": {"red": 1.0, "green": 1.0, "blue": 1.0},
-                            }},
-                            "fields": "userEnteredFormat.backgroundColor",
-                        }
-                    },
-                    {
-                        "setDataValidation": {
-                            "range": {
-                                "sheetId": sheet.id,
-                                "startRowIndex": end_row,
-                                "endRowIndex": end_row + 500,
-                                "startColumnIndex": 1,
-                                "endColumnIndex": 2,
-                            },
-                            "rule": None,
-                        }
-                    }
-                ]})
-                time.sleep(0.5)
-            except Exception as _be:
-                pass
-
-    def _add_resume_dropdowns(self, sheet, start_row, num_rows):
-        reqs = [{
-            "setDataValidation": {
-                "range": {"sheetId": sheet.id, "startRowIndex": start_row+i-1, "endRowIndex": start_row+i,
-                          "startColumnIndex": 9, "endColumnIndex": 10},
-                "rule": {"condition": {"type": "ONE_OF_LIST",
-                         "values": [{"userEnteredValue": "SDE"}, {"userEnteredValue": "ML"}, {"userEnteredValue": "DA"}]},
-                         "showCustomUi": True, "strict": False},
-            }
-        } for i in range(num_rows)]
-        if reqs:
-            for i in range(0, len(reqs), 100):
-                self.spreadsheet.batch_update({"requests": reqs[i:i+100]})
-                import time; time.sleep(1)
-
-    def _add_status_dropdowns(self, sheet, start_row, num_rows):
-        requests = [
-            {
-                "setDataValidation": {
-                    "range": {
-                        "sheetId": sheet.id,
-                        "startRowIndex": start_row + idx - 1,
-                        "endRowIndex": start_row + idx,
-                        "startColumnIndex": 1,
-                        "endColumnIndex": 2,
-                    },
-                    "rule": {
-                        "condition": {
-                            "type": "ONE_OF_LIST",
-                            "values": [
-                                {"userEnteredValue": status}
-                                for status in STATUS_COLORS.keys()
-                            ],
-                        },
-                        "showCustomUi": True,
-                        "strict": False,
-                    },
-                }
-            }
-            for idx in range(num_rows)
-        ]
-
-        if requests:
-            for i in range(0, len(requests), 100):
-                self.spreadsheet.batch_update({"requests": requests[i : i + 100]})
-                time.sleep(1)
-
-    def _apply_status_colors(self, sheet, start_row, end_row):
-        """Color ALL status cells in the sheet, not just new rows.
-        Also clears color on empty rows."""
-        try:
-            all_data = sheet.get_all_values()
-            color_requests = []
-
-            # Color ALL rows from row 2 to last data row
-            for row_idx in range(1, len(all_data)):
-                if len(all_data[row_idx]) < 2:
-                    continue
-
-                status = all_data[row_idx][1].strip()
-                color = STATUS_COLORS.get(status)
-
-                # If row is empty (no company in col C), clear the color
-                company = all_data[row_idx][2].strip() if len(all_data[row_idx]) > 2 else ""
-                if not company and not status:
-                    color_requests.append({
-                        "repeatCell": {
-                            "range": {
-                                "sheetId": sheet.id,
-                                "startRowIndex": row_idx,
-                                "endRowIndex": row_idx + 1,
-                                "startColumnIndex": 1,
-                                "endColumnIndex": 2,
-                            },
-                            "cell": {"userEnteredFormat": {
-                                "backgroundColor": {"red": 1.0, "green": 1.0, "blue": 1.0},
-                            }},
-                            "fields": "userEnteredFormat.backgroundColor",
-                        }
-                    })
-                    continue
-
-                if color:
-                    text_color = (
-                        {"red": 1.0, "green": 1.0, "blue": 1.0}
-                        if status == "Offer accepted"
-                        else {"red": 0.0, "green": 0.0, "blue": 0.0}
-                    )
-
-                    color_requests.append(
-                        {
-                            "repeatCell": {
-                                "range": {
-                                    "sheetId": sheet.id,
-                                    "startRowIndex": row_idx,
-                                    "endRowIndex": row_idx + 1,
-                                    "startColumnIndex": 1,
-                                    "endColumnIndex": 2,
-                                },
-                                "cell": {
-                                    "userEnteredFormat": {
-                                        "backgroundColor": color,
-                                        "textFormat": {
-                                            "foregroundColor": text_color,
-                                            "fontFamily": "Times New Roman",
-                                            "fontSize": 13,
-                                        },
-                                        "horizontalAlignment": "CENTER",
-                                        "verticalAlignment": "MIDDLE",
-                                    }
-                                },
-                                "fields": "userEnteredFormat",
-                            }
-                        }
-                    )
-
-            if color_requests:
-                for i in range(0, len(color_requests), 100):
-                    self.spreadsheet.batch_update(
-                        {"requests": color_requests[i : i + 100]}
-                    )
-                    time.sleep(1)
-
-        except Exception as e:
-            print(f"Color application error: {e}")
+            # Status colors of the rows above (statuses edited since the last run)
+            requests += self._status_color_requests(sheet, self.snapshot.values(sheet)[:start_row - 1])
+            # Clear column B color+validation on buffer rows after last written row,
+            # within the grid: one out-of-range request rejects the whole batch
+            buffer_end = min(end_row + 500, sheet.row_count)
+            if buffer_end > end_row:
+                buffer = grid_range(sheet.id, end_row, buffer_end, 1, 2)
+                requests += [
+                    repeat_cell(buffer, {"backgroundColor": WHITE}, "userEnteredFormat.backgroundColor"),
+                    set_validation(buffer, None),
+                ]
+
+        self.spreadsheet.batch_update({"requests": requests})
+        self.snapshot.record_rows(sheet, start_row, rows_data)
+
+    def _status_color_requests(self, sheet, all_data):
+        """Color every status cell in all_data (row 1 is the header), one
+        repeatCell per run of rows with the same status. Rows with no
+        company and no status are cleared to white."""
+        requests, run = [], None  # run: [first row idx, last row idx, format, fields]
+
+        def close():
+            if run:
+                requests.append(repeat_cell(grid_range(sheet.id, run[0], run[1] + 1, 1, 2), run[2], run[3]))
+
+        for row_idx in range(1, len(all_data)):
+            row = all_data[row_idx]
+            if len(row) < 2:
+                continue
+            status = row[1].strip()
+            company = row[2].strip() if len(row) > 2 else ""
+            if not company and not status:
+                want = ({"backgroundColor": WHITE}, "userEnteredFormat.backgroundColor")
+            else:
+                fmt = self._status_format(status)
+                want = (fmt, "userEnteredFormat") if fmt else None
+            if run and want and run[1] == row_idx - 1 and (run[2], run[3]) == want:
+                run[1] = row_idx
+                continue
+            close()
+            run = [row_idx, row_idx, *want] if want else None
+        close()
+        return requests
 
     def _auto_resize_columns(self, sheet, total_columns):
         try:
@@ -853,7 +676,6 @@ class SheetsManager:
 
             for i in range(0, len(requests), 100):
                 self.spreadsheet.batch_update({"requests": requests[i : i + 100]})
-                time.sleep(1)
 
         except Exception as e:
             print(f"Column resize error: {e}")
@@ -11,10 +11,11 @@ Usage:
 """
 import re
 import logging
-import json
 import os
 from urllib.parse import urlparse, unquote
 
+from outreach.brain_store import open_store
+
 log = logging.getLogger(__name__)
 
 _BRAIN_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".local", "brain.json")
@@ -99,25 +100,20 @@ _CUSTOM_CAREER_DOMAINS = {
 
 
 def _load_url_cache():
-    """Load URL-company cache from brain.json."""
+    """Load URL-company cache from the brain."""
     try:
-        if os.path.exists(_BRAIN_PATH):
-            brain = json.load(open(_BRAIN_PATH))
-            return brain.get("url_company_cache", {})
+        return open_store(_BRAIN_PATH).namespace("url_company_cache", {}) or {}
     except Exception:
         pass
     return {}
 
 
-def _save_url_cache(cache):
-    """Save URL-company cache to brain.json."""
+def _save_url_cache(entries):
+    """Merge new URL-company entries into the brain's cache."""
     try:
-        brain = {}
-        if os.path.exists(_BRAIN_PATH):
-            brain = json.load(open(_BRAIN_PATH))
-        brain["url_company_cache"] = cache
-        with open(_BRAIN_PATH, "w") as f:
-            json.dump(brain, f, indent=2)
+        open_store(_BRAIN_PATH).update(
+            lambda brain: brain.setdefault("url_company_cache", {}).update(entries)
+        )
     except Exception:
         pass
 
@@ -439,7 +435,7 @@ def validate_job(job):
                 cache_key = domain
             if url_company and cache_key and cache_key not in cache:
                 cache[cache_key] = url_company
-                _save_url_cache(cache)
+                _save_url_cache({cache_key: url_company})
         except Exception:
             pass
 
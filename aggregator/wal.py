@@ -4,28 +4,55 @@ Write-Ahead Log (WAL) for Google Sheets mutations.
 Guarantees crash-safe writes: if a sheet write fails mid-way,
 the next run detects the uncommitted entry and replays it.
 
-Inspired by database transaction log architecture.
+The log is a single append-only segment file (.local/wal/wal.log), one JSON
+record per line:
+
+    {"tx": "tx_…", "op": "begin", "operation": "add_valid_jobs", "key": "…",
+     "payload": {"jobs": [...], "start_row": 42}, "created_at": "…"}
+    {"tx": "tx_…", "op": "commit", "at": "…"}
+    {"tx": "tx_…", "op": "rollback", "at": "…", "error": "…"}
+    {"tx": "tx_…", "op": "retry", "retries": 2}
+
+begin records are fsynced before begin() returns, so the rows are on disk
+before the sheet write starts. commit / rollback / retry records are flushed
+to the OS at once but fsynced in batches (every WAL_SYNC_EVERY records, and
+on close() / compact()): losing one to a power cut only means the next run
+replays a transaction whose rows are already in the sheet, which the
+idempotency key makes harmless.
+
+Every transaction carries a deterministic idempotency key. The default key
+is a hash of the operation and payload. Callers writing rows pass
+rows_key(), which hashes the identities of the rows only, so the same rows
+get the same key whatever start_row they were aimed at. replay_pending()
+commits a pending transaction without running it when a transaction with
+the same key has already committed. The executor gets the full payload and
+can check each row against the sheet before writing it again.
+
+compact() rewrites the segment with the pending transactions and the
+recently settled ones (their keys still guard replays), dropping the rest.
 
 Usage:
     wal = WriteAheadLog()
-    tx = wal.begin("add_valid_jobs", {"jobs": [...], "start_row": 42})
+    tx = wal.begin("add_valid_jobs", {"jobs": [...], "start_row": 42},
+                   key=WriteAheadLog.rows_key("add_valid_jobs", row_ids))
     try:
         sheets.add_valid_jobs(...)  # actual sheet write
         wal.commit(tx)
     except Exception:
         wal.rollback(tx)
-    
+
     # On next startup:
-    wal.replay_pending()  # replays any uncommitted transactions
+    wal.replay_pending(executor)  # executor(tx) -> bool redoes tx.payload
 """
 import os
 import json
 import time
 import logging
 import hashlib
+import threading
 from datetime import datetime
-from typing import Optional, List, Dict
-from dataclasses import dataclass, field, asdict
+from typing import Callable, Dict, Iterable, List, Optional
+from dataclasses import dataclass, asdict
 
 log = logging.getLogger(__name__)
 
@@ -33,6 +60,9 @@ WAL_DIR = os.path.join(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
     ".local", "wal"
 )
+WAL_SEGMENT = "wal.log"
+WAL_SYNC_EVERY = 16              # commit/rollback/retry records per fsync
+WAL_COMPACT_BYTES = 8 * 1024 * 1024
 
 
 @dataclass
@@ -40,13 +70,14 @@ class Transaction:
     """Single WAL transaction."""
     tx_id: str
     operation: str              # add_valid_jobs | add_discarded_jobs | update_cell | batch_update
-    payload: Dict               # operation-specific data
+    payload: Dict               # operation-specific data, including the rows written
     status: str = "pending"     # pending | committed | rolled_back | replayed
     created_at: str = ""
     committed_at: str = ""
     retries: int = 0
     max_retries: int = 3
     error: str = ""
+    key: str = ""               # idempotency key
 
     def to_dict(self) -> dict:
         return asdict(self)
@@ -59,26 +90,49 @@ class Transaction:
 class WriteAheadLog:
     """
     Write-Ahead Log for idempotent sheet mutations.
-    
+
     Flow:
-    1. begin() — writes transaction to pending/ directory
+    1. begin() — appends the transaction with its payload, fsynced
     2. (caller performs actual sheet write)
-    3. commit() — moves to committed/ directory
+    3. commit() — appends a commit record
     4. On failure: rollback() or leave as pending
     5. On next startup: replay_pending() retries uncommitted transactions
     """
 
-    def __init__(self, wal_dir: str = None):
+    def __init__(self, wal_dir: str = None, sync_every: int = WAL_SYNC_EVERY,
+                 compact_bytes: int = WAL_COMPACT_BYTES):
         self.wal_dir = wal_dir or WAL_DIR
-        self.pending_dir = os.path.join(self.wal_dir, "pending")
-        self.committed_dir = os.path.join(self.wal_dir, "committed")
-        self.failed_dir = os.path.join(self.wal_dir, "failed")
-        os.makedirs(self.pending_dir, exist_ok=True)
-        os.makedirs(self.committed_dir, exist_ok=True)
-        os.makedirs(self.failed_dir, exist_ok=True)
-
-    def begin(self, operation: str, payload: Dict) -> Transaction:
-        """Create a new pending transaction."""
+        self.path = os.path.join(self.wal_dir, WAL_SEGMENT)
+        self.sync_every = max(1, sync_every)
+        self.compact_bytes = compact_bytes
+        self._lock = threading.RLock()
+        self._txs: Dict[str, Transaction] = {}      # every transaction in the segment, by id
+        self._order: List[str] = []
+        self._unsynced = 0
+        os.makedirs(self.wal_dir, exist_ok=True)
+        self._load()
+        self._migrate_legacy()
+        self._file = open(self.path, "a", encoding="utf-8")
+        if os.path.getsize(self.path) > self.compact_bytes:
+            self.compact()
+
+    # ── Transactions ──────────────────────────────────────────────────────
+
+    @staticmethod
+    def rows_key(operation: str, row_ids: Iterable[str]) -> str:
+        """Idempotency key for writing a set of rows, independent of where."""
+        h = hashlib.sha256(operation.encode())
+        for rid in sorted(row_ids):
+            h.update(b"\0" + str(rid).encode())
+        return h.hexdigest()[:24]
+
+    @staticmethod
+    def payload_key(operation: str, payload: Dict) -> str:
+        blob = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(f"{operation}\0{blob}".encode()).hexdigest()[:24]
+
+    def begin(self, operation: str, payload: Dict, key: str = None) -> Transaction:
+        """Create a new pending transaction, durable before this returns."""
         tx_id = self._generate_tx_id(operation)
         tx = Transaction(
             tx_id=tx_id,
@@ -86,75 +140,71 @@ class WriteAheadLog:
             payload=payload,
             status="pending",
             created_at=datetime.now().isoformat(),
+            key=key or self.payload_key(operation, payload),
         )
-        self._write_tx(tx, self.pending_dir)
+        with self._lock:
+            self._txs[tx_id] = tx
+            self._order.append(tx_id)
+            self._append({"tx": tx_id, "op": "begin", "operation": operation, "key": tx.key,
+                          "payload": payload, "created_at": tx.created_at}, sync=True)
         log.debug(f"WAL: begin {tx_id} ({operation})")
         return tx
 
     def commit(self, tx: Transaction):
-        """Mark transaction as committed — move from pending to committed."""
+        """Mark transaction as committed."""
         tx.status = "committed"
         tx.committed_at = datetime.now().isoformat()
-
-        # Remove from pending
-        pending_path = os.path.join(self.pending_dir, f"{tx.tx_id}.json")
-        if os.path.exists(pending_path):
-            os.remove(pending_path)
-
-        # Write to committed
-        self._write_tx(tx, self.committed_dir)
+        with self._lock:
+            self._txs[tx.tx_id] = tx
+            self._append({"tx": tx.tx_id, "op": "commit", "at": tx.committed_at})
         log.debug(f"WAL: commit {tx.tx_id}")
 
     def rollback(self, tx: Transaction, error: str = ""):
         """Mark transaction as rolled back."""
         tx.status = "rolled_back"
         tx.error = error
-
-        pending_path = os.path.join(self.pending_dir, f"{tx.tx_id}.json")
-        if os.path.exists(pending_path):
-            os.remove(pending_path)
-
-        self._write_tx(tx, self.failed_dir)
+        tx.committed_at = datetime.now().isoformat()   # settled at
+        with self._lock:
+            self._txs[tx.tx_id] = tx
+            self._append({"tx": tx.tx_id, "op": "rollback", "at": tx.committed_at, "error": error})
         log.warning(f"WAL: rollback {tx.tx_id}: {error}")
 
+    def is_committed(self, key: str) -> bool:
+        """True if a transaction with this idempotency key has committed."""
+        with self._lock:
+            return any(t.key == key and t.status in ("committed", "replayed") for t in self._txs.values())
+
     def get_pending(self) -> List[Transaction]:
         """Get all uncommitted transactions, oldest first."""
-        pending = []
-        if not os.path.exists(self.pending_dir):
-            return pending
-
-        for fname in sorted(os.listdir(self.pending_dir)):
-            if not fname.endswith(".json"):
-                continue
-            try:
-                path = os.path.join(self.pending_dir, fname)
-                data = json.load(open(path))
-                tx = Transaction.from_dict(data)
-                pending.append(tx)
-            except Exception as e:
-                log.warning(f"WAL: failed to load {fname}: {e}")
-
-        return pending
+        with self._lock:
+            return [self._txs[i] for i in self._order if self._txs[i].status == "pending"]
 
-    def replay_pending(self, executor=None) -> Dict:
+    def replay_pending(self, executor: Callable[[Transaction], bool] = None) -> Dict:
         """
         Replay all pending transactions.
-        
+
         Args:
-            executor: callable(tx) -> bool that performs the actual write.
-                     Returns True if successful, False otherwise.
-        
+            executor: callable(tx) -> bool that performs the actual write
+                     from tx.payload. Returns True if successful, False otherwise.
+
         Returns:
-            dict with counts: {"replayed": N, "failed": N, "skipped": N}
+            dict with counts: {"replayed": N, "failed": N, "skipped": N, "duplicate": N}
         """
         pending = self.get_pending()
+        stats = {"replayed": 0, "failed": 0, "skipped": 0, "duplicate": 0}
         if not pending:
-            return {"replayed": 0, "failed": 0, "skipped": 0}
+            return stats
 
         log.info(f"WAL: found {len(pending)} pending transactions to replay")
-        stats = {"replayed": 0, "failed": 0, "skipped": 0}
 
         for tx in pending:
+            if self.is_committed(tx.key):
+                # Same rows already committed by another transaction
+                self.commit(tx)
+                stats["duplicate"] += 1
+                log.info(f"WAL: {tx.tx_id} already applied (key {tx.key}), not replaying")
+                continue
+
             tx.retries += 1
 
             if tx.retries > tx.max_retries:
@@ -171,54 +221,80 @@ class WriteAheadLog:
                         stats["replayed"] += 1
                         log.info(f"WAL: replayed {tx.tx_id} successfully")
                     else:
-                        # Update retry count
-                        self._write_tx(tx, self.pending_dir)
+                        self._record_retry(tx)
                         stats["failed"] += 1
                 except Exception as e:
                     log.error(f"WAL: replay failed for {tx.tx_id}: {e}")
-                    self._write_tx(tx, self.pending_dir)
+                    self._record_retry(tx)
                     stats["failed"] += 1
             else:
+                tx.retries -= 1
                 stats["skipped"] += 1
                 log.debug(f"WAL: no executor provided, skipping {tx.tx_id}")
 
+        self.sync()
         return stats
 
-    def cleanup_committed(self, max_age_days: int = 7):
-        """Remove committed transactions older than max_age_days."""
-        if not os.path.exists(self.committed_dir):
-            return 0
-
-        cutoff = time.time() - (max_age_days * 86400)
-        removed = 0
-
-        for fname in os.listdir(self.committed_dir):
-            if not fname.endswith(".json"):
-                continue
-            path = os.path.join(self.committed_dir, fname)
+    # ── Segment maintenance ───────────────────────────────────────────────
+
+    def compact(self, max_age_days: int = 7) -> int:
+        """Rewrite the segment keeping pending transactions and those settled
+        within max_age_days. Returns how many transactions were dropped."""
+        cutoff = datetime.fromtimestamp(time.time() - max_age_days * 86400).isoformat()
+        with self._lock:
+            keep = [
+                i for i in self._order
+                if self._txs[i].status == "pending"
+                or (self._txs[i].committed_at or self._txs[i].created_at) >= cutoff
+            ]
+            removed = len(self._order) - len(keep)
+            tmp = self.path + ".tmp"
             try:
-                if os.path.getmtime(path) < cutoff:
-                    os.remove(path)
-                    removed += 1
-            except Exception:
-                pass
-
+                with open(tmp, "w", encoding="utf-8") as f:
+                    for i in keep:
+                        f.writelines(json.dumps(r, default=str) + "\n" for r in self._records(self._txs[i]))
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._file.close()
+                os.replace(tmp, self.path)
+            except Exception as e:
+                log.error(f"WAL: compaction failed: {e}")
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+                return 0
+            finally:
+                if self._file.closed:
+                    self._file = open(self.path, "a", encoding="utf-8")
+            self._txs = {i: self._txs[i] for i in keep}
+            self._order = keep
+            self._unsynced = 0
         if removed:
-            log.info(f"WAL: cleaned up {removed} old committed transactions")
+            log.info(f"WAL: compacted away {removed} settled transactions")
         return removed
 
+    def sync(self):
+        """fsync any buffered commit/rollback/retry records."""
+        with self._lock:
+            if self._unsynced and not self._file.closed:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._unsynced = 0
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self.sync()
+                self._file.close()
+
     @property
     def stats(self) -> Dict:
         """Current WAL state."""
-        def count_dir(d):
-            if not os.path.exists(d):
-                return 0
-            return len([f for f in os.listdir(d) if f.endswith(".json")])
-
+        with self._lock:
+            statuses = [t.status for t in self._txs.values()]
         return {
-            "pending": count_dir(self.pending_dir),
-            "committed": count_dir(self.committed_dir),
-            "failed": count_dir(self.failed_dir),
+            "pending": statuses.count("pending"),
+            "committed": statuses.count("committed") + statuses.count("replayed"),
+            "failed": statuses.count("rolled_back"),
         }
 
     # ── Internal ──────────────────────────────────────────────────────────
@@ -226,19 +302,106 @@ class WriteAheadLog:
     def _generate_tx_id(self, operation: str) -> str:
         """Generate unique transaction ID."""
         ts = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        h = hashlib.md5(f"{operation}_{ts}_{os.getpid()}".encode()).hexdigest()[:8]
+        h = hashlib.md5(f"{operation}_{ts}_{os.getpid()}_{len(self._order)}".encode()).hexdigest()[:8]
         return f"tx_{ts}_{h}"
 
-    def _write_tx(self, tx: Transaction, directory: str):
-        """Atomically write transaction to directory."""
-        path = os.path.join(directory, f"{tx.tx_id}.json")
-        tmp_path = path + ".tmp"
+    def _append(self, record: dict, sync: bool = False):
         try:
-            with open(tmp_path, "w") as f:
-                json.dump(tx.to_dict(), f, indent=2)
-            os.replace(tmp_path, path)  # atomic on POSIX
+            self._file.write(json.dumps(record, default=str) + "\n")
+            self._file.flush()
+            self._unsynced += 1
+            if sync or self._unsynced >= self.sync_every:
+                os.fsync(self._file.fileno())
+                self._unsynced = 0
         except Exception as e:
-            log.error(f"WAL: failed to write {path}: {e}")
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
-
+            log.error(f"WAL: failed to append to {self.path}: {e}")
+
+    def _record_retry(self, tx: Transaction):
+        with self._lock:
+            self._append({"tx": tx.tx_id, "op": "retry", "retries": tx.retries})
+
+    @staticmethod
+    def _records(tx: Transaction) -> List[dict]:
+        """The records that rebuild `tx` (used by compaction)."""
+        out = [{"tx": tx.tx_id, "op": "begin", "operation": tx.operation, "key": tx.key,
+                "payload": tx.payload, "created_at": tx.created_at, "max_retries": tx.max_retries}]
+        if tx.retries:
+            out.append({"tx": tx.tx_id, "op": "retry", "retries": tx.retries})
+        if tx.status in ("committed", "replayed"):
+            out.append({"tx": tx.tx_id, "op": "commit", "at": tx.committed_at})
+        elif tx.status == "rolled_back":
+            out.append({"tx": tx.tx_id, "op": "rollback", "at": tx.committed_at, "error": tx.error})
+        return out
+
+    def _load(self):
+        try:
+            with open(self.path, "rb+") as f:
+                data = f.read()
+                if data and not data.endswith(b"\n"):
+                    # A torn last line is a begin that never returned. Cut it off
+                    # so the next append starts on a fresh line instead of
+                    # merging into it.
+                    data = data[:data.rfind(b"\n") + 1]
+                    f.truncate(len(data))
+        except FileNotFoundError:
+            return
+        for n, line in enumerate(data.decode("utf-8", errors="replace").splitlines()):
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                log.warning(f"WAL: skipping corrupt record at line {n + 1}")
+                continue
+            tx_id, op = rec.get("tx"), rec.get("op")
+            if op == "begin":
+                self._txs[tx_id] = Transaction(
+                    tx_id=tx_id, operation=rec.get("operation", ""), payload=rec.get("payload", {}),
+                    created_at=rec.get("created_at", ""), key=rec.get("key", ""),
+                    max_retries=rec.get("max_retries", 3),
+                )
+                self._order.append(tx_id)
+                continue
+            tx = self._txs.get(tx_id)
+            if tx is None:
+                continue
+            if op == "commit":
+                tx.status, tx.committed_at = "committed", rec.get("at", "")
+            elif op == "rollback":
+                tx.status, tx.error = "rolled_back", rec.get("error", "")
+                tx.committed_at = rec.get("at", "")
+            elif op == "retry":
+                tx.retries = rec.get("retries", tx.retries)
+
+    def _migrate_legacy(self):
+        """Fold the old one-file-per-transaction pending/ directory into the
+        segment (committed/ and failed/ are history and are removed)."""
+        pending_dir = os.path.join(self.wal_dir, "pending")
+        if not os.path.isdir(pending_dir):
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            for fname in sorted(os.listdir(pending_dir)):
+                if not fname.endswith(".json"):
+                    continue
+                try:
+                    with open(os.path.join(pending_dir, fname)) as pf:
+                        tx = Transaction.from_dict(json.load(pf))
+                    tx.status = "pending"
+                    tx.key = tx.key or self.payload_key(tx.operation, tx.payload)
+                    if tx.tx_id not in self._txs:
+                        self._txs[tx.tx_id] = tx
+                        self._order.append(tx.tx_id)
+                        f.writelines(json.dumps(r, default=str) + "\n" for r in self._records(tx))
+                except Exception as e:
+                    log.warning(f"WAL: failed to migrate {fname}: {e}")
+            f.flush()
+            os.fsync(f.fileno())
+        for sub in ("pending", "committed", "failed"):
+            d = os.path.join(self.wal_dir, sub)
+            for fname in os.listdir(d) if os.path.isdir(d) else []:
+                try:
+                    os.remove(os.path.join(d, fname))
+                except Exception:
+                    pass
+            try:
+                os.rmdir(d)
+            except Exception:
+                pass
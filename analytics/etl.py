@@ -12,9 +12,9 @@ import sys
 import logging
 from datetime import datetime
 
-import gspread
 from oauth2client.service_account import ServiceAccountCredentials
 
+from aggregator.sheets_client import authorize
 from analytics.store import AnalyticsStore
 from analytics.models import JobRecord
 
@@ -29,7 +29,7 @@ def _get_sheets():
     scope = ['https://spreadsheets.google.com/feeds',
              'https://www.googleapis.com/auth/drive']
     creds = ServiceAccountCredentials.from_json_keyfile_name(CREDS_FILE, scope)
-    return gspread.authorize(creds).open('H1B visa')
+    return authorize(creds).open('H1B visa')
 
 
 def _parse_row(row, outcome: str, headers: list = None) -> JobRecord:
@@ -20,10 +20,17 @@ import math
 import logging
 from collections import Counter, defaultdict
 from dataclasses import dataclass
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional, Dict, Set
 
 log = logging.getLogger(__name__)
 
+_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'of', 'in', 'at', 'for',
+    'to', 'is', 'on', 'with', 'as', 'by', 'from', 'this',
+    'that', 'it', 'be', 'are', 'was', 'been',
+})
+_EMPTY: frozenset = frozenset()
+
 
 @dataclass
 class SimilarityMatch:
@@ -40,13 +47,24 @@ class TitleSimilarity:
     
     Pure Python implementation — no external ML libraries needed.
     Uses cosine similarity over TF-IDF vectors.
+
+    Documents are kept in an inverted index (term -> doc ids), globally and
+    per company, so a query only scores documents that share a term with
+    it. Query terms are visited rarest first and the walk stops once the
+    remaining (common) terms can no longer reach the threshold on their own:
+    a document sharing only those terms scores at most |q_rest| / |q|. IDF
+    is derived from the running document frequencies, and each document's
+    normalized vector is cached until the next add().
     """
 
     def __init__(self):
         self._documents: List[dict] = []     # [{title, tokens, job_id, company}]
         self._df: Dict[str, int] = defaultdict(int)  # document frequency per term
-        self._idf_cache: Dict[str, float] = {}
-        self._dirty = True                   # IDF needs recomputation
+        self._postings: Dict[str, Set[int]] = defaultdict(set)  # term -> doc ids
+        self._by_company: Dict[str, Dict[str, Set[int]]] = defaultdict(lambda: defaultdict(set))
+        self._company_docs: Dict[str, List[int]] = defaultdict(list)
+        self._vectors: Dict[int, Dict[str, float]] = {}  # doc id -> unit vector at current IDF
+        self._generation = 0                 # len(_documents) the cached vectors were built for
 
     @staticmethod
     def _tokenize(text: str) -> List[str]:
@@ -57,10 +75,7 @@ class TitleSimilarity:
         # Split into tokens
         tokens = text.split()
         # Remove stopwords
-        stopwords = {'the', 'a', 'an', 'and', 'or', 'of', 'in', 'at', 'for',
-                      'to', 'is', 'on', 'with', 'as', 'by', 'from', 'this',
-                      'that', 'it', 'be', 'are', 'was', 'been'}
-        tokens = [t for t in tokens if t not in stopwords and len(t) > 1]
+        tokens = [t for t in tokens if t not in _STOPWORDS and len(t) > 1]
         return tokens
 
     @staticmethod
@@ -72,25 +87,34 @@ class TitleSimilarity:
             return {}
         return {term: count / total for term, count in counts.items()}
 
-    def _compute_idf(self):
-        """Recompute IDF scores for all terms."""
-        n = len(self._documents)
-        if n == 0:
-            return
-        self._idf_cache = {}
-        for term, df in self._df.items():
-            self._idf_cache[term] = math.log((n + 1) / (df + 1)) + 1  # smoothed IDF
-        self._dirty = False
+    def _idf(self, term: str) -> float:
+        """Smoothed IDF from the running document frequencies (1.0 for unseen terms)."""
+        df = self._df.get(term)
+        if not df:
+            return 1.0
+        return math.log((len(self._documents) + 1) / (df + 1)) + 1
 
     def _tfidf_vector(self, tokens: List[str]) -> Dict[str, float]:
         """Compute TF-IDF vector for a token list."""
-        if self._dirty:
-            self._compute_idf()
-        tf = self._tf(tokens)
-        return {
-            term: freq * self._idf_cache.get(term, 1.0)
-            for term, freq in tf.items()
-        }
+        return {term: freq * self._idf(term) for term, freq in self._tf(tokens).items()}
+
+    @staticmethod
+    def _normalize(vec: Dict[str, float]) -> Dict[str, float]:
+        norm = math.sqrt(sum(v * v for v in vec.values()))
+        if norm == 0:
+            return {}
+        return {t: v / norm for t, v in vec.items()}
+
+    def _doc_vector(self, doc_id: int) -> Dict[str, float]:
+        """Unit TF-IDF vector of a stored document, cached until the next add()."""
+        if self._generation != len(self._documents):
+            self._vectors.clear()
+            self._generation = len(self._documents)
+        vec = self._vectors.get(doc_id)
+        if vec is None:
+            vec = self._normalize(self._tfidf_vector(self._documents[doc_id]["tokens"]))
+            self._vectors[doc_id] = vec
+        return vec
 
     @staticmethod
     def _cosine_similarity(vec_a: Dict[str, float], vec_b: Dict[str, float]) -> float:
@@ -114,10 +138,14 @@ class TitleSimilarity:
         if not tokens:
             return
 
-        # Update document frequency
-        unique_tokens = set(tokens)
-        for token in unique_tokens:
+        doc_id = len(self._documents)
+        bucket = company.lower()
+        # Update document frequency and postings
+        for token in set(tokens):
             self._df[token] += 1
+            self._postings[token].add(doc_id)
+            self._by_company[bucket][token].add(doc_id)
+        self._company_docs[bucket].append(doc_id)
 
         self._documents.append({
             "title": title,
@@ -125,7 +153,6 @@ class TitleSimilarity:
             "job_id": job_id,
             "company": company,
         })
-        self._dirty = True
 
     def add_batch(self, items: List[dict]):
         """Add multiple titles at once. Each item: {title, job_id?, company?}"""
@@ -136,6 +163,32 @@ class TitleSimilarity:
                 company=item.get("company", ""),
             )
 
+    def _candidates(self, query_vec: Dict[str, float], threshold: float,
+                    same_company: str = "") -> List[int]:
+        """Doc ids that can possibly score >= threshold against query_vec."""
+        if same_company:
+            bucket = same_company.lower()
+            if bucket not in self._company_docs:
+                return []
+            postings = self._by_company[bucket]
+            everything = self._company_docs[bucket]
+        else:
+            postings = self._postings
+            everything = range(len(self._documents))
+        if threshold <= 0:
+            return list(everything)
+
+        norm_sq = sum(w * w for w in query_vec.values())
+        rest_sq = norm_sq
+        found: Set[int] = set()
+        for term, weight in sorted(query_vec.items(), key=lambda kv: -kv[1]):
+            # Documents sharing only the remaining terms score <= |q_rest| / |q|
+            if rest_sq < (threshold * threshold) * norm_sq * (1 - 1e-9):
+                break
+            found |= postings.get(term, _EMPTY)
+            rest_sq -= weight * weight
+        return sorted(found)
+
     def find_similar(self, title: str, threshold: float = 0.7,
                      max_results: int = 5, same_company: str = "") -> List[SimilarityMatch]:
         """
@@ -151,20 +204,18 @@ class TitleSimilarity:
             List of SimilarityMatch sorted by score descending
         """
         query_tokens = self._tokenize(title)
-        if not query_tokens:
+        if not query_tokens or not self._documents:
             return []
 
-        query_vec = self._tfidf_vector(query_tokens)
+        query_vec = self._normalize(self._tfidf_vector(query_tokens))
         matches = []
 
-        for doc in self._documents:
-            if same_company and doc["company"].lower() != same_company.lower():
-                continue
-
-            doc_vec = self._tfidf_vector(doc["tokens"])
-            score = self._cosine_similarity(query_vec, doc_vec)
+        for doc_id in self._candidates(query_vec, threshold, same_company):
+            doc_vec = self._doc_vector(doc_id)
+            score = sum(w * doc_vec[t] for t, w in query_vec.items() if t in doc_vec)
 
             if score >= threshold:
+                doc = self._documents[doc_id]
                 matches.append(SimilarityMatch(
                     title=doc["title"],
                     score=round(score, 4),
@@ -21,10 +21,9 @@ A single helper both of them call. It does two safe things:
 This changes nothing about WHAT gets learned. It only makes sure two
 simultaneous learners don't delete each other's work.
 """
-import json
 import os
-import fcntl  # file locking on macOS/Linux
-import tempfile
+
+from outreach.brain_store import open_store
 
 BRAIN_FILE = os.path.join(
     os.path.dirname(os.path.abspath(__file__)), ".local", "brain.json"
@@ -45,39 +44,11 @@ def update_brain(mutator, brain_file: str = BRAIN_FILE):
     Guarantees: only one process writes at a time, and the change is applied
     on top of the LATEST version of the file, not a stale in-memory copy.
     """
-    os.makedirs(os.path.dirname(brain_file), exist_ok=True)
-    # Open (or create) a lock file next to the brain.
-    lock_path = brain_file + ".lock"
-    with open(lock_path, "w") as lock:
-        fcntl.flock(lock, fcntl.LOCK_EX)   # wait here until it's our turn
-        try:
-            # Re-read FRESH so we merge with anyone who just wrote.
-            data = {}
-            if os.path.exists(brain_file):
-                try:
-                    with open(brain_file, encoding="utf-8") as f:
-                        data = json.load(f)
-                except Exception:
-                    data = {}  # corrupt? start clean rather than crash
-
-            result = mutator(data)
-            if result is not None:      # allow mutator to return a new dict
-                data = result
-
-            # Write to a temp file then rename — a crash mid-write can never
-            # leave brain.json half-written (rename is atomic on the same disk).
-            dir_ = os.path.dirname(brain_file) or "."
-            fd, tmp = tempfile.mkstemp(dir=dir_, suffix=".tmp")
-            try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                os.replace(tmp, brain_file)   # atomic swap
-            except Exception:
-                if os.path.exists(tmp):
-                    os.remove(tmp)
-                raise
-        finally:
-            fcntl.flock(lock, fcntl.LOCK_UN)
+    # Both backends give the same guarantee: with brain.json, a file lock
+    # plus re-read/mutate/temp-file-rename; with brain.db (after
+    # `python3 -m outreach.brain_store migrate`), one SQLite transaction
+    # that writes only the keys the mutator touched.
+    return open_store(brain_file).update(mutator)
 
 
 # ---- How each caller changes ----
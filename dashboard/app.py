@@ -9,11 +9,15 @@ import pandas as pd
 import gspread
 import os
 import re
+import sys
 from datetime import datetime, timedelta
 from oauth2client.service_account import ServiceAccountCredentials
 import plotly.express as px
 import plotly.graph_objects as go
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aggregator.sheet_mirror import read_sheets
+
 st.set_page_config(
     page_title="Job Hunt Analytics | Prasad Kanade",
     page_icon="--",
@@ -74,6 +78,7 @@ def load_sheets():
     gc = gspread.authorize(creds)
     ss = gc.open("H1B visa")
     sheets = {}
+    tabs = {}
     for tab in [
         "Internship Applications",
         "Valid Entries",
@@ -82,8 +87,12 @@ def load_sheets():
         "Reviewed - Not Applied",
     ]:
         try:
-            ws = ss.worksheet(tab)
-            all_vals = ws.get_all_values()
+            tabs[tab] = ss.worksheet(tab)
+        except Exception:
+            sheets[tab] = pd.DataFrame()
+    # One delta sync of the local sheet mirror instead of a download per tab
+    for (tab, ws), all_vals in zip(tabs.items(), read_sheets(ss, list(tabs.values()))):
+        try:
             if len(all_vals) > 1:
                 headers = all_vals[0]
                 seen = {}
@@ -845,14 +854,15 @@ def brain_tab():
     import json, os, datetime
     st.markdown('<div class="section-title">🧠 Pipeline Intelligence</div>', unsafe_allow_html=True)
 
-    brain_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".local", "brain.json")
-    if not os.path.exists(brain_path):
+    from outreach.brain_store import open_store
+    _root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    store = open_store(os.path.join(_root, ".local", "brain.json"))
+    if not store.mtime():
         st.warning("Brain not initialized yet. Run the outreach pipeline first.")
         return
 
     try:
-        with open(brain_path) as f:
-            b = json.load(f)
+        b = store.load()
     except Exception as e:
         st.error(f"Failed to load Brain: {e}")
         return
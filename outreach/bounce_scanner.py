@@ -8,6 +8,8 @@ import base64
 import logging
 import datetime
 
+from aggregator.gmail_client import GmailClient, message_header
+
 log = logging.getLogger(__name__)
 
 BOUNCED_EMAILS_FILE = os.path.join(
@@ -102,41 +104,40 @@ class BounceScanner:
             # FIX 3b: also scan "Failed Emails" label explicitly
             label_query = f"after:{after_date} label:failed-emails"
 
-            messages = []
-            seen_ids = set()
+            gmail = GmailClient(gmail_service)
+            message_ids = []
             for q in [query, label_query]:
                 try:
-                    result = (
-                        gmail_service.users()
-                        .messages()
-                        .list(userId="me", q=q, maxResults=100)
-                        .execute()
-                    )
-                    for m in result.get("messages", []):
-                        if m["id"] not in seen_ids:
-                            seen_ids.add(m["id"])
-                            messages.append(m)
+                    message_ids += gmail.list_ids(q, max_results=100)
                 except Exception as qe:
                     log.debug(f"Bounce query failed ({q[:40]}): {qe}")
+            message_ids = list(dict.fromkeys(message_ids))
 
-            if not messages:
+            if not message_ids:
                 log.info("Bounce scanner: no bounce messages found")
                 return set(bounced.keys())
 
             log.info(
-                f"Bounce scanner: checking {len(messages)} potential bounce messages"
+                f"Bounce scanner: checking {len(message_ids)} potential bounce messages"
             )
 
-            for msg_meta in messages:
-                msg_id = msg_meta["id"]
-                try:
-                    msg = (
-                        gmail_service.users()
-                        .messages()
-                        .get(userId="me", id=msg_id, format="full")
-                        .execute()
-                    )
+            # Metadata first: skip bounces already recorded, by message id or
+            # by the X-Failed-Recipients header most MTAs add
+            known_ids = {v.get("msg_id") for v in bounced.values() if isinstance(v, dict)}
+
+            def unseen(meta):
+                if meta["id"] in known_ids:
+                    return False
+                failed = [a.strip().lower() for a in message_header(meta, "X-Failed-Recipients").split(",") if a.strip()]
+                return not failed or any(a not in bounced for a in failed)
 
+            messages = gmail.fetch(message_ids, keep=unseen,
+                                   metadata_headers=("From", "Subject", "X-Failed-Recipients"))
+            gmail.log_summary("Bounce scanner")
+
+            for msg in messages:
+                msg_id = msg["id"]
+                try:
                     subject = BounceScanner._get_header(msg, "Subject") or ""
                     failed_email = BounceScanner._extract_failed_email(msg)
 
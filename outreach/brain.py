@@ -12,17 +12,35 @@ Usage:
     b.record_pattern_failure("stripe.com", "{f}{last}")
     pat = b.best_pattern_for("stripe.com")       # → "{first}.{last}"
     ranked = b.rank_patterns_for("unknown.com")  # → ["{first}.{last}", "{f}{last}", ...]
+
+Job-ID registrations are buffered: each one goes into memory and onto an
+append-only journal (brain_job_ids.journal), and brain.json is rewritten
+only every _JOB_ID_FLUSH_EVERY registrations / _JOB_ID_FLUSH_SEC seconds,
+on b.flush_job_ids(), or on any other save(). A crash loses nothing — the
+journal is replayed on the next load.
+
+Storage goes through outreach.brain_store: brain.json by default, or
+brain.db (SQLite, a row per key, only changed keys written on save) once
+`python3 -m outreach.brain_store migrate` has been run.
 """
 
-import os, json, time, fcntl, logging, re
+import os, json, time, logging, re, datetime, threading
 from collections import defaultdict
 
+from outreach.brain_store import open_store
+
 log = logging.getLogger(__name__)
 
 _BRAIN_FILE = os.path.join(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".local", "brain.json"
 )
 
+# Job-ID registry: entries expire after 90 days; brain.json is rewritten once
+# this many registrations are pending, or this long after the last flush
+_JOB_ID_TTL_SEC = 90 * 86400
+_JOB_ID_FLUSH_EVERY = 250
+_JOB_ID_FLUSH_SEC = 120
+
 # MX provider → most likely email pattern (learned from corpus)
 _PROVIDER_PATTERN_PRIORS = {
     "google": "{first}.{last}",  # Google Workspace
@@ -70,7 +88,11 @@ _ROLE_REJECTION_REASONS = {
 
 class Brain:
     _instance = None
-    _lock = __import__('threading').Lock()
+    _lock = threading.Lock()
+    # Guards job_id_registry, the journal and save() across worker threads
+    _save_lock = threading.RLock()
+    _pending_job_ids = 0
+    _last_job_id_flush = 0.0
 
     @classmethod
     def get(cls) -> "Brain":
@@ -90,6 +112,7 @@ class Brain:
         self._path = _BRAIN_FILE
         os.makedirs(os.path.dirname(self._path), exist_ok=True)
         self._data = self._load()
+        self._replay_job_id_journal()
         # One-time migration from legacy .local/ files
         try:
             self.migrate_legacy_files()
@@ -98,14 +121,14 @@ class Brain:
 
     # ── Persistence ──────────────────────────────────────────────────────────
 
+    @property
+    def _store(self):
+        """Storage backend for _path — SQLite once brain.db exists, else brain.json."""
+        return open_store(self._path)
+
     def _load(self) -> dict:
-        if not os.path.exists(self._path):
-            return self._default()
         try:
-            with open(self._path, "r") as f:
-                fcntl.flock(f, fcntl.LOCK_SH)
-                d = json.load(f)
-                fcntl.flock(f, fcntl.LOCK_UN)
+            d = self._store.load()
             # Ensure all top-level keys exist (forward-compat)
             defaults = self._default()
             for k, v in defaults.items():
@@ -118,45 +141,36 @@ class Brain:
 
     def save(self):
         """Atomic write with exclusive lock. Also prunes stale data on save."""
+        with self._save_lock:
+            self._save()
+
+    def _save(self):
         try:
             self._prune_stale()
-            # Preserve top-level keys written by OTHER processes (e.g.
-            # ats_discovery writes discovered_ats / known_ats_slugs).
-            # Without this, Brain's in-memory copy silently erases them.
-            _out = dict(self._data)
-            try:
-                if os.path.exists(self._path):
-                    with open(self._path) as _cf:
-                        _current = json.load(_cf)
-                    for _k, _v in _current.items():
-                        if _k not in _out:
-                            _out[_k] = _v
-            except Exception:
-                pass
-            tmp = self._path + ".tmp"
-            with open(tmp, "w") as f:
-                fcntl.flock(f, fcntl.LOCK_EX)
-                json.dump(_out, f, indent=2)
-                fcntl.flock(f, fcntl.LOCK_UN)
-            os.replace(tmp, self._path)
+            # JSON: rewrites the file, keeping top-level keys written by OTHER
+            # processes (e.g. ats_discovery writes discovered_ats /
+            # known_ats_slugs). SQLite: writes only the keys touched here.
+            self._store.save(self._data)
+            # Everything journaled is on disk now
+            self._truncate_job_id_journal()
             # Daily backup — keep last 7 days
             self._daily_backup()
         except Exception as e:
             log.debug(f"Brain save failed: {e}")
 
     def _daily_backup(self):
-        """Write daily backup of brain.json, keep last 7."""
+        """Write daily backup of the brain, keep last 7."""
         try:
             today = datetime.datetime.now().strftime("%Y-%m-%d")
-            backup_path = self._path.replace("brain.json", f"brain_backup_{today}.json")
+            ext = ".db" if self._store.backend == "sqlite" else ".json"
+            backup_dir = os.path.dirname(self._path)
+            backup_path = os.path.join(backup_dir, f"brain_backup_{today}{ext}")
             if not os.path.exists(backup_path):
-                import shutil
-                shutil.copy2(self._path, backup_path)
+                self._store.backup(backup_path)
                 log.info(f"Brain backup: {backup_path}")
             # Prune backups older than 7 days
             import glob
-            backup_dir = os.path.dirname(self._path)
-            backups = sorted(glob.glob(os.path.join(backup_dir, "brain_backup_*.json")))
+            backups = sorted(glob.glob(os.path.join(backup_dir, f"brain_backup_*{ext}")))
             for old_backup in backups[:-7]:
                 os.remove(old_backup)
                 log.debug(f"Removed old brain backup: {old_backup}")
@@ -166,18 +180,26 @@ class Brain:
     def _prune_stale(self):
         """Prune unbounded keys to prevent brain.json growing forever."""
         try:
+            # Pruned in place (deletes only), so the SQLite store rewrites
+            # just the dropped keys rather than whole namespaces.
             # simplify_retry_queue: remove exhausted entries older than 7 days
             # exhausted_at is a float unix timestamp
-            srq = self._data.get("simplify_retry_queue", {})
+            srq = self._data.setdefault("simplify_retry_queue", {})
             cutoff_ts = (datetime.datetime.now() - datetime.timedelta(days=7)).timestamp()
-            self._data["simplify_retry_queue"] = {
-                k: v for k, v in srq.items()
-                if not (v.get("exhausted", False) and float(v.get("exhausted_at", 9e12)) < cutoff_ts)
-            }
-            # job_id_registry: cap at 2000 most recent
-            jir = self._data.get("job_id_registry", {})
+            for k in [
+                k for k, v in dict.items(srq)
+                if v.get("exhausted", False) and float(v.get("exhausted_at", 9e12)) < cutoff_ts
+            ]:
+                del srq[k]
+            # job_id_registry: drop entries past the 90-day window, then cap
+            # at 2000 most recent
+            jir = self._data.setdefault("job_id_registry", {})
+            cutoff = time.time() - _JOB_ID_TTL_SEC
+            for k in [k for k, v in dict.items(jir) if v.get("ts", 0) <= cutoff]:
+                del jir[k]
             if len(jir) > 2000:
-                self._data["job_id_registry"] = dict(list(jir.items())[-1500:])
+                for k in list(jir)[:-1500]:
+                    del jir[k]
             # draft_history: cap at 500
             dh = self._data.get("draft_history", [])
             if len(dh) > 500:
@@ -185,7 +207,8 @@ class Brain:
             # run_history in brain: cap at 30 entries (SQLite is source of truth)
             rh = self._data.get("run_history", {})
             if len(rh) > 30:
-                self._data["run_history"] = dict(list(rh.items())[-20:])
+                for k in list(rh)[:-20]:
+                    del rh[k]
         except Exception as e:
             log.debug(f"Brain prune failed: {e}")
 
@@ -750,7 +773,7 @@ class Brain:
         if not entry:
             return False
         # Expire after 90 days
-        if time.time() - entry.get("ts", 0) > 90 * 86400:
+        if time.time() - entry.get("ts", 0) > _JOB_ID_TTL_SEC:
             return False
         # Fuzzy title check: same company + similar title = dupe even with different ID format
         if company and title and entry.get("company"):
@@ -768,25 +791,79 @@ class Brain:
         return True
 
     def register_job_id(self, job_id: str, company: str = "", title: str = ""):
+        """Record a job ID. Visible to is_duplicate_job_id() immediately and
+        journaled to disk; brain.json itself is rewritten in batches."""
         nid = self.normalize_job_id(job_id)
         if not nid:
             return
-        if "job_id_registry" not in self._data:
-            self._data["job_id_registry"] = {}
-        self._data["job_id_registry"][nid] = {
+        entry = {
             "ts": time.time(),
             "company": company,
             "title": title,
             "raw": job_id,
         }
-        # Prune entries older than 90 days to keep file small
-        cutoff = time.time() - 90 * 86400
-        self._data["job_id_registry"] = {
-            k: v
-            for k, v in self._data["job_id_registry"].items()
-            if v.get("ts", 0) > cutoff
-        }
-        self.save()
+        with self._save_lock:
+            self._data.setdefault("job_id_registry", {})[nid] = entry
+            self._append_job_id_journal(nid, entry)
+            self._pending_job_ids += 1
+            if not self._last_job_id_flush:
+                self._last_job_id_flush = time.time()
+            due = (
+                self._pending_job_ids >= _JOB_ID_FLUSH_EVERY
+                or time.time() - self._last_job_id_flush >= _JOB_ID_FLUSH_SEC
+            )
+            if due:
+                self._save()
+
+    def flush_job_ids(self):
+        """Checkpoint: write buffered job-ID registrations to brain.json."""
+        with self._save_lock:
+            if self._pending_job_ids:
+                self._save()
+
+    @property
+    def _job_id_journal_path(self) -> str:
+        return os.path.join(os.path.dirname(self._path), "brain_job_ids.journal")
+
+    def _append_job_id_journal(self, nid: str, entry: dict):
+        try:
+            with open(self._job_id_journal_path, "a") as f:
+                f.write(json.dumps({"nid": nid, **entry}) + "\n")
+        except Exception as e:
+            log.debug(f"Job ID journal append failed: {e}")
+
+    def _truncate_job_id_journal(self):
+        self._pending_job_ids = 0
+        self._last_job_id_flush = time.time()
+        try:
+            if os.path.exists(self._job_id_journal_path):
+                os.remove(self._job_id_journal_path)
+        except Exception as e:
+            log.debug(f"Job ID journal truncate failed: {e}")
+
+    def _replay_job_id_journal(self):
+        """Apply registrations journaled after the last successful save."""
+        try:
+            with open(self._job_id_journal_path) as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            log.debug(f"Job ID journal replay failed: {e}")
+            return
+        registry = self._data.setdefault("job_id_registry", {})
+        replayed = 0
+        for line in lines:
+            try:
+                rec = json.loads(line)
+                nid = rec.pop("nid")
+            except Exception:
+                continue  # torn final line from a crash mid-write
+            registry[nid] = rec
+            replayed += 1
+        self._pending_job_ids = replayed
+        if replayed:
+            log.info(f"Brain: replayed {replayed} journaled job IDs")
 
     @staticmethod
     def _levenshtein(s1: str, s2: str) -> int:
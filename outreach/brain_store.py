@@ -0,0 +1,663 @@
+#!/usr/bin/env python3
+"""
+outreach/brain_store.py — Storage backends for the shared brain.
+
+The brain is one big dict of namespaces (domains, mx_cache, companies,
+job_id_registry, url_company_cache, discovered_ats, ...). Two backends hold
+it on disk:
+
+    JsonBrainStore     .local/brain.json — the original format. Every save
+                       re-reads and rewrites the whole file.
+    SqliteBrainStore   .local/brain.db — one table per namespace, one row per
+                       key. Loads namespaces on first access and saves only
+                       the keys that changed, each save in one transaction,
+                       so startup and save cost don't grow with brain size
+                       and writers in different processes don't clobber
+                       each other's keys. WAL mode keeps readers unblocked.
+
+open_store() picks SQLite once brain.db exists (after `migrate`), JSON
+otherwise, so every reader and writer follows the same switch.
+
+Usage:
+    from outreach.brain_store import open_store
+    store = open_store()
+    data = store.load()                         # dict-like, namespaces lazy
+    data["mx_cache"]["stripe.com"] = {...}
+    store.save(data)                            # writes just that row
+    store.namespace("discovered_ats")           # point read of one namespace
+    store.update(lambda d: d.setdefault("learned_slugs", {}).update(x=1))
+
+    python3 -m outreach.brain_store migrate     # brain.json → brain.db
+    python3 -m outreach.brain_store export      # brain.db → brain.json snapshot
+    python3 -m outreach.brain_store stats
+"""
+
+import os, re, json, time, fcntl, sqlite3, logging, tempfile, threading, shutil
+from contextlib import contextmanager
+
+log = logging.getLogger(__name__)
+
+_LOCAL = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".local")
+BRAIN_JSON = os.path.join(_LOCAL, "brain.json")
+BRAIN_DB = os.path.join(_LOCAL, "brain.db")
+
+
+# ── Change tracking ──────────────────────────────────────────────────────────
+
+
+class TrackedDict(dict):
+    """A dict that remembers which keys may have changed.
+
+    Setting or deleting a key marks it as changed. Handing out a mutable
+    dict/list value (by key, get(), items() or values()) only marks it as
+    handed out: the caller may mutate it in place, so the store compares it
+    against `_baseline` (its JSON as last loaded or saved) on save and
+    writes it only if it differs. Read-only iteration therefore writes
+    nothing. Nested TrackedDicts track themselves and are not marked.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._touched = set()
+        self._handed = set()
+        self._baseline = {}     # str(key) → JSON text on disk
+        self._pending = {}      # baseline changes written by a save not yet committed
+
+    def _note(self, key, value):
+        if isinstance(value, (dict, list)) and not isinstance(value, TrackedDict):
+            self._handed.add(key)
+        return value
+
+    def __getitem__(self, key):
+        return self._note(key, dict.__getitem__(self, key))
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def __setitem__(self, key, value):
+        self._touched.add(key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self._touched.add(key)
+        dict.__delitem__(self, key)
+
+    def pop(self, key, *default):
+        self._touched.add(key)
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        self._touched.add(key)
+        return key, value
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        self._touched.update(dict.keys(self))
+        dict.clear(self)
+
+    def items(self):
+        return [(k, self[k]) for k in dict.keys(self)]
+
+    def values(self):
+        return [v for _, v in self.items()]
+
+    def __iter__(self):
+        # Overriding __iter__ also keeps dict(x) / {**x} off the C fast path,
+        # which would read raw slots and skip the hooks above
+        return iter(list(dict.keys(self)))
+
+    def touched(self):
+        """(changed keys, handed-out keys) since the last mark_clean()."""
+        return set(self._touched), self._handed - self._touched
+
+    def mark_clean(self):
+        for key, text in self._pending.items():
+            if text is None:
+                self._baseline.pop(key, None)
+            else:
+                self._baseline[key] = text
+        self._pending.clear()
+        self._touched.clear()
+        self._handed.clear()
+
+    def __reduce__(self):
+        return (dict, (dict(self.items()),))
+
+
+class _Unloaded:
+    """Placeholder for a namespace that hasn't been read from disk yet."""
+    def __repr__(self):
+        return "<unloaded>"
+
+
+_UNLOADED = _Unloaded()
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+class BrainData(TrackedDict):
+    """Top-level brain dict for the SQLite store; namespaces load on access."""
+
+    def __init__(self, loader, names=()):
+        super().__init__({name: _UNLOADED for name in names})
+        self._loader = loader
+        self._replaced = {}     # name → baseline of a namespace assigned over
+
+    def _resolve(self, key):
+        value = dict.__getitem__(self, key)
+        if value is _UNLOADED:
+            value = self._loader(key)
+            dict.__setitem__(self, key, value)
+            if not isinstance(value, TrackedDict):
+                self._baseline[key] = _dumps(value)
+        return value
+
+    def __getitem__(self, key):
+        return self._note(key, self._resolve(key))
+
+    def __setitem__(self, key, value):
+        # A namespace assigned over keeps its on-disk baseline, so the save
+        # deletes just the keys the new dict dropped
+        if dict.__contains__(self, key) and key not in self._replaced:
+            old = self._resolve(key)
+            if isinstance(old, TrackedDict):
+                self._replaced[key] = old._baseline
+        super().__setitem__(key, value)
+
+    def namespace_baseline(self, name, value) -> dict:
+        if name in self._replaced:
+            return self._replaced[name]
+        return value._baseline if isinstance(value, TrackedDict) else {}
+
+    def mark_clean(self):
+        super().mark_clean()
+        self._replaced.clear()
+
+    def loaded_items(self):
+        """(name, value) for namespaces already in memory — no disk reads."""
+        return [(k, v) for k, v in dict.items(self) if v is not _UNLOADED]
+
+
+# ── JSON backend ─────────────────────────────────────────────────────────────
+
+
+class JsonBrainStore:
+    """brain.json, read and written whole (the original behaviour)."""
+
+    backend = "json"
+
+    def __init__(self, path: str = BRAIN_JSON):
+        self.path = path
+        self._lock_path = path + ".lock"
+
+    def load(self) -> dict:
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, "r") as f:
+            fcntl.flock(f, fcntl.LOCK_SH)
+            try:
+                return json.load(f)
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def namespace(self, name: str, default=None):
+        try:
+            return self.load().get(name, default)
+        except Exception:
+            return default
+
+    def save(self, data: dict):
+        """Write `data` over the latest file, keeping top-level keys that
+        other processes added and `data` doesn't have."""
+        def merge(disk):
+            disk.update(data)
+            return disk
+        self.update(merge)
+
+    def update(self, mutator):
+        """Apply mutator(data) to the latest on-disk version under a file lock."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self._lock_path, "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                try:
+                    data = self.load()
+                except Exception:
+                    data = {}  # corrupt? start clean rather than crash
+                result = mutator(data)
+                if result is not None:
+                    data = result
+                self._write(data)
+                return data
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _write(self, data: dict):
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except Exception:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def mtime(self) -> float:
+        try:
+            return os.path.getmtime(self.path)
+        except OSError:
+            return 0.0
+
+    def size_bytes(self) -> int:
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def backup(self, dest: str):
+        shutil.copy2(self.path, dest)
+
+
+# ── SQLite backend ───────────────────────────────────────────────────────────
+
+
+class SqliteBrainStore:
+    """brain.db — a table per namespace, a row per key, JSON values.
+
+    Top-level values that aren't dicts (counters, flags, short lists) live in
+    the `meta` table. Saves write only keys a TrackedDict reports as set,
+    deleted, or handed out and since changed, inside BEGIN IMMEDIATE, so
+    concurrent writers serialise per transaction and only ever overwrite or
+    delete the keys they changed. A namespace table is never emptied
+    wholesale except when the namespace itself is deleted.
+    """
+
+    backend = "sqlite"
+    _BUSY_TIMEOUT_MS = 15000
+
+    def __init__(self, path: str = BRAIN_DB):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = None
+        self._tables = None
+
+    # Connection / schema
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            conn.execute(f"PRAGMA busy_timeout = {self._BUSY_TIMEOUT_MS}")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS namespaces (name TEXT PRIMARY KEY, tbl TEXT NOT NULL UNIQUE)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL, updated REAL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _namespace_tables(self) -> dict:
+        rows = self._db().execute("SELECT name, tbl FROM namespaces").fetchall()
+        self._tables = dict(rows)
+        return self._tables
+
+    def _table(self, name: str, create: bool = False):
+        tables = self._tables if self._tables is not None else self._namespace_tables()
+        tbl = tables.get(name)
+        if tbl is None and name not in tables:
+            tbl = self._namespace_tables().get(name)
+        if tbl is None and create:
+            base = "ns_" + re.sub(r"\W", "_", name)[:48]
+            tbl, n = base, 1
+            while tbl in set(tables.values()):
+                n += 1
+                tbl = f"{base}_{n}"
+            db = self._db()
+            db.execute(
+                f'CREATE TABLE IF NOT EXISTS "{tbl}" (key TEXT PRIMARY KEY, value TEXT NOT NULL, updated REAL)'
+            )
+            db.execute("INSERT INTO namespaces (name, tbl) VALUES (?, ?)", (name, tbl))
+            tables[name] = tbl
+        return tbl
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            db = self._db()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                yield db
+            except BaseException:
+                db.execute("ROLLBACK")
+                self._tables = None
+                raise
+            db.execute("COMMIT")
+
+    # Reads
+
+    def names(self) -> list:
+        with self._lock:
+            db = self._db()
+            meta = [r[0] for r in db.execute("SELECT key FROM meta")]
+            return list(self._namespace_tables()) + meta
+
+    def _load_namespace(self, name: str):
+        with self._lock:
+            tbl = self._table(name)
+            if tbl is not None:
+                rows = self._db().execute(f'SELECT key, value FROM "{tbl}"').fetchall()
+                ns = TrackedDict((k, json.loads(v)) for k, v in rows)
+                ns._baseline = dict(rows)
+                return ns
+            row = self._db().execute("SELECT value FROM meta WHERE key = ?", (name,)).fetchone()
+            if row is None:
+                raise KeyError(name)
+            return json.loads(row[0])
+
+    def load(self) -> BrainData:
+        return BrainData(self._load_namespace, self.names())
+
+    def namespace(self, name: str, default=None):
+        try:
+            return self._load_namespace(name)
+        except KeyError:
+            return default
+
+    def get(self, name: str, key: str, default=None):
+        """Point read of one key in one namespace."""
+        with self._lock:
+            tbl = self._table(name)
+            if tbl is None:
+                return default
+            row = self._db().execute(f'SELECT value FROM "{tbl}" WHERE key = ?', (str(key),)).fetchone()
+            return json.loads(row[0]) if row else default
+
+    # Writes
+
+    def put(self, name: str, key: str, value):
+        """Point write of one key in one namespace."""
+        with self._transaction() as db:
+            self._upsert(db, self._table(name, create=True), key, value)
+
+    def delete(self, name: str, key: str):
+        with self._transaction() as db:
+            tbl = self._table(name)
+            if tbl is not None:
+                db.execute(f'DELETE FROM "{tbl}" WHERE key = ?', (str(key),))
+
+    def save(self, data: dict):
+        """Persist whatever changed in `data` since it was loaded / last saved."""
+        with self._transaction() as db:
+            self._write_changes(db, data)
+        self._mark_clean(data)
+
+    def update(self, mutator):
+        """Apply mutator(data) to the latest stored state, in one transaction."""
+        with self._transaction() as db:
+            data = self.load()
+            result = mutator(data)
+            if result is not None and result is not data:
+                self._write_everything(db, result, current=data)
+                return result
+            self._write_changes(db, data)
+        self._mark_clean(data)
+        return data
+
+    def _upsert(self, db, tbl, key, value):
+        self._upsert_text(db, tbl, key, _dumps(value))
+
+    def _upsert_text(self, db, tbl, key, text):
+        db.execute(
+            f'INSERT INTO "{tbl}" (key, value, updated) VALUES (?, ?, ?) '
+            f"ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated = excluded.updated",
+            (str(key), text, time.time()),
+        )
+
+    def _sync_namespace(self, db, name, value, keys, baseline, pending):
+        """Write the given keys of a dict namespace: upsert those whose JSON
+        differs from `baseline`, delete those no longer in `value`."""
+        tbl = self._table(name, create=True)
+        present = {str(k): k for k in dict.keys(value)}
+        for key in {str(k) for k in keys}:
+            if key in present:
+                text = _dumps(dict.__getitem__(value, present[key]))
+                if baseline.get(key) != text:
+                    self._upsert_text(db, tbl, key, text)
+                pending[key] = text
+            else:
+                db.execute(f'DELETE FROM "{tbl}" WHERE key = ?', (key,))
+                pending[key] = None
+
+    def _write_namespace(self, db, name, value, baseline):
+        """A dict assigned as a whole namespace: sync every key it has and
+        every key the previous version had on disk."""
+        db.execute("DELETE FROM meta WHERE key = ?", (name,))
+        pending = value._pending if isinstance(value, TrackedDict) else {}
+        keys = {str(k) for k in dict.keys(value)} | set(baseline)
+        self._sync_namespace(db, name, value, keys, baseline, pending)
+        return pending
+
+    def _write_meta(self, db, name, value):
+        tbl = self._table(name)
+        if tbl is not None:
+            db.execute(f'DELETE FROM "{tbl}"')      # was a namespace, now a plain value
+        db.execute(
+            "INSERT INTO meta (key, value, updated) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated = excluded.updated",
+            (name, _dumps(value), time.time()),
+        )
+
+    def _drop_top_level(self, db, name):
+        tbl = self._table(name)
+        if tbl is not None:
+            db.execute(f'DELETE FROM "{tbl}"')
+        db.execute("DELETE FROM meta WHERE key = ?", (name,))
+
+    def _write_changes(self, db, data):
+        if not isinstance(data, TrackedDict):
+            self._write_everything(db, data)
+            return
+        changed, handed = data.touched()
+        for name in changed | handed:
+            if name not in data:
+                self._drop_top_level(db, name)
+                continue
+            value = dict.__getitem__(data, name)
+            if value is _UNLOADED:
+                continue
+            if isinstance(value, dict):
+                baseline = data.namespace_baseline(name, value)
+                pending = self._write_namespace(db, name, value, baseline)
+                if not isinstance(value, TrackedDict):
+                    # Track from here on so the next save is incremental again
+                    value = TrackedDict(value)
+                    value._baseline = dict(baseline)
+                    value._pending = pending
+                    dict.__setitem__(data, name, value)
+                continue
+            text = _dumps(value)
+            if name in changed or data._baseline.get(name) != text:
+                self._write_meta(db, name, value)
+            data._pending[name] = text
+
+        for name, value in list(dict.items(data)):
+            if name in changed or name in handed or not isinstance(value, TrackedDict):
+                continue
+            ns_changed, ns_handed = value.touched()
+            if ns_changed or ns_handed:
+                self._sync_namespace(db, name, value, ns_changed | ns_handed,
+                                     value._baseline, value._pending)
+
+    def _write_everything(self, db, data, current=None):
+        """Make the store hold exactly `data`. Dict namespaces are diffed
+        against `current` (the stored state) key by key."""
+        for name in set(self.names()) - set(data):
+            self._drop_top_level(db, name)
+        for name in data:
+            value = data[name]
+            if isinstance(value, dict):
+                old = dict.get(current, name) if current is not None else None
+                if old is _UNLOADED:
+                    old = current[name]
+                baseline = old._baseline if isinstance(old, TrackedDict) else {}
+                if not baseline and current is None:
+                    baseline = self._stored_keys(name)
+                self._write_namespace(db, name, value, baseline)
+            else:
+                self._write_meta(db, name, value)
+
+    def _stored_keys(self, name) -> dict:
+        tbl = self._table(name)
+        if tbl is None:
+            return {}
+        return dict(self._db().execute(f'SELECT key, value FROM "{tbl}"').fetchall())
+
+    @staticmethod
+    def _mark_clean(data):
+        if isinstance(data, TrackedDict):
+            data.mark_clean()
+            for value in dict.values(data):
+                if isinstance(value, TrackedDict):
+                    value.mark_clean()
+
+    # Housekeeping
+
+    def import_dict(self, data: dict):
+        with self._transaction() as db:
+            self._write_everything(db, data)
+
+    def export_dict(self) -> dict:
+        data = self.load()
+        return {name: data[name] for name in data}
+
+    def mtime(self) -> float:
+        stamps = []
+        for path in (self.path, self.path + "-wal"):
+            try:
+                stamps.append(os.path.getmtime(path))
+            except OSError:
+                pass
+        return max(stamps, default=0.0)
+
+    def size_bytes(self) -> int:
+        return sum(
+            os.path.getsize(p) for p in (self.path, self.path + "-wal") if os.path.exists(p)
+        )
+
+    def backup(self, dest: str):
+        with self._lock:
+            target = sqlite3.connect(dest)
+            try:
+                self._db().backup(target)
+            finally:
+                target.close()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self._tables = None
+
+
+# ── Selection / migration ────────────────────────────────────────────────────
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def db_path_for(json_path: str) -> str:
+    return os.path.splitext(json_path)[0] + ".db"
+
+
+def open_store(json_path: str = BRAIN_JSON):
+    """The store for this brain: SQLite once brain.db exists (or
+    BRAIN_BACKEND=sqlite), JSON otherwise. One instance per path."""
+    db_path = db_path_for(json_path)
+    use_sqlite = os.path.exists(db_path) or os.environ.get("BRAIN_BACKEND") == "sqlite"
+    key = (db_path if use_sqlite else json_path, use_sqlite)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = SqliteBrainStore(db_path) if use_sqlite else JsonBrainStore(json_path)
+        return store
+
+
+def load_brain_data(json_path: str = BRAIN_JSON) -> dict:
+    """Whole brain as a dict (namespaces load lazily on SQLite); {} if unreadable."""
+    try:
+        return open_store(json_path).load()
+    except Exception as e:
+        log.debug(f"Brain load failed: {e}")
+        return {}
+
+
+def migrate(json_path: str = BRAIN_JSON, db_path: str = None) -> dict:
+    """Copy brain.json into brain.db. brain.json is left in place as a
+    snapshot; open_store() switches to SQLite from now on."""
+    db_path = db_path or db_path_for(json_path)
+    with open(json_path, encoding="utf-8") as f:
+        data = json.load(f)
+    store = SqliteBrainStore(db_path)
+    store.import_dict(data)
+    counts = {
+        name: (len(value) if isinstance(value, (dict, list)) else 1)
+        for name, value in data.items()
+    }
+    store.close()
+    with _stores_lock:
+        _stores.clear()
+    return counts
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Brain storage tools")
+    parser.add_argument("command", choices=["migrate", "export", "stats"])
+    parser.add_argument("--json", default=BRAIN_JSON, help="brain.json path")
+    parser.add_argument("--db", default=None, help="brain.db path (default: next to --json)")
+    args = parser.parse_args(argv)
+    db_path = args.db or db_path_for(args.json)
+
+    if args.command == "migrate":
+        if os.path.exists(db_path):
+            print(f"{db_path} already exists — remove it first to re-migrate")
+            return 1
+        counts = migrate(args.json, db_path)
+        for name, n in sorted(counts.items()):
+            print(f"  {name:<32} {n:>7}")
+        print(f"Migrated {len(counts)} namespaces → {db_path}")
+    elif args.command == "export":
+        store = SqliteBrainStore(db_path)
+        JsonBrainStore(args.json)._write(store.export_dict())
+        print(f"Exported {db_path} → {args.json}")
+    else:
+        store = open_store(args.json)
+        data = store.load()
+        print(f"Backend: {store.backend}  ({store.size_bytes() // 1024} KB)")
+        for name in sorted(data):
+            value = data[name]
+            print(f"  {name:<32} {len(value) if isinstance(value, (dict, list)) else value!r:>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
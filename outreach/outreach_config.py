@@ -214,7 +214,7 @@ DELAY_MIN = 30
 DELAY_MAX = 90
 API_TIMEOUT = 10
 API_RETRIES = 3
-SHEET_PAUSE = 1.5
+SHEET_WRITE_BATCH = 200  # buffered Outreach cells per automatic flush
 HUNTER_CONF = 70
 
 WARMUP_ON = True
@@ -18,7 +18,6 @@ from outreach.outreach_config import (
     V_JOBID,
     V_LOCATION,
     V_RESUME,
-    SHEET_PAUSE,
     CREDITS_FILE,
     APIS,
     MAX_DAILY,
@@ -35,6 +34,9 @@ from outreach.outreach_config import (
     REC_LI_MSG_TEMPLATE,
     LI_MSG_MAX,
 )
+from aggregator.sheet_mirror import read_sheets
+from aggregator.sheets_client import authorize
+from outreach.sheet_writer import SheetWriteBuffer
 
 log = logging.getLogger(__name__)
 
@@ -68,8 +70,14 @@ class Sheets:
             "https://www.googleapis.com/auth/drive",
         ]
         creds = ServiceAccountCredentials.from_json_keyfile_name(SHEETS_CREDS, scope)
-        self.ss = gspread.authorize(creds).open(SPREADSHEET)
+        self.ss = authorize(creds).open(SPREADSHEET)
         self._ensure()
+        self.writes = SheetWriteBuffer(self.ws)
+
+    def flush_writes(self):
+        """Send the buffered cell writes (run_outreach phases call this in a
+        finally, so a failure partway through keeps what was queued)."""
+        return self.writes.flush()
 
     def _ensure(self):
         try:
@@ -80,8 +88,7 @@ class Sheets:
 
         row1 = self.ws.row_values(1)
         if not row1 or row1[0] != O_HEADERS[0]:
-            self._retry(
-                self.ws.update,
+            self.ws.update(
                 values=[O_HEADERS],
                 range_name=f"A1:{_cl(len(O_HEADERS)-1)}1",
                 value_input_option="RAW",
@@ -200,7 +207,6 @@ class Sheets:
             except Exception as _e:
                 log.debug(f"sheets op failed: {_e}")
 
-            self._p()
         # Always apply body formatting (runs every session, not just creation)
         # Skip hm_li (col 5) and rec_li (col 8) to preserve hyperlink formatting
         try:
@@ -258,7 +264,6 @@ class Sheets:
                 })
             if fmt_requests:
                 self.ss.batch_update({"requests": fmt_requests})
-            self._p()
         except Exception as _e:
             log.debug(f"op failed: {_e}")
 
@@ -271,9 +276,7 @@ class Sheets:
             return 0
 
         vdata = valid.get_all_values()
-        self._p()
         odata = self.ws.get_all_values()
-        self._p()
 
         # Build outreach lookup: key → row data (preserve HM/Rec/emails/notes)
         outreach_by_key = {}
@@ -463,21 +466,16 @@ class Sheets:
                 clear_end = total_existing
                 try:
                     clear_range = f"A{clear_start}:{end_col}{clear_end}"
-                    self._retry(
-                        self.ws.batch_clear, [clear_range]
-                    )
-                    self._p()
+                    self.ws.batch_clear([clear_range])
                 except Exception as _e:
                     pass  # suppressed: use log.debug(_e) to investigate
 
             # Write all data
-            self._retry(
-                self.ws.update,
+            self.ws.update(
                 values=all_data,
                 range_name=f"A1:{end_col}{len(all_data)}",
                 value_input_option="USER_ENTERED",
             )
-            self._p()
 
             # Format data rows
             if new_count > 0:
@@ -519,7 +517,6 @@ class Sheets:
                 try:
                     for chunk_i in range(0, len(li_requests), 100):
                         self.ss.batch_update({"requests": li_requests[chunk_i:chunk_i+100]})
-                        self._p()
                 except Exception as _le:
                     log.debug(f"LinkedIn hyperlink restore failed: {_le}")
 
@@ -551,7 +548,6 @@ class Sheets:
                     } for row_i in range(1, new_count + 1)]  # rows 2..N (0-indexed 1..N)
                     for chunk_i in range(0, len(extract_requests), 100):
                         self.ss.batch_update({"requests": extract_requests[chunk_i:chunk_i+100]})
-                        self._p()
                 except Exception as _dv:
                     log.debug(f"Extract dropdown failed: {_dv}")
 
@@ -705,7 +701,6 @@ class Sheets:
 
     def rows_for_extraction(self):
         data = self.ws.get_all_values()
-        self._p()
 
         ecache = {}
         for r in data[1:]:
@@ -801,12 +796,9 @@ class Sheets:
     def write_bounce_note(self, row, ct, email, bounced_at):
         """Write clean bounce note, overwrite delivery status, clear bad email."""
         try:
-            notes_col = _cl(C["notes"])
-            existing_note = self.ws.acell(f"{notes_col}{row}").value or ""
-            self._p()
-
-            r = _pad(self.ws.row_values(row))
-            self._p()
+            existing_note = self.writes.get(row, C["notes"])
+            if existing_note is None:
+                existing_note = self.ws.acell(f"{_cl(C['notes'])}{row}").value or ""
 
             other_ct = "Rec" if ct == "hm" else "HM"
             this_ct = "HM" if ct == "hm" else "Rec"
@@ -834,12 +826,9 @@ class Sheets:
             else:
                 final = bounce_note
 
-            self._retry(self.ws.update_acell, f"{notes_col}{row}", final)
-            self._p()
-
+            self.writes.set(row, C["notes"], final)
             email_col = C["hm_email"] if ct == "hm" else C["rec_email"]
-            self._retry(self.ws.update_acell, f"{_cl(email_col)}{row}", "")
-            self._p()
+            self.writes.set(row, email_col, "")
             log.info(f"Row {row}: {this_ct} bounce noted for {email}")
         except Exception as e:
             log.error(f"write_bounce_note row {row}: {e}")
@@ -851,7 +840,6 @@ class Sheets:
         bounced_lower = {e.lower().strip() for e in bounced_emails}
         try:
             data = self.ws.get_all_values()
-            self._p()
             flagged = 0
             retried = 0
             today = __import__('datetime').date.today().strftime("%b %d, %Y")
@@ -876,16 +864,12 @@ class Sheets:
                         new_email = self._retry_bounced_email(name, co, email)
                         if new_email and new_email.lower() != email.lower():
                             email_col = C["hm_email"] if ct == "hm" else C["rec_email"]
-                            self._retry(self.ws.update_acell, f"{_cl(email_col)}{i}", new_email)
-                            self._p()
-                            # Update notes
-                            notes_col = _cl(C["notes"])
-                            existing = self.ws.acell(f"{notes_col}{i}").value or ""
-                            self._p()
+                            self.writes.set(i, email_col, new_email)
+                            # Update notes (write_bounce_note just queued them)
+                            existing = self.writes.get(i, C["notes"], r[C["notes"]])
                             retry_note = f"Retried: {new_email}"
                             updated = f"{existing} | {retry_note}".strip(" |") if existing else retry_note
-                            self._retry(self.ws.update_acell, f"{notes_col}{i}", updated)
-                            self._p()
+                            self.writes.set(i, C["notes"], updated)
                             retried += 1
                             log.info(f"Row {i}: bounce retry {email} → {new_email}")
 
@@ -899,6 +883,8 @@ class Sheets:
         except Exception as e:
             log.error(f"flag_bounced_rows failed: {e}")
             return 0
+        finally:
+            self.flush_writes()  # notes already queued for rows scanned so far
 
     def _retry_bounced_email(self, name, company, bounced_email):
         """Try alternative email patterns after a bounce. Returns new email or None."""
@@ -1004,7 +990,6 @@ class Sheets:
         """Auto-populate HM and Rec LinkedIn Msg columns."""
         try:
             data = self.ws.get_all_values()
-            self._p()
             updates = []
             for i, r in enumerate(data[1:], start=2):
                 r = _pad(r)
@@ -1055,8 +1040,7 @@ class Sheets:
             if updates:
                 for chunk_start in range(0, len(updates), 50):
                     chunk = updates[chunk_start:chunk_start+50]
-                    self._retry(self.ws.batch_update, chunk, value_input_option="USER_ENTERED")
-                    self._p()
+                    self.ws.batch_update(chunk, value_input_option="USER_ENTERED")
                 print(f"  LinkedIn messages: {len(updates)} generated")
                 log.info(f"populate_linkedin_msgs: {len(updates)} messages written")
             return len(updates)
@@ -1103,9 +1087,8 @@ class Sheets:
                 return
             email = ", ".join(clean_emails)
             col = C["hm_email"] if ct == "hm" else C["rec_email"]
-            self._retry(self.ws.update_acell, f"{_cl(col)}{row}", email)
+            self.writes.set(row, col, email)
             log.info(f"Row {row} {ct}: {email} (via {source})")
-            self._p()
         except Exception as e:
             log.error(f"write_email row {row}: {e}")
 
@@ -1114,9 +1097,7 @@ class Sheets:
         try:
             from outreach.outreach_verifier import confidence_label
             label = confidence_label(confidence_score)
-            col_letter = _cl(C["confidence"])
-            self._retry(self.ws.update_acell, f"{col_letter}{row}", label)
-            self._p()
+            self.writes.set(row, C["confidence"], label)
             # Apply background color based on confidence
             colors = {
                 "High": {"red": 0.56, "green": 0.93, "blue": 0.56},    # Green
@@ -1125,40 +1106,19 @@ class Sheets:
             }
             color = colors.get(label)
             if color:
-                try:
-                    col_idx = C["confidence"]
-                    self.ws.spreadsheet.batch_update({"requests": [{
-                        "repeatCell": {
-                            "range": {
-                                "sheetId": self.ws.id,
-                                "startRowIndex": row - 1,
-                                "endRowIndex": row,
-                                "startColumnIndex": col_idx,
-                                "endColumnIndex": col_idx + 1,
-                            },
-                            "cell": {
-                                "userEnteredFormat": {
-                                    "backgroundColor": color,
-                                    "textFormat": {"bold": True},
-                                    "horizontalAlignment": "CENTER",
-                                }
-                            },
-                            "fields": "userEnteredFormat",
-                        }
-                    }]})
-                    self._p()
-                except Exception as ce:
-                    log.debug(f"Color formatting failed row {row}: {ce}")
+                self.writes.format(row, C["confidence"], {
+                    "backgroundColor": color,
+                    "textFormat": {"bold": True},
+                    "horizontalAlignment": "CENTER",
+                })
         except Exception as e:
             log.error(f"write_confidence row {row}: {e}")
 
     def write_send_at(self, row, send_at_text, sent_date_text=""):
         try:
-            self._retry(self.ws.update_acell, f"{_cl(C['send_at'])}{row}", send_at_text)
-            self._p()
+            self.writes.set(row, C["send_at"], send_at_text)
             if sent_date_text:
-                self._retry(self.ws.update_acell, f"{_cl(C['sent_dt'])}{row}", sent_date_text)
-                self._p()
+                self.writes.set(row, C["sent_dt"], sent_date_text)
         except Exception as e:
             log.error(f"write_send_at row {row}: {e}")
 
@@ -1170,12 +1130,16 @@ class Sheets:
         """Errors logged to .local/outreach.log only — no sheet column."""
         log.debug(f"Row {row}: {msg}")
 
+    def _valid_rows(self):
+        """Valid Entries rows for read-only lookups, via the local sheet mirror
+        (one delta sync, reused for a few minutes) instead of a full download."""
+        valid = self.ss.worksheet(VALID_TAB)
+        return read_sheets(self.ss, [valid], max_age=300)[0]
+
     def _build_resume_cache(self):
         """Build resume cache from Valid Entries. Safe to call multiple times."""
         try:
-            valid = self.ss.worksheet("Valid Entries")
-            rows = valid.get_all_values()
-            self._p()
+            rows = self._valid_rows()
             Sheets._resume_cache = {}
             for row in rows[1:]:
                 if len(row) > V_RESUME:
@@ -1201,9 +1165,7 @@ class Sheets:
     def get_location(self, company, title):
         if Sheets._location_cache is None:
             try:
-                valid = self.ss.worksheet("Valid Entries")
-                rows = valid.get_all_values()
-                self._p()
+                rows = self._valid_rows()
                 Sheets._location_cache = {}
                 for row in rows[1:]:
                     if len(row) > 8:
@@ -1223,9 +1185,7 @@ class Sheets:
         """Extract domain from Job URL in Valid Entries (column F, index 5)."""
         if not hasattr(Sheets, "_url_domain_cache") or Sheets._url_domain_cache is None:
             try:
-                valid = self.ss.worksheet("Valid Entries")
-                rows = valid.get_all_values()
-                self._p()
+                rows = self._valid_rows()
                 Sheets._url_domain_cache = {}
                 for row in rows[1:]:
                     if len(row) > 5 and row[5].strip().startswith("http"):
@@ -1318,24 +1278,6 @@ class Sheets:
             target += datetime.timedelta(days=1)
         return target.strftime("%b %d, 11:00 AM ET"), target.strftime("%b %d, %Y")
 
-    @staticmethod
-    def _retry(func, *args, retries=3, **kwargs):
-        for attempt in range(retries):
-            try:
-                return func(*args, **kwargs)
-            except Exception as e:
-                if "429" in str(e) or "RESOURCE_EXHAUSTED" in str(e):
-                    wait = 2 ** (attempt + 1)
-                    log.warning(f"Sheets rate limit, retrying in {wait}s...")
-                    time.sleep(wait)
-                elif attempt < retries - 1:
-                    time.sleep(1)
-                else:
-                    raise
-
-    def _p(self):
-        time.sleep(SHEET_PAUSE)
-
 
 class Credits:
     def __init__(self):
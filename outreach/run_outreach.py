@@ -7,7 +7,7 @@ Outreach Pipeline
     python3 -m outreach reset        # Reset API credits
 """
 
-import sys, os, datetime, logging
+import sys, os, datetime, logging, functools
 
 
 def _notify(msg):
@@ -88,11 +88,23 @@ def phase_pull(sheets):
     return sheets.pull()
 
 
+def _flushes_writes(phase):
+    """Send the phase's buffered Outreach cell writes however it ends, so an
+    exception or interrupt doesn't drop emails and send_at already paid for."""
+    @functools.wraps(phase)
+    def run(sheets, *args, **kwargs):
+        try:
+            return phase(sheets, *args, **kwargs)
+        finally:
+            sheets.flush_writes()
+    return run
+
+
+@_flushes_writes
 def phase_draft_existing(sheets, mailer):
     from outreach.outreach_data import _pad, C
 
     data = sheets.ws.get_all_values()
-    sheets._p()
     stats = {"drafts": 0, "draft_failed": 0}
     for i, r in enumerate(data[1:], start=2):
         r = _pad(r)
@@ -182,6 +194,7 @@ def phase_draft_existing(sheets, mailer):
     return stats
 
 
+@_flushes_writes
 def phase_extract_and_draft(sheets, finder, mailer):
     # Auto-fill emails from Brain contacts before extraction
     try:
@@ -0,0 +1,148 @@
+"""
+SheetWriteBuffer — write-behind buffer for Outreach sheet cells.
+
+Sheets.write_email / write_confidence / write_send_at / write_bounce_note
+used to call update_acell once per cell, plus one batch_update per colored
+cell, each followed by a SHEET_PAUSE sleep. For a 100-row outreach run that
+is hundreds of round trips.
+
+Writes now go into the buffer, keyed by (row, column). A later write to the
+same cell replaces the earlier one. Format requests are kept per cell the
+same way. flush() sends everything in two requests:
+
+    values_batch_update    one range per block of adjacent cells
+    batch_update           the repeatCell format requests
+
+Pacing and 429 / 5xx retries happen in the shared Sheets client
+(aggregator.sheets_client), which resends the whole request. If it still
+fails, the buffer keeps its contents for the next flush, so no write is
+lost to a quota blip. get() answers reads for cells that are still
+pending, so code that reads a cell back after writing it sees its own write.
+
+Flush points are explicit (end of a phase, before a full re-read). The
+buffer also flushes itself once SHEET_WRITE_BATCH cells are pending.
+
+Usage:
+    buf = SheetWriteBuffer(ws)
+    buf.set(row, C["hm_email"], "jane@acme.com")
+    buf.format(row, C["confidence"], {"backgroundColor": green})
+    buf.flush()
+"""
+import logging
+import threading
+from typing import Any, Dict, List, Tuple
+
+from gspread.utils import rowcol_to_a1
+
+from outreach.outreach_config import SHEET_WRITE_BATCH
+
+log = logging.getLogger(__name__)
+
+
+class SheetWriteBuffer:
+    def __init__(self, ws, max_cells: int = SHEET_WRITE_BATCH,
+                 value_input_option: str = "USER_ENTERED"):
+        self.ws = ws
+        self.max_cells = max_cells
+        self.value_input_option = value_input_option
+        self._values: Dict[Tuple[int, int], Any] = {}
+        self._formats: Dict[Tuple[int, int], Tuple[dict, str]] = {}
+        self._lock = threading.RLock()
+        self.stats = {"cells": 0, "formats": 0, "flushes": 0, "requests": 0, "failed": 0}
+
+    def __len__(self):
+        return len(self._values) + len(self._formats)
+
+    # ── Buffering ────────────────────────────────────────────────────────────
+
+    def set(self, row: int, col: int, value):
+        """Queue a value for the cell at 1-based `row`, 0-based `col`."""
+        with self._lock:
+            self._values[(row, col)] = value
+            full = len(self._values) >= self.max_cells
+        if full:
+            self.flush()
+
+    def get(self, row: int, col: int, default=None):
+        """The pending value for a cell, or `default` if none is queued."""
+        with self._lock:
+            return self._values.get((row, col), default)
+
+    def format(self, row: int, col: int, fmt: dict, fields: str = "userEnteredFormat"):
+        """Queue a userEnteredFormat for one cell (replaces an earlier one)."""
+        with self._lock:
+            self._formats[(row, col)] = (fmt, fields)
+
+    # ── Flushing ─────────────────────────────────────────────────────────────
+
+    def _value_ranges(self, values: Dict[Tuple[int, int], Any]) -> List[dict]:
+        """One range per block of adjacent cells: runs within a row, stacked
+        when consecutive rows cover the same columns."""
+        title = self.ws.title.replace("'", "''")
+        runs: List[list] = []           # [row, first col, last col, values]
+        for (r, c), v in sorted(values.items()):
+            if runs and runs[-1][0] == r and runs[-1][2] == c - 1:
+                runs[-1][2] = c
+                runs[-1][3].append(v)
+            else:
+                runs.append([r, c, c, [v]])
+
+        blocks: List[list] = []         # [first row, last row, first col, last col, rows]
+        for r, c0, c1, row in sorted(runs, key=lambda run: (run[1], run[2], run[0])):
+            b = blocks[-1] if blocks else None
+            if b and b[2] == c0 and b[3] == c1 and b[1] == r - 1:
+                b[1] = r
+                b[4].append(row)
+            else:
+                blocks.append([r, r, c0, c1, [row]])
+
+        return [
+            {"range": f"'{title}'!{rowcol_to_a1(r0, c0 + 1)}:{rowcol_to_a1(r1, c1 + 1)}", "values": rows}
+            for r0, r1, c0, c1, rows in sorted(blocks)
+        ]
+
+    def _format_requests(self, formats: Dict[Tuple[int, int], Tuple[dict, str]]) -> List[dict]:
+        return [
+            {"repeatCell": {
+                "range": {"sheetId": self.ws.id, "startRowIndex": r - 1, "endRowIndex": r,
+                          "startColumnIndex": c, "endColumnIndex": c + 1},
+                "cell": {"userEnteredFormat": fmt},
+                "fields": fields,
+            }}
+            for (r, c), (fmt, fields) in sorted(formats.items())
+        ]
+
+    def _send(self, func, body) -> None:
+        self.stats["requests"] += 1
+        func(body)
+
+    def flush(self) -> bool:
+        """Send every pending write. False if a request failed (after the
+        client's retries); whatever did not go out stays queued."""
+        with self._lock:
+            values, formats = dict(self._values), dict(self._formats)
+            if not values and not formats:
+                return True
+            ss = self.ws.spreadsheet
+            try:
+                if values:
+                    self._send(ss.values_batch_update, {
+                        "valueInputOption": self.value_input_option,
+                        "data": self._value_ranges(values),
+                    })
+                    for k in values:
+                        del self._values[k]
+                    self.stats["cells"] += len(values)
+                if formats:
+                    self._send(ss.batch_update, {"requests": self._format_requests(formats)})
+                    for k in formats:
+                        self._formats.pop(k, None)
+                    self.stats["formats"] += len(formats)
+            except Exception as e:
+                self.stats["failed"] += 1
+                log.error(f"Sheets write batch failed ({len(self._values)} cells, "
+                          f"{len(self._formats)} formats kept for the next flush): {e}")
+                return False
+            self.stats["flushes"] += 1
+            log.debug(f"Sheets write batch: {len(values)} cells, {len(formats)} formats")
+            return True
@@ -20,8 +20,12 @@ import re
 import time
 import urllib.request
 import ssl
+import sys
 from typing import Dict, Set
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from outreach.brain_store import open_store
+
 log = logging.getLogger(__name__)
 _CTX = ssl.create_default_context()
 BRAIN_FILE = ".local/brain.json"
@@ -80,26 +84,21 @@ class ATSDiscoveryEngine:
 
     def _load_brain(self):
         try:
-            if os.path.exists(BRAIN_FILE):
-                with open(BRAIN_FILE) as f:
-                    return json.load(f)
+            return open_store(BRAIN_FILE).load()
         except Exception:
             pass
         return {}
 
     def _save_brain(self):
-        # Re-read current brain so we never clobber writes made by other
-        # processes (outreach Brain) while discovery was running.
-        current = self._load_brain() or {}
-        current["discovered_ats"] = self.discovered
-        current["known_ats_slugs"] = {
-            k: list(v) for k, v in self.known_slugs.items()
-        }
-        self.brain = current
-        tmp = BRAIN_FILE + ".tmp"
-        with open(tmp, "w") as f:
-            json.dump(current, f, indent=2)
-        os.replace(tmp, BRAIN_FILE)
+        # Applied on top of the latest stored brain so we never clobber
+        # writes made by other processes (outreach Brain) while discovery
+        # was running.
+        def merge(current):
+            current["discovered_ats"] = self.discovered
+            current["known_ats_slugs"] = {
+                k: list(v) for k, v in self.known_slugs.items()
+            }
+        self.brain = open_store(BRAIN_FILE).update(merge)
 
     def extract_slugs_from_urls(self, urls):
         """Extract ATS company slugs from a list of URLs."""
@@ -244,26 +243,18 @@ class ATSDiscoveryEngine:
 
             all_urls = []
 
-            # Scan valid entries
-            valid = ss.worksheet("Valid Entries").get_all_values()
-            for row in valid[1:]:
-                if len(row) > 5 and row[5].strip().startswith("http"):
-                    all_urls.append(row[5].strip())
-
-            # Scan discarded entries
-            disc = ss.worksheet("Discarded Entries").get_all_values()
-            for row in disc[1:]:
-                if len(row) > 5 and row[5].strip().startswith("http"):
-                    all_urls.append(row[5].strip())
-
-            # Reviewed - Not Applied sheet (URLs that never reached Valid)
+            # Valid + Discarded entries, and Reviewed - Not Applied (URLs
+            # that never reached Valid) — read from the local sheet mirror
+            from aggregator.sheet_mirror import read_sheets
+            tabs = [ss.worksheet("Valid Entries"), ss.worksheet("Discarded Entries")]
             try:
-                rev = ss.worksheet("Reviewed - Not Applied").get_all_values()
-                for row in rev[1:]:
-                    if len(row) > 5 and row[5].strip().startswith("http"):
-                        all_urls.append(row[5].strip())
+                tabs.append(ss.worksheet("Reviewed - Not Applied"))
             except Exception:
                 pass
+            for data in read_sheets(ss, tabs):
+                for row in data[1:]:
+                    if len(row) > 5 and row[5].strip().startswith("http"):
+                        all_urls.append(row[5].strip())
 
             # Raw skipped-jobs log: thousands of ATS URLs filtered out pre-sheet
             try:
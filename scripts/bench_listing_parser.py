@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Benchmark the streaming README parser against the whole-document path,
+comparing wall time and peak RSS, and check both produce the same jobs.
+
+    python3 scripts/bench_listing_parser.py                     # synthetic READMEs
+    python3 scripts/bench_listing_parser.py path/to/README.md   # saved READMEs
+    python3 scripts/bench_listing_parser.py --rows 5000 20000 60000
+
+"Document" is what SimplifyGitHubScraper.scrape used to do: hold the whole
+response text, build a soup of it, walk the tables, and fall back to the
+Markdown parser. "Stream" is the current path: _response_lines() over the
+body in 64 KB chunks into iter_listings(). Each run happens in a fresh
+subprocess, so peak RSS (ru_maxrss) belongs to that parser alone; the
+"base" column is the RSS right after imports, before any parsing.
+
+Without arguments, two READMEs are synthesised per size: a Simplify-style
+HTML table document (h2 sections, ↳ sub-rows, 🔒 closed rows, two links per
+apply cell) and a pipe-table document in the zapplyjobs/speedyapply shape.
+"""
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import logging
+import argparse
+import resource
+import subprocess
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SECTIONS = ["💻 Software Engineering Internship Roles", "🤖 Data Science, AI & Machine Learning Internship Roles",
+            "📈 Quantitative Finance Internship Roles", "🔧 Hardware Engineering Internship Roles"]
+ROLES = ["Software Engineer Intern", "Backend Engineering Intern", "Machine Learning Intern",
+         "Data Science Intern - Summer 2026", "Quant Research Intern", "Firmware Engineer Co-op",
+         "Full Stack Developer Intern (Remote)", "Security Engineering Intern"]
+CITIES = ["New York, NY", "San Francisco, CA", "Seattle, WA", "Austin, TX", "Remote in USA",
+          "Boston, MA", "Chicago, IL", "</br>Toronto, ON</br>Remote in Canada"]
+
+
+def synthetic_html(rows, seed=5):
+    rng = random.Random(seed)
+    out = ["# Summer 2026 Tech Internships", "", "Use this repo to share and keep track of internships.", ""]
+    per_section = max(rows // len(SECTIONS), 1)
+    n = 0
+    for section in SECTIONS:
+        out += [f"## {section}", "", "<table>", "<thead>", "<tr>",
+                "<th>Company</th>", "<th>Role</th>", "<th>Location</th>", "<th>Application</th>", "<th>Age</th>",
+                "</tr>", "</thead>", "<tbody>"]
+        for _ in range(per_section):
+            n += 1
+            sub = n > 1 and rng.random() < 0.25
+            company = "↳" if sub else f'<strong><a href="https://simplify.jobs/c/Company{n}">Company{n}</a></strong>'
+            closed = rng.random() < 0.2
+            apply = "🔒" if closed else (
+                f'<div align="center"><a href="https://jobs.lever.co/company{n}/{n:08x}?utm_source=Simplify">'
+                f'<img src="https://i.imgur.com/u1KNU8z.png" width="118" alt="Apply"></a> '
+                f'<a href="https://simplify.jobs/p/{n:08x}?utm_source=GHList">'
+                f'<img src="https://i.imgur.com/aVnQdox.png" width="30" alt="Simplify"></a></div>'
+            )
+            out += ["<tr>", f"<td>{company}</td>", f"<td>{rng.choice(ROLES)} 🛂</td>",
+                    f"<td>{rng.choice(CITIES)}</td>", f"<td>{apply}</td>", f"<td>{rng.randint(0, 120)}d</td>", "</tr>"]
+        out += ["</tbody>", "</table>", "", "[⬆️ Back to Top ⬆️](#summer-2026-tech-internships)", ""]
+    return "\n".join(out) + "\n"
+
+
+def synthetic_markdown(rows, seed=6):
+    rng = random.Random(seed)
+    out = ["# 2026 New Grad Positions", "", "| Company | Role | Location | Posted | Visa | **Apply** |",
+           "|---|---|---|---|---|---|"]
+    for n in range(1, rows + 1):
+        company = "↳" if n > 1 and rng.random() < 0.25 else f"**Company{n}**"
+        link = f'<a href="https://boards.greenhouse.io/company{n}/jobs/{n}"><img src="x.png" alt="Apply"></a>'
+        if rng.random() < 0.15:
+            link = "🔒 Closed"
+        out.append(f"| {company} | {rng.choice(ROLES)} | {rng.choice(CITIES)} | {rng.randint(0, 60)}d | "
+                   f"{rng.choice(['✅', '❌ No Sponsor', ''])} | {link} |")
+    return "\n".join(out) + "\n"
+
+
+def _maxrss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024  # bytes on macOS, KB on Linux
+
+
+class _FileResponse:
+    """Just enough of requests.Response for _response_lines()."""
+
+    def __init__(self, path):
+        self.path = path
+        self.encoding = "utf-8"
+
+    def iter_content(self, chunk_size, decode_unicode=True):
+        with open(self.path, encoding=self.encoding, newline="") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+
+def _worker(mode, path):
+    logging.disable(logging.CRITICAL)
+    from aggregator.extractors import SimplifyGitHubScraper, _response_lines
+    from aggregator.listing_stream import iter_listings
+    base = _maxrss_mb()
+    start = time.perf_counter()
+    if mode == "document":
+        with open(path, encoding="utf-8", newline="") as f:
+            text = f.read()
+        jobs = SimplifyGitHubScraper._parse(text, "bench")
+    else:
+        jobs = list(iter_listings(_response_lines(_FileResponse(path)), "bench"))
+    sec = time.perf_counter() - start
+    digest = hashlib.sha1(json.dumps(jobs, sort_keys=True).encode()).hexdigest()
+    print(json.dumps({"sec": sec, "base_mb": base, "rss_mb": _maxrss_mb(), "jobs": len(jobs), "digest": digest}))
+
+
+def _run(mode, path, repeat):
+    best = None
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), "--worker", mode, path],
+                             capture_output=True, text=True, check=True).stdout
+        r = json.loads(out.strip().splitlines()[-1])
+        if best is None or r["sec"] < best["sec"]:
+            best = r
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("files", nargs="*", help="saved README files (default: synthetic)")
+    parser.add_argument("--rows", type=int, nargs="+", default=[2_000, 10_000, 20_000])
+    parser.add_argument("--repeat", type=int, default=1, help="runs per parser; the fastest is shown")
+    parser.add_argument("--worker", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        _worker(*args.worker)
+        return
+
+    tmp = tempfile.TemporaryDirectory()
+    docs = [(os.path.basename(p), p) for p in args.files]
+    if not docs:
+        for rows in args.rows:
+            for kind, build in (("html", synthetic_html), ("markdown", synthetic_markdown)):
+                path = os.path.join(tmp.name, f"{kind}_{rows}.md")
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(build(rows))
+                docs.append((f"{kind} x{rows}", path))
+
+    print(f"{'document':<18} {'MB':>6} {'jobs':>7}  {'doc s':>7} {'stream s':>8} {'speedup':>7}  "
+          f"{'base MB':>7} {'doc peak MB':>11} {'stream peak MB':>14}  same")
+    for label, path in docs:
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        doc = _run("document", path, args.repeat)
+        stream = _run("stream", path, args.repeat)
+        same = "yes" if doc["digest"] == stream["digest"] else f"NO ({doc['jobs']} vs {stream['jobs']})"
+        print(f"{label:<18} {size_mb:>6.1f} {stream['jobs']:>7}  {doc['sec']:>7.2f} {stream['sec']:>8.2f} "
+              f"{doc['sec'] / max(stream['sec'], 1e-9):>6.1f}x  {stream['base_mb']:>7.0f} "
+              f"{doc['rss_mb']:>11.0f} {stream['rss_mb']:>14.0f}  {same}")
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Benchmark the compiled restriction rule engine against the old per-pattern
+re.search loops, and check both reach the same decisions.
+
+    python3 scripts/bench_restriction_rules.py                  # synthetic corpus
+    python3 scripts/bench_restriction_rules.py path/to/pages/   # saved *.html pages
+    python3 scripts/bench_restriction_rules.py --pages 2000 --repeat 3
+
+"Legacy" runs every rule the way the _check_* passes used to: re.search with
+the pattern string, in list order, no prefilter. "Engine" is scan_page().
+Both feed the same check functions, so any decision mismatch is printed.
+
+Without a corpus directory, pages are synthesised: filler job-description
+text plus random strings generated from the rule patterns themselves (so
+every category actually fires), mixed-case and with a few non-ASCII
+characters thrown in.
+"""
+import os
+import re
+import sys
+import glob
+import time
+import random
+import logging
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from re import _parser as sre_parse, _constants as sre_const
+except ImportError:  # Python < 3.11
+    import sre_parse
+    import sre_constants as sre_const
+
+from bs4 import BeautifulSoup
+
+from aggregator import processors
+from aggregator.processors import ValidationHelper
+from aggregator.page_document import PageDocument
+from aggregator.restriction_rules import RESTRICTION_RULES, RuleHit, RuleScan, scan_page
+
+FILLER = (
+    "We are looking for a Software Engineering Intern to join our platform team. "
+    "You will design services, write tests and ship features used by millions. "
+    "Qualifications: currently pursuing a degree in Computer Science or a related field. "
+    "Benefits include housing, mentorship and a final presentation to leadership — "
+    "our résumé review takes about two weeks. "
+)
+EXTRAS = [
+    "master's degree", "export control", "we support cpt", "computer science",
+    "İTAR", "ſtudent", "naïve façade", "qualifications", "requirements",
+    "between 2025 and 2028 graduation", "class of 2028", "Boston, MA",
+]
+
+
+class _LazyHits:
+    """Hits produced on demand, so a check that stops at its first hit only
+    pays for the patterns before it — as the old loops did."""
+
+    def __init__(self, gen):
+        self._gen, self._seen = gen, []
+
+    def __iter__(self):
+        yield from self._seen
+        for hit in self._gen:
+            self._seen.append(hit)
+            yield hit
+
+    def __bool__(self):
+        return any(True for _ in self)
+
+
+class LegacyScan(RuleScan):
+    """Hits computed like the old loops: uncompiled re.search per pattern."""
+
+    def hits(self, category):
+        cached = self._hits.get(category)
+        if cached is None:
+            cached = self._hits[category] = _LazyHits(
+                RuleHit(rule, m)
+                for rule in self._rule_set.rules(category)
+                for m in [re.search(rule.pattern, self.text, rule.regex.flags)]
+                if m
+            )
+        return cached
+
+
+def legacy_scan_page(page, n=processors.PAGE_TEXT_FULL_SCAN):
+    page = PageDocument.of(page)
+    return page.memo(("legacy_scan", n), lambda: LegacyScan(RESTRICTION_RULES, page.lower_prefix(n)))
+
+
+def _generate(items, rng):
+    """A random string matching the parsed regex (best effort; anchors ignored)."""
+    out = []
+    for op, av in items:
+        if op is sre_const.LITERAL:
+            out.append(chr(av))
+        elif op is sre_const.NOT_LITERAL:
+            out.append("x" if av != ord("x") else "y")
+        elif op is sre_const.ANY:
+            out.append(rng.choice(" abc"))
+        elif op is sre_const.IN:
+            choices = []
+            for sub_op, sub_av in av:
+                if sub_op is sre_const.LITERAL:
+                    choices.append(chr(sub_av))
+                elif sub_op is sre_const.RANGE:
+                    choices.append(chr(rng.randint(*sub_av)))
+                elif sub_op is sre_const.CATEGORY:
+                    choices.append({sre_const.CATEGORY_DIGIT: "7", sre_const.CATEGORY_WORD: "w"}.get(sub_av, " "))
+            out.append(rng.choice(choices) if choices else " ")
+        elif op is sre_const.BRANCH:
+            out.append(_generate(rng.choice(av[1]), rng))
+        elif op is sre_const.SUBPATTERN:
+            out.append(_generate(av[-1], rng))
+        elif op in (sre_const.MAX_REPEAT, sre_const.MIN_REPEAT):
+            lo, hi, sub = av
+            out.append("".join(_generate(sub, rng) for _ in range(rng.randint(lo, min(hi, lo + 2)))))
+    return "".join(out)
+
+
+def synthetic_corpus(n_pages, seed=7):
+    rng = random.Random(seed)
+    patterns = [r.pattern for c in RESTRICTION_RULES.categories for r in RESTRICTION_RULES.rules(c)]
+    filler = FILLER * 30
+    pages = []
+    for _ in range(n_pages):
+        parts = [filler[: rng.randint(len(filler) // 4, len(filler))]]
+        for _ in range(rng.randint(0, 3)):
+            phrase = _generate(sre_parse.parse(rng.choice(patterns)).data, rng)
+            parts.insert(rng.randint(0, len(parts)), phrase.title() if rng.random() < 0.4 else phrase)
+        for _ in range(rng.randint(0, 2)):
+            parts.insert(rng.randint(0, len(parts)), rng.choice(EXTRAS))
+        pages.append(f"<html><body><div class='job-description'>{' . '.join(parts)}</div></body></html>")
+    return pages
+
+
+def load_corpus(directory):
+    pages = []
+    for path in sorted(glob.glob(os.path.join(directory, "**", "*.htm*"), recursive=True)):
+        with open(path, encoding="utf-8", errors="replace") as f:
+            pages.append(f.read())
+    return pages
+
+
+def _run(soups, scanner):
+    processors.scan_page = scanner
+    decisions = []
+    start = time.perf_counter()
+    for soup in soups:
+        decisions.append(ValidationHelper.check_page_restrictions(PageDocument(soup))[:2])
+    return time.perf_counter() - start, decisions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("corpus", nargs="?", help="directory of saved job pages (*.html)")
+    parser.add_argument("--pages", type=int, default=1000, help="synthetic pages when no corpus is given")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    html = load_corpus(args.corpus) if args.corpus else synthetic_corpus(args.pages)
+    if not html:
+        sys.exit(f"No pages found under {args.corpus}")
+    soups = [BeautifulSoup(h, "html.parser") for h in html]
+    print(f"{len(soups)} pages, {len(RESTRICTION_RULES)} rules in {len(RESTRICTION_RULES.categories)} categories")
+
+    # Per-category hits must agree rule for rule, match for match
+    hit_mismatches = 0
+    for soup in soups:
+        text = PageDocument(soup).lower_prefix(processors.PAGE_TEXT_FULL_SCAN)
+        engine, legacy = RESTRICTION_RULES.scan(text), LegacyScan(RESTRICTION_RULES, text)
+        for category in RESTRICTION_RULES.categories:
+            a = [(h.pattern, h.match.span()) for h in engine.hits(category)]
+            b = [(h.pattern, h.match.span()) for h in legacy.hits(category)]
+            hit_mismatches += a != b
+
+    legacy_best = engine_best = float("inf")
+    try:
+        for _ in range(args.repeat):
+            legacy_sec, legacy_decisions = _run(soups, legacy_scan_page)
+            engine_sec, engine_decisions = _run(soups, scan_page)
+            legacy_best = min(legacy_best, legacy_sec)
+            engine_best = min(engine_best, engine_sec)
+    finally:
+        processors.scan_page = scan_page
+
+    mismatches = [(i, a, b) for i, (a, b) in enumerate(zip(legacy_decisions, engine_decisions)) if a != b]
+    rejected = sum(1 for d in engine_decisions if d[0] == "REJECT")
+    n = len(soups)
+
+    print(f"Rejected: {rejected}/{n}")
+    print(f"Legacy re.search loops: {legacy_best:.2f}s  ({legacy_best / n * 1000:.2f} ms/page)")
+    print(f"Compiled rule engine:   {engine_best:.2f}s  ({engine_best / n * 1000:.2f} ms/page)")
+    print(f"Speedup: {legacy_best / engine_best:.1f}x")
+    print(f"Hit-list mismatches: {hit_mismatches}   Decision mismatches: {len(mismatches)}")
+    for i, a, b in mismatches[:10]:
+        print(f"  page {i}: legacy={a} engine={b}")
+    return 1 if (mismatches or hit_mismatches) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark TitleSimilarity queries against the old full-scan implementation
+at growing index sizes, and check both return the same matches.
+
+    python3 scripts/bench_title_similarity.py                      # 10k, 50k, 200k
+    python3 scripts/bench_title_similarity.py --sizes 5000 20000 --queries 500
+
+"Full scan" is what find_similar used to do: rebuild the IDF table after
+every add, then recompute and compare the TF-IDF vector of every stored
+title. "Indexed" is the current engine. Queries follow the aggregator's
+dedup pattern (UnifiedJobAggregator._is_duplicate): is_near_duplicate at
+0.90 within the job's company, then add() the title, so every query sees an
+index that has just changed. A second pass runs the same queries with no
+company filter at threshold 0.7.
+
+Titles are synthesised from intern-posting vocabulary; the full scan only
+runs a sample of the queries at large sizes (see --legacy-queries).
+"""
+import os
+import sys
+import math
+import time
+import random
+import logging
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics.similarity import SimilarityMatch, TitleSimilarity
+
+SENIORITY = ["", "", "Summer 2026", "Fall 2026", "Spring 2027", "2026", "Co-op", "PhD", "Graduate", "Undergraduate"]
+AREAS = [
+    "Software", "Software Engineering", "Backend", "Frontend", "Full Stack", "Machine Learning",
+    "ML", "Data Science", "Data Engineering", "Research", "Security", "Infrastructure", "Platform",
+    "Mobile", "iOS", "Android", "Embedded", "Firmware", "Quantitative", "Cloud", "DevOps", "SRE",
+    "Computer Vision", "NLP", "Robotics", "Hardware", "Distributed Systems", "Product",
+]
+ROLES = ["Engineer", "Engineering", "Developer", "Scientist", "Analyst", "Researcher"]
+SUFFIXES = ["Intern", "Internship", "Intern", "- Intern", "Co-op", "Intern (Remote)"]
+TEAMS = ["", "", "", "Payments", "Ads", "Search", "Maps", "Core", "Growth", "Storage", "AI Platform", "Risk"]
+
+
+def synthetic_titles(n, seed=11):
+    rng = random.Random(seed)
+    companies = [f"Company{i}" for i in range(max(n // 40, 50))]
+    out = []
+    for i in range(n):
+        parts = [rng.choice(SENIORITY), rng.choice(AREAS), rng.choice(ROLES), rng.choice(SUFFIXES)]
+        team = rng.choice(TEAMS)
+        if team:
+            parts.append(f"- {team}")
+        if rng.random() < 0.3:
+            parts.append(f"R{rng.randint(1000, 99999)}")
+        out.append((" ".join(p for p in parts if p), rng.choice(companies)))
+    return out
+
+
+class FullScan(TitleSimilarity):
+    """The pre-index find_similar: dirty-flag IDF and a pass over every document."""
+
+    def __init__(self):
+        super().__init__()
+        self._idf_cache = {}
+        self._dirty = True
+
+    def add(self, title, job_id="", company=""):
+        super().add(title, job_id, company)
+        self._dirty = True
+
+    def _legacy_vector(self, tokens):
+        if self._dirty:
+            n = len(self._documents)
+            self._idf_cache = {t: math.log((n + 1) / (df + 1)) + 1 for t, df in self._df.items()}
+            self._dirty = False
+        return {t: f * self._idf_cache.get(t, 1.0) for t, f in self._tf(tokens).items()}
+
+    def find_similar(self, title, threshold=0.7, max_results=5, same_company=""):
+        tokens = self._tokenize(title)
+        if not tokens:
+            return []
+        q = self._legacy_vector(tokens)
+        matches = []
+        for doc in self._documents:
+            if same_company and doc["company"].lower() != same_company.lower():
+                continue
+            score = self._cosine_similarity(q, self._legacy_vector(doc["tokens"]))
+            if score >= threshold:
+                matches.append(SimilarityMatch(doc["title"], round(score, 4), doc["job_id"], doc["company"]))
+        matches.sort(key=lambda m: -m.score)
+        return matches[:max_results]
+
+
+def _time_dedup(engine, queries):
+    """_is_duplicate's pattern: near-duplicate check within company, then add."""
+    results = []
+    start = time.perf_counter()
+    for title, company in queries:
+        m = engine.find_similar(title, threshold=0.90, max_results=1, same_company=company)
+        results.append([(x.title, x.score) for x in m])
+        engine.add(title, company=company)
+    return time.perf_counter() - start, results
+
+
+def _time_open(engine, queries):
+    results = []
+    start = time.perf_counter()
+    for title, _ in queries:
+        m = engine.find_similar(title, threshold=0.7)
+        results.append([(x.title, x.score) for x in m])
+    return time.perf_counter() - start, results
+
+
+def _build(cls, titles):
+    engine = cls()
+    for title, company in titles:
+        engine.add(title, company=company)
+    return engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 50_000, 200_000])
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--legacy-queries", type=int, default=50,
+                        help="queries timed on the full scan (it is O(N) per query)")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    print(f"{'titles':>8}  {'mode':<12} {'full scan ms/q':>15} {'indexed ms/q':>13} {'speedup':>8}  mismatches")
+    for size in args.sizes:
+        titles = synthetic_titles(size + args.queries)
+        stored, queries = titles[:size], titles[size:]
+        legacy_q = queries[:args.legacy_queries]
+
+        for mode, timer in (("dedup@0.90", _time_dedup), ("open@0.70", _time_open)):
+            indexed = _build(TitleSimilarity, stored)
+            legacy = _build(FullScan, stored)
+            # Same sample on both engines for the correctness check and a fair ms/query
+            legacy_sec, legacy_res = timer(legacy, legacy_q)
+            sample_sec, indexed_res = timer(indexed, legacy_q)
+            rest_sec, _ = timer(indexed, queries[len(legacy_q):])
+            mismatches = sum(a != b for a, b in zip(legacy_res, indexed_res))
+            legacy_ms = legacy_sec / max(len(legacy_q), 1) * 1000
+            indexed_ms = (sample_sec + rest_sec) / max(len(queries), 1) * 1000
+            print(f"{size:>8}  {mode:<12} {legacy_ms:>15.2f} {indexed_ms:>13.3f} "
+                  f"{legacy_ms / max(indexed_ms, 1e-9):>7.0f}x  {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
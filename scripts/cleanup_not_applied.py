@@ -9,12 +9,18 @@ ENHANCED: Moves expired jobs (blank status, 3+ days old) to Reviewed sheet.
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
 import datetime
-import time
 import os
 import shutil
 import subprocess
+import sys
 from pathlib import Path
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aggregator.sheet_mirror import invalidate_sheets
+from aggregator.row_deletion import delete_rows
+from aggregator.sheets_client import authorize
+from outreach.sheet_writer import SheetWriteBuffer
+
 SHEET_NAME = "H1B visa"
 WORKSHEET_NAME = "Valid Entries"
 REVIEWED_WORKSHEET = "Reviewed - Not Applied"
@@ -61,6 +67,17 @@ class ManualCleanup:
 
     STATUS_VALUES = list(STATUS_COLORS.keys())
 
+    CELL_FORMAT = {
+        "horizontalAlignment": "CENTER",
+        "verticalAlignment": "MIDDLE",
+        "textFormat": {"fontFamily": "Times New Roman", "fontSize": 13},
+    }
+    # Leaves status colors and link runs alone when re-formatting one cell
+    CELL_FORMAT_FIELDS = (
+        "userEnteredFormat.horizontalAlignment,userEnteredFormat.verticalAlignment,"
+        "userEnteredFormat.textFormat.fontFamily,userEnteredFormat.textFormat.fontSize"
+    )
+
     # Statuses that are PROTECTED - never moved regardless of age
     PROTECTED_STATUSES = {
         "Applied",
@@ -87,7 +104,6 @@ class ManualCleanup:
                     "dimension": "ROWS",
                     "length": needed
                 }}]})
-                import time; time.sleep(2)
                 log.info(f"Auto-expanded {ws.title}: +{needed} rows (was {available} buffer)")
                 print(f"  ✓ Auto-expanded {ws.title}: +{needed} rows")
 
@@ -123,7 +139,6 @@ class ManualCleanup:
                         }
                     }
                 ]})
-                import time; time.sleep(1)
         except Exception as e:
             log.debug(f"Sheet capacity check failed: {e}")
 
@@ -133,7 +148,7 @@ class ManualCleanup:
             "https://www.googleapis.com/auth/drive",
         ]
         creds = ServiceAccountCredentials.from_json_keyfile_name(CREDS_FILE, scope)
-        client = gspread.authorize(creds)
+        client = authorize(creds)
 
         self.spreadsheet = client.open(SHEET_NAME)
         self.sheet = self.spreadsheet.worksheet(WORKSHEET_NAME)
@@ -144,7 +159,6 @@ class ManualCleanup:
             from outreach.outreach_config import C, OUTREACH_TAB
             from outreach.outreach_data import _pad
             ows = self.spreadsheet.worksheet(OUTREACH_TAB)
-            time.sleep(1)
             odata = ows.get_all_values()
             for row in odata[1:]:
                 row = _pad(row)
@@ -169,12 +183,10 @@ class ManualCleanup:
             current_cols = len(self.reviewed_sheet.row_values(1))
             if current_cols < 12:
                 self.reviewed_sheet.resize(rows=1000, cols=12)
-                time.sleep(2)
 
             headers = self.reviewed_sheet.row_values(1)
             if "Sponsorship" not in headers:
                 self.reviewed_sheet.update_cell(1, 12, "Sponsorship")
-                time.sleep(1)
                 self._format_headers(self.reviewed_sheet)
 
         except gspread.exceptions.WorksheetNotFound:
@@ -344,6 +356,8 @@ class ManualCleanup:
                     entry_date = self._get_cell(row, 11)
                     print(f"  → {company} (added {entry_date})")
 
+                # Rows move between sheets — the local mirror must re-download both
+                invalidate_sheets(self.sheet, self.reviewed_sheet)
                 self._move_to_reviewed(expired_rows, reason="Expired: 2+ days")
                 self._repopulate_main_sheet(all_data, remaining_rows)
 
@@ -421,6 +435,7 @@ class ManualCleanup:
                 print(
                     f"Moving {len(not_applied_rows)} jobs, keeping {len(remaining_rows)}"
                 )
+                invalidate_sheets(self.sheet, self.reviewed_sheet)
                 self._move_to_reviewed(
                     not_applied_rows, reason="Does not match profile"
                 )
@@ -472,7 +487,6 @@ class ManualCleanup:
                 f"  Expanding Reviewed sheet: {total_rows} → {new_total} rows ({available_rows} available < 250 threshold)"
             )
             self.reviewed_sheet.resize(rows=new_total)
-            time.sleep(2)
             print(f"  ✓ Reviewed sheet now has {1000 + available_rows} available rows")
 
         # DEDUP GUARD: skip jobs already in the Reviewed tab.
@@ -530,7 +544,6 @@ class ManualCleanup:
         self.reviewed_sheet.update(
             values=reviewed_rows, range_name=range_name, value_input_option="RAW"
         )
-        time.sleep(2)
 
         self.reviewed_sheet.format(
             range_name,
@@ -546,9 +559,45 @@ class ManualCleanup:
         )
 
     def _repopulate_main_sheet(self, all_data, remaining_rows):
+        """Make Valid Entries hold exactly remaining_rows, renumbered.
+
+        remaining_rows is a filtered copy of all_data[1:], so the dropped rows
+        are deleted in place (one batched deleteDimension request). The kept
+        rows move up with their formatting, hyperlinks, dropdowns and search
+        link formulas intact. Only the Sr. No. cells that no longer match the
+        row's position are written, in one values request plus one format
+        request. Other cells are never rewritten, so user edits survive.
+        """
+        kept, pos = set(), 1
+        for row in remaining_rows:
+            while pos < len(all_data) and all_data[pos] is not row:
+                pos += 1
+            if pos == len(all_data):
+                print("  Kept rows are not in sheet order - rewriting the whole table")
+                return self._rewrite_main_sheet(all_data, remaining_rows)
+            kept.add(pos)
+            pos += 1
+
+        dropped = [i + 1 for i in range(1, len(all_data)) if i not in kept]
+        if dropped:
+            if delete_rows(self.sheet, dropped) != len(dropped):
+                raise RuntimeError(f"could not delete {len(dropped)} rows from {self.sheet.title}")
+
+        writes = SheetWriteBuffer(self.sheet, max_cells=10 ** 6, value_input_option="RAW")
+        renumbered = 0
+        for idx, row in enumerate(remaining_rows, start=1):
+            if self._get_cell(row, 0) != str(idx):
+                writes.set(idx + 1, 0, idx)
+                writes.format(idx + 1, 0, self.CELL_FORMAT, self.CELL_FORMAT_FIELDS)
+                renumbered += 1
+        if not writes.flush():
+            raise RuntimeError(f"could not renumber {renumbered} rows in {self.sheet.title}")
+        print(f"  Valid Entries: {len(dropped)} rows deleted, {renumbered} rows renumbered")
+
+    def _rewrite_main_sheet(self, all_data, remaining_rows):
+        """Full rewrite: clear every data row and write remaining_rows back."""
         if len(all_data) > 1:
             self.sheet.delete_rows(2, len(all_data))
-            time.sleep(2)
 
         if not remaining_rows:
             return
@@ -563,45 +612,34 @@ class ManualCleanup:
         self.sheet.update(
             values=renumbered_rows, range_name=range_name, value_input_option="RAW"
         )
-        time.sleep(2)
 
-        self.sheet.format(
-            range_name,
-            {
-                "horizontalAlignment": "CENTER",
-                "verticalAlignment": "MIDDLE",
-                "textFormat": {"fontFamily": "Times New Roman", "fontSize": 13},
-            },
-        )
-        time.sleep(2)
+        self.sheet.format(range_name, self.CELL_FORMAT)
 
         self._add_hyperlinks(self.sheet, renumbered_rows, 2, url_col_idx=5)
-        self._reconstruct_search_links(self.sheet, renumbered_rows, 2)
+        self._reconstruct_search_links(
+            self.sheet, [(2 + idx, row) for idx, row in enumerate(renumbered_rows)]
+        )
         self._add_status_dropdowns(self.sheet, 2, len(renumbered_rows))
         self._apply_status_colors(self.sheet, 2, 2 + len(renumbered_rows))
 
-    def _reconstruct_search_links(self, sheet, rows_data, start_row):
-        """Reconstruct clickable HYPERLINK formulas for search link entries."""
+    def _reconstruct_search_links(self, sheet, rows):
+        """Reconstruct search-link URLs for the given (row number, row) pairs
+        in one values request."""
         import urllib.parse
-        search_updates = []
-        for idx, row_data in enumerate(rows_data):
+        data = []
+        for row_num, row_data in rows:
             url = self._get_cell(row_data, 5)
             company = self._get_cell(row_data, 2)
             title = self._get_cell(row_data, 3)
             if url and '🔍' in url and company:
                 query = urllib.parse.quote(f"{company} {title} careers apply")
                 formula = f'https://www.google.com/search?q={query}'
-                row_num = start_row + idx
-                search_updates.append((row_num, formula))
-
-        if search_updates:
-            for row_num, formula in search_updates:
-                self.sheet.update(
-                    range_name=f'F{row_num}',
-                    values=[[formula]],
-                    value_input_option='USER_ENTERED'
-                )
-            time.sleep(2)
+                data.append({"range": f"'{sheet.title}'!F{row_num}", "values": [[formula]]})
+
+        if data:
+            self.spreadsheet.values_batch_update(
+                {"valueInputOption": "USER_ENTERED", "data": data}
+            )
 
     def _add_hyperlinks(self, sheet, rows_data, start_row, url_col_idx):
         url_requests = []
@@ -639,7 +677,6 @@ class ManualCleanup:
 
         if url_requests:
             self.spreadsheet.batch_update({"requests": url_requests})
-            time.sleep(2)
 
     def _add_status_dropdowns(self, sheet, start_row, num_rows):
         dropdown_requests = [
@@ -670,7 +707,6 @@ class ManualCleanup:
 
         if dropdown_requests:
             self.spreadsheet.batch_update({"requests": dropdown_requests})
-            time.sleep(2)
 
     def _apply_status_colors(self, sheet, start_row, end_row):
         try:
@@ -727,7 +763,6 @@ class ManualCleanup:
             for i in range(0, len(color_requests), 20):
                 batch = color_requests[i : i + 20]
                 self.spreadsheet.batch_update({"requests": batch})
-                time.sleep(1)
 
         except Exception as _e:
             pass  # suppressed: use log.debug(_e) to investigate
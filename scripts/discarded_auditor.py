@@ -17,10 +17,16 @@ import json
 import logging
 import os
 import re
-import time
+import sys
 from datetime import datetime, timedelta
 from google.oauth2.service_account import Credentials
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from outreach.brain_store import open_store
+from aggregator.sheet_mirror import invalidate_sheets, read_sheets
+from aggregator.row_deletion import delete_rows
+from aggregator.sheets_client import authorize
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(message)s")
 log = logging.getLogger(__name__)
 
@@ -80,17 +86,14 @@ class BrainConnector:
 
     def _load(self):
         try:
-            if os.path.exists(BRAIN_FILE):
-                with open(BRAIN_FILE, "r") as f:
-                    return json.load(f)
+            return open_store(BRAIN_FILE).load()
         except Exception:
             pass
         return {}
 
     def _save(self):
         try:
-            with open(BRAIN_FILE, "w") as f:
-                json.dump(self.brain, f, indent=2)
+            open_store(BRAIN_FILE).save(self.brain)
         except Exception:
             pass
 
@@ -160,7 +163,7 @@ class DiscardedAuditor:
         scopes = ["https://www.googleapis.com/auth/spreadsheets",
                   "https://www.googleapis.com/auth/drive"]
         creds = Credentials.from_service_account_file(CREDS_FILE, scopes=scopes)
-        gc = gspread.authorize(creds)
+        gc = authorize(creds)
         self.ss = gc.open(SHEET_NAME)
         self.discarded = self.ss.worksheet("Discarded Entries")
         self.valid = self.ss.worksheet("Valid Entries")
@@ -186,6 +189,9 @@ class DiscardedAuditor:
         if rescued:
             self._rescue_jobs(rescued)
 
+        if duplicates or rescued:
+            invalidate_sheets(self.discarded, self.valid)
+
         # Step 5: Report brain stats
         self._report_brain_stats()
 
@@ -194,7 +200,7 @@ class DiscardedAuditor:
     def _learn_from_user_behavior(self):
         """Learn from what the user applies to."""
         log.info("\n--- Learning from user behavior ---")
-        valid_data = self.valid.get_all_values()
+        valid_data = read_sheets(self.ss, [self.valid])[0]
 
         applied_companies = set()
         applied_titles = []
@@ -367,7 +373,7 @@ class DiscardedAuditor:
     def _rescue_jobs(self, rescued):
         """Move rescued jobs back to Valid Entries."""
         log.info("\n--- Rescuing false positives ---")
-        valid_data = self.valid.get_all_values()
+        valid_data = read_sheets(self.ss, [self.valid])[0]
         existing_keys = set()
         for row in valid_data[1:]:
             if len(row) > 3:
@@ -414,26 +420,10 @@ class DiscardedAuditor:
 
         # Delete rescued rows from discarded
         rescued_rows = sorted([r[0] for r in rescued], reverse=True)
-        self._delete_rows_safe(self.discarded, rescued_rows)
+        self._delete_rows(self.discarded, rescued_rows)
 
     def _delete_rows(self, sheet, row_nums):
-        for r in sorted(row_nums, reverse=True):
-            try:
-                sheet.delete_rows(r)
-                time.sleep(0.4)
-            except Exception:
-                pass
-
-    def _delete_rows_safe(self, sheet, row_nums):
-        """Delete rows with retry."""
-        for r in sorted(row_nums, reverse=True):
-            for attempt in range(3):
-                try:
-                    sheet.delete_rows(r)
-                    time.sleep(0.5)
-                    break
-                except Exception:
-                    time.sleep(2)
+        return delete_rows(sheet, row_nums)
 
     def _report_brain_stats(self):
         """Report what brain has learned."""
@@ -6,11 +6,13 @@ Designed to catch silent bugs within hours, not days.
 """
 import os
 import re
+import sys
 import json
 import logging
 import datetime
 
 BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE)
 LOG_FILE = os.path.join(BASE, ".local", "skipped_jobs.log")
 HEALTH_FILE = os.path.join(BASE, ".local", "health_state.json")
 HEALTH_LOG = os.path.join(BASE, ".local", "health_alerts.log")
@@ -208,9 +210,8 @@ def check_health():
 
     # CHECK 7: ATS discovery producing companies?
     try:
-        import json as _json
-        b = _json.load(open(os.path.join(BASE, ".local", "brain.json")))
-        disc = b.get("discovered_ats", {})
+        from outreach.brain_store import open_store
+        disc = open_store(os.path.join(BASE, ".local", "brain.json")).namespace("discovered_ats") or {}
         total_disc = sum(len(v) for v in disc.values() if isinstance(v, dict))
         if total_disc < 20:
             alerts.append(
@@ -37,12 +37,9 @@ def _get_token():
 def _source_quality_stats():
     """Get source quality rates from brain.json."""
     try:
-        import json
-        brain_path = os.path.join(_LOCAL, "brain.json")
-        if not os.path.exists(brain_path):
-            return {}
-        b = json.load(open(brain_path))
-        sq = b.get("aggregator", {}).get("source_quality", {})
+        from outreach.brain_store import open_store
+        agg = open_store(os.path.join(_LOCAL, "brain.json")).namespace("aggregator") or {}
+        sq = agg.get("source_quality", {})
         result = {}
         for src, data in sq.items():
             if isinstance(data, dict) and data.get("runs", 0) >= 2:
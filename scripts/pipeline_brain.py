@@ -18,19 +18,21 @@ INTELLIGENCE LAYERS:
 10. QUALITY SCORING — rates every job based on how similar it is to your applied jobs
 """
 
-import json
 import logging
 import os
 import re
+import sys
 import time
 from datetime import datetime, timedelta
 from collections import Counter
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from outreach.brain_store import open_store
+
 log = logging.getLogger(__name__)
 BRAIN_FILE = os.path.join(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
     ".local", "brain.json")
-BRAIN_LOCK = BRAIN_FILE + ".lock"
 
 
 class PipelineBrain:
@@ -50,9 +52,7 @@ class PipelineBrain:
     
     def _load(self):
         try:
-            if os.path.exists(BRAIN_FILE):
-                with open(BRAIN_FILE) as f:
-                    return json.load(f)
+            return open_store(BRAIN_FILE).load()
         except Exception:
             pass
         return {}
@@ -61,24 +61,9 @@ class PipelineBrain:
         if not self._dirty:
             return
         try:
-            os.makedirs(os.path.dirname(BRAIN_FILE), exist_ok=True)
-            import fcntl, tempfile
-            with open(BRAIN_LOCK, "w") as _lk:
-                fcntl.flock(_lk, fcntl.LOCK_EX)
-                disk = {}
-                if os.path.exists(BRAIN_FILE):
-                    try:
-                        with open(BRAIN_FILE) as _f:
-                            disk = json.load(_f)
-                    except Exception:
-                        disk = {}
-                disk.update(self.data)
-                _fd, _tmp = tempfile.mkstemp(dir=os.path.dirname(BRAIN_FILE), suffix=".tmp")
-                with os.fdopen(_fd, "w") as _f:
-                    json.dump(disk, _f, indent=2)
-                os.replace(_tmp, BRAIN_FILE)
-                self.data = disk
-                fcntl.flock(_lk, fcntl.LOCK_UN)
+            # Merges with what's on disk: our top-level keys win, keys other
+            # writers added survive. On brain.db only changed rows are written.
+            open_store(BRAIN_FILE).save(self.data)
             self._dirty = False
         except Exception as e:
             log.error(f"Brain save failed: {e}")
@@ -370,7 +355,7 @@ class PipelineBrain:
             "ats_discovered": total_discovered,
             "source_quality": {k: round(v.get("quality_ratio", 0), 2) for k, v in source_quality.items()},
             "preferred_roles": self.get_preferred_role_types(),
-            "brain_size_kb": os.path.getsize(BRAIN_FILE) // 1024 if os.path.exists(BRAIN_FILE) else 0,
+            "brain_size_kb": open_store(BRAIN_FILE).size_bytes() // 1024,
         }
         return report
     
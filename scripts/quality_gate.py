@@ -25,11 +25,16 @@ import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import re
-import time
 import urllib.parse
 from datetime import datetime
 from google.oauth2.service_account import Credentials
 
+from outreach.brain_store import open_store
+from aggregator.sheet_mirror import invalidate_sheets
+from aggregator.row_deletion import delete_rows
+from aggregator.sheets_client import authorize
+from outreach.sheet_writer import SheetWriteBuffer
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(message)s")
 log = logging.getLogger(__name__)
 
@@ -38,7 +43,6 @@ SHEET_NAME = "H1B visa"
 BRAIN_FILE = os.path.join(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
     ".local", "brain.json")
-BRAIN_LOCK = BRAIN_FILE + ".lock"
 QUALITY_LOG = ".local/quality_log.json"
 
 
@@ -49,32 +53,14 @@ class Brain:
 
     def _load(self):
         try:
-            if os.path.exists(BRAIN_FILE):
-                with open(BRAIN_FILE) as f:
-                    return json.load(f)
+            return open_store(BRAIN_FILE).load()
         except Exception:
             pass
         return {}
 
     def save(self):
-        os.makedirs(os.path.dirname(BRAIN_FILE), exist_ok=True)
-        import fcntl, tempfile
-        with open(BRAIN_LOCK, "w") as _lk:
-            fcntl.flock(_lk, fcntl.LOCK_EX)
-            disk = {}
-            if os.path.exists(BRAIN_FILE):
-                try:
-                    with open(BRAIN_FILE) as _f:
-                        disk = json.load(_f)
-                except Exception:
-                    disk = {}
-            disk.update(self.data)
-            _fd, _tmp = tempfile.mkstemp(dir=os.path.dirname(BRAIN_FILE), suffix=".tmp")
-            with os.fdopen(_fd, "w") as _f:
-                json.dump(disk, _f, indent=2)
-            os.replace(_tmp, BRAIN_FILE)
-            self.data = disk
-            fcntl.flock(_lk, fcntl.LOCK_UN)
+        # Our top-level keys win, keys other writers added survive
+        open_store(BRAIN_FILE).save(self.data)
 
     def add_slug_fix(self, slug, correct):
         if "learned_slugs" not in self.data:
@@ -128,13 +114,15 @@ class QualityGate:
         scopes = ["https://www.googleapis.com/auth/spreadsheets",
                   "https://www.googleapis.com/auth/drive"]
         creds = Credentials.from_service_account_file(CREDS_FILE, scopes=scopes)
-        gc = gspread.authorize(creds)
+        gc = authorize(creds)
         ss = gc.open(SHEET_NAME)
         self.valid = ss.worksheet("Valid Entries")
         self.discarded = ss.worksheet("Discarded Entries")
         self.brain = Brain()
         self.fixes = 0
         self.deletes = 0
+        # Cell fixes are coalesced and sent in one request before any delete
+        self.writes = SheetWriteBuffer(self.valid)
 
     def run(self, check_last_n=100):
         """Run all quality checks on recent rows."""
@@ -205,22 +193,17 @@ class QualityGate:
             if (not job_id or job_id == "N/A") and url and 'http' in url:
                 extracted = self._extract_job_id_from_url(url)
                 if extracted:
-                    self.valid.update_cell(row_num, 7, extracted)
+                    self.writes.set(row_num, 6, extracted)
                     log.info(f"  FIX R{row_num}: {company} job_id → {extracted}")
                     self.fixes += 1
-                    time.sleep(0.3)
 
             # ── CHECK 4: Broken search links ──
             if '🔍' in url and 'HYPERLINK' not in formula:
                 query = urllib.parse.quote(f"{company} {title} careers apply")
                 new_formula = f'=HYPERLINK("https://www.google.com/search?q={query}", "🔍 {company} - Search")'
-                self.valid.update(
-                    range_name=f'F{row_num}', values=[[new_formula]],
-                    value_input_option='USER_ENTERED'
-                )
+                self.writes.set(row_num, 5, new_formula)
                 log.info(f"  FIX R{row_num}: {company} search link → clickable")
                 self.fixes += 1
-                time.sleep(0.3)
 
             # ── CHECK 5: Search link has wrong company name ──
             if '🔍' in url and company:
@@ -234,13 +217,9 @@ class QualityGate:
                         if link_company.lower() != company.lower() and link_company not in company:
                             query = urllib.parse.quote(f"{company} {title} careers apply")
                             new_formula = f'=HYPERLINK("https://www.google.com/search?q={query}", "🔍 {company} - Search")'
-                            self.valid.update(
-                                range_name=f'F{row_num}', values=[[new_formula]],
-                                value_input_option='USER_ENTERED'
-                            )
+                            self.writes.set(row_num, 5, new_formula)
                             log.info(f"  FIX R{row_num}: Search link '{link_company}' → '{company}'")
                             self.fixes += 1
-                            time.sleep(0.3)
 
             # ── CHECK 6: Clearance companies ──
             from aggregator.config import CLEARANCE_COMPANIES
@@ -267,19 +246,17 @@ class QualityGate:
             
             fixed_name = COMPANY_NAME_FIXES.get(co_lower) or learned_slugs.get(co_lower)
             if fixed_name and fixed_name != company:
-                self.valid.update_cell(row_num, 3, fixed_name)
+                self.writes.set(row_num, 2, fixed_name)
                 log.info(f"  FIX R{row_num}: {company} → {fixed_name}")
                 self.fixes += 1
-                time.sleep(0.3)
 
             # ── CHECK 9: Garbage locations ──
             garbage_locs = ["select how often", "opportunity", "where they work",
                           "cover letter", "s as required by law", "unknown"]
             if location.lower() in garbage_locs:
-                self.valid.update_cell(row_num, 9, "Unknown")
+                self.writes.set(row_num, 8, "Unknown")
                 log.info(f"  FIX R{row_num}: Garbage location '{location}' → Unknown")
                 self.fixes += 1
-                time.sleep(0.3)
 
             # State prefix fix: "NJ Princeton" → "Princeton, NJ"
             state_match = re.match(r'^([A-Z]{2})\s+([A-Z][a-z].+)$', location)
@@ -290,10 +267,9 @@ class QualityGate:
                     "SC","SD","TN","TX","UT","VT","VA","WA","WV","WI","WY","DC"}
                 if state_match.group(1) in us_states:
                     fixed_loc = f"{state_match.group(2)}, {state_match.group(1)}"
-                    self.valid.update_cell(row_num, 9, fixed_loc)
+                    self.writes.set(row_num, 8, fixed_loc)
                     log.info(f"  FIX R{row_num}: {location} → {fixed_loc}")
                     self.fixes += 1
-                    time.sleep(0.3)
 
         # ── CHECK 10: Row-shift detection ──
         # Same title appearing 3+ times in a row = row shift
@@ -331,19 +307,17 @@ class QualityGate:
             else:
                 job_id_map[key] = i + 1
 
+        self.writes.flush()
+
         # Delete bad rows
         if rows_to_delete:
-            for r in sorted(rows_to_delete, reverse=True):
-                try:
-                    self.valid.delete_rows(r)
-                    time.sleep(0.4)
-                    self.deletes += 1
-                except Exception:
-                    pass
+            self.deletes += delete_rows(self.valid, rows_to_delete)
+
+        if self.fixes or self.deletes:
+            invalidate_sheets(self.valid)
 
         # Renumber if we deleted anything
         if self.deletes > 0:
-            time.sleep(3)
             data = self.valid.get_all_values()
             total = len(data) - 1
             sr_values = [[str(i)] for i in range(1, total + 1)]
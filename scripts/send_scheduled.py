@@ -11,7 +11,8 @@ from outreach.outreach_config import (
     MS_SENDER_EMAIL, MS_CLIENT_ID, MS_AUTHORITY, MS_SCOPES, MS_TOKEN_FILE,
     SHEETS_CREDS, SPREADSHEET, OUTREACH_TAB, C,
 )
-from outreach.outreach_data import _cl
+from outreach.sheet_writer import SheetWriteBuffer
+from aggregator.sheets_client import authorize
 from outreach.brain import Brain
 import requests as _req, gspread
 from oauth2client.service_account import ServiceAccountCredentials
@@ -285,19 +286,21 @@ def _move(token, msg_id, folder_id):
 def _get_sheets():
     scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
     creds = ServiceAccountCredentials.from_json_keyfile_name(SHEETS_CREDS, scope)
-    return gspread.authorize(creds).open(SPREADSHEET).worksheet(OUTREACH_TAB)
+    return authorize(creds).open(SPREADSHEET).worksheet(OUTREACH_TAB)
 
 
-def _mark_sent(ws, company, title, date_str):
+def _mark_sent(data, writes, company, title, date_str):
+    """Queue Sent Date on the first unsent row for company+title. `data` is
+    the sheet read once per run and is updated too, so a row already marked
+    this run isn't picked again after `writes` has been flushed."""
     try:
-        data = ws.get_all_values()
         for i, row in enumerate(data[1:], start=2):
-            if (len(row) > max(C["company"], C["title"]) and
+            if (len(row) > max(C["company"], C["title"], C["sent_dt"]) and
                     row[C["company"]].strip().lower() == company.lower() and
                     row[C["title"]].strip().lower() == title.lower() and
                     not row[C["sent_dt"]].strip()):
-                ws.update_acell(f"{_cl(C['sent_dt'])}{i}", date_str)
-                time.sleep(0.5)
+                writes.set(i, C["sent_dt"], date_str)
+                row[C["sent_dt"]] = date_str
                 return
     except Exception as e:
         log.debug(f"Sheet mark-sent failed: {e}")
@@ -412,6 +415,7 @@ def main():
              f"Confirmed-pattern domains: {len(_confirmed_domains)}")
 
     ws    = None  # lazy — only loaded if we actually send
+    sheet_rows = sent_marks = None
 
     scheduled_fid = _ensure_folder(token, SCHEDULED_FOLDER)
     cold_fid      = _ensure_folder(token, COLD_EMAILING_FOLDER)
@@ -600,8 +604,11 @@ def main():
             if company and title:
                 try:
                     if ws is None:
-                        ws = _get_sheets(); time.sleep(1)
-                    _mark_sent(ws, company, title, now_et.strftime("%b %d, %Y"))
+                        ws = _get_sheets()
+                        sheet_rows, sent_marks = ws.get_all_values(), SheetWriteBuffer(ws)
+                    _mark_sent(sheet_rows, sent_marks, company, title, now_et.strftime("%b %d, %Y"))
+                    # Durable before the next send's delay: the mail has gone out
+                    sent_marks.flush()
                 except Exception as se:
                     log.debug(f"Sheet update: {se}")
 
@@ -117,8 +117,9 @@ try:
     from aggregator.run_aggregator import UnifiedJobAggregator as U
     check("53. _is_duplicate exists", hasattr(U, "_is_duplicate"), True)
     check("54. _try_trusted_fallback exists", hasattr(U, "_try_trusted_fallback"), True)
-    check("55. run-scoped jid lock present", "JID_" in src, True)
-    check("56. processing_lock used", "processing_lock.add" in src, True)
+    dsrc = open("aggregator/dedup_index.py", encoding="utf-8").read()
+    check("55. run-scoped jid lock present", "JID_" in dsrc, True)
+    check("56. processing_lock used", "self.processing_lock" in src and "self.reserved.add" in dsrc, True)
 except Exception as e: skip("51-56 fallback", e)
 
 # ─────────────────────────────────────────────────────────────
@@ -150,6 +151,7 @@ section("65-74: HTML + MARKDOWN PARSERS (extractors.py)")
 try:
     from aggregator.extractors import SimplifyGitHubScraper as S, _HEADER_PATTERN
     src = open("aggregator/extractors.py", encoding="utf-8").read()
+    lsrc = open("aggregator/listing_stream.py", encoding="utf-8").read()
     check("65. Visa in header pattern", "Visa" in _HEADER_PATTERN.pattern, True)
     check("66. zapplyjobs-2026 header matches",
           bool(_HEADER_PATTERN.search("| Company | Role | Location | Posted | Visa | **Apply** |")), True)
@@ -159,7 +161,7 @@ try:
     check("69. markdown parser exists", hasattr(S, "_parse_markdown_text"), True)
     check("70. link found by scanning cells", "for _c in cells[2:]" in src, True)
     check("71. no hardcoded cells[3] link", 'apply_link = cells[3].find' in src, False)
-    check("72. md link scans from end", "for _cell in reversed(parts[2:])" in src, True)
+    check("72. md link scans from end", "for _cell in reversed(parts[2:])" in lsrc, True)
     check("73. politeness wait exists", "_polite_wait" in src, True)
     check("74. fetch cache exists", "already_fetched" in src, True)
 except Exception as e: skip("65-74 parsers", e)
@@ -206,10 +208,11 @@ try:
     check("96. keeps status-or-url rows", "self._get_cell(row, 5).strip()" in cl, True)
     sm = open("aggregator/sheets_manager.py", encoding="utf-8").read()
     check("97. startIndex in link runs", '"startIndex": 0' in sm, True)
-    check("98. both link writers fixed", sm.count('"startIndex": 0'), 2)
+    sr = open("aggregator/sheet_requests.py", encoding="utf-8").read()
+    check("98. both link writers fixed", sm.count('"startIndex": 0') + sr.count('"startIndex": 0'), 2)
     check("99. within-batch dedup present", "within-batch duplicates" in sm, True)
     ad = open("scripts/ats_discovery.py", encoding="utf-8").read()
-    check("100. brain save is merge-then-atomic", "os.replace(tmp, BRAIN_FILE)" in ad, True)
+    check("100. brain save is merge-then-atomic", "open_store(BRAIN_FILE).update(merge)" in ad, True)
 except Exception as e: skip("93-100 cleanup/writer", e)
 
 # ─────────────────────────────────────────────────────────────
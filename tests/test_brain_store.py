@@ -0,0 +1,157 @@
+"""Test Brain storage backends — JSON default, SQLite point writes, migration."""
+import json
+import sqlite3
+import pytest
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from outreach.brain_store import (
+    JsonBrainStore,
+    SqliteBrainStore,
+    TrackedDict,
+    migrate,
+    open_store,
+)
+
+SAMPLE = {
+    "domains": {"stripe.com": {"best_pattern": "{first}.{last}"}, "acme.io": {"best_pattern": "{f}{last}"}},
+    "mx_cache": {"stripe.com": {"valid": True, "provider": "google"}},
+    "draft_history": [{"to": "a@b.c"}],
+    "_legacy_migration_done": True,
+}
+
+
+@pytest.fixture
+def json_path(tmp_path):
+    path = tmp_path / "brain.json"
+    path.write_text(json.dumps(SAMPLE))
+    return str(path)
+
+
+@pytest.fixture
+def store(json_path):
+    migrate(json_path)
+    s = open_store(json_path)
+    yield s
+    s.close()
+
+
+def _rows(db_path, name):
+    conn = sqlite3.connect(db_path)
+    tbl = conn.execute("SELECT tbl FROM namespaces WHERE name = ?", (name,)).fetchone()[0]
+    rows = dict(conn.execute(f'SELECT key, updated FROM "{tbl}"').fetchall())
+    conn.close()
+    return rows
+
+
+class TestSelection:
+
+    def test_json_is_default(self, json_path):
+        store = open_store(json_path)
+        assert isinstance(store, JsonBrainStore)
+        assert store.load() == SAMPLE
+
+    def test_sqlite_after_migration(self, store):
+        assert isinstance(store, SqliteBrainStore)
+        assert store.export_dict() == SAMPLE
+
+
+class TestSqliteStore:
+
+    def test_point_read_write(self, store):
+        assert store.get("domains", "stripe.com") == {"best_pattern": "{first}.{last}"}
+        store.put("mx_cache", "acme.io", {"valid": False})
+        assert store.get("mx_cache", "acme.io") == {"valid": False}
+        store.delete("mx_cache", "acme.io")
+        assert store.get("mx_cache", "acme.io") is None
+
+    def test_namespaces_load_lazily(self, store):
+        data = store.load()
+        assert dict.get(data, "domains") is not None  # placeholder only
+        assert not isinstance(dict.get(data, "domains"), dict)
+        assert data["domains"]["acme.io"]["best_pattern"] == "{f}{last}"
+        assert isinstance(dict.get(data, "domains"), TrackedDict)
+
+    def test_save_writes_only_touched_keys(self, store):
+        before = _rows(store.path, "domains")
+        data = store.load()
+        data["domains"]["acme.io"]["best_pattern"] = "{first}"
+        store.save(data)
+        after = _rows(store.path, "domains")
+        assert after["stripe.com"] == before["stripe.com"]
+        assert after["acme.io"] > before["acme.io"]
+        assert store.get("domains", "acme.io") == {"best_pattern": "{first}"}
+
+    def test_writers_do_not_clobber_each_other(self, store, json_path):
+        other = SqliteBrainStore(store.path)  # e.g. ats_discovery's process
+        mine, theirs = store.load(), other.load()
+        mine["domains"]["new.com"] = {"best_pattern": "{first}"}
+        theirs["discovered_ats"] = {"greenhouse": {"stripe": "Stripe"}}
+        theirs["domains"]["stripe.com"]["best_pattern"] = "{last}"
+        store.save(mine)
+        other.save(theirs)
+        other.close()
+        data = store.export_dict()
+        assert data["domains"]["new.com"] == {"best_pattern": "{first}"}
+        assert data["domains"]["stripe.com"] == {"best_pattern": "{last}"}
+        assert data["discovered_ats"] == {"greenhouse": {"stripe": "Stripe"}}
+
+    def test_read_only_iteration_writes_nothing(self, store):
+        before = _rows(store.path, "domains")
+        data = store.load()
+        assert sorted(k for k, _ in data["domains"].items()) == ["acme.io", "stripe.com"]
+        list(data["mx_cache"].values())
+        store.put("domains", "other.com", {"best_pattern": "{last}"})   # another process
+        store.save(data)
+        after = _rows(store.path, "domains")
+        assert after["stripe.com"] == before["stripe.com"] and after["acme.io"] == before["acme.io"]
+        assert store.get("domains", "other.com") == {"best_pattern": "{last}"}
+
+    def test_iterated_value_mutated_in_place_is_saved(self, store):
+        data = store.load()
+        for _, entry in data["domains"].items():
+            entry["checked"] = True
+        store.save(data)
+        assert store.get("domains", "acme.io")["checked"] is True
+
+    def test_replaced_namespace_deletes_only_dropped_keys(self, store):
+        data = store.load()
+        data["domains"] = {k: v for k, v in data["domains"].items() if k != "acme.io"}
+        store.put("domains", "other.com", {"best_pattern": "{last}"})   # another process
+        store.save(data)
+        domains = store.export_dict()["domains"]
+        assert sorted(domains) == ["other.com", "stripe.com"]
+
+    def test_update_and_top_level_values(self, store):
+        store.update(lambda d: d.setdefault("learned_slugs", {}).update(leonardodrs="Leonardo DRS"))
+        store.update(lambda d: d["draft_history"].append({"to": "x@y.z"}))
+        data = store.export_dict()
+        assert data["learned_slugs"] == {"leonardodrs": "Leonardo DRS"}
+        assert len(data["draft_history"]) == 2
+        assert data["_legacy_migration_done"] is True
+
+    def test_deletes_persist(self, store):
+        data = store.load()
+        del data["mx_cache"]["stripe.com"]
+        data.pop("_legacy_migration_done")
+        store.save(data)
+        exported = store.export_dict()
+        assert exported["mx_cache"] == {}
+        assert "_legacy_migration_done" not in exported
+
+
+class TestBrainOnSqlite:
+
+    def test_brain_round_trip(self, store, json_path):
+        from outreach.brain import Brain
+        b = Brain.__new__(Brain)
+        b._path = json_path
+        b._data = b._load()
+        b.set_mx("new.com", True, "google")
+        b.register_job_id("JR-42", "Acme", "Software Intern")
+        b.save()
+        fresh = Brain.__new__(Brain)
+        fresh._path = json_path
+        fresh._data = fresh._load()
+        assert fresh.get_mx("new.com")["valid"] is True
+        assert fresh.is_duplicate_job_id("JR-42")
+        assert fresh._data["domains"]["stripe.com"] == SAMPLE["domains"]["stripe.com"]
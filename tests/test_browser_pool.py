@@ -0,0 +1,129 @@
+"""Test BrowserPool — bounded checkout, render queue, recycling and metrics."""
+import pytest
+import sys, os, threading, time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aggregator.browser_pool import BrowserPool, process_tree_rss_mb
+
+
+class FakeDriver:
+    created = 0
+
+    def __init__(self):
+        FakeDriver.created += 1
+        self.id = FakeDriver.created
+        self.closed = False
+        self.current_url = ""
+
+    def get(self, url):
+        assert not self.closed
+        self.current_url = url
+
+    def quit(self):
+        self.closed = True
+
+
+@pytest.fixture
+def drivers():
+    FakeDriver.created = 0
+    made = []
+
+    def factory():
+        d = FakeDriver()
+        made.append(d)
+        return d
+    return made, factory
+
+
+def _load(driver, url):
+    driver.get(url)
+    return driver.current_url, driver.id
+
+
+class TestBrowserPool:
+
+    def test_renders_run_in_parallel_up_to_size(self, drivers):
+        made, factory = drivers
+        pool = BrowserPool(size=3, max_pages=0, max_rss_mb=0, factory=factory)
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def slow(driver, url):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return url
+
+        futures = [pool.submit(f"https://x.wd5.myworkdayjobs.com/{i}", slow) for i in range(9)]
+        assert [f.result(5) for f in futures] == [f"https://x.wd5.myworkdayjobs.com/{i}" for i in range(9)]
+        assert peak[0] == 3 and len(made) == 3
+        s = pool.stats()
+        assert s["render"]["count"] == 9 and s["queue_wait"]["count"] == 9
+        assert s["queue_wait"]["max_sec"] >= 0.05  # later jobs waited for a browser
+        pool.shutdown()
+        assert all(d.closed for d in made)
+
+    def test_recycled_after_max_pages(self, drivers):
+        made, factory = drivers
+        pool = BrowserPool(size=1, max_pages=2, max_rss_mb=0, factory=factory)
+        ids = [pool.render(f"https://a/{i}", _load)[1] for i in range(5)]
+        assert ids == [1, 1, 2, 2, 3]
+        assert made[0].closed and made[1].closed and pool.stats()["recycled"] == 2
+        pool.shutdown()
+
+    def test_recycled_over_memory_ceiling(self, drivers):
+        made, factory = drivers
+        rss = {1: 2000.0}
+        pool = BrowserPool(size=1, max_pages=0, max_rss_mb=1000, factory=factory,
+                           rss=lambda w: rss.get(w.driver.id, 100.0))
+        assert pool.render("https://a/1", _load)[1] == 1
+        assert pool.render("https://a/2", _load)[1] == 2
+        assert pool.render("https://a/3", _load)[1] == 2
+        assert made[0].closed and not made[1].closed
+        pool.shutdown()
+
+    def test_crash_replaces_only_that_browser(self, drivers):
+        made, factory = drivers
+        pool = BrowserPool(size=2, max_pages=0, max_rss_mb=0, factory=factory)
+
+        def crash(driver, url):
+            raise RuntimeError("chrome not reachable")
+
+        with pool.checkout() as healthy:
+            with pytest.raises(RuntimeError):
+                pool.render("https://a/1", crash)
+            assert not healthy.driver.closed
+        assert pool.render("https://a/2", _load)[0] == "https://a/2"
+        s = pool.stats()
+        assert s["crashed"] == 1 and s["failures"] == 1 and s["started"] == 2
+        pool.shutdown()
+
+    def test_checkout_times_out_when_exhausted(self, drivers):
+        _, factory = drivers
+        pool = BrowserPool(size=1, factory=factory, max_rss_mb=0)
+        with pool.checkout():
+            with pytest.raises(TimeoutError):
+                with pool.checkout(timeout=0.05):
+                    pass
+        with pool.checkout(timeout=0.05) as browser:
+            assert browser.id == 1
+        pool.shutdown()
+
+    def test_factory_failure_frees_slot(self):
+        calls = []
+
+        def factory():
+            calls.append(1)
+            if len(calls) == 1:
+                raise OSError("chromedriver missing")
+            return FakeDriver()
+        pool = BrowserPool(size=1, factory=factory, max_rss_mb=0)
+        with pytest.raises(OSError):
+            pool.render("https://a/1", _load)
+        assert pool.render("https://a/2", _load)[0] == "https://a/2"
+        pool.shutdown()
+
+    def test_process_tree_rss(self):
+        assert process_tree_rss_mb(os.getpid()) > 0
+        assert process_tree_rss_mb(0) == 0.0
@@ -0,0 +1,54 @@
+"""Test cleanup_not_applied's minimal-diff rewrite of Valid Entries."""
+import pytest
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aggregator.fake_sheets import FakeSpreadsheet
+
+cleanup = pytest.importorskip("scripts.cleanup_not_applied")
+
+
+def _cleanup(rows):
+    header = ["Sr. No.", "Status", "Company", "Title", "Date", "URL"]
+    ss = FakeSpreadsheet({"Valid Entries": [header] + rows})
+    mc = cleanup.ManualCleanup.__new__(cleanup.ManualCleanup)
+    mc.spreadsheet, mc.sheet = ss, ss.worksheet("Valid Entries")
+    return mc, ss
+
+
+def _rows(n):
+    return [[str(i), "Applied", f"Co{i}", "SWE Intern", "", f"https://x.com/{i}"] for i in range(1, n + 1)]
+
+
+class TestRepopulateMainSheet:
+
+    def test_deletes_dropped_rows_and_renumbers_the_rest(self):
+        mc, ss = _cleanup(_rows(8))
+        all_data = mc.sheet.get_all_values()
+        remaining = [r for r in all_data[1:] if r[2] not in ("Co3", "Co4", "Co7")]
+        mc._repopulate_main_sheet(all_data, remaining)
+        out = mc.sheet.get_all_values()[1:]
+        assert [r[2] for r in out] == ["Co1", "Co2", "Co5", "Co6", "Co8"]
+        assert [r[0] for r in out] == ["1", "2", "3", "4", "5"]
+
+    def test_cost_scales_with_changed_rows(self):
+        mc, ss = _cleanup(_rows(200))
+        all_data = mc.sheet.get_all_values()
+        remaining = all_data[1:199]          # drop the last two rows only
+        mc._repopulate_main_sheet(all_data, remaining)
+        assert ss.api_calls["delete_rows"] == 0 and ss.api_calls["update"] == 0
+        assert ss.api_calls["batch_update"] == 1        # the deleteDimension batch
+        assert ss.api_calls["values_batch_update"] == 0  # nothing shifted
+        assert len(mc.sheet.get_all_values()) == 199
+
+    def test_untouched_cells_are_not_rewritten(self):
+        mc, ss = _cleanup(_rows(5))
+        all_data = mc.sheet.get_all_values()
+        remaining = [r for r in all_data[1:] if r[2] != "Co2"]
+        # A user edits a cell after the read; only Sr. No. cells get written
+        mc.sheet.update(values=[["Interview 1"]], range_name="B6")
+        bodies, real = [], ss.values_batch_update
+        ss.values_batch_update = lambda body: bodies.append(body) or real(body)
+        mc._repopulate_main_sheet(all_data, remaining)
+        assert mc.sheet.get_all_values()[4][1] == "Interview 1"
+        assert len(bodies) == 1
+        assert [d["range"] for d in bodies[0]["data"]] == ["'Valid Entries'!A3:A5"]
@@ -146,3 +146,36 @@ class TestTitleSimilarity:
         # Stopwords removed
         assert "the" not in tokens
 
+
+    def test_index_matches_full_scan(self):
+        import random
+        rng = random.Random(3)
+        words = ["software", "engineer", "engineering", "intern", "data", "ml",
+                 "research", "backend", "platform", "summer", "2026", "co-op", "security"]
+        e = TitleSimilarity()
+        for i in range(300):
+            e.add(" ".join(rng.sample(words, rng.randint(1, 5))), job_id=str(i),
+                  company=rng.choice(["Acme", "Globex", "Initech"]))
+        for _ in range(50):
+            query = " ".join(rng.sample(words, rng.randint(1, 4)))
+            for company in ("", "acme"):
+                q = e._tfidf_vector(e._tokenize(query))
+                expected = sorted(
+                    round(s, 4) for s in (
+                        e._cosine_similarity(q, e._tfidf_vector(d["tokens"]))
+                        for d in e._documents
+                        if not company or d["company"].lower() == company
+                    ) if s >= 0.6
+                )[::-1][:50]
+                got = [m.score for m in e.find_similar(query, threshold=0.6, max_results=50, same_company=company)]
+                assert got == expected
+
+    def test_common_terms_do_not_widen_candidates(self):
+        e = TitleSimilarity()
+        for i in range(200):
+            e.add(f"Intern Role{i}", company="Acme")
+        e.add("Quantum Intern", company="Acme")
+        q = e._normalize(e._tfidf_vector(e._tokenize("Quantum Intern")))
+        assert e._candidates(q, 0.9) == [200]
+        assert e.find_similar("Quantum Intern", threshold=0.9)[0].title == "Quantum Intern"
+        assert e.find_similar("Quantum Intern", threshold=0.9, same_company="Globex") == []
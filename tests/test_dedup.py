@@ -1,6 +1,6 @@
 """Test deduplication logic — job ID, URL, company+title."""
 import pytest
-import sys, os, json, tempfile
+import sys, os, json, time, tempfile
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
@@ -43,6 +43,33 @@ class TestJobIDDedup:
         assert not brain.is_duplicate_job_id("")
         assert not brain.is_duplicate_job_id("N/A")
 
+    def test_register_buffers_until_checkpoint(self, brain):
+        for i in range(20):
+            brain.register_job_id(f"JR-{i}", "Acme", "Software Intern")
+        on_disk = json.loads(open(brain._path).read())
+        assert "job_id_registry" not in on_disk
+        brain.flush_job_ids()
+        on_disk = json.loads(open(brain._path).read())
+        assert len(on_disk["job_id_registry"]) == 20
+        assert not os.path.exists(brain._job_id_journal_path)
+
+    def test_journal_replayed_after_crash(self, brain):
+        from outreach.brain import Brain
+        brain.register_job_id("JR-777", "Acme", "Software Intern")
+        with open(brain._job_id_journal_path, "a") as f:
+            f.write('{"nid": "torn')  # half-written line from the crash
+        fresh = Brain.__new__(Brain)
+        fresh._path = brain._path
+        fresh._data = fresh._load()
+        fresh._replay_job_id_journal()
+        assert fresh.is_duplicate_job_id("JR-777")
+
+    def test_expired_ids_pruned_on_save(self, brain):
+        brain._data["job_id_registry"] = {"old1": {"ts": time.time() - 91 * 86400}}
+        brain.register_job_id("JR-1")
+        brain.flush_job_ids()
+        assert set(brain._data["job_id_registry"]) == {"jr1"}
+
 
 class TestRunScopedJobIDDedup:
     """Same numeric ID on two domains in one run must dedup (ByteDance jobs. vs join.)."""
@@ -0,0 +1,105 @@
+"""Test DedupIndex — atomic check-and-reserve under striped locks."""
+import pytest
+import sys, os, threading
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aggregator.dedup_index import DedupIndex, clean_company
+
+
+@pytest.fixture
+def brain(tmp_path):
+    from outreach.brain import Brain
+    brain_file = tmp_path / "brain.json"
+    brain_file.write_text("{}")
+    b = Brain.__new__(Brain)
+    b._path = str(brain_file)
+    b._data = b._default()
+    return b
+
+
+@pytest.fixture
+def index(brain):
+    return DedupIndex(
+        jobs={"acmeswintern"}, urls={"https://acme.com/jobs/1"}, job_ids={"jr-7"}, brain=brain
+    )
+
+
+class TestDedupIndex:
+
+    def test_new_job_reserves_all_keys(self, index):
+        assert index.check_and_reserve("Globex", "Data Intern", "https://globex.com/j/2", "R-0042") is None
+        assert {"JID_r0042", "globexdataintern", "https://globex.com/j/2"} <= index.reserved
+        assert index.is_known_url("https://globex.com/j/2")
+
+    def test_duplicate_reasons(self, index, brain):
+        brain.register_job_id("JR-99", "Acme", "Old Intern")
+        assert index.check_and_reserve("Acme", "X", "https://a.com/1", "JR-99").label == "job_id"
+        assert index.check_and_reserve("Initech", "Y", "https://acme.com/jobs/1").outcome == "skipped_duplicate_url"
+        assert index.check_and_reserve("Acme, Inc.", "SW Intern", "https://a.com/2").label == "company+title"
+        assert index.check_and_reserve("Hooli", "Z", "https://h.com/3", "JR-7").label == "job_id2"
+        index.check_and_reserve("Hooli", "R1 Intern", "https://h.com/4", "000123")
+        assert index.check_and_reserve("Hooli", "R2 Intern", "https://h.com/5", "123").label == "job_id run"
+
+    def test_fuzzy_within_company(self, index):
+        assert index.check_and_reserve("Stripe", "Software Engineering Intern", "https://s.com/1") is None
+        dup = index.check_and_reserve("Stripe", "Intern, Software Engineering", "https://s.com/2")
+        assert dup.outcome == "skipped_duplicate_fuzzy" and dup.match.title == "Software Engineering Intern"
+        assert index.check_and_reserve("Plaid", "Intern, Software Engineering", "https://p.com/2") is None
+
+    def test_rejected_job_reserves_nothing(self, index):
+        before = set(index.reserved)
+        index.check_and_reserve("Initech", "Y", "https://acme.com/jobs/1", "R-5")
+        assert index.reserved == before
+
+    def test_restore_skips_rows_already_in_sheet(self, index):
+        assert index.restore("Acme", "SW Intern", "https://acme.com/jobs/9") is False
+        assert index.restore("Globex", "Data Intern", "URL_SHIFTED") is True
+        assert index.check_and_reserve("Globex", "Data Intern", "https://globex.com/j/1").label == "company+title"
+        assert not index.is_known_url("URL_SHIFTED")
+
+    def test_concurrent_same_job_has_one_winner(self, brain):
+        index = DedupIndex(set(), set(), set(), brain=brain)
+        results, barrier = [], threading.Barrier(16)
+
+        def worker(i):
+            barrier.wait()
+            results.append(index.check_and_reserve("Acme", "SWE Intern", f"https://acme.com/{i % 2}", "N/A"))
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert sum(r is None for r in results) == 1
+
+    def test_other_companies_do_not_wait(self, index):
+        held_stripe = index._stripe(index.keys("Acme", "SWE Intern", "https://acme.com/9").company)
+        held = index._stripes[held_stripe]
+
+        def stripes(company):
+            # the stripes check_and_reserve locks: cleaned company and cleaned URL keys
+            k = index.keys(company, "T", "https://x.com/" + company)
+            return {index._stripe(k.company), index._stripe(k.url)}
+        other = next(c for c in (f"Co{i}" for i in range(1000)) if held_stripe not in stripes(c))
+        done = threading.Event()
+        with held:
+            t = threading.Thread(target=lambda: (index.check_and_reserve(other, "T", "https://x.com/" + other), done.set()))
+            t.start()
+            assert done.wait(2)
+        t.join()
+
+    def test_clean_company(self):
+        assert clean_company("Acme, Inc.") == "Acme"
+        assert clean_company("Susquehanna (SIG)") == "Susquehanna"
+
+
+class TestClaimSet:
+
+    def test_claimed_listing_matches(self):
+        from aggregator.dedup_index import ClaimSet
+        claims = ClaimSet()
+        claims.add("Acme, Inc.", "Software Engineer Intern", "https://boards.greenhouse.io/acme/jobs/1?gh_src=x")
+        assert claims.match("Initech", "Other", "https://boards.greenhouse.io/acme/jobs/1") == "url"
+        assert claims.match("Acme", "Software Engineer Intern", "https://simplify.jobs/p/9") == "company+title"
+        assert claims.match("Acme", "Intern, Software Engineer", "https://x.com/2") == "fuzzy"
+        assert claims.match("Globex", "Software Engineer Intern", "https://x.com/3") is None
+        assert len(claims) == 1
@@ -235,3 +235,105 @@ class TestDataContracts:
         assert isinstance(d, dict)
         assert d["company"] == "X"
 
+
+
+class TestRateLimiter:
+    """Test per-domain token-bucket rate limiter."""
+
+    def test_burst_then_wait(self):
+        from aggregator.rate_limiter import TokenBucket
+        b = TokenBucket(rate=10.0, burst=2)
+        assert b.reserve() == 0.0
+        assert b.reserve() == 0.0
+        delay = b.reserve()
+        assert 0.05 < delay <= 0.1
+        assert b.stats["waited"] == 1
+
+    def test_longest_suffix_wins(self):
+        from aggregator.rate_limiter import DomainRateLimiter
+        lim = DomainRateLimiter(
+            limits={"greenhouse.io": (1.0, 1), "boards-api.greenhouse.io": (8.0, 8)},
+            default_rate=(0.5, 1),
+        )
+        assert lim.rate_for("boards-api.greenhouse.io") == (8.0, 8)
+        assert lim.rate_for("job-boards.greenhouse.io") == (1.0, 1)
+        assert lim.rate_for("example.com") == (0.5, 1)
+
+    def test_hosts_do_not_block_each_other(self):
+        import threading
+        from aggregator.rate_limiter import DomainRateLimiter
+        lim = DomainRateLimiter(limits={}, default_rate=(2.0, 1))
+        lim.acquire("https://slow.example.com/a")
+        waiter = threading.Thread(target=lim.acquire, args=("https://slow.example.com/b",))
+        waiter.start()
+        start = time.monotonic()
+        lim.acquire("https://other.example.com/a")
+        assert time.monotonic() - start < 0.1
+        waiter.join()
+        stats = lim.stats()
+        assert stats["slow.example.com"]["requests"] == 2
+        assert stats["slow.example.com"]["wait_sec"] > 0
+        assert stats["other.example.com"]["wait_sec"] == 0
+
+    def test_no_host_is_noop(self):
+        from aggregator.rate_limiter import DomainRateLimiter
+        lim = DomainRateLimiter(limits={})
+        assert lim.acquire("not a url") == 0.0
+        assert lim.stats() == {}
+
+
+class TestFanOut:
+    """Test bounded fan-out engine used for direct ATS fetching."""
+
+    def test_results_grouped_in_task_order(self):
+        from aggregator.fanout import FanOutEngine, FetchTask
+        def slow_echo(x):
+            time.sleep(0.01 * (5 - x))
+            return [x]
+        tasks = [FetchTask("A" if i % 2 else "B", f"h{i}", slow_echo, (i,)) for i in range(5)]
+        out = FanOutEngine(max_workers=5).run(tasks)
+        assert out["B"] == [0, 2, 4]
+        assert out["A"] == [1, 3]
+
+    def test_per_host_cap(self):
+        import threading
+        from aggregator.fanout import FanOutEngine, FetchTask
+        live, peak, lock = [0], [0], threading.Lock()
+        def work():
+            with lock:
+                live[0] += 1
+                peak[0] = max(peak[0], live[0])
+            time.sleep(0.02)
+            with lock:
+                live[0] -= 1
+            return [1]
+        tasks = [FetchTask("S", "same.host", work) for _ in range(8)]
+        out = FanOutEngine(max_workers=8, per_host=2).run(tasks)
+        assert len(out["S"]) == 8
+        assert peak[0] <= 2
+
+    def test_busy_host_does_not_block_others(self):
+        import threading
+        from aggregator.fanout import FanOutEngine, FetchTask
+        started, lock = [], threading.Lock()
+        def work(host):
+            with lock:
+                started.append(host)
+            time.sleep(0.05)
+            return [host]
+        tasks = ([FetchTask("GH", "greenhouse", work, ("greenhouse",)) for _ in range(12)]
+                 + [FetchTask("LV", "lever", work, ("lever",)) for _ in range(2)])
+        out = FanOutEngine(max_workers=4, per_host=2).run(tasks)
+        assert len(out["GH"]) == 12 and len(out["LV"]) == 2
+        # Lever starts in the first wave instead of after Greenhouse drains
+        assert started[:4].count("lever") == 2
+
+    def test_errors_are_counted_not_raised(self):
+        from aggregator.fanout import FanOutEngine, FetchTask
+        def boom():
+            raise RuntimeError("board down")
+        engine = FanOutEngine()
+        out = engine.run([FetchTask("S", "h", boom), FetchTask("S", "h", lambda: [1])])
+        assert out["S"] == [1]
+        assert engine.timings["S"].errors == 1
+        assert engine.timings["S"].tasks == 2
@@ -0,0 +1,145 @@
+"""Test conditional GETs and row-level diffs for the GitHub README feeds."""
+import pytest
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aggregator import extractors
+from aggregator.extractors import SimplifyGitHubScraper
+
+README = """
+| Company | Role | Location | Application | Age |
+| ------- | ---- | -------- | ----------- | --- |
+| **Acme** | Software Engineer Intern | NYC | <a href="https://jobs.lever.co/acme/1">Apply</a> | 2d |
+| ↳ | Data Intern | Remote | <a href="https://jobs.lever.co/acme/2">Apply</a> | 3d |
+"""
+URL = "https://raw.githubusercontent.com/SimplifyJobs/Summer2027-Internships/dev/README.md"
+
+
+class FakeResponse:
+    def __init__(self, status_code, text="", headers=None):
+        self.status_code, self.text, self.headers = status_code, text, headers or {}
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(extractors, "GITHUB_FEED_STATE_DIR", str(tmp_path / "github_feeds"))
+    state = {"etag": '"abc"', "body": README, "requests": []}
+
+    def fake_request(url, **kwargs):
+        headers = kwargs.get("headers", {})
+        state["requests"].append(headers)
+        if headers.get("If-None-Match") == state["etag"]:
+            return FakeResponse(304)
+        return FakeResponse(200, state["body"], {"ETag": state["etag"], "Last-Modified": "Tue, 13 Oct 2026 10:00:00 GMT"})
+    monkeypatch.setattr(extractors, "retry_request", fake_request)
+    monkeypatch.setattr(SimplifyGitHubScraper, "feed_status", {})
+    monkeypatch.setattr(SimplifyGitHubScraper, "closures", {})
+    monkeypatch.setattr(SimplifyGitHubScraper, "_pending", {})
+    return state
+
+
+def _scrape(url=URL, name="SimplifyJobs"):
+    jobs = SimplifyGitHubScraper.scrape(url, name)
+    SimplifyGitHubScraper.commit(name)
+    return jobs
+
+
+class TestConditionalFeeds:
+
+    def test_unchanged_feed_skips_parsing(self, server, monkeypatch):
+        first = _scrape()
+        assert [j["url"] for j in first] == ["https://jobs.lever.co/acme/1", "https://jobs.lever.co/acme/2"]
+        assert server["requests"][0] == {}
+
+        def no_parse(*a, **k):
+            raise AssertionError("304 must skip parsing")
+        monkeypatch.setattr(extractors, "iter_listings", no_parse)
+        assert _scrape() == []
+        assert server["requests"][1] == {"If-None-Match": '"abc"', "If-Modified-Since": "Tue, 13 Oct 2026 10:00:00 GMT"}
+        assert SimplifyGitHubScraper.feed_status["SimplifyJobs"] == "not_modified"
+
+    def test_state_is_per_feed_and_url(self, server):
+        _scrape()
+        _scrape(URL.replace("dev", "main"))
+        _scrape(name="vanshb03")
+        assert server["requests"] == [{}, {}, {}]
+
+    def test_uncommitted_feed_is_re_emitted(self, server):
+        SimplifyGitHubScraper.scrape(URL, "SimplifyJobs")  # run crashed before commit
+        assert len(_scrape()) == 2
+        assert server["requests"] == [{}, {}]
+
+
+class TestRowDiff:
+
+    def test_only_inserted_and_changed_rows(self, server):
+        _scrape()
+        server["etag"] = '"def"'
+        server["body"] = (
+            README.replace("| 2d |", "| 3d |")                    # age only: unchanged
+            .replace("| Remote |", "| Boston, MA |")            # changed location
+            + '| **Globex** | ML Intern | SF | <a href="https://globex.com/j/9">Apply</a> | 0d |\n'
+        )
+        jobs = _scrape()
+        assert [(j["company"], j["url"]) for j in jobs] == [
+            ("Acme", "https://jobs.lever.co/acme/2"), ("Globex", "https://globex.com/j/9"),
+        ]
+        assert SimplifyGitHubScraper.feed_status["SimplifyJobs"] == "fetched"
+
+    def test_removed_rows_recorded_as_closures(self, server, tmp_path):
+        import json
+        _scrape()
+        server["etag"] = '"def"'
+        server["body"] = README.replace("acme/2", "acme/3")
+        assert [j["url"] for j in _scrape()] == ["https://jobs.lever.co/acme/3"]
+        assert SimplifyGitHubScraper.closures["SimplifyJobs"] == [("Acme", "Data Intern", "https://jobs.lever.co/acme/2")]
+        with open(tmp_path / "github_feeds" / "closures.jsonl") as f:
+            logged = [json.loads(line) for line in f]
+        assert [(c["source"], c["url"]) for c in logged] == [("SimplifyJobs", "https://jobs.lever.co/acme/2")]
+
+    def test_empty_parse_keeps_fingerprints(self, server):
+        _scrape()
+        server["etag"] = '"broken"'
+        server["body"] = "# README moved"
+        assert _scrape() == []
+        server["etag"] = '"abc"'
+        server["body"] = README
+        assert _scrape() == []  # back to the known content: 304
+
+
+class TestFailedListings:
+
+    def _aggregator(self, fail):
+        import threading
+        from aggregator.run_aggregator import UnifiedJobAggregator
+        agg = UnifiedJobAggregator.__new__(UnifiedJobAggregator)
+        agg._fetch_failed = threading.local()
+
+        def process(job):
+            if fail.get(job["url"]) == "raise":
+                raise RuntimeError("parser bug")
+            if fail.get(job["url"]) == "fetch":
+                agg._fetch_failed.flag = True
+        agg._process_single_github_job = process
+        return agg
+
+    def test_failed_units_come_back_next_run(self, server):
+        jobs = SimplifyGitHubScraper.scrape(URL, "SimplifyJobs")
+        agg = self._aggregator({jobs[0]["url"]: "raise", jobs[1]["url"]: "fetch"})
+        for job in jobs:
+            job["_source_name"] = "SimplifyJobs"
+            try:
+                agg._github_unit(job)
+            except RuntimeError:
+                pass
+        SimplifyGitHubScraper.commit("SimplifyJobs")
+        assert len(_scrape()) == 2              # no 304, both re-emitted
+        assert server["requests"][1] == {}
+
+    def test_processed_units_stay_committed(self, server):
+        jobs = SimplifyGitHubScraper.scrape(URL, "SimplifyJobs")
+        agg = self._aggregator({})
+        for job in jobs:
+            job["_source_name"] = "SimplifyJobs"
+            agg._github_unit(job)
+        SimplifyGitHubScraper.commit("SimplifyJobs")
+        assert _scrape() == []
@@ -0,0 +1,108 @@
+"""Test GmailClient — batched metadata-first fetch, against recorded messages."""
+import pytest
+import sys, os, json, base64
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aggregator.fake_gmail import FakeGmail
+from aggregator.gmail_client import GmailClient
+from aggregator.extractors import EmailExtractor
+
+
+def _message(msg_id, subject, html, sender="Jobright <noreply@jobright.ai>", ts=1760000000000, extra=None):
+    headers = [{"name": "From", "value": sender}, {"name": "Subject", "value": subject},
+               {"name": "X-Mailer", "value": "mailer"}] + (extra or [])
+    return {
+        "id": msg_id, "threadId": f"t{msg_id}", "labelIds": ["Label_7"], "internalDate": str(ts),
+        "snippet": subject, "sizeEstimate": len(html),
+        "payload": {"mimeType": "text/html", "headers": headers,
+                    "body": {"data": base64.urlsafe_b64encode(html.encode()).decode()}},
+    }
+
+
+def _alert(msg_id, job, ts=1760000000000):
+    return _message(msg_id, f"New job: {job}", f'<a href="https://boards.greenhouse.io/acme/jobs/{job}">SWE Intern</a>', ts=ts)
+
+
+class TestGmailClient:
+
+    def test_batches_instead_of_one_get_per_message(self):
+        gmail = FakeGmail([_alert(f"m{i}", i) for i in range(120)])
+        client = GmailClient(gmail, batch_size=50)
+        ids = client.list_ids("anything", max_results=120)
+        msgs = client.fetch(ids)
+        assert [m["id"] for m in msgs] == ids
+        assert gmail.api_calls["batch"] == 3 and gmail.api_calls["get"] == 0
+        assert gmail.api_calls["get_full"] == 120 and gmail.api_calls["get_metadata"] == 0
+
+    def test_metadata_pass_filters_before_full_fetch(self):
+        gmail = FakeGmail([_alert(f"m{i}", i) for i in range(10)])
+        client = GmailClient(gmail)
+        seen = []
+
+        def keep(meta):
+            seen.append(meta)
+            return meta["id"] in ("m3", "m7")
+        msgs = client.fetch([f"m{i}" for i in range(10)], keep=keep)
+        assert [m["id"] for m in msgs] == ["m3", "m7"]
+        assert "body" not in seen[0]["payload"]
+        assert [h["name"] for h in seen[0]["payload"]["headers"]] == ["From", "Subject"]
+        assert gmail.api_calls["get_metadata"] == 10 and gmail.api_calls["get_full"] == 2
+        assert client.stats["skipped"] == 8
+
+    def test_rate_limited_parts_are_retried(self):
+        gmail = FakeGmail([_alert("a", 1), _alert("b", 2), _alert("c", 3)], fail={"b": [429, 503], "c": [404]})
+        sleeps = []
+        client = GmailClient(gmail, sleep=sleeps.append)
+        msgs = client.fetch(["a", "b", "c"])
+        assert [m["id"] for m in msgs] == ["a", "b"]
+        assert gmail.api_calls["batch"] == 3 and len(sleeps) == 2 and sleeps[0] < sleeps[1]
+        assert client.stats["retried"] == 2 and client.stats["failed"] == 1
+
+    def test_gives_up_after_max_retries(self):
+        gmail = FakeGmail([_alert("a", 1)], fail={"a": [429] * 10})
+        client = GmailClient(gmail, max_retries=2, sleep=lambda s: None)
+        assert client.fetch(["a"]) == []
+        assert gmail.api_calls["get_full"] == 3 and client.stats["failed"] == 1
+
+
+class TestEmailExtractor:
+
+    def test_processed_emails_never_fetched_in_full(self):
+        query = EmailExtractor.JOB_HUNT_QUERY
+        gmail = FakeGmail([_alert("old", 1, ts=1), _alert("new1", 2, ts=2), _alert("new2", 3, ts=3)],
+                          queries={query: ["old", "new1", "new2"]})
+        emails = EmailExtractor(service=gmail).fetch_job_emails(processed={"old": {"subject": "x"}})
+        assert [e["email_id"] for e in emails] == ["new2", "new1"]
+        assert emails[0]["urls"] == ["https://boards.greenhouse.io/acme/jobs/3"]
+        assert emails[0]["sender"] == "Jobright" and emails[0]["timestamp"] == 3
+        assert gmail.api_calls["get_full"] == 2 and gmail.api_calls["batch"] == 2
+
+    def test_from_recorded_file(self, tmp_path):
+        path = tmp_path / "recorded.json"
+        path.write_text(json.dumps({"messages": [_alert("r1", 9)]}))
+        emails = EmailExtractor(service=FakeGmail.from_file(str(path))).fetch_job_emails()
+        assert [e["email_id"] for e in emails] == ["r1"]
+
+
+class TestBounceScanner:
+
+    def test_known_bounces_skip_full_fetch(self, tmp_path, monkeypatch):
+        from outreach import bounce_scanner
+        from outreach.bounce_scanner import BounceScanner
+        cache = {"gone@acme.com": {"bounced_at": "2026-10-01", "subject": "x", "msg_id": "b1"},
+                 "old@globex.com": {"bounced_at": "2026-10-02", "subject": "y", "msg_id": "b9"}}
+        path = tmp_path / "bounced_emails.json"
+        path.write_text(json.dumps(cache))
+        monkeypatch.setattr(bounce_scanner, "BOUNCED_EMAILS_FILE", str(path))
+        monkeypatch.setattr(BounceScanner, "update_domain_reputation", staticmethod(lambda: None))
+        monkeypatch.setattr("outreach.outreach_config.SHEETS_CREDS", str(tmp_path / "missing.json"))  # stay offline
+
+        dsn = "Final-Recipient: rfc822; gone@acme.com\nAction: failed"
+        gmail = FakeGmail([
+            _message("b1", "Delivery Status Notification (Failure)", dsn),
+            _message("b2", "Undeliverable: Application", "Your message to old@globex.com couldn't be delivered",
+                     extra=[{"name": "X-Failed-Recipients", "value": "Old@Globex.com"}]),
+        ])
+        found = BounceScanner.scan(gmail, days_back=14)
+        assert found == {"gone@acme.com", "old@globex.com"}
+        assert gmail.api_calls["get_metadata"] == 2 and gmail.api_calls["get_full"] == 0
+        assert json.loads(path.read_text()) == cache
@@ -0,0 +1,106 @@
+"""Test HttpCache — byte-bounded LRU, disk bodies, TTL and revalidation."""
+import pytest
+import sys, os, time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aggregator.http_cache import HttpCache
+
+PAGE = "<html><body><h1>Software Engineer Intern</h1>" + "x" * 2000 + "</body></html>"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = HttpCache(str(tmp_path / "http_cache"), ttl=60, memory_bytes=5000, disk_bytes=10_000)
+    yield c
+    c.close()
+
+
+class TestHttpCache:
+
+    def test_put_get_round_trip(self, cache):
+        assert cache.get("https://a.com/1") is None
+        cache.put("https://a.com/1", PAGE, "https://a.com/jobs/1", headers={"ETag": '"v1"'})
+        hit = cache.get("https://a.com/1")
+        assert (hit.text, hit.url, hit.status_code, hit.etag) == (PAGE, "https://a.com/jobs/1", 200, '"v1"')
+        s = cache.stats()
+        assert (s["misses"], s["hits_memory"], s["bytes_served"]) == (1, 1, len(PAGE))
+
+    def test_memory_bounded_by_bytes_disk_keeps_rest(self, cache, tmp_path):
+        for i in range(5):
+            cache.put(f"https://a.com/{i}", PAGE + str(i))
+        assert cache.stats()["memory_bytes"] <= 5000
+        assert "https://a.com/0" not in cache._memory
+        assert cache.get("https://a.com/0").text == PAGE + "0"
+        assert cache.stats()["hits_disk"] == 1
+        other = HttpCache(cache.directory, ttl=60)  # next run reads the same store
+        assert other.get("https://a.com/3").text == PAGE + "3"
+        other.close()
+
+    def test_bodies_are_content_addressed(self, cache):
+        cache.put("https://a.com/1", PAGE)
+        cache.put("https://a.com/1?utm=x", PAGE)
+        blobs = [f for _, _, fs in os.walk(cache.directory) for f in fs if f.endswith(".gz")]
+        assert len(blobs) == 1
+
+    def test_ttl_honored_and_revalidation(self, cache):
+        cache.put("https://a.com/1", PAGE, headers={"ETag": '"v1"', "Last-Modified": "Tue, 13 Oct 2026 10:00:00 GMT"}, ttl=0.01)
+        time.sleep(0.02)
+        assert cache.get("https://a.com/1") is None
+        assert cache.stats()["expired"] == 1
+        assert cache.conditional_headers("https://a.com/1") == {
+            "If-None-Match": '"v1"', "If-Modified-Since": "Tue, 13 Oct 2026 10:00:00 GMT",
+        }
+        assert cache.revalidated("https://a.com/1", {"ETag": '"v1"'}).text == PAGE
+        assert cache.get("https://a.com/1").fresh
+        assert cache.conditional_headers("https://a.com/unknown") == {}
+
+    def test_failures_remembered_in_memory(self, cache):
+        cache.put_failure("https://a.com/dead", ttl=60)
+        assert cache.failed("https://a.com/dead")
+        assert cache.get("https://a.com/dead") is None
+        cache.put("https://a.com/dead", PAGE)
+        assert not cache.failed("https://a.com/dead")
+
+    def test_prune_keeps_disk_under_budget(self, cache):
+        for i in range(8):
+            cache.put(f"https://a.com/{i}", PAGE + str(i))
+        removed = cache.prune()
+        assert removed >= 3
+        assert cache.get("https://a.com/7") is not None
+        cache._memory.clear()
+        cache._memory_used = 0
+        assert cache.get("https://a.com/0") is None
+
+
+class FakeResponse:
+    def __init__(self, status_code, text="", url="", headers=None):
+        self.status_code, self.text, self.url, self.headers = status_code, text, url, headers or {}
+
+
+class TestPageFetcherUsesCache:
+
+    @pytest.fixture
+    def fetcher(self, cache, monkeypatch):
+        from aggregator import extractors
+        monkeypatch.setattr(HttpCache, "_default", cache)
+        monkeypatch.setattr(extractors.PageFetcher, "_failed_urls", {})
+        monkeypatch.setattr(extractors.PageFetcher, "_save_failed_url", classmethod(lambda cls, url: None))
+        calls = []
+
+        def fake_request(url, **kwargs):
+            calls.append(kwargs.get("headers", {}))
+            if kwargs.get("headers", {}).get("If-None-Match") == '"v1"':
+                return FakeResponse(304, headers={"ETag": '"v1"'})
+            return FakeResponse(200, PAGE, url + "#final", {"ETag": '"v1"'})
+        monkeypatch.setattr(extractors, "retry_request", fake_request)
+        return extractors.PageFetcher(), calls
+
+    def test_second_fetch_is_a_hit_then_304_after_expiry(self, fetcher, cache):
+        pf, calls = fetcher
+        url = "https://jobs.lever.co/acme/1"
+        assert pf.fetch_page(url)[2] == PAGE
+        assert pf.fetch_page(url)[1] == url + "#final"
+        assert len(calls) == 1
+        cache._memory[url].expires_at = 0
+        response, final_url, page = pf.fetch_page(url)
+        assert calls[-1] == {"If-None-Match": '"v1"'} and page == PAGE
+        assert cache.stats()["revalidated"] == 1
@@ -0,0 +1,104 @@
+"""Test direct ATS listing content — parsed board fields, rendered page, fallback."""
+import pytest
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bs4 import BeautifulSoup
+from aggregator import direct_sources
+from aggregator.listing_page import listing_html
+from aggregator.page_document import PageDocument
+from aggregator.extractors import PageParser, JobTypeExtractor
+from aggregator.processors import LocationExtractor, JobIDExtractor, ValidationHelper
+
+BODY = "<p>Build distributed systems with our platform team. </p>" * 10
+
+
+def _job(**extra):
+    job = {"company": "Stripe", "title": "Software Engineer Intern", "location": "Seattle, WA",
+           "url": "https://boards.greenhouse.io/stripe/jobs/7012345", "job_id": "7012345",
+           "description_html": BODY}
+    job.update(extra)
+    return job
+
+
+class TestBoardParsers:
+
+    def test_greenhouse_keeps_unescaped_content(self, monkeypatch):
+        urls = []
+        monkeypatch.setattr(direct_sources, "_fetch_json", lambda url, timeout=5: urls.append(url) or {"jobs": [{
+            "title": "Software Engineer Intern", "location": {"name": "Seattle, WA"},
+            "absolute_url": "https://boards.greenhouse.io/stripe/jobs/1", "id": 1,
+            "content": "&lt;p&gt;Hello&lt;/p&gt;", "first_published": "2026-10-01T09:00:00-04:00",
+            "departments": [{"name": "Engineering"}],
+        }]})
+        job, = direct_sources._greenhouse_board("stripe", "Stripe")
+        assert urls[0].endswith("?content=true")
+        assert job["description_html"] == "<p>Hello</p>"
+        assert job["posted_at"] == "2026-10-01" and job["department"] == "Engineering"
+
+    def test_lever_joins_lists_and_salary(self, monkeypatch):
+        monkeypatch.setattr(direct_sources, "_fetch_json", lambda url, timeout=5: [{
+            "text": "Software Engineer Intern", "hostedUrl": "https://jobs.lever.co/x/1",
+            "categories": {"location": "Boston, MA", "commitment": "Intern", "team": "Infra"},
+            "description": "<p>Intro</p>", "lists": [{"text": "You will", "content": "<li>Ship</li>"}],
+            "additional": "<p>Outro</p>", "createdAt": 1760000000000, "workplaceType": "hybrid",
+            "salaryRange": {"min": 40, "max": 55, "currency": "USD", "interval": "per-hour-wage"},
+        }])
+        job, = direct_sources._lever_board("x", "X")
+        assert job["description_html"] == "<p>Intro</p><h3>You will</h3><ul><li>Ship</li></ul><p>Outro</p>"
+        assert job["compensation"] == "$40 - $55/hr"
+        assert (job["employment_type"], job["department"], job["workplace"]) == ("Intern", "Infra", "Hybrid")
+        assert job["posted_at"] == "2025-10-09"
+
+    def test_ashby_requests_compensation(self, monkeypatch):
+        urls = []
+        monkeypatch.setattr(direct_sources, "_fetch_json", lambda url, timeout=5: urls.append(url) or {"jobs": [{
+            "title": "Software Engineer Intern", "location": "New York, NY", "jobUrl": "https://jobs.ashbyhq.com/r/1",
+            "descriptionHtml": "<p>Body</p>", "employmentType": "Intern", "isRemote": True,
+            "compensation": {"scrapeableCompensationSalarySummary": "$45/hr"},
+        }]})
+        job, = direct_sources._ashby_board("r", "R")
+        assert urls[0].endswith("?includeCompensation=true")
+        assert (job["compensation"], job["workplace"], job["employment_type"]) == ("$45/hr", "Remote", "Intern")
+
+
+class TestListingHtml:
+
+    def _page(self, job):
+        return PageDocument(BeautifulSoup(listing_html(job), "html.parser"))
+
+    def test_too_little_content_falls_back(self):
+        assert listing_html(_job(description_html="<p>Apply now</p>")) is None
+        assert listing_html(_job(description_html="")) is None
+
+    def test_extractors_read_the_rendered_page(self):
+        page = self._page(_job(employment_type="Intern"))
+        assert PageParser.extract_title(page) == "Software Engineer Intern"
+        assert LocationExtractor.extract_from_json_ld(page).value == "Seattle, WA"
+        assert JobIDExtractor.extract_from_json_ld(page).value == "7012345"
+        assert JobTypeExtractor.extract_from_json_ld(page) == "Internship"
+        assert "distributed systems" in page.lower
+
+    def test_compensation_reaches_salary_check(self):
+        page = self._page(_job(compensation="$18/hr"))
+        assert ValidationHelper.check_salary_requirement(page)[0] == "REJECT"
+
+
+class TestReadDirectPage:
+
+    def _aggregator(self, monkeypatch):
+        from collections import defaultdict
+        from aggregator import extractors
+        from aggregator.run_aggregator import UnifiedJobAggregator
+        monkeypatch.setattr(extractors, "mark_fetched", lambda url: None)
+        agg = UnifiedJobAggregator.__new__(UnifiedJobAggregator)
+        agg.outcomes = defaultdict(int)
+        agg.calls = []
+        agg._process_single_job_comprehensive = lambda url, **kw: agg.calls.append(kw.get("page_html"))
+        return agg
+
+    def test_listing_content_skips_the_page_fetch(self, monkeypatch):
+        agg = self._aggregator(monkeypatch)
+        agg._read_direct_page(_job())
+        agg._read_direct_page(_job(description_html="<p>Short</p>"))
+        assert "distributed systems" in agg.calls[0] and agg.calls[1] is None
+        assert agg.outcomes["direct_from_listing"] == 1 and agg.outcomes["direct_page_fetch"] == 1
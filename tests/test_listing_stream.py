@@ -0,0 +1,104 @@
+"""Test the streaming README parser — parity with the whole-document parsers."""
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bs4 import BeautifulSoup
+from aggregator.extractors import SimplifyGitHubScraper, _response_lines
+from aggregator.listing_stream import ListingStream, iter_listings
+
+HTML_README = """# Summer 2026 Internships
+
+<h2>💻 Software Engineering <em>Internship</em> Roles</h2>
+
+<table>
+<thead>
+<tr>
+<th>Company</th><th>Role</th><th>Location</th><th>Application</th><th>Age</th>
+</tr>
+</thead>
+<tbody>
+<tr>
+<td><strong><a href="https://simplify.jobs/c/Acme">Acme 🔥</a></strong></td>
+<td>Software Engineer Intern 🛂</td>
+<td>New York, NY</td>
+<td><div align="center"><a href="https://jobs.lever.co/acme/1"><img src="apply.png" alt="Apply"></a>
+<a href="https://simplify.jobs/p/1"><img src="s.png" alt="Simplify"></a></div></td>
+<td>2d</td>
+</tr>
+<tr><td>↳</td><td>Data Intern</td><td>Remote &amp; NYC</td><td><a href="https://jobs.lever.co/acme/2">Apply</a></td><td>3d</td></tr>
+<tr><td>↳</td><td>Closed Intern</td><td>SF</td><td>🔒</td><td>9d</td></tr>
+<tr><td>Plain text co</td><td>Skipped</td><td>SF</td><td><a href="https://x.com/1">Apply</a></td><td>1d</td></tr>
+<tr><td><a href="https://simplify.jobs/c/Globex">Globex</a></td><td>ML Intern</td><td>SF</td>
+<td><a href="/relative">Apply</a></td><td><a href="https://globex.com/j/9">Apply</a></td></tr>
+<tr><td><a href="https://simplify.jobs/c/Initech">Initech</a></td><td>Intern</td><td>TX</td><td><img src="🔒.png"> <a href="https://initech.com/j">x</a></td><td>5d</td></tr>
+<tr><td>Short</td><td>row</td></tr>
+</tbody>
+</table>
+
+<h3>🤖 Data Science, AI &amp; Machine Learning Internship Roles</h3>
+
+<table>
+<tr><th>Company</th><th>Role</th><th>Location</th><th>Application</th><th>Age</th></tr>
+<tr><td></td><td>Research Intern</td><td>Seattle</td><td><a href="https://jobs.ashbyhq.com/globex/r">Apply</a></td><td>0d</td></tr>
+</table>
+"""
+
+MD_README = """# 2026 New Grad
+
+| Company | Role | Location | Posted | Visa | **Apply** |
+|---|---|---|---|---|---|
+| ↳ | Orphan | NYC | 1d | ✅ | <a href="https://boards.greenhouse.io/a/1">Apply</a> |
+| **<a href="https://acme.com">Acme</a>** | SWE 🎓 | NYC | 1d | ✅ | <a href="https://boards.greenhouse.io/acme/1">Apply</a> |
+| ↳ | Data | Remote | 4w |  | [Apply](https://boards.greenhouse.io/acme/2) |
+| **Globex** | Closed role | SF | 2d | ❌ No Sponsor | <a href="https://globex.com/1">Apply</a> |
+| **Initech** | SWE | TX | 3h | https://initech.com/jobs/7 |
+| too | few | cells |
+"""
+
+
+def _document(text):
+    return SimplifyGitHubScraper._parse(text, "Feed")
+
+
+def _stream(text):
+    return list(iter_listings(text.split("\n"), "Feed"))
+
+
+class TestListingStream:
+
+    def test_html_tables_match_soup_parser(self):
+        expected = SimplifyGitHubScraper._parse_html_tables(BeautifulSoup(HTML_README, "html.parser"), "Feed")
+        assert _stream(HTML_README) == expected
+        assert [(j["company"], j["is_closed"]) for j in expected] == [
+            ("Acme ", False), ("Acme ", False), ("Globex", False), ("Initech", True), ("Initech", False),
+        ]
+        assert expected[0]["github_category"] == "Software Engineering Internship"
+        assert expected[-1]["github_category"] == "Data Science AI ML Internship"
+
+    def test_markdown_matches_text_parser(self):
+        expected = SimplifyGitHubScraper._parse_markdown_text(MD_README, "Feed")
+        assert _stream(MD_README) == expected
+        assert [j["url"] for j in expected] == [
+            "https://boards.greenhouse.io/acme/1", "https://boards.greenhouse.io/acme/2", "https://initech.com/jobs/7",
+        ]
+
+    def test_yields_rows_before_document_ends(self):
+        lines = iter(HTML_README.split("\n"))
+        first = next(iter_listings(lines, "Feed"))
+        assert first["url"] == "https://jobs.lever.co/acme/1"
+        assert any("Data Science" in line for line in lines)
+
+    def test_one_format_per_document(self):
+        stream = ListingStream("Feed")
+        jobs = list(iter_listings((HTML_README + MD_README).split("\n"), "Feed", stream))
+        assert stream.format == "html" and len(jobs) == 5
+        assert _document(MD_README) == _stream(MD_README)
+        assert _stream("# nothing here\n\nat all") == []
+
+    def test_response_lines_across_chunk_boundaries(self):
+        class Streamed:
+            encoding = "utf-8"
+
+            def iter_content(self, chunk_size, decode_unicode=True):
+                for i in range(0, len(MD_README), 7):
+                    yield MD_README[i:i + 7]
+        assert list(_response_lines(Streamed(), chunk_size=7)) == MD_README.split("\n")
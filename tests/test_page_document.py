@@ -0,0 +1,76 @@
+"""Test PageDocument: one text extraction shared by every extractor/check."""
+import pytest
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aggregator.page_document import PageDocument
+from aggregator.processors import ValidationHelper, LocationExtractor, JobIDExtractor
+
+
+class _CountingSoup:
+    """Wraps a soup and counts full-DOM get_text() walks."""
+
+    def __init__(self, soup):
+        self._soup = soup
+        self.calls = 0
+
+    def get_text(self, *args, **kwargs):
+        self.calls += 1
+        return self._soup.get_text(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._soup, name)
+
+
+class TestPageDocument:
+
+    def test_text_extracted_once(self, job_page):
+        counting = _CountingSoup(job_page("Must hold an active TS/SCI clearance. " * 50))
+        page = PageDocument(counting)
+        ValidationHelper.check_page_restrictions(page)
+        ValidationHelper.check_salary_requirement(page)
+        ValidationHelper.extract_page_age(page)
+        JobIDExtractor.extract_all_methods("https://example.com/job/1", page)
+        assert counting.calls == 1
+
+    def test_lower_prefix_matches_old_idiom(self, job_page):
+        soup = job_page("Software Engineer INTERN — Boston, MA " * 500)
+        page = PageDocument(soup)
+        for n in (2000, 5000, 15000):
+            assert page.lower_prefix(n) == soup.get_text()[:n].lower()
+            assert page.prefix(n) == soup.get_text()[:n]
+
+    def test_same_decisions_as_soup(self, job_page):
+        bodies = [
+            "Currently pursuing a bachelor's degree in Computer Science",
+            "U.S. citizenship is required for this position",
+            "Pay range: $18.00 - $20.00 per hour",
+            "Open to BS, MS and PhD students in CS",
+        ]
+        for body in bodies:
+            soup = job_page(body)
+            assert ValidationHelper.check_page_restrictions(soup) == \
+                ValidationHelper.check_page_restrictions(PageDocument(soup))
+            assert ValidationHelper.check_salary_requirement(soup) == \
+                ValidationHelper.check_salary_requirement(PageDocument(soup))
+
+    def test_json_ld_parsed_once(self, make_soup):
+        soup = make_soup(
+            '<html><head><script type="application/ld+json">'
+            '{"jobLocation": {"address": {"addressLocality": "Austin", "addressRegion": "TX"}}}'
+            '</script></head><body></body></html>'
+        )
+        page = PageDocument(soup)
+        assert page.first_json_ld["jobLocation"]["address"]["addressRegion"] == "TX"
+        assert LocationExtractor.extract_from_json_ld(page).value == "Austin, TX"
+
+    def test_bad_json_ld_is_none(self, make_soup):
+        page = PageDocument(make_soup('<script type="application/ld+json">{oops</script>'))
+        assert page.json_ld == [None]
+        assert JobIDExtractor.extract_from_json_ld(page).value is None
+
+    def test_soup_passthrough(self, make_soup):
+        page = PageDocument(make_soup("<html><head><title> Intern </title></head><h1>Hi</h1></html>"))
+        assert page.find("h1").get_text() == "Hi"
+        assert page.page_title == "Intern"
+        assert PageDocument.of(page) is page
+        assert PageDocument.of(None) is None
@@ -0,0 +1,142 @@
+"""Test RunPipeline — priority order, watermark-safe flushes, stage waits."""
+import pytest
+import sys, os, time, threading
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aggregator.pipeline import RunPipeline
+
+
+def _pipeline(valid, flushed, **kw):
+    def flush(upto):
+        flushed.append(list(valid[len(sum(flushed, [])):upto]))
+        return upto
+    kw.setdefault("flush_sec", 60)
+    return RunPipeline(flush=flush, mark=lambda: len(valid), **kw)
+
+
+class TestRunPipeline:
+
+    def test_lower_priority_number_runs_first(self):
+        valid, flushed, order = [], [], []
+        pipe = _pipeline(valid, flushed, workers=1)
+
+        def produce(p):
+            for i in range(3):
+                p.put("github", 1, order.append, f"g{i}")
+            for i in range(3):
+                p.put("direct", 0, order.append, f"d{i}")
+        pipe.producer("all", produce)
+        # One worker is held until everything is queued, so order is decided by priority
+        gate = threading.Event()
+        pipe.put("hold", 0, gate.wait)
+        threading.Timer(0.2, gate.set).start()
+        pipe.run()
+        assert order == ["d0", "d1", "d2", "g0", "g1", "g2"]
+        assert pipe.stages["direct"].items == 3 and pipe.stages["github"].items == 3
+
+    def test_running_item_holds_back_the_writer(self):
+        valid, flushed = [], []
+        pipe = _pipeline(valid, flushed, workers=2, flush_rows=1)
+        release = threading.Event()
+
+        def slow():
+            valid.append({"id": "slow"})
+            release.wait(2)
+            valid[0]["url"] = "URL_CONFLICT"      # still mutating its own job
+
+        def fast():
+            time.sleep(0.05)
+            valid.append({"id": "fast"})
+
+        pipe.put("s", 0, slow)
+        pipe.put("s", 0, fast)
+        seen = []
+        threading.Timer(0.4, lambda: (seen.append(list(flushed)), release.set())).start()
+        assert pipe.run() == 2
+        assert seen == [[]]                         # nothing written while `slow` ran
+        assert [j["id"] for batch in flushed for j in batch] == ["slow", "fast"]
+        assert flushed[0][0]["url"] == "URL_CONFLICT"
+
+    def test_flushes_in_batches_while_running(self):
+        valid, flushed = [], []
+        pipe = _pipeline(valid, flushed, workers=4, flush_rows=5)
+
+        def produce(p):
+            for i in range(23):
+                p.put("github", 1, lambda i=i: (time.sleep(0.01), valid.append(i)))
+        pipe.producer("github", produce)
+        assert pipe.run() == 23
+        assert sorted(sum(flushed, [])) == list(range(23))
+        assert len(flushed) >= 2 and all(len(b) >= 5 for b in flushed[:-1])
+
+    def test_wait_stage_and_busy(self):
+        valid, flushed, events = [], [], []
+        pipe = _pipeline(valid, flushed, workers=2)
+
+        def direct(p):
+            for i in range(3):
+                p.put("direct", 0, lambda i=i: (time.sleep(0.05), events.append(f"d{i}")))
+
+        def email(p):
+            p.wait_stage("direct")
+            with p.busy("email"):
+                events.append("email")
+                valid.append("e")
+        pipe.producer("direct", direct)
+        pipe.producer("email", email)
+        pipe.run()
+        assert events[-1] == "email" and sorted(events[:3]) == ["d0", "d1", "d2"]
+        assert flushed == [["e"]]
+
+    def test_failed_flush_is_retried(self):
+        valid, calls = [], []
+
+        def flush(upto):
+            calls.append(upto)
+            if len(calls) == 1:
+                raise RuntimeError("quota")
+            return upto
+        pipe = RunPipeline(workers=1, flush=flush, mark=lambda: len(valid), flush_rows=1, flush_sec=0.1)
+        pipe.put("s", 0, valid.append, 1)
+        pipe.put("s", 0, time.sleep, 0.3)
+        assert pipe.run() == 1
+        assert pipe.flush_errors == 1 and calls[-1] == 1
+
+
+class TestPipelinedExclusion:
+
+    def _aggregator(self):
+        from collections import defaultdict
+        from types import SimpleNamespace
+        from aggregator.run_aggregator import UnifiedJobAggregator
+        from aggregator.run_journal import RunJournal
+        agg = UnifiedJobAggregator.__new__(UnifiedJobAggregator)
+        agg.valid_jobs, agg.discarded_jobs, agg.written = [], [], []
+        agg.outcomes = defaultdict(int)
+        agg._journal = RunJournal(valid=lambda: agg.valid_jobs, discarded=lambda: agg.discarded_jobs)
+        agg.sheets = SimpleNamespace(
+            get_next_row_numbers=lambda: {"valid": 2, "valid_sr_no": 1},
+            add_valid_jobs=lambda jobs, row, sr: agg.written.extend(jobs) or len(jobs),
+        )
+        agg._wal = None
+        agg._written_valid = agg._added_valid = 0
+        agg._flushed_keys, agg._withheld = set(), []
+        return agg
+
+    def test_discard_after_flush_keeps_only_the_valid_row(self):
+        agg = self._aggregator()
+        agg.valid_jobs.append({"company": "Acme", "title": "SWE Intern"})
+        agg._flush_valid(1)
+        agg.discarded_jobs += [{"company": "ACME", "title": "swe intern"}, {"company": "Globex", "title": "SWE Intern"}]
+        agg.outcomes["discarded"] = 2
+        agg._settle_pipelined()
+        assert [j["company"] for j in agg.written] == ["Acme"]
+        assert [j["company"] for j in agg.discarded_jobs] == ["Globex"]
+        assert agg.outcomes["discarded"] == 1
+
+    def test_discard_before_flush_withholds_the_valid_row(self):
+        agg = self._aggregator()
+        agg.valid_jobs.append({"company": "Acme", "title": "SWE Intern"})
+        agg.discarded_jobs.append({"company": "Acme", "title": "SWE Intern"})
+        agg._flush_valid(1)
+        agg._settle_pipelined()
+        assert agg.written == [] and agg.valid_jobs == [] and len(agg.discarded_jobs) == 1
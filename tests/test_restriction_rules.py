@@ -0,0 +1,82 @@
+"""Test the compiled restriction rule engine: same hits and decisions as plain re.search."""
+import re
+import pytest
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aggregator.page_document import PageDocument
+from aggregator.processors import ValidationHelper
+from aggregator.restriction_rules import (
+    RESTRICTION_RULES,
+    RestrictionRuleSet,
+    required_literals,
+    scan_page,
+)
+
+PAGES = [
+    "Must be a U.S. citizen. Active TS/SCI clearance required.",
+    "Currently pursuing a bachelor's degree in Computer Science. Rising junior or senior.",
+    "Pursuing a bachelor's or master's degree in Computer Science.",
+    "PhD Internship - Machine Learning Research. Must be pursuing a PhD.",
+    "We do not sponsor CPT or OPT for this internship.",
+    "We support CPT for eligible students.",
+    "Applicants must be a U.S. Person as defined by export control regulations.",
+    "High school students only. Must be enrolled in high school.",
+    "Must be enrolled at a university in Michigan.",
+    "Graduating in December 2025. Class of 2028 preferred.",
+    "Great team, free lunch, no requirements listed. İTAR ſtudent naïve.",
+]
+
+
+def _legacy_hits(text, category):
+    return [
+        (rule.pattern, m.span())
+        for rule in RESTRICTION_RULES.rules(category)
+        for m in [re.search(rule.pattern, text, rule.regex.flags)]
+        if m
+    ]
+
+
+class TestRequiredLiterals:
+
+    def test_mandatory_runs(self):
+        assert required_literals(r"(?:sophomore|junior|senior)\s+standing") == ("standing",)
+        assert required_literals(r"\(ph\.?d\.?\)") == ("(ph",)
+        assert required_literals(r"must\s+be\s+ear\s+eligible") == ("must", "ear", "eligible")
+
+    def test_optional_parts_skipped(self):
+        assert required_literals(r"(?:security\s+)?clearance") == ("clearance",)
+        assert required_literals(r"ts|sci") == ()
+
+    def test_ignorecase_lowercased(self):
+        assert required_literals(r"ITAR\s+Required", re.I) == ("itar", "required")
+        assert required_literals(r"ITAR") == ("ITAR",)
+
+
+class TestRuleEngine:
+
+    @pytest.mark.parametrize("body", PAGES)
+    def test_hits_match_plain_search(self, job_page, body):
+        text = PageDocument(job_page(body)).lower_prefix(15000)
+        scan = RESTRICTION_RULES.scan(text)
+        for category in RESTRICTION_RULES.categories:
+            got = [(h.pattern, h.match.span()) for h in scan.hits(category)]
+            assert got == _legacy_hits(text, category), category
+
+    def test_ignorecase_special_characters(self):
+        # re.I matches "ſ" as "s" and "K" (Kelvin) as "k"; the prefilter must too
+        rules = RestrictionRuleSet().add("x", [r"student", r"kelvin"], re.I)
+        scan = rules.scan("ſtudent and Kelvin")
+        assert [h.pattern for h in scan.hits("x")] == ["student", "kelvin"]
+
+    @pytest.mark.parametrize("body", PAGES)
+    def test_decisions_unchanged_without_prefilter(self, job_page, body):
+        soup = job_page(body)
+        page = PageDocument(soup)
+        page.memo(("restriction_scan", 15000), lambda: RESTRICTION_RULES.scan(page.lower_prefix(15000), prefilter=False))
+        assert ValidationHelper.check_page_restrictions(page) == ValidationHelper.check_page_restrictions(soup)
+
+    def test_scan_shared_across_checks(self, job_page):
+        page = PageDocument(job_page("Must be a U.S. citizen."))
+        assert scan_page(page) is scan_page(page)
+        dec, reason = ValidationHelper._check_citizenship_requirements(page)
+        assert dec == "REJECT"
@@ -0,0 +1,47 @@
+"""Test batched row deletion — contiguous ranges, bottom-up, one request."""
+import pytest
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aggregator.fake_sheets import FakeSpreadsheet
+from aggregator.row_deletion import delete_rows, row_ranges
+
+
+def _sheet(n=12):
+    ss = FakeSpreadsheet({"Discarded Entries": [["Sr"]] + [[f"r{i}"] for i in range(2, n + 1)]})
+    return ss, ss.worksheet("Discarded Entries")
+
+
+class TestRowRanges:
+
+    def test_merges_runs_bottom_first(self):
+        assert row_ranges([5, 3, 4, 9, 11, 10, 7]) == [(9, 11), (7, 7), (3, 5)]
+
+    def test_ignores_header_and_duplicates(self):
+        assert row_ranges([1, 2, 2, 3]) == [(2, 3)]
+        assert row_ranges([]) == []
+
+
+class TestDeleteRows:
+
+    def test_removes_exactly_the_requested_rows(self):
+        ss, ws = _sheet()
+        deleted = delete_rows(ws, {3, 4, 5, 8, 11, 12})
+        assert deleted == 6
+        assert [r[0] for r in ws.get_all_values()] == ["Sr", "r2", "r6", "r7", "r9", "r10"]
+
+    def test_one_batch_update_no_per_row_calls(self):
+        ss, ws = _sheet()
+        delete_rows(ws, range(2, 12, 2))
+        assert ss.api_calls["batch_update"] == 1
+        assert ss.api_calls["delete_rows"] == 0
+        starts = [r["deleteDimension"]["range"]["startIndex"] for r in ss.batch_updates[0]["requests"]]
+        assert starts == sorted(starts, reverse=True)
+
+    def test_failure_deletes_nothing(self):
+        ss, ws = _sheet()
+
+        def broken(body):
+            raise Exception("APIError: [400]: Invalid requests")
+        ss.batch_update = broken
+        assert delete_rows(ws, [2, 3]) == 0
+        assert len(ws.get_all_values()) == 12
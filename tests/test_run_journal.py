@@ -0,0 +1,106 @@
+"""Test RunJournal — checkpoint a run, resume it after a kill."""
+import pytest
+import sys, os, json, time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aggregator.run_journal import RunJournal
+
+
+class _Run:
+    """The two lists a run accumulates, plus its journal."""
+
+    def __init__(self, path, **kw):
+        self.valid, self.discarded = [], []
+        self.journal = RunJournal(valid=lambda: self.valid, discarded=lambda: self.discarded,
+                                  path=str(path), **kw)
+
+
+def _job(n):
+    return {"company": f"Co{n}", "title": "SWE Intern", "url": f"https://co{n}.com/jobs/{n}"}
+
+
+class TestRunJournal:
+
+    def test_killed_run_resumes_unwritten_jobs_and_skips_done_work(self, tmp_path):
+        path = tmp_path / "run_journal.jsonl"
+        run = _Run(path)
+        assert run.journal.load() is None
+        run.journal.start()
+        for n in range(4):
+            with run.journal.unit(f"github:{n}"):
+                run.valid.append(_job(n))
+        with run.journal.unit("email:e1"):
+            run.discarded.append(dict(_job(9), reason="Senior role"))
+        assert run.journal.checkpoint() == 4
+        run.journal.written("valid", 2)               # first flush made it to the sheet
+        # killed here: no finish()
+
+        resumed = _Run(path)
+        state = resumed.journal.load()
+        assert [j["company"] for j in state.valid] == ["Co2", "Co3"]
+        assert [j["reason"] for j in state.discarded] == ["Senior role"]
+        assert state.done == {"github:0", "github:1", "github:2", "github:3", "email:e1"}
+        resumed.journal.start(state.valid, state.discarded, state.done)
+        assert resumed.journal.is_done("github:3") and not resumed.journal.is_done("github:4")
+        assert resumed.journal.run_id == state.run_id
+
+        resumed.valid.extend(state.valid)
+        resumed.discarded.extend(state.discarded)
+        resumed.journal.checkpoint()
+        resumed.journal.written("valid")
+        resumed.journal.written("discarded")
+        again = _Run(path).journal.load()
+        assert again.valid == [] and again.discarded == [] and again.run_id == state.run_id
+
+    def test_running_unit_holds_back_its_jobs_and_later_done_marks(self, tmp_path):
+        run = _Run(tmp_path / "j.jsonl")
+        run.journal.start()
+        slow = run.journal.unit("direct:slow")
+        slow.__enter__()
+        run.valid.append(_job(1))                      # slow unit's job, may still change
+        with run.journal.unit("direct:fast"):
+            run.valid.append(_job(2))
+        assert run.journal.checkpoint() == 0
+        state = _Run(tmp_path / "j.jsonl").journal.load()
+        assert state.valid == [] and state.done == set()
+
+        run.valid[0]["url"] = "URL_CONFLICT"
+        slow.__exit__(None, None, None)
+        assert run.journal.checkpoint() == 2
+        state = _Run(tmp_path / "j.jsonl").journal.load()
+        assert state.valid[0]["url"] == "URL_CONFLICT"
+        assert state.done == {"direct:slow", "direct:fast"}
+
+    def test_failed_unit_is_not_done(self, tmp_path):
+        run = _Run(tmp_path / "j.jsonl")
+        run.journal.start()
+        with pytest.raises(RuntimeError):
+            with run.journal.unit("github:x"):
+                raise RuntimeError("timeout")
+        run.journal.checkpoint()
+        assert _Run(tmp_path / "j.jsonl").journal.load().done == set()
+
+    def test_checkpoints_in_batches(self, tmp_path):
+        path = tmp_path / "j.jsonl"
+        run = _Run(path, every_units=3, every_sec=3600)
+        run.journal.start()
+        for n in range(7):
+            with run.journal.unit(f"github:{n}"):
+                run.valid.append(_job(n))
+        lines = path.read_text().splitlines()
+        assert sum('"done"' in l for l in lines) == 6      # two batches of three
+
+    def test_torn_tail_and_stale_journals(self, tmp_path):
+        path = tmp_path / "j.jsonl"
+        path.write_text(json.dumps({"run": "run_x", "started": time.time()}) + "\n"
+                        + json.dumps({"valid": _job(1)}) + "\n" + '{"valid": {"comp')
+        assert [j["company"] for j in _Run(path).journal.load().valid] == ["Co1"]
+
+        path.write_text(json.dumps({"run": "run_old", "started": time.time() - 48 * 3600}) + "\n")
+        assert _Run(path, max_age_hours=12).journal.load() is None
+
+    def test_finish_removes_the_journal(self, tmp_path):
+        path = tmp_path / "j.jsonl"
+        run = _Run(path)
+        run.journal.start()
+        run.journal.finish()
+        assert not path.exists() and _Run(path).journal.load() is None
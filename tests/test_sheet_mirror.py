@@ -0,0 +1,88 @@
+"""Test SheetMirror delta sync against the fake sheet backend."""
+import pytest
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aggregator import sheet_mirror
+from aggregator.fake_sheets import FakeSpreadsheet
+from aggregator.sheet_mirror import SheetMirror
+
+HEADER = ["Sr. No.", "Status", "Company", "Title", "Date Applied", "Job URL", "Job ID"]
+
+
+def _rows(n, start=1):
+    return [
+        [str(i), "Not Applied", f"Co{i}", f"SWE Intern {i}", "N/A", f"https://co{i}.com/jobs/{i}", f"JR-{i}"]
+        for i in range(start, start + n)
+    ]
+
+
+@pytest.fixture
+def ss():
+    return FakeSpreadsheet({
+        "Valid Entries": [HEADER] + _rows(30),
+        "Discarded Entries": [HEADER] + _rows(5),
+    })
+
+
+@pytest.fixture
+def mirror(tmp_path, monkeypatch):
+    monkeypatch.setattr(sheet_mirror, "PROBE_ROWS", 10)
+    m = SheetMirror(str(tmp_path / "sheet_mirror.db"))
+    yield m
+    m.close()
+
+
+def _sheets(ss):
+    return [ss.worksheet("Valid Entries"), ss.worksheet("Discarded Entries")]
+
+
+def _check(mirror, ss):
+    for ws in _sheets(ss):
+        assert mirror.values(ws) == ws.get_all_values(), ws.title
+
+
+class TestSheetMirror:
+
+    def test_cold_then_warm_sync(self, mirror, ss):
+        assert mirror.sync(ss, _sheets(ss)) == {"Valid Entries": "full", "Discarded Entries": "full"}
+        assert mirror.sync(ss, _sheets(ss)) == {"Valid Entries": "delta", "Discarded Entries": "delta"}
+        assert ss.api_calls["values_batch_get"] == 2
+        _check(mirror, ss)
+
+    def test_new_rows_and_status_edits_are_deltas(self, mirror, ss):
+        valid, _ = _sheets(ss)
+        mirror.sync(ss, _sheets(ss))
+        valid.update(values=_rows(3, start=31), range_name="A32:G34")
+        valid.update(values=[["Applied", "Co7", "SWE Intern 7", "10/16/2026"]], range_name="B8:E8")
+        assert mirror.sync(ss, _sheets(ss))["Valid Entries"] == "delta"
+        assert ss.api_calls["values_batch_get"] == 2
+        _check(mirror, ss)
+
+    def test_deleted_rows_force_full_refetch(self, mirror, ss):
+        valid, _ = _sheets(ss)
+        mirror.sync(ss, _sheets(ss))
+        valid.delete_rows(5, 7)
+        assert mirror.sync(ss, _sheets(ss))["Valid Entries"] == "full"
+        assert ss.api_calls["values_batch_get"] == 3  # cold + delta + one full
+        _check(mirror, ss)
+
+    def test_probe_finds_edits_outside_key_columns(self, mirror, ss):
+        valid, _ = _sheets(ss)
+        mirror.sync(ss, _sheets(ss))
+        valid.update(values=[["https://fixed.example/25"]], range_name="F26")
+        for _ in range(4):  # 31 rows / 10-row probe → every row checked within 4 syncs
+            mirror.sync(ss, _sheets(ss))
+        _check(mirror, ss)
+
+    def test_invalidate_and_max_age(self, mirror, ss):
+        valid, _ = _sheets(ss)
+        mirror.sync(ss, _sheets(ss))
+        assert mirror.sync(ss, _sheets(ss), max_age=3600) == {"Valid Entries": "fresh", "Discarded Entries": "fresh"}
+        mirror.invalidate(valid)
+        assert mirror.sync(ss, _sheets(ss), max_age=3600) == {"Valid Entries": "full", "Discarded Entries": "fresh"}
+
+    def test_shared_between_processes(self, mirror, ss):
+        mirror.sync(ss, _sheets(ss))
+        other = SheetMirror(mirror.path)
+        assert other.values(ss.worksheet("Valid Entries"))[3][2] == "Co3"
+        other.close()
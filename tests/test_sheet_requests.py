@@ -0,0 +1,92 @@
+"""Test the single-request block write in SheetsManager._batch_write."""
+import pytest
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aggregator.fake_sheets import FakeSpreadsheet
+from aggregator.sheet_requests import cell, extended_value
+from aggregator.sheet_snapshot import SheetSnapshot
+
+HEADER = ["Sr. No.", "Status", "Company", "Title", "Date Applied", "Job URL", "Job ID",
+          "Job Type", "Location", "Resume", "Remote", "Entry Date", "Source", "Sponsorship"]
+
+
+def _row(n, status="Not Applied", url="https://acme.com/jobs/1"):
+    return [n, status, f"Co{n}", "SWE Intern", "N/A", url, "JR-1", "Internship",
+            "Boston, MA", "SDE", "Hybrid", "16-Oct-2026", "GitHub", "Unknown"]
+
+
+@pytest.fixture
+def manager():
+    from aggregator.sheets_manager import SheetsManager
+    ss = FakeSpreadsheet({
+        "Valid Entries": [
+            HEADER,
+            ["1", "Applied", "Acme"], ["2", "Applied", "Globex"],
+            ["3", "Rejected", "Initech"], ["4", "", ""],
+        ],
+    })
+    sm = SheetsManager.__new__(SheetsManager)
+    sm.spreadsheet = ss
+    sm.valid_sheet = ss.worksheet("Valid Entries")
+    sm.snapshot = SheetSnapshot(ss, [sm.valid_sheet])
+    return sm
+
+
+class TestCellBuilder:
+
+    def test_values_parse_like_user_entered(self):
+        assert extended_value(7) == {"numberValue": 7}
+        assert extended_value("=SUM(A1)") == {"formulaValue": "=SUM(A1)"}
+        assert extended_value("16-Oct-2026", "%d-%b-%Y") == {"numberValue": 46311}
+        assert extended_value("not a date", "%d-%b-%Y") == {"stringValue": "not a date"}
+
+    def test_link_and_date_pattern(self):
+        c = cell("https://x.com/1", link="https://x.com/1")
+        assert c["textFormatRuns"][0]["format"]["link"]["uri"] == "https://x.com/1"
+        d = cell("16-Oct-2026", date_format="%d-%b-%Y", date_pattern="dd-mmm-yyyy")
+        assert d["userEnteredFormat"]["numberFormat"] == {"type": "DATE", "pattern": "dd-mmm-yyyy"}
+
+
+class TestBatchWrite:
+
+    def test_block_is_one_batch_update(self, manager):
+        ss = manager.spreadsheet
+        manager._batch_write(manager.valid_sheet, 6, [_row(5), _row(6, url="N/A")], is_valid_sheet=True)
+        assert ss.api_calls["batch_update"] == 1
+        assert ss.api_calls["update"] == 0 and ss.api_calls["format"] == 0
+
+        requests = ss.batch_updates[0]["requests"]
+        uc = requests[0]["updateCells"]
+        assert uc["start"] == {"sheetId": manager.valid_sheet.id, "rowIndex": 5, "columnIndex": 0}
+        first, second = (r["values"] for r in uc["rows"])
+        assert first[5]["textFormatRuns"][0]["format"]["link"]["uri"] == "https://acme.com/jobs/1"
+        assert "textFormatRuns" not in second[5]
+        assert first[1]["userEnteredFormat"]["backgroundColor"]
+        assert first[1]["dataValidation"]["condition"]["type"] == "ONE_OF_LIST"
+        assert [v["userEnteredValue"] for v in first[9]["dataValidation"]["condition"]["values"]] == ["SDE", "ML", "DA"]
+        assert first[11]["userEnteredValue"] == {"numberValue": 46311}
+
+    def test_existing_status_runs_are_merged(self, manager):
+        ss = manager.spreadsheet
+        manager._batch_write(manager.valid_sheet, 6, [_row(5)], is_valid_sheet=True)
+        repeats = [r["repeatCell"]["range"] for r in ss.batch_updates[0]["requests"] if "repeatCell" in r]
+        spans = [(g["startRowIndex"], g["endRowIndex"]) for g in repeats]
+        # rows 2-3 Applied, row 4 Rejected, row 5 empty, then the buffer reset after row 6
+        assert spans == [(1, 3), (3, 4), (4, 5), (6, 506)]
+
+    def test_snapshot_sees_the_new_rows(self, manager):
+        manager._batch_write(manager.valid_sheet, 6, [_row(5)], is_valid_sheet=True)
+        assert manager.snapshot.values(manager.valid_sheet)[5][:3] == ["5", "Not Applied", "Co5"]
+
+    def test_buffer_reset_stays_inside_the_grid(self, manager):
+        ss = manager.spreadsheet
+        manager.valid_sheet.row_count = 20
+        manager._batch_write(manager.valid_sheet, 6, [_row(5)], is_valid_sheet=True)
+        repeats = [r["repeatCell"]["range"] for r in ss.batch_updates[0]["requests"] if "repeatCell" in r]
+        assert (repeats[-1]["startRowIndex"], repeats[-1]["endRowIndex"]) == (6, 20)
+
+    def test_request_past_the_grid_is_rejected(self, manager):
+        from aggregator.sheet_requests import grid_range, set_validation
+        ss = manager.spreadsheet
+        with pytest.raises(Exception, match="exceeds grid limits"):
+            ss.batch_update({"requests": [set_validation(grid_range(manager.valid_sheet.id, 6, 1006, 1, 2), None)]})
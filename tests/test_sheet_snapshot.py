@@ -0,0 +1,93 @@
+"""Test SheetSnapshot — one batched download answers every sheet index question."""
+import pytest
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aggregator.fake_sheets import FakeSpreadsheet
+from aggregator.sheet_mirror import SheetMirror
+from aggregator.sheet_snapshot import SheetSnapshot
+
+HEADER = ["Sr. No.", "Status", "Company", "Title", "Date Applied", "Job URL", "Job ID"]
+
+
+@pytest.fixture
+def ss():
+    return FakeSpreadsheet({
+        "Valid Entries": [
+            HEADER,
+            ["1", "Applied", "Acme", "SWE Intern", "", "https://acme.com/jobs/1", "JR-1"],
+            ["2", "Not Applied", "Globex", "Data Intern", "", "https://globex.com/j/2"],
+            ["3", "", "", ""],
+            ["4", "Not Applied", "Initech", "ML Intern", "", "https://initech.com/3", "N/A"],
+        ],
+        "Discarded Entries": [HEADER],
+        "Reviewed - Not Applied": [],
+    })
+
+
+@pytest.fixture
+def sheets(ss):
+    return tuple(ss.worksheets())
+
+
+@pytest.fixture
+def manager(ss, sheets):
+    from aggregator.sheets_manager import SheetsManager
+    valid, discarded, reviewed = sheets
+    sm = SheetsManager.__new__(SheetsManager)
+    sm.spreadsheet = ss
+    sm.valid_sheet, sm.discarded_entries, sm.reviewed___not_applied = valid, discarded, reviewed
+    sm.snapshot = SheetSnapshot(ss, [valid, discarded, reviewed])
+    return sm
+
+
+class TestSheetSnapshot:
+
+    def test_values_match_get_all_values(self, ss, sheets):
+        snap = SheetSnapshot(ss, sheets)
+        for ws in sheets:
+            assert snap.values(ws) == ws.get_all_values()
+
+    def test_next_row_is_first_gap(self, ss, sheets):
+        valid, discarded, reviewed = sheets
+        snap = SheetSnapshot(ss, sheets)
+        assert snap.next_row(valid) == {"row": 4, "sr_no": 3}
+        assert snap.next_row(discarded) == {"row": 2, "sr_no": 1}
+        assert snap.next_row(reviewed) == {"row": 1, "sr_no": 0}
+
+    def test_record_rows_moves_next_row(self, ss, sheets):
+        valid, discarded, _ = sheets
+        snap = SheetSnapshot(ss, sheets)
+        snap.record_rows(valid, 4, [[3, "Not Applied", "Umbrella", "SWE Intern", "N/A", "https://u.com/1", "U-1", "Intern"]])
+        assert snap.next_row(valid) == {"row": 6, "sr_no": 5}
+        assert snap.values(valid)[3][2] == "Umbrella"
+        assert len({len(r) for r in snap.values(valid)}) == 1  # still rectangular
+        snap.record_rows(discarded, 2, [[1, "Filtered", "A", "B"], [2, "Filtered", "C", "D"]])
+        assert snap.next_row(discarded) == {"row": 4, "sr_no": 3}
+
+    def test_unregistered_sheet_falls_back(self, ss, sheets):
+        valid, discarded, reviewed = sheets
+        snap = SheetSnapshot(ss, [valid])
+        assert snap.used_rows(discarded) == 1
+        assert ss.api_calls["get_all_values"] == 1
+
+    def test_loads_through_mirror(self, ss, sheets, tmp_path):
+        mirror = SheetMirror(str(tmp_path / "sheet_mirror.db"))
+        SheetSnapshot(ss, sheets, mirror=mirror).refresh()
+        snap = SheetSnapshot(ss, sheets, mirror=mirror)  # next run: delta sync
+        for ws in sheets:
+            assert snap.values(ws) == ws.get_all_values()
+        assert ss.api_calls["values_batch_get"] == 2
+        mirror.close()
+
+
+class TestSheetsManagerUsesSnapshot:
+
+    def test_one_download_for_all_index_questions(self, manager, ss):
+        rows = manager.get_next_row_numbers()
+        assert rows == {"valid": 4, "valid_sr_no": 3, "discarded": 2, "discarded_sr_no": 1}
+        assert manager.load_urls_only() == {"https://acme.com/jobs/1", "https://globex.com/j/2", "https://initech.com/3"}
+        assert manager.load_job_ids_only() == {"jr-1"}
+        assert len(manager.load_company_titles_only()) == 3
+        manager.ensure_sufficient_rows(manager.valid_sheet)
+        assert ss.api_calls["values_batch_get"] == 1
+        assert ss.api_calls["get_all_values"] == 0
@@ -0,0 +1,133 @@
+"""Test SheetWriteBuffer — merged ranges, one request per kind, whole-batch retry."""
+import pytest
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aggregator.fake_sheets import FakeSpreadsheet
+from outreach.sheet_writer import SheetWriteBuffer
+
+
+def _sheet(rows=3):
+    ss = FakeSpreadsheet({"Outreach": [["H"] * 6] + [[""] * 6 for _ in range(rows)]})
+    return ss, ss.worksheet("Outreach")
+
+
+class TestSheetWriteBuffer:
+
+    def test_adjacent_cells_merge_into_one_range(self):
+        ss, ws = _sheet()
+        buf = SheetWriteBuffer(ws)
+        buf.set(2, 0, "a")
+        buf.set(2, 1, "b")
+        buf.set(2, 3, "d")
+        buf.set(3, 1, "x")
+        ranges = [d["range"] for d in buf._value_ranges(buf._values)]
+        assert ranges == ["'Outreach'!A2:B2", "'Outreach'!D2:D2", "'Outreach'!B3:B3"]
+
+    def test_same_columns_on_consecutive_rows_stack(self):
+        ss, ws = _sheet(rows=5)
+        buf = SheetWriteBuffer(ws)
+        for row in (2, 3, 4, 6):
+            buf.set(row, 0, str(row))
+        data = buf._value_ranges(buf._values)
+        assert [d["range"] for d in data] == ["'Outreach'!A2:A4", "'Outreach'!A6:A6"]
+        assert data[0]["values"] == [["2"], ["3"], ["4"]]
+
+    def test_flush_sends_one_values_and_one_format_request(self):
+        ss, ws = _sheet()
+        buf = SheetWriteBuffer(ws)
+        for row in (2, 3, 4):
+            buf.set(row, 2, f"r{row}@acme.com")
+            buf.set(row, 3, "High")
+            buf.format(row, 3, {"textFormat": {"bold": True}})
+        assert buf.flush() is True
+        assert ss.api_calls["values_batch_update"] == 1
+        assert ss.api_calls["batch_update"] == 1
+        assert len(ss.batch_updates[0]["requests"]) == 3
+        assert ws.row_values(3)[2:4] == ["r3@acme.com", "High"]
+        assert len(buf) == 0
+
+    def test_later_write_to_same_cell_wins(self):
+        ss, ws = _sheet()
+        buf = SheetWriteBuffer(ws)
+        buf.set(2, 0, "old")
+        buf.set(2, 0, "new")
+        assert buf.get(2, 0) == "new"
+        assert buf.get(2, 1, "dflt") == "dflt"
+        buf.flush()
+        assert ws.row_values(2)[0] == "new"
+
+    def test_failed_batch_is_resent_whole(self):
+        ss, ws = _sheet()
+        calls, real = [], ss.values_batch_update
+
+        def flaky(body):
+            calls.append(body["data"])
+            if len(calls) == 1:
+                raise Exception("APIError: [429]: Quota exceeded")
+            return real(body)
+        ss.values_batch_update = flaky
+        buf = SheetWriteBuffer(ws)
+        buf.set(2, 0, "a")
+        buf.set(3, 0, "b")
+        assert buf.flush() is False
+        buf.set(4, 0, "c")
+        assert buf.flush() is True
+        assert [d["range"] for d in calls[1]] == ["'Outreach'!A2:A4"]
+        assert ws.row_values(3)[0] == "b"
+
+    def test_failed_flush_keeps_the_buffer(self):
+        ss, ws = _sheet()
+
+        def broken(body):
+            raise Exception("APIError: [400]: Invalid range")
+        ss.values_batch_update = broken
+        buf = SheetWriteBuffer(ws)
+        buf.set(2, 0, "a")
+        assert buf.flush() is False
+        assert buf.get(2, 0) == "a"
+        assert buf.stats["failed"] == 1
+
+    def test_auto_flush_at_max_cells(self):
+        ss, ws = _sheet(rows=5)
+        buf = SheetWriteBuffer(ws, max_cells=4)
+        for row in range(2, 6):
+            buf.set(row, 0, str(row))
+        assert ss.api_calls["values_batch_update"] == 1
+        assert len(buf) == 0
+        assert [r[0] for r in ws.get_all_values()[1:5]] == ["2", "3", "4", "5"]
+
+
+class TestOutreachFlush:
+
+    def test_bounce_notes_flushed_when_scan_fails(self):
+        from outreach.outreach_config import O_HEADERS, C
+        from outreach.outreach_data import Sheets
+        row = [""] * len(O_HEADERS)
+        row[C["company"]], row[C["hm_name"]], row[C["hm_email"]] = "Acme", "Ann Lee", "ann@acme.com"
+        ss = FakeSpreadsheet({"Outreach": [O_HEADERS, row]})
+        sheets = Sheets.__new__(Sheets)
+        sheets.ws = ss.worksheet("Outreach")
+        sheets.writes = SheetWriteBuffer(sheets.ws)
+
+        def retry_fails(*args):
+            raise RuntimeError("pattern lookup down")
+        sheets._retry_bounced_email = retry_fails
+        assert sheets.flag_bounced_rows({"ann@acme.com"}) == 0
+        assert len(sheets.writes) == 0
+        assert "HM email bounced" in sheets.ws.get_all_values()[1][C["notes"]]
+
+    def test_sent_marks_survive_flush_between_sends(self):
+        from outreach.outreach_config import O_HEADERS, C
+        from scripts.send_scheduled import _mark_sent
+        rows = []
+        for _ in range(2):
+            row = [""] * len(O_HEADERS)
+            row[C["company"]], row[C["title"]] = "Acme", "SWE Intern"
+            rows.append(row)
+        ss = FakeSpreadsheet({"Outreach": [O_HEADERS] + [list(r) for r in rows]})
+        ws = ss.worksheet("Outreach")
+        data, marks = ws.get_all_values(), SheetWriteBuffer(ws)
+        for day in ("Oct 16, 2026", "Oct 17, 2026"):
+            _mark_sent(data, marks, "Acme", "SWE Intern", day)
+            marks.flush()
+        assert [r[C["sent_dt"]] for r in ws.get_all_values()[1:]] == ["Oct 16, 2026", "Oct 17, 2026"]
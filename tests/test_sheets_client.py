@@ -0,0 +1,116 @@
+"""Test the shared Sheets quota — cross-process windows, AIMD pacing, retries, counts."""
+import pytest
+import sys, os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gspread.exceptions import APIError
+from aggregator.sheets_client import QuotaHTTPClient, SharedQuota, _Transport
+
+SHEETS = "https://sheets.googleapis.com/v4/spreadsheets/abc"
+
+
+class _Clock:
+    def __init__(self, t=1_760_000_000.0):
+        self.t = t
+
+    def __call__(self):
+        return self.t
+
+
+def _quota(tmp_path, clock, per_min=3):
+    return SharedQuota(path=str(tmp_path / "quota.json"), reads_per_min=per_min,
+                       writes_per_min=per_min, min_scale=0.2, clock=clock)
+
+
+class _Response:
+    def __init__(self, status):
+        self.status_code = status
+        self.text = ""
+
+    def json(self):
+        return {"error": {"code": self.status_code, "message": "quota", "status": "RESOURCE_EXHAUSTED"}}
+
+
+class TestSharedQuota:
+
+    def test_window_full_means_wait(self, tmp_path):
+        clock = _Clock()
+        q = _quota(tmp_path, clock)
+        assert [q.reserve("write", "a") for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert q.reserve("write", "a") == pytest.approx(60.0)
+        assert q.reserve("read", "a") == 0.0          # reads have their own window
+
+    def test_processes_share_one_window(self, tmp_path):
+        clock = _Clock()
+        one, two = _quota(tmp_path, clock), _quota(tmp_path, clock)
+        one.reserve("write", "run_aggregator")
+        one.reserve("write", "run_aggregator")
+        two.reserve("write", "quality_gate")
+        assert two.reserve("write", "quality_gate") == pytest.approx(60.0)
+
+    def test_429_halves_rate_and_recovers(self, tmp_path):
+        clock = _Clock()
+        q = _quota(tmp_path, clock, per_min=10)
+        q.throttled("write", "a")
+        assert [q.reserve("write", "a") for _ in range(5)] == [0.0] * 5
+        assert q.reserve("write", "a") > 0            # 5 a minute now
+        clock.t += 5 * 60                             # +0.1 a minute → back to full
+        assert [q.reserve("write", "a") for _ in range(10)] == [0.0] * 10
+
+    def test_counts_per_script(self, tmp_path):
+        clock = _Clock()
+        q = _quota(tmp_path, clock)
+        q.reserve("read", "run_aggregator")
+        q.reserve("write", "run_aggregator")
+        q.reserve("write", "quality_gate")
+        q.reserve("other", "quality_gate")
+        q.throttled("write", "quality_gate")
+        counts = _quota(tmp_path, clock).counts()
+        assert counts["run_aggregator"]["read"] == 1 and counts["run_aggregator"]["write"] == 1
+        assert counts["quality_gate"]["other"] == 1 and counts["quality_gate"]["throttled"] == 1
+
+
+class TestQuotaHTTPClient:
+
+    def _client(self, tmp_path, monkeypatch, responses):
+        calls = []
+
+        def fake_request(self, method, endpoint, *args, **kwargs):
+            calls.append((method, endpoint))
+            status = responses.pop(0)
+            if status != 200:
+                raise APIError(_Response(status))
+            return "ok"
+        monkeypatch.setattr(_Transport, "request", fake_request)
+        client = QuotaHTTPClient.__new__(QuotaHTTPClient)
+        client.quota = _quota(tmp_path, _Clock(), per_min=60)
+        client.script = "test"
+        client.sleep = lambda s: None
+        return client, calls
+
+    def test_retries_429_then_succeeds(self, tmp_path, monkeypatch):
+        client, calls = self._client(tmp_path, monkeypatch, [429, 503, 200])
+        assert client.request("post", SHEETS + ":batchUpdate") == "ok"
+        assert len(calls) == 3
+        counts = client.quota.counts()["test"]
+        assert counts["write"] == 3 and counts["throttled"] == 1
+
+    def test_client_errors_are_not_retried(self, tmp_path, monkeypatch):
+        client, calls = self._client(tmp_path, monkeypatch, [400, 200])
+        with pytest.raises(APIError):
+            client.request("get", SHEETS + "/values/A1")
+        assert len(calls) == 1
+
+    def test_kind_by_method_and_host(self):
+        assert QuotaHTTPClient.kind("get", SHEETS + "/values:batchGet") == "read"
+        assert QuotaHTTPClient.kind("post", SHEETS + ":batchUpdate") == "write"
+        assert QuotaHTTPClient.kind("get", "https://www.googleapis.com/drive/v3/files") == "other"
+
+    def test_authorize_works_on_gspread_5_and_6(self, monkeypatch):
+        import gspread
+        from aggregator import sheets_client
+        seen = []
+        monkeypatch.setattr(gspread, "authorize", lambda creds, **kw: seen.append(kw))
+        sheets_client.authorize(object())
+        monkeypatch.setattr(sheets_client, "_Transport", gspread.Client)   # as on gspread 5.x
+        sheets_client.authorize(object())
+        assert list(seen[0]) == ["http_client"] and seen[1] == {"client_factory": QuotaHTTPClient}
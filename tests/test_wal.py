@@ -81,8 +81,8 @@ class TestWALReplay:
         # Manually set retries to max
         tx.retries = 3
         tx.max_retries = 3
-        # Re-write with high retry count
-        wal._write_tx(tx, wal.pending_dir)
+        # Record the high retry count in the log
+        wal._record_retry(tx)
         result = wal.replay_pending(executor=lambda t: False)
         assert result["failed"] == 1
         assert wal.stats["pending"] == 0
@@ -102,32 +102,103 @@ class TestWALReplay:
         assert wal.stats["pending"] == 1  # still pending
 
 
-class TestWALCleanup:
-    """Test committed transaction cleanup."""
+class TestWALSegment:
+    """Test the single-segment log: payloads, reopen, idempotency, compaction."""
 
     @pytest.fixture
-    def wal(self, tmp_path):
-        return WriteAheadLog(wal_dir=str(tmp_path / "wal"))
-
-    def test_cleanup_old_committed(self, wal):
-        tx = wal.begin("old_op", {"old": True})
-        wal.commit(tx)
-        assert wal.stats["committed"] == 1
-        # Set file mtime to 10 days ago
-        path = os.path.join(wal.committed_dir, f"{tx.tx_id}.json")
-        old_time = os.path.getmtime(path) - (10 * 86400)
-        os.utime(path, (old_time, old_time))
-        removed = wal.cleanup_committed(max_age_days=7)
+    def wal_dir(self, tmp_path):
+        return str(tmp_path / "wal")
+
+    def test_one_segment_file(self, wal_dir):
+        wal = WriteAheadLog(wal_dir=wal_dir)
+        wal.commit(wal.begin("op1", {"a": 1}))
+        wal.begin("op2", {"b": 2})
+        wal.close()
+        assert os.listdir(wal_dir) == ["wal.log"]
+
+    def test_payload_survives_crash(self, wal_dir):
+        jobs = [{"company": "Acme", "title": "SWE Intern", "url": "https://acme.com/1"}]
+        wal = WriteAheadLog(wal_dir=wal_dir)
+        tx = wal.begin("add_valid_jobs", {"jobs": jobs, "start_row": 42})
+        # crash: no commit, no close
+        reopened = WriteAheadLog(wal_dir=wal_dir)
+        pending = reopened.get_pending()
+        assert [t.tx_id for t in pending] == [tx.tx_id]
+        assert pending[0].payload["jobs"] == jobs and pending[0].key == tx.key
+
+    def test_replay_skips_rows_already_committed(self, wal_dir):
+        wal = WriteAheadLog(wal_dir=wal_dir)
+        key = WriteAheadLog.rows_key("add_valid_jobs", ["acmeswintern", "globexdataintern"])
+        assert key == WriteAheadLog.rows_key("add_valid_jobs", ["globexdataintern", "acmeswintern"])
+        stale = wal.begin("add_valid_jobs", {"start_row": 10}, key=key)   # crashed attempt
+        wal.commit(wal.begin("add_valid_jobs", {"start_row": 12}, key=key))
+        calls = []
+        result = WriteAheadLog(wal_dir=wal_dir).replay_pending(executor=lambda t: calls.append(t) or True)
+        assert result["duplicate"] == 1 and result["replayed"] == 0 and calls == []
+        assert WriteAheadLog(wal_dir=wal_dir).stats == {"pending": 0, "committed": 2, "failed": 0}
+
+    def test_default_key_is_deterministic(self, wal_dir):
+        wal = WriteAheadLog(wal_dir=wal_dir)
+        assert wal.begin("op", {"a": 1, "b": 2}).key == wal.begin("op", {"b": 2, "a": 1}).key
+
+    def test_commits_fsynced_in_batches(self, wal_dir, monkeypatch):
+        wal = WriteAheadLog(wal_dir=wal_dir, sync_every=4)
+        txs = [wal.begin("op", {"n": n}) for n in range(8)]
+        syncs = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(os, "fsync", lambda fd: (syncs.append(fd), real_fsync(fd)))
+        for tx in txs:
+            wal.commit(tx)
+        assert len(syncs) == 2
+        wal.close()
+        assert WriteAheadLog(wal_dir=wal_dir).stats["committed"] == 8
+
+    def test_torn_last_record_is_ignored(self, wal_dir):
+        wal = WriteAheadLog(wal_dir=wal_dir)
+        wal.begin("op", {"ok": True})
+        wal.close()
+        with open(os.path.join(wal_dir, "wal.log"), "a") as f:
+            f.write('{"tx": "tx_torn", "op": "begin", "paylo')
+        reopened = WriteAheadLog(wal_dir=wal_dir)
+        assert len(reopened.get_pending()) == 1
+        after = reopened.begin("op", {"after": True})
+        reopened.close()
+        pending = WriteAheadLog(wal_dir=wal_dir).get_pending()
+        assert [t.tx_id for t in pending][-1] == after.tx_id and len(pending) == 2
+
+    def test_compaction_drops_old_settled(self, wal_dir):
+        wal = WriteAheadLog(wal_dir=wal_dir)
+        old = wal.begin("old_op", {"old": True})
+        wal.commit(old)
+        old.committed_at = old.created_at = "2000-01-01T00:00:00"
+        recent = wal.begin("new_op", {"new": True})
+        wal.commit(recent)
+        pending = wal.begin("pending_op", {"p": True})
+        removed = wal.compact(max_age_days=7)
         assert removed == 1
-        assert wal.stats["committed"] == 0
-
-    def test_cleanup_keeps_recent(self, wal):
-        tx = wal.begin("new_op", {"new": True})
-        wal.commit(tx)
-        removed = wal.cleanup_committed(max_age_days=7)
-        assert removed == 0
+        wal.begin("after", {"x": 1})
+        wal.close()
+        reopened = WriteAheadLog(wal_dir=wal_dir)
+        assert reopened.stats == {"pending": 2, "committed": 1, "failed": 0}
+        assert [t.tx_id for t in reopened.get_pending()][0] == pending.tx_id
+
+    def test_compaction_keeps_recent(self, wal_dir):
+        wal = WriteAheadLog(wal_dir=wal_dir)
+        wal.commit(wal.begin("new_op", {"new": True}))
+        assert wal.compact(max_age_days=7) == 0
         assert wal.stats["committed"] == 1
 
+    def test_legacy_pending_files_are_migrated(self, wal_dir):
+        os.makedirs(os.path.join(wal_dir, "pending"))
+        os.makedirs(os.path.join(wal_dir, "committed"))
+        legacy = Transaction(tx_id="tx_legacy", operation="add_valid_jobs",
+                             payload={"count": 3, "start_row": 7})
+        with open(os.path.join(wal_dir, "pending", "tx_legacy.json"), "w") as f:
+            json.dump(legacy.to_dict(), f)
+        wal = WriteAheadLog(wal_dir=wal_dir)
+        assert [t.tx_id for t in wal.get_pending()] == ["tx_legacy"]
+        assert os.listdir(wal_dir) == ["wal.log"]
+
 
 class TestTransaction:
     """Test Transaction serialization."""